@@ -0,0 +1,65 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of ArrayStruct path-indexed mode, get/set the last key and updateByKey on a padstack with many layers.
+
+usage: python benchArrayStruct.py [layers]
+'''
+
+import sys,os
+import time
+from copy import deepcopy
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.common.arrayStruct import ArrayStruct
+from pyLayout.common import hfss3DLParameters
+
+def padStack(layers):
+    pds = ["NAME:pds"]
+    for i in range(layers):
+        pds.append([
+                "NAME:lgm",
+                "lay:=", "L%s"%i,
+                "id:=", i,
+                "pad:=", ["shp:=", "Cir","Szs:=", ["10mil"],"ply:=", [],"X:=", "0mil","Y:=", "0mil","R:=", "0deg"],
+                "ant:=", ["shp:=", "Cir","Szs:=", ["20mil"],"ply:=", [],"X:=", "0mm","Y:=", "0mm","R:=", "0deg"],
+                "thm:=", ["shp:=", "No","Szs:=", [],"ply:=", [],"X:=", "0mm","Y:=", "0mm","R:=", "0deg"],
+                "X:=", "0",
+                "Y:=", "0",
+                "dir:=", "No"
+            ])
+    datas = deepcopy(hfss3DLParameters.padStackData)
+    datas.append(pds)
+    datas.extend(["bch:=", ["lvl:=", 0], "tag:=", "bench"]) #keys after the large sub list
+    return datas
+
+def run(label,datas,indexed,count):
+    ary = ArrayStruct(deepcopy(datas),indexed = indexed)
+    start = time.time()
+    ary.get("tag") #index build in first access
+    build = time.time() - start
+    
+    start = time.time()
+    for i in range(count):
+        ary.get("bch/lvl")
+        ary.set("tag","bench%s"%i)
+    access = time.time() - start
+    
+    start = time.time()
+    count = ary.updateByKey("dir","No")
+    update = time.time() - start
+    print("%-10s %10.2f %14.1f %14.2f %10s"%(label,build*1000,200/access,update*1000,count))
+
+def main():
+    layers = int(sys.argv[1]) if len(sys.argv)>1 else 500
+    pyLayout.log.setLogLevel("WARNING")
+    datas = padStack(layers)
+    print("%-10s %10s %14s %14s %10s"%("mode","build(ms)","get+set/s","update(ms)","updated"))
+    run("scan",datas,False,200)
+    run("indexed",datas,True,200)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of layout.batch(), set backdrill properties of pins one by one vs batched ChangeProperty.
+
+usage: python benchBatch.py [comps] [pinsPerComp]
+'''
+
+import sys,os
+import time
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.primitive.propertyBatch import PropertyBatch
+from recordingEditor import RecordingEditor,BenchLayout
+
+def edit(layout):
+    for i,pin in enumerate(layout.Pins.All):
+        pin["Backdrill Top"] = "L%s"%(i%4+2)
+        pin["Top Offset"] = "2mil"
+        pin.update()
+        pin.Location = [pin.Location.x,"1mm"]
+    
+def run(label,batch,comps,pinsPerComp):
+    oEditor = RecordingEditor.synthetic(comps,pinsPerComp)
+    for name,info in oEditor.objects.items():
+        if info["Type"] == "pin":
+            info["Backdrill Top"] = "----"
+            info["Top Offset"] = "0mil"
+    layout = BenchLayout(oEditor)
+    layout.Pins.All #FindObjects and parse before measure
+    oEditor.reset()
+    
+    start = time.time()
+    if batch:
+        with PropertyBatch(layout):
+            edit(layout)
+    else:
+        edit(layout)
+    cost = time.time() - start
+    writes = oEditor.calls["ChangeProperty"] + oEditor.calls["SetPropertyValue"]
+    print("%-10s %8s %12s %10.3fs"%(label,layout.Pins.Count,writes,cost))
+    return dict((name,(info.get("Backdrill Top"),info.get("Top Offset"),info.get("Location"))) for name,info in oEditor.objects.items())
+
+def main():
+    comps = int(sys.argv[1]) if len(sys.argv)>1 else 50
+    pinsPerComp = int(sys.argv[2]) if len(sys.argv)>2 else 40
+    pyLayout.log.setLogLevel("WARNING")
+    print("%-10s %8s %12s %11s"%("mode","pins","COM writes","time"))
+    before = run("per-edit",False,comps,pinsPerComp)
+    after = run("batch",True,comps,pinsPerComp)
+    print("same result: %s"%(before == after))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of Objects3DL aggregates (Shapes, Traces, Objects), merged copy per access vs chained view.
+
+usage: python benchChainedView.py [comps] [pinsPerComp] [shapes] [lookups]
+'''
+
+import sys,os
+import time
+import random
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.common.complexDict import ComplexDict
+from recordingEditor import RecordingEditor,bindLayout
+
+def legacyObjectDict(objects):
+    '''
+    Objects3DL.ObjectDict before chained view, merge copy of all member collections
+    '''
+    merged = None
+    for member in objects.Members:
+        if merged == None:
+            merged = ComplexDict()
+        merged.append(member.ObjectDict)
+    return merged
+
+def buildEditor(comps,pinsPerComp,shapes):
+    oEditor = RecordingEditor.synthetic(comps,pinsPerComp)
+    for i in range(shapes):
+        oEditor.addObject("poly_%s"%i,"poly",Net = "GND",Layer = "TOP")
+        oEditor.addObject("line_%s"%i,"line",Net = "NET_%s"%i,Layer = "TOP",LineWidth = "0.1mm")
+    return oEditor
+
+def run(label,layout,names,getDict):
+    t0 = time.time()
+    found = 0
+    for name in names:
+        objects = getDict(layout.Objects)
+        if name in objects:
+            found += len(getDict(layout.Shapes)) > 0
+            objects[name]
+    t1 = time.time()-t0
+    print("%-10s %8s %10.3fs %10.0f/s"%(label,len(names),t1,len(names)/max(t1,1e-9)))
+    return found
+
+def main():
+    comps = int(sys.argv[1]) if len(sys.argv)>1 else 100
+    pinsPerComp = int(sys.argv[2]) if len(sys.argv)>2 else 50
+    shapes = int(sys.argv[3]) if len(sys.argv)>3 else 2000
+    count = int(sys.argv[4]) if len(sys.argv)>4 else 200
+    pyLayout.log.setLogLevel("ERROR")
+
+    layout = bindLayout(buildEditor(comps,pinsPerComp,shapes))
+    print("objects: %s, shapes: %s"%(len(layout.Objects),len(layout.Shapes)))
+
+    random.seed(0)
+    names = random.sample(list(layout.Objects.NameList),count)
+    print("%-10s %8s %11s %12s"%("mode","lookups","time","rate"))
+    legacy = run("merge",layout,names,legacyObjectDict)
+    chained = run("view",layout,names,lambda objects: objects.ObjectDict)
+    print("same result: %s"%(legacy == chained))
+
+if __name__ == '__main__':
+    main()
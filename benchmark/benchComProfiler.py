@@ -0,0 +1,78 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of ComProfiler on the stand-in oEditor: time of a workload with raw handles, profiled handles, and raw again after disable.
+
+usage: python benchComProfiler.py [comps] [pinsPerComp]
+'''
+
+import sys,os
+import time
+import tempfile
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from recordingEditor import RecordingEditor,bindLayout
+
+def workload(layout):
+    '''
+    parse all components and pins, read pin nets and query objects on layer
+    '''
+    layout.Components.refresh()
+    layout.Pins.refresh()
+    nets = set()
+    for pin in layout.Pins.ObjectDict.Values:
+        nets.add(pin.Net)
+    for comp in layout.Components.ObjectDict.Values:
+        comp.parse()
+    layout.oEditor.FindObjects("Layer","TOP")
+    return len(nets)
+
+def timed(layout,repeat = 3):
+    best = None
+    for i in range(repeat):
+        t0 = time.time()
+        result = workload(layout)
+        t = time.time()-t0
+        best = t if best == None else min(best,t)
+    return result,best
+
+def main():
+    comps = int(sys.argv[1]) if len(sys.argv)>1 else 100
+    pinsPerComp = int(sys.argv[2]) if len(sys.argv)>2 else 50
+    pyLayout.log.setLogLevel("ERROR")
+
+    oEditor = RecordingEditor.synthetic(comps,pinsPerComp)
+    layout = bindLayout(oEditor)
+    oEditor.reset()
+    nets,t1 = timed(layout)
+    calls = oEditor.CallCount
+    print("%-18s %9.3fs  %s COM calls"%("raw handles",t1,calls))
+
+    profiler = layout.enableComProfiler()
+    with profiler.stage("workload"):
+        nets2,t2 = timed(layout)
+    print("%-18s %9.3fs  overhead %.1f us/call"%("profiled",t2,(t2-t1)/max(calls//3,1)*1e6))
+
+    layout.disableComProfiler()
+    nets3,t3 = timed(layout)
+    print("%-18s %9.3fs  handle type %s"%("disabled",t3,type(layout.oEditor).__name__))
+    print("same result: %s"%(nets == nets2 == nets3))
+
+    print(profiler.summary("workload",top = 8))
+    rpt = profiler.report("workload")
+    print("top callers: %s"%[(c["Caller"],c["Method"],c["Count"]) for c in rpt["Callers"][:3]])
+    folder = tempfile.mkdtemp()
+    paths = profiler.dumpStages(folder)
+    print("reports: %s"%[os.path.basename(p) for p in paths])
+    with open(paths[-1]) as f:
+        print("folded stack: %s"%f.readline().strip())
+    for path in paths:
+        os.remove(path)
+    os.rmdir(folder)
+
+if __name__ == '__main__':
+    main()
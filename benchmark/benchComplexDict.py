@@ -0,0 +1,39 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+micro-benchmark of ComplexDict case-insensitive lookup, lookup cost should keep flat with collection size.
+
+usage: python benchComplexDict.py
+'''
+
+import sys,os
+import time
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.common.complexDict import ComplexDict
+from pyLayout.common.common import findDictKey
+
+def timeit(func,keys):
+    start = time.time()
+    for key in keys:
+        func(key)
+    return (time.time() - start)/len(keys)*1e6 #us per call
+
+def main():
+    pyLayout.log.setLogLevel("WARNING")
+    print("%10s %14s %14s %14s %14s %14s"%("size","scan(us)","index(ms)","get(us)","contains(us)","reallyKey(us)"))
+    for size in [1000,10000,100000]:
+        cdict = ComplexDict(dict([("U%s-A%s"%(i//100,i%100),i) for i in range(size)]))
+        keys = ["u%s-a%s"%(i//100,i%100) for i in range(0,size,max(size//200,1))]
+        scan = timeit(lambda k:findDictKey(k,cdict.Dict),keys[:20])
+        index = timeit(lambda k:cdict[k],keys[:1])/1000.0 #first lookup build the index
+        get = timeit(lambda k:cdict[k],keys)
+        contains = timeit(lambda k:k in cdict,keys)
+        reallyKey = timeit(lambda k:cdict.getReallyKey(k),keys)
+        print("%10s %14.2f %14.2f %14.2f %14.2f %14.2f"%(size,scan,index,get,contains,reallyKey))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of Connectivity graph, components on all nets and nets of all components,
+per-object COM query vs one pass build.
+
+usage: python benchConnectivity.py [comps] [pinsPerComp]
+'''
+
+import sys,os
+import time
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from recordingEditor import RecordingEditor,BenchLayout
+
+def perObject(layout,nets):
+    #same as Net.getConnectedComponnets and Component.NetNames before Connectivity
+    oEditor = layout.oEditor
+    compsOnNet = {}
+    for net in nets:
+        comps = []
+        for name in oEditor.FilterObjectList('Type','pin',oEditor.FindObjects('Net',net)):
+            comp = layout.Pins[name].CompName
+            if comp and comp not in comps:
+                comps.append(comp)
+        compsOnNet[net] = comps
+    
+    netsOfComp = {}
+    for comp in layout.Components.NameList:
+        netsOfComp[comp] = list(set([layout.Pins[p].Net for p in oEditor.GetComponentPins(comp)]))
+    return compsOnNet,netsOfComp
+
+def byGraph(layout,nets):
+    graph = layout.Connectivity
+    compsOnNet = dict((net,graph.getComponentsOnNet(net)) for net in nets)
+    netsOfComp = dict((comp,graph.getNetsOfComponent(comp)) for comp in layout.Components.NameList)
+    return compsOnNet,netsOfComp
+
+def run(label,func,oEditor):
+    layout = BenchLayout(oEditor)
+    nets = [n for n in oEditor.GetNetClassNets('<All>') if n != "<NO-NET>"]
+    oEditor.reset()
+    start = time.time()
+    result = func(layout,nets)
+    func(layout,nets) #second pass, from buffer
+    cost = time.time() - start
+    print("%-12s %10s %12s %10.3fs"%(label,len(nets),oEditor.CallCount,cost))
+    return result
+
+def main():
+    comps = int(sys.argv[1]) if len(sys.argv)>1 else 100
+    pinsPerComp = int(sys.argv[2]) if len(sys.argv)>2 else 20
+    pyLayout.log.setLogLevel("WARNING")
+    
+    oEditor = RecordingEditor.synthetic(comps,pinsPerComp)
+    print("%-12s %10s %12s %11s"%("mode","nets","COM calls","time"))
+    compsOnNet1,netsOfComp1 = run("per-object",perObject,oEditor)
+    compsOnNet2,netsOfComp2 = run("graph",byGraph,oEditor)
+    
+    same = all(sorted(compsOnNet1[n]) == sorted(compsOnNet2[n]) for n in compsOnNet1) and \
+        all(sorted(netsOfComp1[c]) == sorted(netsOfComp2[c]) for c in netsOfComp1)
+    print("same result: %s"%same)
+
+if __name__ == '__main__':
+    main()
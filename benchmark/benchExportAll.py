@@ -0,0 +1,72 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of Solutions.exportAll on the stand-in design, export and compress one by one vs post process in thread pool.
+
+stand-in ExportNetworkData sleeps exportDelay seconds and writes a touchstone like file.
+
+usage: python benchExportAll.py [variations] [exportDelay] [MB]
+'''
+
+import sys,os
+import time
+import tempfile
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from recordingEditor import RecordingEditor,bindLayout
+from pyLayout.postData.solution import _compress
+
+def sequential(layout,outDir):
+    '''
+    before exportAll: exportNetworkData of each variation, compress after it
+    '''
+    paths = []
+    for solution in layout.Solutions.All.Values:
+        for i,variation in enumerate(solution.getVariations()):
+            path = os.path.join(outDir,"seq_%s_%s.s8p"%(solution.Name.replace(":","_"),i))
+            solution.exportNetworkData(path,variation = variation,portCount = 8)
+            paths.append(_compress(path))
+    return paths
+
+def main():
+    variations = int(sys.argv[1]) if len(sys.argv)>1 else 12
+    delay = float(sys.argv[2]) if len(sys.argv)>2 else 0.1
+    mb = float(sys.argv[3]) if len(sys.argv)>3 else 8
+    pyLayout.log.setLogLevel("ERROR")
+
+    oEditor = RecordingEditor()
+    layout = bindLayout(oEditor)
+    outDir = tempfile.mkdtemp()
+    layout._info.update("ProjectDir",outDir)
+    layout._info.update("ProjectName","bench")
+    layout._info.update("DesignName","board")
+    setups = layout.oDesign.GetModule("SolveSetups")
+    setups.sweeps = {"HFSS":["Sweep1","Sweep2"]}
+    layout.oDesign.GetModule("Excitations").ports = ["U1.A%s.DQ%s"%(i,i) for i in range(8)]
+    setups.variations = ["w='%smil' len='%smm'"%(3+i%3,i) for i in range(variations)]
+    layout.oDesign.exportDelay = delay
+    layout.oDesign.exportBytes = int(mb*1024*1024)
+    count = 2*variations
+    print("%s exports, %.2fs each, %.0f MB files"%(count,delay,mb))
+
+    t0 = time.time()
+    paths = sequential(layout,outDir)
+    print("%-24s %8.2fs  %s files"%("sequential",time.time()-t0,len(paths)))
+
+    for workers in [1,4]:
+        t0 = time.time()
+        summary = layout.Solutions.exportAll("HFSS:.*",variations = "all",workers = workers,outDir = outDir,compress = True)
+        print("%-24s %8.2fs  %s files, %.1f MB"%("exportAll workers=%s"%workers,time.time()-t0,len(summary.Paths),summary.TotalSize/1024.0/1024))
+    print(summary.report().splitlines()[0])
+    print(summary.report().splitlines()[-1])
+
+    for name in os.listdir(outDir):
+        os.remove(os.path.join(outDir,name))
+    os.rmdir(outDir)
+
+if __name__ == '__main__':
+    main()
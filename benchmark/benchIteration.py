@@ -0,0 +1,64 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of loop over layout.Pins, int index protocol (key list copied per step) vs __iter__.
+
+usage: python benchIteration.py [comps] [pinsPerComp]
+'''
+
+import sys,os
+import time
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from recordingEditor import RecordingEditor,BenchLayout
+
+def legacyLoop(objectDict):
+    '''
+    for loop by __getitem__(int) before __iter__
+    '''
+    dict1 = objectDict._dict
+    names = []
+    i = 0
+    while True:
+        try:
+            obj = dict1[list(dict1.keys())[i]]
+        except IndexError:
+            break
+        names.append(obj.name)
+        i += 1
+    return names
+
+def main():
+    comps = int(sys.argv[1]) if len(sys.argv)>1 else 400
+    pinsPerComp = int(sys.argv[2]) if len(sys.argv)>2 else 50
+    pyLayout.log.setLogLevel("WARNING")
+
+    oEditor = RecordingEditor.synthetic(comps,pinsPerComp)
+    layout = BenchLayout(oEditor)
+    pins = layout.Pins
+    count = len(pins)
+    print("%-10s %10s %10s %12s"%("mode","pins","time","per/s"))
+
+    t0 = time.time()
+    legacy = legacyLoop(pins.ObjectDict)
+    t1 = time.time()-t0
+    print("%-10s %10s %9.3fs %12.0f"%("index",count,t1,count/t1))
+
+    t0 = time.time()
+    names = [pin.name for pin in pins]
+    t2 = time.time()-t0
+    print("%-10s %10s %9.3fs %12.0f"%("iter",count,t2,count/t2))
+
+    t0 = time.time()
+    batches = [len(batch) for batch in pins.iterBatches(1000)]
+    t3 = time.time()-t0
+    print("%-10s %10s %9.3fs %12.0f"%("batches",sum(batches),t3,count/t3))
+
+    print("same result: %s"%(legacy == names))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of JobRunner with a stand-in solver process, blocking read per job vs asyncio runner.
+
+the stand-in prints progress lines, allocates memory and sleeps like ansysedt -batchsolve.
+
+usage: python benchJobRunner.py [jobs] [maxJobs] [seconds]
+'''
+
+import sys,os
+import time
+import subprocess
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.common.jobRunner import JobRunner
+
+solver = '''
+import sys,time
+seconds = float(sys.argv[1])
+data = bytearray(int(sys.argv[2])*1024*1024)
+for i in range(5):
+    print("solve pass %s"%i)
+    sys.stdout.flush()
+    time.sleep(seconds/5)
+sys.stderr.write("done\\n")
+sys.exit(int(sys.argv[3]))
+'''
+
+def standIn(seconds,mb,code = 0):
+    return [sys.executable,"-c",solver,str(seconds),str(mb),str(code)]
+
+def blocking(cmds):
+    '''
+    Layout.batchAnalysis before the runner, wait each job and read output line by line
+    '''
+    for cmd in cmds:
+        proc = subprocess.Popen(cmd,stdout = subprocess.PIPE,stderr = subprocess.DEVNULL)
+        for line in proc.stdout:
+            pass
+        proc.wait()
+
+def main():
+    jobs = int(sys.argv[1]) if len(sys.argv)>1 else 8
+    maxJobs = int(sys.argv[2]) if len(sys.argv)>2 else 4
+    seconds = float(sys.argv[3]) if len(sys.argv)>3 else 0.5
+    pyLayout.log.setLogLevel("ERROR")
+
+    cmds = [standIn(seconds,20*(i+1)) for i in range(jobs)]
+    t0 = time.time()
+    blocking(cmds)
+    print("%-24s %4s jobs %8.2fs"%("blocking per job",jobs,time.time()-t0))
+
+    runner = JobRunner(maxJobs = maxJobs,sampleInterval = 0.05)
+    t0 = time.time()
+    results = runner.runAll(cmds)
+    print("%-24s %4s jobs %8.2fs"%("JobRunner maxJobs=%s"%maxJobs,jobs,time.time()-t0))
+    for result in results[:3]:
+        print("  %s, %s lines"%(repr(result),result.OutputLines))
+
+    runner = JobRunner(maxJobs = 2,timeout = seconds/2,sampleInterval = 0.05)
+    results = runner.runAll([standIn(seconds*4,10),standIn(0,10,3)])
+    print("timeout and exit code: %s"%[(r.TimedOut,r.ReturnCode) for r in results])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of LicenseChecker with canned lmstat output, lmstat calls per check and per wait.
+
+usage: python benchLicense.py [checks] [busyRounds]
+'''
+
+import sys,os
+import re
+import time
+import asyncio
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.common.licenseChecker import LicenseChecker
+
+lmstatText = \
+'''lmutil - Copyright (c) 1989-2019 Flexera. All Rights Reserved.
+Flexible License Manager status on Sat 10/18/2026 10:00
+
+License server status: 1055@licsrv
+licsrv: license server UP (MASTER) v11.16.4
+
+Feature usage info:
+
+Users of electronics_desktop:  (Total of 20 licenses issued;  Total of 4 licenses in use)
+Users of elec_solve_hfss:  (Total of 10 licenses issued;  Total of %(hfss)s licenses in use)
+
+  "elec_solve_hfss" v2025.0630, vendor: ansyslmd, expiry: 30-jun-2026
+  floating license
+
+    user1 host1 host1 (v2025.0630) (licsrv/1055 101), start Sat 10/18 9:00
+
+Users of elec_solve_level1:  (Total of 10 licenses issued;  Total of 3 licenses in use)
+Users of elec_solve_level2:  (Total of 10 licenses issued;  Total of 3 licenses in use)
+Users of anshpc_pack:  (Total of 8 licenses issued;  Total of 2 licenses in use)
+Users of node_locked:  (Uncounted, node-locked)
+'''
+
+class CannedServer(object):
+    '''
+    elec_solve_hfss all in use for busyRounds polls
+    '''
+    def __init__(self,busyRounds = 0):
+        self.busyRounds = busyRounds
+        self.calls = 0
+
+    def __call__(self,cmd):
+        self.calls += 1
+        hfss = 10 if self.calls <= self.busyRounds else 3
+        text = lmstatText%{"hfss":hfss}
+        if " -f " in cmd:
+            #lmstat -f feature, only lines of the feature
+            feature = cmd.split(" -f ")[-1].strip()
+            return "\n".join([l for l in text.splitlines() if "Users of %s:"%feature in l])
+        return text
+
+def legacyCheckHFSSSolver(runner,server):
+    '''
+    LicenseChecker.checkHFSSSolver before the poller, one lmstat -f per feature
+    '''
+    for feature in ["elec_solve_hfss","elec_solve_level1","elec_solve_level2"]:
+        rst = runner("lmutil lmstat -c %s -f %s"%(server,feature))
+        total,used = re.findall(r"Total\D*(\d+)\D*issued;\D*Total\D*(\d+)\D*",rst,re.DOTALL)[0]
+        if int(total)-int(used) < 1:
+            return False
+    return True
+
+def main():
+    checks = int(sys.argv[1]) if len(sys.argv)>1 else 1000
+    busyRounds = int(sys.argv[2]) if len(sys.argv)>2 else 3
+    pyLayout.log.setLogLevel("ERROR")
+
+    server = CannedServer()
+    t0 = time.time()
+    legacy = [legacyCheckHFSSSolver(server,"1055@licsrv") for i in range(checks)]
+    print("%-24s %8s checks %8s lmstat %8.3fs"%("legacy lmstat -f",checks,server.calls,time.time()-t0))
+
+    server = CannedServer()
+    checker = LicenseChecker("1055@licsrv",runner = server)
+    t0 = time.time()
+    cached = [checker.checkHFSSSolver() for i in range(checks)]
+    print("%-24s %8s checks %8s lmstat %8.3fs"%("cached lmstat -a",checks,server.calls,time.time()-t0))
+    print("same result: %s"%(legacy == cached))
+
+    features = [{"module":"HFSSSolver"},{"feature":"anshpc_pack","count":2}]
+    checker = LicenseChecker("1055@licsrv",runner = CannedServer(busyRounds))
+    checker.interval = 0.01
+    t0 = time.time()
+    rst = checker.waitForlicense(features,timeout = 10)
+    print("%-24s %8s rounds %8s lmstat %8.3fs %s"%("waitForlicense",busyRounds+1,checker.pollCount,time.time()-t0,rst))
+
+    checker = LicenseChecker("1055@licsrv",runner = CannedServer(busyRounds))
+    checker.interval = 0.01
+    t0 = time.time()
+    rst = asyncio.run(checker.awaitFeatures(features,timeout = 10))
+    print("%-24s %8s rounds %8s lmstat %8.3fs %s"%("awaitFeatures",busyRounds+1,checker.pollCount,time.time()-t0,rst))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of logging on attribute access hot path (Primitive.__getattr__ -> ComplexDict) on SyntheticBoard:
+attribute reads per second and messages formatted, at INFO (debug skipped) and DEBUG (log file written synchronously or by background thread),
+and cost of one skipped log.debug call: eager "%s"%key formatting before the call vs deferred arguments.
+background writer helps on slow (network) disks, on local disk the GIL makes it about as fast as synchronous writing.
+
+console output is disabled during timing, only log file is written.
+
+usage: python benchLogging.py [pins] [rounds]
+'''
+
+import sys,os
+import time
+import timeit
+import logging
+import tempfile
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.common import log as logModule
+from boardGenerator import SyntheticBoard
+
+log = pyLayout.log
+formatted = [0]
+_formatMessage = logModule.formatMessage
+def countFormat(content,args):
+    formatted[0] += 1
+    return _formatMessage(content,args)
+logModule.formatMessage = countFormat
+
+def attributeAccess(pins,rounds):
+    count = 0
+    for r in range(rounds):
+        for pin in pins:
+            pin.Net
+            pin.Layer
+            count += 2
+    return count
+
+def callCost(count = 200000):
+    log.setLogLevel("INFO")
+    key = "Net"
+    logger = log.logger
+    def eager(content,*args):
+        #log.debug before deferred arguments
+        logger.debug(content+",".join(args))
+    old = timeit.timeit(lambda: eager("__getattr__ from _dict: %s"%key),number = count)/count
+    new = timeit.timeit(lambda: log.debug("__getattr__ from _dict: %s",key),number = count)/count
+    print("skipped log.debug at INFO: eager %.3f us, deferred %.3f us per call"%(old*1e6,new*1e6))
+
+def run(label,pins,rounds,level,path = None,background = True):
+    log.setPath(path,background = background)
+    log.setLogLevel(level)
+    formatted[0] = 0
+    t0 = time.time()
+    count = attributeAccess(pins,rounds)
+    t1 = time.time()
+    log.flush()
+    t2 = time.time()
+    print("%-28s %10.3f %12.0f %10s %10.3f"%(label,t1-t0,count/(t1-t0),formatted[0],t2-t1))
+
+def main():
+    pins = int(sys.argv[1]) if len(sys.argv)>1 else 10000
+    rounds = int(sys.argv[2]) if len(sys.argv)>2 else 5
+    log.setLogLevel("ERROR")
+    layout = SyntheticBoard.ofScale(pins).bindLayout()
+    pinObjs = list(layout.Pins)
+    for pin in pinObjs:
+        pin.parse()
+
+    log.logger.removeHandler(log.console_handler)
+    callCost()
+    folder = tempfile.mkdtemp()
+    print("%-28s %10s %12s %10s %10s"%("mode","seconds","access/s","formatted","flush(s)"))
+    run("INFO",pinObjs,rounds,"INFO")
+    run("DEBUG, file synchronous",pinObjs,rounds,"DEBUG",os.path.join(folder,"sync.log"),background = False)
+    run("DEBUG, file background",pinObjs,rounds,"DEBUG",os.path.join(folder,"background.log"),background = True)
+    run("INFO, file background",pinObjs,rounds,"INFO",os.path.join(folder,"info.log"),background = True)
+    log.stopListener()
+    log.logger.addHandler(log.console_handler)
+    for name in ["sync.log","background.log"]:
+        print("%s: %.1f MB"%(name,os.path.getsize(os.path.join(folder,name))/1048576.0))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of maps resolution, access rate of mapped properties on Layer and Setup objects.
+
+usage: python benchMaps.py [count]
+'''
+
+import sys,os
+import time
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.common import hfss3DLParameters
+from pyLayout.definition.layer import Layer
+from pyLayout.definition.setup import Setup
+from recordingEditor import RecordingEditor,BenchLayout
+
+layerInfo = ['Type: signal', 'TopBottomAssociation: Neither', 'Color: 6599935d', 'IsVisible: true', 'IsLocked: false', 
+    'LayerId: 1', 'Index: 1', 'LayerThickness: 4.826e-05', 'EtchFactor: -2.5', 'IsIgnored: false', 'NumberOfSublayers: 1', 
+    'Material0: copper', 'FillMaterial0: TOP_FILL', 'Thickness0: 0.04826mm', 'LowerElevation0: 1.98628mm']
+
+def rate(func,count):
+    start = time.time()
+    for i in range(count):
+        func()
+    return count/(time.time() - start)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv)>1 else 20000
+    pyLayout.log.setLogLevel("WARNING")
+    
+    oEditor = RecordingEditor()
+    oEditor.layers["TOP"] = layerInfo
+    layout = BenchLayout(oEditor)
+    layout.oDesign.modules["SolveSetups"].setups["HFSS_Setup"] = hfss3DLParameters.hfssSetup
+    
+    layer = Layer("TOP",layout = layout)
+    setup = Setup("HFSS_Setup",layout = layout)
+    info = layer.Info
+    
+    cases = [
+        ("Layer.Thickness",lambda: info.Thickness),
+        ("Layer.Material",lambda: info["material"]),
+        ("Layer.Upper",lambda: info.Upper),
+        ("Layer.EtchAngle",lambda: info.EtchAngle),
+        ("Setup.Order",lambda: setup.Array["Order"]),
+        ("Setup.MaxPasses",lambda: setup.MaxPasses),
+        ("Setup.parse",lambda: Setup("HFSS_Setup",layout = layout).parse()),
+        ]
+    
+    print("%-20s %14s"%("property","access/s"))
+    for name,func in cases:
+        try:
+            print("%-20s %14.0f"%(name,rate(func,count)))
+        except Exception as e:
+            print("%-20s %14s"%(name,"error: %s"%str(e)))
+
+if __name__ == '__main__':
+    main()
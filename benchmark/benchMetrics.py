@@ -0,0 +1,98 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of S-parameter metrics on a synthetic 128 ports matrix, loop per pair and frequency vs SParamMetrics.
+
+ports: 32 single ended channels U1.Ax.DQi -> U2.Bx.DQi and 16 differential channels U1.Cx.CLKi_P/N -> U2.Dx.CLKi_P/N
+
+usage: python benchMetrics.py [freqs], numpy required
+'''
+
+import sys,os
+import time
+import math
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.postData.metrics import SParamMetrics,findChannels,findDiffPairs,np
+
+def synthetic(freqCount):
+    names = []
+    for i in range(32):
+        names += ["U1.A%s.DQ%s"%(i,i),"U2.B%s.DQ%s"%(i,i)]
+    for i in range(16):
+        for s in ["P","N"]:
+            names += ["U1.C%s%s.CLK%s_%s"%(i,s,i,s),"U2.D%s%s.CLK%s_%s"%(i,s,i,s)]
+    rng = np.random.default_rng(0)
+    count = len(names)
+    S = 0.05*(rng.standard_normal((freqCount,count,count)) + 1j*rng.standard_normal((freqCount,count,count)))
+    S = 0.5*(S + S.transpose(0,2,1))
+    return np.linspace(1e7,20e9,freqCount),S,names
+
+def dB(value):
+    return 20*math.log10(max(abs(value),1e-30))
+
+def loopMetrics(S,names):
+    '''
+    one python loop per pair and frequency, dict of (metric,victim,aggressor): worst
+    '''
+    result = {}
+    freqCount = len(S)
+    def add(metric,v,a,values,worst):
+        result[(metric,v,a)] = worst(values)
+
+    def channelMetrics(get,channels,prefix):
+        for net,near,far in channels:
+            add(prefix+"21",net,net,[dB(get(k,far,near)) for k in range(freqCount)],min)
+            add(prefix+"11",net,net,[dB(get(k,near,near)) for k in range(freqCount)],max)
+            add(prefix+"22",net,net,[dB(get(k,far,far)) for k in range(freqCount)],max)
+        for vnet,vnear,vfar in channels:
+            for gnet,gnear,gfar in channels:
+                if vnet == gnet:
+                    continue
+                add(prefix+"NEXT",vnet,gnet,[dB(get(k,vnear,gnear)) for k in range(freqCount)],max)
+                add(prefix+"FEXT",vnet,gnet,[dB(get(k,vfar,gnear)) for k in range(freqCount)],max)
+
+    channelMetrics(lambda k,i,j: S[k][i][j],findChannels(names),"S")
+
+    pairs = findDiffPairs(names)
+    def sdd(k,a,b):
+        pa,na = pairs[a][1],pairs[a][2]
+        pb,nb = pairs[b][1],pairs[b][2]
+        return 0.5*(S[k][pa][pb] - S[k][pa][nb] - S[k][na][pb] + S[k][na][nb])
+    diffNames = ["%s.diff.%s"%tuple(p[0].split(".",1)) for p in pairs]
+    channelMetrics(sdd,findChannels(diffNames),"SDD")
+    return result
+
+def main():
+    freqCount = int(sys.argv[1]) if len(sys.argv)>1 else 200
+    pyLayout.log.setLogLevel("ERROR")
+    if np is None:
+        print("numpy not installed, skip metrics benchmark")
+        return
+
+    freq,S,names = synthetic(freqCount)
+    print("%s ports x %s freqs"%(len(names),freqCount))
+
+    nested = S.tolist() #loop on python lists, numpy scalar indexing is slower
+    t0 = time.time()
+    loop = loopMetrics(nested,names)
+    t1 = time.time()-t0
+    print("%-16s %8.2fs  %s rows"%("loop",t1,len(loop)))
+
+    t0 = time.time()
+    table = SParamMetrics(freq,S,names).getTable()
+    t2 = time.time()-t0
+    print("%-16s %8.3fs  %s rows  (%.0fx)"%("SParamMetrics",t2,len(table),t1/max(t2,1e-9)))
+
+    err = max(abs(loop[(r["Metric"],r["Victim"],r["Aggressor"])] - r["Worst"]) for r in table)
+    print("same rows: %s, max difference: %g"%(len(loop) == len(table),err))
+    for metric in ["S21","S11","SNEXT","SFEXT","SDD21","SDDFEXT"]:
+        rows = table[table["Metric"] == metric]
+        print("  %-8s %5s rows, worst %.2f dB"%(metric,len(rows),rows["Worst"].max()))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of Layout.__getitem__ and Layout.delete, probe all collections vs name index.
+
+usage: python benchNameIndex.py [comps] [pinsPerComp] [deletes]
+
+default run (500 gets and deletes of 5000 pins, stand-in editor):
+mode        objects  get calls   get time  del calls   del time
+probe           500          1     0.026s       1022     0.071s
+index           500          1     0.044s         20     0.007s
+
+get: index is not built by __getitem__, same probe while Pins is the first collection probed.
+delete: legacy reads Type of every object, index is built once (FindObjects('Type','*') + FilterObjectList per type)
+and sends one oEditor.Delete.
+'''
+
+import sys,os
+import time
+import random
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from recordingEditor import RecordingEditor,bindLayout
+
+def legacyGetItem(layout,key):
+    '''
+    Layout.__getitem__ before name index
+    '''
+    for ele in layout.primitiveTypes:
+        collection = ele+"s"
+        if key in layout._info[collection]:
+            return layout._info[collection][key]
+    return None
+
+def legacyDelete(layout,objs):
+    '''
+    Layout.delete before name index
+    '''
+    for name in objs:
+        try:
+            obj = layout.Objects[name]
+            layout[obj.Type+"s"].pop(name)
+        except:
+            pass
+    layout.oEditor.Delete(objs)
+    layout.Objects.refresh()
+
+def run(label,comps,pinsPerComp,names,getItem,delete):
+    oEditor = RecordingEditor.synthetic(comps,pinsPerComp)
+    layout = bindLayout(oEditor)
+    oEditor.reset()
+    t0 = time.time()
+    found = [getItem(layout,name).name for name in names]
+    t1 = time.time()-t0
+    getCalls = oEditor.CallCount
+
+    oEditor.reset()
+    t0 = time.time()
+    delete(layout,names)
+    t2 = time.time()-t0
+    print("%-10s %8s %10s %9.3fs %10s %9.3fs"%(label,len(names),getCalls,t1,oEditor.CallCount,t2))
+    return found,sorted(oEditor.objects.keys())
+
+def main():
+    comps = int(sys.argv[1]) if len(sys.argv)>1 else 100
+    pinsPerComp = int(sys.argv[2]) if len(sys.argv)>2 else 50
+    count = int(sys.argv[3]) if len(sys.argv)>3 else 500
+    pyLayout.log.setLogLevel("ERROR")
+
+    random.seed(0)
+    names = random.sample(["U%s-%s"%(c,p) for c in range(1,comps+1) for p in range(1,pinsPerComp+1)],count)
+    print("%-10s %8s %10s %10s %10s %10s"%("mode","objects","get calls","get time","del calls","del time"))
+    legacy = run("probe",comps,pinsPerComp,names,legacyGetItem,legacyDelete)
+    indexed = run("index",comps,pinsPerComp,names,lambda layout,name: layout[name],lambda layout,objs: layout.delete(objs))
+    print("same result: %s"%(legacy == indexed))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of Components.findComponentByPin for pins not named like U1-A1, 
+hasPin scan over all components vs pin -> component index.
+
+usage: python benchPinIndex.py [comps] [pinsPerComp] [irregularPins]
+'''
+
+import sys,os
+import time
+import random
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from recordingEditor import RecordingEditor,BenchLayout
+
+def addIrregularPins(oEditor,comps,count):
+    '''
+    pins named PAD<n>, belong to random components
+    '''
+    random.seed(0)
+    names = []
+    for i in range(count):
+        name = "PAD%s"%i
+        comp = "U%s"%random.randint(1,comps)
+        oEditor.addObject(name,"pin",Net = "NET_PAD%s"%i,Layer = "TOP",Component_Pin = name)
+        oEditor.compPins.pop(name,None)
+        oEditor.compPins[comp].append(name)
+        names.append(name)
+    return names
+
+def legacyFindComponentByPin(layout,pinName):
+    '''
+    findComponentByPin before pin index
+    '''
+    for component in layout.Components.All:
+        for pin in component.PinNames:
+            if pin.lower() == pinName.lower():
+                return component
+    return None
+
+def main():
+    comps = int(sys.argv[1]) if len(sys.argv)>1 else 2000
+    pinsPerComp = int(sys.argv[2]) if len(sys.argv)>2 else 10
+    count = int(sys.argv[3]) if len(sys.argv)>3 else 200
+    pyLayout.log.setLogLevel("WARNING")
+
+    oEditor = RecordingEditor.synthetic(comps,pinsPerComp)
+    pins = addIrregularPins(oEditor,comps,count)
+    print("%-10s %8s %12s %10s"%("mode","pins","COM calls","time"))
+
+    layout = BenchLayout(oEditor)
+    layout.Components.ObjectDict
+    oEditor.reset()
+    t0 = time.time()
+    legacy = [legacyFindComponentByPin(layout,pin).Name for pin in pins]
+    print("%-10s %8s %12s %9.3fs"%("scan",count,oEditor.CallCount,time.time()-t0))
+
+    layout = BenchLayout(oEditor)
+    layout.Components.ObjectDict
+    oEditor.reset()
+    t0 = time.time()
+    indexed = [layout.Components.findComponentByPin(pin).Name for pin in pins]
+    print("%-10s %8s %12s %9.3fs"%("index",count,oEditor.CallCount,time.time()-t0))
+
+    oEditor.reset()
+    t0 = time.time()
+    parsed = [layout.Pins[pin].CompName for pin in pins]
+    print("%-10s %8s %12s %9.3fs"%("Pin.parse",count,oEditor.CallCount,time.time()-t0))
+
+    print("same result: %s"%(legacy == indexed == parsed))
+
+if __name__ == '__main__':
+    main()
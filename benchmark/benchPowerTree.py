@@ -0,0 +1,49 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of Path power tree search, all rails from VRM to sink ICs in one search.
+
+usage: python benchPowerTree.py [rails] [depth] [fanout]
+
+deep chain (fanout 1, depth 3000) is more than python recursion limit of recursive search.
+'''
+
+import sys,os
+import time
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.definition.path import Path
+from recordingEditor import RecordingEditor,BenchLayout
+
+def run(rails,depth,fanout):
+    oEditor = RecordingEditor.powerTree(rails,depth,fanout)
+    layout = BenchLayout(oEditor)
+    sinks = [[name,oEditor.objects[name+"-1"]["Net"]] for name,info in oEditor.objects.items() if info["Type"] == "component" and name.startswith("S")]
+    comps = len([info for info in oEditor.objects.values() if info["Type"] == "component"])
+    
+    oEditor.reset()
+    start = time.time()
+    path = Path(layout = layout)
+    path.startNodes = [["U%s"%r,"VR%s"%r] for r in range(1,rails+1)]
+    path.endNodes = sinks
+    path.search()
+    cost = time.time() - start
+    ends = len([n for n in path.nodes if n.Type == "End"])
+    print("%6s %6s %6s %8s %8s %8s/%-8s %10s %9.3fs"%(rails,depth,fanout,comps,len(path.nodes),ends,len(sinks),oEditor.CallCount,cost))
+
+def main():
+    rails = int(sys.argv[1]) if len(sys.argv)>1 else 4
+    pyLayout.log.setLogLevel("WARNING")
+    print("%6s %6s %6s %8s %8s %17s %10s %10s"%("rails","depth","fanout","comps","nodes","ends","COM calls","time"))
+    if len(sys.argv)>2:
+        run(rails,int(sys.argv[2]),int(sys.argv[3]) if len(sys.argv)>3 else 2)
+        return
+    for depth,fanout in [(5,2),(10,2),(3000,1)]:
+        run(rails,depth,fanout)
+
+if __name__ == '__main__':
+    main()
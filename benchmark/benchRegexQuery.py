@@ -0,0 +1,70 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of Nets.getRegularNets and regAnyMatch, re.match per name and pattern vs NameQuery.
+
+usage: python benchRegexQuery.py [buses] [bits]
+'''
+
+import sys,os
+import re
+import time
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.common.common import regAnyMatch
+from recordingEditor import RecordingEditor,bindLayout
+
+def legacyGetRegularNets(nets,regNets):
+    '''
+    Nets.getRegularNets before NameQuery, bus expansion skipped
+    '''
+    result = []
+    for regNet in regNets:
+        regNet = regNet.replace("$","\\$").strip()
+        result += filter(lambda x: re.match(regNet+"$",x,re.IGNORECASE),nets.NameList)
+    return result
+
+def legacyRegAnyMatch(regs,val):
+    return any([re.match(r+"$",val,re.IGNORECASE) for r in regs])
+
+def timeit(func,*args):
+    t0 = time.time()
+    result = func(*args)
+    return result,time.time()-t0
+
+def main():
+    buses = int(sys.argv[1]) if len(sys.argv)>1 else 200
+    bits = int(sys.argv[2]) if len(sys.argv)>2 else 200
+    pyLayout.log.setLogLevel("ERROR")
+
+    oEditor = RecordingEditor()
+    for b in range(buses):
+        for i in range(bits):
+            oEditor.addObject("line_%s_%s"%(b,i),"line",Net = "BUS%s_D%s"%(b,i),Layer = "TOP",LineWidth = "0.1mm")
+    layout = bindLayout(oEditor)
+    nets = layout.Nets
+    patterns = ["BUS%s_D\\d+"%b for b in range(buses)]
+    print("nets: %s, patterns: %s"%(len(nets.NameList),len(patterns)))
+
+    legacy,t0 = timeit(legacyGetRegularNets,nets,patterns)
+    first,t1 = timeit(nets.getRegularNets,patterns)
+    again,t2 = timeit(nets.getRegularNets,patterns)
+    print("%-28s %10.3fs"%("getRegularNets re.match",t0))
+    print("%-28s %10.3fs"%("getRegularNets query",t1))
+    print("%-28s %10.3fs"%("getRegularNets memoized",t2))
+    print("same result: %s"%(legacy == first == again))
+
+    regs = ["C\\d+","R\\d+","L\\d+","FB\\d+","U\\d+_PWR"]
+    names = ["C%s"%i for i in range(20000)] + ["U%s"%i for i in range(20000)]
+    legacy,t0 = timeit(lambda: [bool(legacyRegAnyMatch(regs,n)) for n in names])
+    query,t1 = timeit(lambda: [bool(regAnyMatch(regs,n)) for n in names])
+    print("%-28s %10.3fs"%("regAnyMatch re.match",t0))
+    print("%-28s %10.3fs"%("regAnyMatch merged",t1))
+    print("same result: %s"%(legacy == query))
+
+if __name__ == '__main__':
+    main()
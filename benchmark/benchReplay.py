@@ -0,0 +1,82 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of COM record/replay: record a session on the stand-in desktop, then time initDesign, pin parse, stackup and power tree
+search on the replayed session (no AEDT, no stand-in), and check results are same as live session.
+
+with a real AEDT, record once by Layout.recordCom() and replay the file here by: python benchReplay.py path.comrec.gz
+
+usage: python benchReplay.py [rails] [depth] [fanout]
+'''
+
+import sys,os
+import time
+import tempfile
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.pyLayout import Layout
+from pyLayout.definition.path import Path
+from recordingEditor import RecordingEditor,RecordingDesktop
+
+def stages(layout):
+    '''
+    (name,function) of timed stages, function return a value to compare live and replay
+    '''
+    def pins():
+        return sorted([(pin.Name,pin.Net) for pin in layout.Pins.ObjectDict.Values])
+    def stackup():
+        return [(name,str(layout.Layers[name].Upper)) for name in layout.Layers.LayerNames]
+    def powerTree():
+        comps = layout.Components.ObjectDict.Keys
+        path = Path(layout = layout)
+        path.startNodes = [[c,layout.Pins["%s-1"%c].Net] for c in comps if c.startswith("U")]
+        path.endNodes = [[c,layout.Pins["%s-1"%c].Net] for c in comps if c.startswith("S")]
+        path.search()
+        return len(path.nodes)
+    return [("initDesign",layout.initDesign),("pins",pins),("stackup",stackup),("powerTree",powerTree)]
+
+def run(label,layout):
+    results = []
+    total = 0
+    line = []
+    for name,func in stages(layout):
+        t0 = time.time()
+        results.append(func())
+        t = time.time()-t0
+        total += t
+        line.append("%s %.3fs"%(name,t))
+    print("%-16s %s, total %.3fs"%(label,", ".join(line),total))
+    return results
+
+def main():
+    pyLayout.log.setLogLevel("ERROR")
+    folder = tempfile.mkdtemp()
+    if len(sys.argv)>1 and os.path.exists(sys.argv[1]):
+        layout = Layout.fromReplay(sys.argv[1],projectDir = folder)
+        run("replay",layout)
+        print(layout.ReplaySession)
+        return
+
+    rails = int(sys.argv[1]) if len(sys.argv)>1 else 4
+    depth = int(sys.argv[2]) if len(sys.argv)>2 else 8
+    fanout = int(sys.argv[3]) if len(sys.argv)>3 else 2
+    oEditor = RecordingEditor.powerTree(rails,depth,fanout)
+    oEditor.addStackup(12)
+
+    layout = Layout(oDesktop = RecordingDesktop(oEditor,folder))
+    recorder = layout.recordCom()
+    live = run("live stand-in",layout)
+    path = recorder.save(os.path.join(folder,"bench.comrec.gz"))
+    print("%s, file %.1f KB"%(recorder,os.path.getsize(path)/1024.0))
+
+    for latency in [0,1]:
+        layout = Layout.fromReplay(path,latency = latency,projectDir = folder)
+        replay = run("replay latency=%s"%latency,layout)
+        print("  %s, same result: %s"%(layout.ReplaySession,replay[1:] == live[1:]))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of Primitives.snapshot, count COM calls of reading Net, Layer, Location and Start Layer for all pins.
+
+usage: python benchSnapshot.py [comps] [pinsPerComp]
+'''
+
+import sys,os
+import time
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from boardGenerator import SyntheticBoard
+
+props = ["Net","Layer","Location","Start Layer"]
+
+def readPins(layout):
+    for pin in layout.Pins.All:
+        for prop in props:
+            pin[prop]
+
+def run(label,board,snapshot = False):
+    layout = board.bindLayout()
+    oEditor = board.oEditor
+    oEditor.reset()
+    start = time.time()
+    if snapshot:
+        layout.Pins.snapshot(props)
+    readPins(layout)
+    readPins(layout) #second pass, from buffer
+    cost = time.time() - start
+    print("%-12s %10s %12s %10.3fs  %s"%(label,layout.Pins.Count,oEditor.CallCount,cost,dict(oEditor.calls)))
+    return oEditor.CallCount
+
+def main():
+    comps = int(sys.argv[1]) if len(sys.argv)>1 else 200
+    pinsPerComp = int(sys.argv[2]) if len(sys.argv)>2 else 50
+    pyLayout.log.setLogLevel("WARNING")
+
+    board = SyntheticBoard(comps,pinsPerComp,layers = 4).build()
+    print("%-12s %10s %12s %11s"%("mode","pins","COM calls","time"))
+    before = run("per-object",board)
+    after = run("snapshot",board,snapshot=True)
+    print("COM calls reduced: %.1fx"%(before*1.0/max(after,1)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of SpatialIndex, point queries by oEditor.FindObjectsByPoint vs local grid index.
+
+usage: python benchSpatialIndex.py [comps] [pinsPerComp] [queries]
+'''
+
+import sys,os
+import time
+import random
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.primitive.spatialIndex import SpatialIndex
+from recordingEditor import RecordingEditor,BenchLayout
+
+def randomPoints(comps,pinsPerComp,count):
+    random.seed(0)
+    return [[random.uniform(0,(comps+1)*10e-3),random.uniform(0,(pinsPerComp+1)*0.5e-3)] for i in range(count)]
+
+def byEditor(oEditor,points):
+    result = []
+    for x,y in points:
+        result.append(list(oEditor.FindObjectsByPoint(oEditor.Point().Set(x,y),"TOP")))
+    return result
+
+def main():
+    comps = int(sys.argv[1]) if len(sys.argv)>1 else 50
+    pinsPerComp = int(sys.argv[2]) if len(sys.argv)>2 else 50
+    count = int(sys.argv[3]) if len(sys.argv)>3 else 10000
+    pyLayout.log.setLogLevel("WARNING")
+    
+    oEditor = RecordingEditor.synthetic(comps,pinsPerComp)
+    layout = BenchLayout(oEditor)
+    points = randomPoints(comps,pinsPerComp,count)
+    print("%-10s %10s %10s %12s %10s"%("mode","objects","queries","COM calls","time"))
+    
+    oEditor.reset()
+    start = time.time()
+    expected = byEditor(oEditor,points)
+    print("%-10s %10s %10s %12s %9.3fs"%("editor",len(oEditor.bboxes),count,oEditor.CallCount,time.time() - start))
+    
+    oEditor.reset()
+    start = time.time()
+    index = SpatialIndex(layout = layout,layers = ["TOP"]).build()
+    build = time.time() - start
+    result = index.queryMany(points,layer = "TOP")
+    print("%-10s %10s %10s %12s %9.3fs  (build %.3fs)"%("index",index.Count,count,oEditor.CallCount,time.time() - start,build))
+    
+    same = all(sorted(a) == sorted(b) for a,b in zip(expected,result))
+    print("same result: %s"%same)
+
+if __name__ == '__main__':
+    main()
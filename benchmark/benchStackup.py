@@ -0,0 +1,77 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of Layers.getLayerByHeight, per vertex search on layer objects vs StackupTable search.
+
+usage: python benchStackup.py [conductors] [heights]
+'''
+
+import sys,os
+import time
+import random
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.common.unit import Unit
+from recordingEditor import RecordingEditor,BenchLayout
+
+def legacyGetLayerByHeight(layers,height):
+    '''
+    getLayerByHeight before StackupTable, adjust = "Near"
+    '''
+    flayer = None
+    distance = 1e9
+    height = Unit(height)
+    for name in layers.LayerNames[::-1]:
+        layer = layers.DefinitionDict[name]
+        if layer["Type"] != "signal":
+            continue
+        if height> layer.Upper:
+            distance1 = height - layer.Upper
+        elif height<layer.Lower:
+            distance1 = height - layer.Lower
+        else:
+            return name
+        if abs(distance1)<abs(distance):
+            distance = distance1
+            flayer = name
+    return flayer
+
+def main():
+    conductors = int(sys.argv[1]) if len(sys.argv)>1 else 16
+    count = int(sys.argv[2]) if len(sys.argv)>2 else 2000
+    pyLayout.log.setLogLevel("WARNING")
+
+    oEditor = RecordingEditor().addStackup(conductors)
+    layout = BenchLayout(oEditor)
+    total = layout.Layers.table.Upper[0]
+    random.seed(0)
+    heights = ["%smm"%(random.uniform(0,total)*1e3) for i in range(count)]
+    print("%-10s %10s %12s %10s %10s"%("mode","heights","COM calls","time","per/s"))
+
+    oEditor.reset()
+    t0 = time.time()
+    legacy = [legacyGetLayerByHeight(layout.Layers,h) for h in heights]
+    t1 = time.time()-t0
+    print("%-10s %10s %12s %9.3fs %10.0f"%("legacy",count,oEditor.CallCount,t1,count/t1))
+
+    layout.Layers.invalidate()
+    oEditor.reset()
+    t0 = time.time()
+    scalar = [layout.Layers.getLayerByHeight(h) for h in heights]
+    t2 = time.time()-t0
+    print("%-10s %10s %12s %9.3fs %10.0f"%("scalar",count,oEditor.CallCount,t2,count/t2))
+
+    oEditor.reset()
+    t0 = time.time()
+    vector = layout.Layers.getLayerByHeight(heights)
+    t3 = time.time()-t0
+    print("%-10s %10s %12s %9.3fs %10.0f"%("vector",count,oEditor.CallCount,t3,count/t3))
+
+    print("same result: %s"%(legacy == scalar == vector))
+
+if __name__ == '__main__':
+    main()
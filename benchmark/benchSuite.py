@@ -0,0 +1,195 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark suite of pyLayout hot paths on SyntheticBoard, at 1k/10k/100k pins scales.
+
+each case runs on a new Layout bound to the board (board build and layout bind are not timed),
+results are written as json: one record per (case, scale) with seconds, COM calls and environment, for trend tracking.
+
+usage:
+    python benchSuite.py                                  all cases at 1k,10k
+    python benchSuite.py --scales 1k,10k,100k --out results.json
+    python benchSuite.py --cases regexLookup,pathSearch --repeat 3
+'''
+
+import sys,os
+import time
+import json
+import platform
+import argparse
+import subprocess
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.definition.path import Path
+from boardGenerator import SyntheticBoard
+from recordingEditor import RecordingEditor,bindLayout
+
+
+#--- cases: prepare(layout) is not timed, run(layout,prepared) is timed, return count of processed items
+
+def collectionLoad(layout,prepared):
+    return len(layout.Pins.ObjectDict) + len(layout.Vias.ObjectDict) + len(layout.Components.ObjectDict)
+
+def iteration(layout,prepared):
+    count = 0
+    for pin in layout.Pins:
+        count += 1
+    for via in layout.Vias:
+        count += 1
+    return count
+
+def propertyAccess(layout,prepared):
+    pins = prepared
+    nets = [pin.Net for pin in pins]
+    xs = [pin.X for pin in pins]
+    return len(nets) + len(xs)
+
+def regexLookup(layout,prepared):
+    count = 0
+    for pattern in [r"U1\d*-1\d+",r"U\d+-2.*",r".*-4\d+",r"via_1[0-9]+"]:
+        count += len(layout.Pins[pattern]) if not pattern.startswith("via") else len(layout.Vias[pattern])
+    return count
+
+def regularNets(layout,prepared):
+    return len(layout.Nets.getRegularNets(r"NET_1\d+ NET_[63:0] NET_.*7 VDD GND"))
+
+def definitionLoad(layout,prepared):
+    count = 0
+    for collection in [layout.PadStacks,layout.Materials,layout.ComponentDefs]:
+        for name in collection.DefinitionDict.Keys:
+            collection[name].parse()
+            count += 1
+    return count
+
+def setLayerDatas(layout,prepared):
+    layout.Layers.setLayerDatas(prepared,mode = 1)
+    return len(prepared)
+
+def portsReorder(layout,prepared):
+    comps = sorted(set([name.split(".")[0] for name in layout.Ports.NameList]))
+    return len(layout.Ports.reorder(compOrder = comps[::-2]))
+
+def gridPins(layout,prepared):
+    grid = layout.Components[0]._gridPins(prepared,20,20)
+    return sum([len(v) for v in grid.values()])
+
+def pathSearch(layout,prepared):
+    path = Path(layout = layout)
+    path.startNodes,path.endNodes = prepared
+    path.search()
+    return len(path.nodes)
+
+
+def preparePins(layout):
+    pins = list(layout.Pins)
+    for pin in pins:
+        pin.parse()
+    return pins
+
+def prepareLayers(layout):
+    #thickness of dielectric layers changed, by index
+    infos = []
+    for layer in layout.Layers.All:
+        info = {"Name":layer.Name,"Type":layer["Type"],"Thickness":layer["Thickness"]}
+        if layer["Type"] == "dielectric":
+            info.update({"Thickness":"0.09mm","DK":4.1,"DF":0.015})
+        infos.append(info)
+    return infos
+
+def preparePowerTree(layout):
+    editor = layout.oEditor
+    comps = [name for name,info in editor.objects.items() if info["Type"] == "component"]
+    starts = [[c,editor.objects[c+"-1"]["Net"]] for c in comps if c.startswith("U")]
+    ends = [[c,editor.objects[c+"-1"]["Net"]] for c in comps if c.startswith("S")]
+    return starts,ends
+
+
+def powerTreeLayout(scale):
+    '''
+    PDN board of about scale pins for Path.search, 6 levels of resistors, fanout 2
+    '''
+    rails = max(1,scale//800)
+    return bindLayout(RecordingEditor.powerTree(rails = rails,depth = 6,fanout = 2))
+
+#name -> (run,prepare,layout factory)
+cases = [
+    ("collectionLoad",collectionLoad,None,None),
+    ("iteration",iteration,lambda layout: layout.Pins.ObjectDict and layout.Vias.ObjectDict,None),
+    ("propertyAccess",propertyAccess,preparePins,None),
+    ("regexLookup",regexLookup,lambda layout: layout.Pins.ObjectDict and layout.Vias.ObjectDict,None),
+    ("getRegularNets",regularNets,None,None),
+    ("definitionLoad",definitionLoad,None,None),
+    ("setLayerDatas",setLayerDatas,prepareLayers,None),
+    ("portsReorder",portsReorder,None,None),
+    ("gridPins",gridPins,preparePins,None),
+    ("pathSearch",pathSearch,preparePowerTree,powerTreeLayout),
+    ]
+
+
+def parseScale(text):
+    text = text.strip().lower()
+    if text.endswith("k"):
+        return int(float(text[:-1])*1000)
+    if text.endswith("m"):
+        return int(float(text[:-1])*1000000)
+    return int(text)
+
+def gitRevision():
+    try:
+        return subprocess.check_output(["git","rev-parse","--short","HEAD"],cwd = appDir,stderr = subprocess.STDOUT).decode().strip()
+    except Exception:
+        return None
+
+def runCase(name,run,prepare,factory,scale,board,repeat):
+    best = None
+    for i in range(repeat):
+        layout = factory(scale) if factory else board.bindLayout()
+        prepared = prepare(layout) if prepare else None
+        layout.oEditor.reset()
+        t0 = time.time()
+        count = run(layout,prepared)
+        seconds = time.time()-t0
+        if best == None or seconds < best[0]:
+            best = (seconds,layout.oEditor.CallCount,count)
+    seconds,calls,count = best
+    return {"Case":name,"Scale":scale,"Seconds":round(seconds,6),"ComCalls":calls,"Items":count,
+            "ItemsPerSecond":round(count/seconds,1) if seconds > 0 else None}
+
+def main():
+    parser = argparse.ArgumentParser(description = "pyLayout benchmark suite on synthetic boards")
+    parser.add_argument("--scales",default = "1k,10k",help = "pins of board, comma separated: 1k,10k,100k")
+    parser.add_argument("--cases",default = None,help = "case names, comma separated, default all")
+    parser.add_argument("--repeat",type = int,default = 1,help = "best of repeat runs")
+    parser.add_argument("--layers",type = int,default = 8,help = "conductor layers")
+    parser.add_argument("--out",default = None,help = "json result path")
+    args = parser.parse_args()
+    pyLayout.log.setLogLevel("ERROR")
+
+    selected = args.cases.split(",") if args.cases else None
+    results = []
+    print("%-16s %8s %10s %10s %10s %12s"%("case","scale","seconds","COM calls","items","items/s"))
+    for scale in [parseScale(s) for s in args.scales.split(",")]:
+        t0 = time.time()
+        board = SyntheticBoard.ofScale(scale,layers = args.layers).build()
+        print("%s, build %.1fs"%(board,time.time()-t0))
+        for name,run,prepare,factory in cases:
+            if selected and name not in selected:
+                continue
+            result = runCase(name,run,prepare,factory,scale,board,args.repeat)
+            results.append(result)
+            print("%-16s %8s %10.4f %10s %10s %12s"%(name,scale,result["Seconds"],result["ComCalls"],result["Items"],result["ItemsPerSecond"]))
+
+    report = {"Time":time.strftime("%Y-%m-%dT%H:%M:%S"),"Revision":gitRevision(),"Python":platform.python_version(),
+              "Platform":platform.platform(),"Results":results}
+    if args.out:
+        with open(args.out,"w") as f:
+            json.dump(report,f,indent = 2)
+        print("results written to: %s"%args.out)
+    return report
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of Touchstone read/write, readlines and float per token vs chunked reader.
+
+peak memory is measured by tracemalloc (numpy report its buffers to tracemalloc).
+
+usage: python benchTouchstone.py [ports] [freqs] [legacy], default 96 ports x 4000 frequencies, numpy required
+
+readlines needs about 5 times of file size memory, it is measured if file is smaller than legacyLimitMB
+or "legacy" is given (about 5 GB for the default size).
+'''
+
+import sys,os
+import time
+import tempfile
+import tracemalloc
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.postData.touchstone import Touchstone,np
+
+def legacyRead(path,portCount):
+    '''
+    readlines, split and float every token, complex nested list
+    '''
+    with open(path) as f:
+        lines = f.readlines()
+    values = []
+    for line in lines:
+        line = line.split("!")[0].strip()
+        if not line or line.startswith("#"):
+            continue
+        values += [float(t) for t in line.split()]
+    rowLen = 1+2*portCount*portCount
+    freq = []
+    data = []
+    for k in range(0,len(values),rowLen):
+        row = values[k:k+rowLen]
+        freq.append(row[0]*1e9)
+        cells = [complex(row[i],row[i+1]) for i in range(1,rowLen,2)]
+        data.append([cells[i*portCount:(i+1)*portCount] for i in range(portCount)])
+    return freq,data
+
+def synthetic(portCount,freqCount):
+    freq = np.array([1e7*(k+1) for k in range(freqCount)])
+    rng = np.random.default_rng(0)
+    data = rng.uniform(-1,1,(freqCount,portCount,portCount)) + 1j*rng.uniform(-1,1,(freqCount,portCount,portCount))
+    return freq,data
+
+def measure(func,*args):
+    '''
+    time of untraced run, peak memory of a traced run
+    '''
+    t0 = time.time()
+    result = func(*args)
+    t1 = time.time()-t0
+    result = None
+    tracemalloc.start()
+    result = func(*args)
+    current,peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result,t1,peak/1024.0/1024
+
+legacyLimitMB = 200
+
+def main():
+    portCount = int(sys.argv[1]) if len(sys.argv)>1 else 96
+    freqCount = int(sys.argv[2]) if len(sys.argv)>2 else 4000
+    runLegacy = len(sys.argv)>3 and sys.argv[3] == "legacy"
+    pyLayout.log.setLogLevel("ERROR")
+    if np is None:
+        print("numpy not installed, skip touchstone benchmark")
+        return
+
+    freq,data = synthetic(portCount,freqCount)
+    path = os.path.join(tempfile.gettempdir(),"bench.s%sp"%portCount)
+    ts = Touchstone(freq,data,50.0)
+    t0 = time.time()
+    ts.write(path,format = "RI")
+    fileMB = os.path.getsize(path)/1024.0/1024
+    print("write %s ports x %s freqs: %.2fs, %.1f MB"%(portCount,freqCount,time.time()-t0,fileMB))
+    ts = None
+
+    outMB = freqCount*portCount*portCount*16/1024.0/1024
+    if runLegacy or fileMB < legacyLimitMB:
+        legacy,t1,peak1 = measure(legacyRead,path,portCount)
+        print("%-12s %8.2fs  peak %8.1f MB"%("readlines",t1,peak1))
+        legacy = None
+    else:
+        print("%-12s skipped, file larger than %s MB"%("readlines",legacyLimitMB))
+    result,t2,peak2 = measure(Touchstone.read,path)
+    print("%-12s %8.2fs  peak %8.1f MB (output %.1f MB)"%("chunked",t2,peak2,outMB))
+
+    #written values have 10 significant digits
+    err = float(np.max(np.abs(result.Data-data)))
+    print("frequencies: %s, max difference: %g"%(result.FrequencyCount,err))
+    os.remove(path)
+
+if __name__ == '__main__':
+    main()
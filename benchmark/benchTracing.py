@@ -0,0 +1,65 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of tracing spans: overhead per span, and a traced workflow on SyntheticBoard
+(Layers.loadFromDict -> Layers.setLayerDatas, Components.updateModels) with COM calls and peak memory per span.
+
+usage: python benchTracing.py [pins] [trace.json]
+'''
+
+import sys,os
+import time
+import tempfile
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.common.tracing import Tracer,tracer
+from boardGenerator import SyntheticBoard
+
+def overhead(enabled,count = 100000):
+    local = Tracer(enabled = enabled)
+    @local.traced()
+    def add(a,b):
+        return a+b
+    def plain(a,b):
+        return a+b
+
+    t0 = time.time()
+    for i in range(count):
+        plain(i,1)
+    base = time.time()-t0
+    t0 = time.time()
+    for i in range(count):
+        assert add(i,1) == i+1
+    traced = time.time()-t0
+    print("span overhead, tracer %s: %.2f us per call (%s calls)"%("enabled" if enabled else "disabled",(traced-base)/count*1e6,count))
+
+def main():
+    pyLayout.log.setLogLevel("ERROR")
+    pins = int(sys.argv[1]) if len(sys.argv)>1 else 10000
+    path = sys.argv[2] if len(sys.argv)>2 else os.path.join(tempfile.mkdtemp(),"trace.json")
+    overhead(False)
+    overhead(True)
+
+    layout = SyntheticBoard.ofScale(pins).bindLayout()
+    layout.enableComProfiler(stacks = False)
+    tracer.reset()
+    tracer.enabled = True
+    tracer.memory = True
+    with tracer.span("workflow","stage",pins = pins):
+        with tracer.span("loadStackup","stage"):
+            infos = [{"Name":layer.Name,"Type":layer["Type"],"Thickness":"0.09mm","DK":4.1,"DF":0.015} if layer["Type"] == "dielectric"
+                     else {"Name":layer.Name,"Type":layer["Type"],"Thickness":layer["Thickness"]} for layer in layout.Layers.All]
+            layout.Layers.loadFromDict(infos)
+        with tracer.span("pins","stage"):
+            nets = [pin.Net for pin in layout.Pins]
+    tracer.memory = False
+    tracer.enabled = False
+    print(tracer.summary())
+    print("trace written to: %s"%tracer.dumpChrome(path))
+
+if __name__ == '__main__':
+    main()
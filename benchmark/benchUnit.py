@@ -0,0 +1,67 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+benchmark of Unit value parse, expression + eval vs literal tokens + LRU cache.
+
+usage: python benchUnit.py [values] [distinct]
+'''
+
+import sys,os
+import time
+import random
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+import pyLayout
+from pyLayout.common.unit import Unit
+
+class LegacyUnit(Unit):
+    '''
+    Unit.V before the literal parser
+    '''
+    @property
+    def V(self):
+        s = self.Expression
+        if s[0] == "*":
+            s = "1"+s
+        try:
+            return float(s)
+        except:
+            return eval(s)
+
+def values(count,distinct):
+    random.seed(0)
+    units = ["mm","mil","um","meter",""]
+    pool = ["%.6g%s"%(random.uniform(-100,100),random.choice(units)) for i in range(distinct)]
+    return [random.choice(pool) for i in range(count)]
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv)>1 else 100000
+    distinct = int(sys.argv[2]) if len(sys.argv)>2 else 5000
+    pyLayout.log.setLogLevel("WARNING")
+    strs = values(count,distinct)
+    print("%-12s %10s %10s %12s"%("mode","values","time","per/s"))
+
+    t0 = time.time()
+    legacy = [LegacyUnit(s).V for s in strs]
+    t1 = time.time()-t0
+    print("%-12s %10s %9.3fs %12.0f"%("legacy",count,t1,count/t1))
+
+    Unit._cache.clear()
+    t0 = time.time()
+    single = [Unit(s).V for s in strs]
+    t2 = time.time()-t0
+    print("%-12s %10s %9.3fs %12.0f"%("Unit.V",count,t2,count/t2))
+
+    Unit._cache.clear()
+    t0 = time.time()
+    many = list(Unit.parseMany(strs))
+    t3 = time.time()-t0
+    print("%-12s %10s %9.3fs %12.0f"%("parseMany",count,t3,count/t3))
+
+    print("same result: %s"%(legacy == single == [float(v) for v in many]))
+
+if __name__ == '__main__':
+    main()
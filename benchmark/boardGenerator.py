@@ -0,0 +1,173 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+parametric synthetic 3D Layout board on the stand-in oEditor / definition manager of recordingEditor.
+
+board:
+- layers conductor layers L1..Ln with dielectric between, 2 padstack definitions per conductor count
+- comps components U1..Un in a grid, part types IC / Resistor / Capacitor, pinsPerComp pins in a square array
+- nets nets NET_0..NET_k, pins and vias are assigned round robin, last 2 nets are VDD and GND (power/ground class)
+- vias vias between random conductor layers, on pin nets
+- ports comp.pin.net names for the first pins of ICs
+
+Examples:
+    >>> board = SyntheticBoard(comps = 200,pinsPerComp = 50,nets = 2500,layers = 8,vias = 5000)
+    >>> layout = board.bindLayout()
+    >>> len(layout.Pins)
+    10000
+'''
+
+import sys,os
+import math
+import random
+appDir = os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(appDir)
+sys.path.append(os.path.dirname(appDir))
+
+from recordingEditor import RecordingEditor,RecordingDesktop,bindLayout
+
+
+def padstackData(name,layers,drill = "0.2mm",pad = "0.45mm"):
+    '''
+    GetData array of padstack manager
+    '''
+    pds = ["NAME:pds"]
+    for i,layer in enumerate(layers):
+        pds.append(["NAME:lgm","lay:=",layer,"id:=",i,
+                    "pad:=",["shp:=","Cir","Szs:=",[pad],"X:=","0mm","Y:=","0mm","R:=","0deg"],
+                    "ant:=",["shp:=","No","Szs:=",[],"X:=","0mm","Y:=","0mm","R:=","0deg"],
+                    "thm:=",["shp:=","No","Szs:=",[],"X:=","0mm","Y:=","0mm","R:=","0deg"],
+                    "X:=","0","Y:=","0","dir:=","No"])
+    return ["NAME:%s"%name,"ModTime:=",0,"Library:=","","ModSinceLib:=",False,"LibLocation:=","Project",
+            ["NAME:psd","nam:=",name,"lib:=","","mat:=","copper","plt:=","0",pds,
+             "hle:=",["shp:=","Cir","Szs:=",[drill],"X:=","0mm","Y:=","0mm","R:=","0deg"],
+             "hRg:=","UTL","sbsh:=","None","sbpl:=","abv","sbr:=","0mm","sb2:=","0mm","sbn:=",""],
+            "ppl:=",[]]
+
+def materialData(name,conductivity = None,permittivity = None,lossTangent = None):
+    datas = ["NAME:%s"%name,"CoordinateSystemType:=","Cartesian","BulkOrSurfaceType:=",1]
+    if conductivity != None:
+        datas += ["conductivity:=",str(conductivity)]
+    if permittivity != None:
+        datas += ["permittivity:=",str(permittivity),"dielectric_loss_tangent:=",str(lossTangent)]
+    return datas
+
+
+class SyntheticBoard(object):
+    '''
+    comps: component count
+    pinsPerComp: pins of each component
+    nets: net count, default one net per 4 pins
+    layers: conductor layer count
+    vias: via count, default one via per 2 pins
+    ports: port count (comp.pin.net), default one per 10 pins
+    '''
+
+    def __init__(self,comps = 20,pinsPerComp = 50,nets = None,layers = 8,vias = None,ports = None,seed = 0):
+        pins = comps*pinsPerComp
+        self.comps = comps
+        self.pinsPerComp = pinsPerComp
+        self.nets = nets or max(2,pins//4)
+        self.layers = layers
+        self.vias = pins//2 if vias == None else vias
+        self.ports = pins//10 if ports == None else ports
+        self.seed = seed
+        self.oEditor = None
+        self.desktop = None
+        self.netNames = ["NET_%s"%i for i in range(self.nets-2)] + ["VDD","GND"]
+
+    def __repr__(self):
+        return "SyntheticBoard: %s comps x %s pins, %s nets, %s layers, %s vias, %s ports"%(
+            self.comps,self.pinsPerComp,self.nets,self.layers,self.vias,self.ports)
+
+    @classmethod
+    def ofScale(cls,objects,**kwargs):
+        '''
+        board with about objects pins (+ objects/2 vias), 50 pins per component
+        '''
+        pinsPerComp = kwargs.pop("pinsPerComp",50)
+        return cls(comps = max(1,objects//pinsPerComp),pinsPerComp = pinsPerComp,**kwargs)
+
+    @property
+    def ConductorNames(self):
+        return ["L%s"%i for i in range(1,self.layers+1)]
+
+    def build(self):
+        random.seed(self.seed)
+        oEditor = RecordingEditor().addStackup(self.layers)
+        conductors = self.ConductorNames
+        side = int(math.ceil(math.sqrt(self.pinsPerComp)))
+        compsPerRow = int(math.ceil(math.sqrt(self.comps)))
+        pitch = 1.0 #mm
+        netCount = len(self.netNames)
+
+        index = 0
+        icPins = []
+        for c in range(1,self.comps+1):
+            comp = "U%s"%c
+            partType = ["IC","IC","Resistor","Capacitor"][c%4]
+            layer = conductors[0] if c%2 else conductors[-1]
+            x0,y0 = (c%compsPerRow)*(side+2)*pitch,(c//compsPerRow)*(side+2)*pitch
+            oEditor.addObject(comp,"component",Part_Type = partType,Part = "PART_%s"%(c%20),Placement_Layer = layer)
+            for p in range(1,self.pinsPerComp+1):
+                x,y = x0 + (p%side)*pitch,y0 + (p//side)*pitch
+                net = self.netNames[index%netCount]
+                name = "%s-%s"%(comp,p)
+                oEditor.addObject(name,"pin",
+                                  Net = net,
+                                  Location = "%s,%s"%(x,y),
+                                  Layer = layer,
+                                  bbox = ((x-0.2)*1e-3,(y-0.2)*1e-3,(x+0.2)*1e-3,(y+0.2)*1e-3), #meter
+                                  Start_Layer = layer,
+                                  Stop_Layer = layer,
+                                  Padstack_Definition = "PAD_%s"%(p%2),
+                                  Component_Pin = str(p)
+                                  )
+                if partType == "IC" and len(icPins) < self.ports and net not in ["VDD","GND"]:
+                    icPins.append("%s.%s.%s"%(comp,p,net))
+                index += 1
+
+        extent = (compsPerRow+1)*(side+2)*pitch
+        for v in range(self.vias):
+            x,y = random.uniform(0,extent),random.uniform(0,extent)
+            top,bottom = sorted(random.sample(range(len(conductors)),2)) if len(conductors)>1 else (0,0)
+            oEditor.addObject("via_%s"%v,"via",
+                              Net = self.netNames[v%netCount],
+                              Location = "%s,%s"%(x,y),
+                              Layer = conductors[top],
+                              bbox = ((x-0.15)*1e-3,(y-0.15)*1e-3,(x+0.15)*1e-3,(y+0.15)*1e-3),
+                              Start_Layer = conductors[top],
+                              Stop_Layer = conductors[bottom],
+                              Padstack_Definition = "VIA_%s"%(v%2),
+                              HoleDiameter = "0.2mm"
+                              )
+
+        #reference planes on inner layers
+        for layer in conductors[1:-1]:
+            oEditor.addObject("plane_%s"%layer,"poly",Net = "GND",Layer = layer,bbox = (0,0,extent*1e-3,extent*1e-3))
+
+        self.oEditor = oEditor
+        self.desktop = RecordingDesktop(oEditor)
+        self.desktop.project.design.GetModule("Excitations").ports = icPins
+        definitions = self.desktop.project.definitionManager
+        padstacks = definitions.GetManager("Padstack")
+        for name,drill in [("PAD_0","0.25mm"),("PAD_1","0.3mm"),("VIA_0","0.2mm"),("VIA_1","0.15mm")]:
+            padstacks.datas[name] = padstackData(name,conductors,drill)
+        materials = definitions.GetManager("Material")
+        materials.datas["copper"] = materialData("copper",conductivity = 5.8e7)
+        materials.datas["FR4_epoxy"] = materialData("FR4_epoxy",permittivity = 4.4,lossTangent = 0.02)
+        components = definitions.GetManager("Component")
+        for i in range(20):
+            components.datas["PART_%s"%i] = ["NAME:PART_%s"%i,"Info:=",["Type:=",i%4,"Manufacturer:=","","DataSheet:=",""],"CircuitEnv:=",0,
+                                              "Refbase:=","U","NumParts:=",1,"ModSinceLib:=",False]
+        oEditor.reset()
+        return self
+
+    def bindLayout(self):
+        '''
+        new Layout bind to the board, built at first call
+        '''
+        if self.oEditor == None:
+            self.build()
+        return bindLayout(self.oEditor,self.desktop)
@@ -0,0 +1,556 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+in-memory stand-in of 3D Layout oEditor, record the count of COM calls.
+
+It only implement the oEditor API used by primitive collections, used to benchmark pyLayout without AEDT.
+RecordingDesktop / RecordingProject / RecordingDesign / RecordingDefinitionManager serve Layout.initDesign, modules and definitions,
+boardGenerator.SyntheticBoard builds parametric boards on them.
+
+Examples:
+    >>> oEditor = RecordingEditor.synthetic(comps = 200,pinsPerComp = 50)
+    >>> layout = BenchLayout(oEditor)
+    >>> layout.Pins["U1-1"].Net
+    >>> oEditor.calls
+    Counter({'GetPropertyValue': 1, ...})
+'''
+
+import sys
+import re
+import time
+import tempfile
+from collections import Counter,OrderedDict
+
+
+class RecordingPoint(object):
+
+    def __init__(self,x = 0,y = 0):
+        self.x = x
+        self.y = y
+
+    def Set(self,x,y):
+        self.x = x
+        self.y = y
+        return self
+
+    def GetX(self):
+        return self.x
+
+    def GetY(self):
+        return self.y
+
+
+class RecordingBBox(object):
+
+    def __init__(self,x0,y0,x1,y1):
+        self.LL = RecordingPoint(x0,y0)
+        self.UR = RecordingPoint(x1,y1)
+
+    def BBoxLL(self):
+        return self.LL
+
+    def BBoxUR(self):
+        return self.UR
+
+
+class RecordingPolygon(object):
+
+    def __init__(self):
+        self.points = []
+
+    def AddPoint(self,pt):
+        self.points.append(pt)
+        return self
+
+    def SetClosed(self,closed):
+        return self
+
+
+class RecordingEditor(object):
+
+    def __init__(self):
+        self.objects = {} #name -> {property:value}
+        self.layers = {} #name -> GetLayerInfo list
+        self.bboxes = {} #name -> (x0,y0,x1,y1) in meter
+        self.compPins = {} #component -> pin names
+        self._findIndex = {} #property -> {value:[names]}, cache of FindObjects
+        self.calls = Counter()
+
+    def _record(self,api):
+        self.calls[api] += 1
+
+    def reset(self):
+        self.calls.clear()
+
+    @property
+    def CallCount(self):
+        return sum(self.calls.values())
+
+    def addObject(self,name,type,bbox = None,**props):
+        info = {"Type":type,"Name":name}
+        if bbox:
+            self.bboxes[name] = bbox
+        for k,v in props.items():
+            info[k.replace("_"," ")] = v
+        self.objects[name] = info
+        self._findIndex = {}
+        if type == "pin" and "Component Pin" in info:
+            self.compPins.setdefault(name.split("-")[0],[]).append(name)
+        return info
+
+    #--- oEditor API
+    def FindObjects(self,by,value):
+        self._record("FindObjects")
+        if value == "*":
+            return list(self.objects.keys())
+        if by not in self._findIndex:
+            index = {}
+            for name,info in self.objects.items():
+                index.setdefault(info.get(by),[]).append(name)
+            self._findIndex[by] = index
+        return list(self._findIndex[by].get(value,[]))
+
+    def FilterObjectList(self,by,value,objs):
+        self._record("FilterObjectList")
+        if value == "*":
+            return list(objs)
+        return [name for name in objs if self.objects[name].get(by) == value]
+
+    def GetNetClassNets(self,netClass):
+        self._record("GetNetClassNets")
+        nets = set(info["Net"] for info in self.objects.values() if info.get("Net"))
+        if netClass == "<Power/Ground>":
+            return sorted([net for net in nets if re.match(r"(VDD|VCC|GND|VSS|VR)",net,re.I)])
+        return sorted(nets) + ["<NO-NET>"]
+
+    def GetProperties(self,tab,name):
+        self._record("GetProperties")
+        return list(self.objects[name].keys())
+
+    def GetPropertyValue(self,tab,name,prop):
+        self._record("GetPropertyValue")
+        return self.objects[name][prop]
+
+    def SetPropertyValue(self,tab,name,prop,value):
+        self._record("SetPropertyValue")
+        self.objects[name][prop] = value
+        self._findIndex.pop(prop,None)
+
+    def GetComponentPinInfo(self,comp,pin):
+        self._record("GetComponentPinInfo")
+        info = self.objects[pin]
+        return ['PinName = %s'%pin, 'NetName=%s'%info.get("Net","")]
+
+    def ChangeProperty(self,args):
+        self._record("ChangeProperty")
+        for tab in args[1:]:
+            names = [v for v in tab if isinstance(v, list) and v[0] == "NAME:PropServers"][0][1:]
+            props = [v for v in tab if isinstance(v, list) and v[0] == "NAME:ChangedProps"][0][1:]
+            for prop in props:
+                key = prop[0][5:]
+                values = dict(zip(prop[1::2],prop[2::2]))
+                value = values["Value:="] if "Value:=" in values else "%s,%s"%(values["X:="],values["Y:="])
+                for name in names:
+                    self.objects[name][key] = value
+                self._findIndex.pop(key,None)
+
+    def GetComponentInfo(self,comp):
+        self._record("GetComponentInfo")
+        info = self.objects[comp]
+        return ['ComponentName=%s'%comp, 'ComponentType=%s'%info.get("Part Type","Other"),
+                'LocationX=0', 'LocationY=0', 'BBoxLLx=0', 'BBoxLLy=0', 'BBoxURx=0', 'BBoxURy=0']
+
+    def Delete(self,names):
+        self._record("Delete")
+        for name in names:
+            self.objects.pop(name,None)
+            self.bboxes.pop(name,None)
+            self.compPins.pop(name,None)
+        self._findIndex = {}
+
+    def GetComponentPins(self,comp):
+        self._record("GetComponentPins")
+        return list(self.compPins.get(comp,[]))
+
+    def GetLayerInfo(self,name):
+        self._record("GetLayerInfo")
+        return self.layers[name]
+
+    def GetStackupLayerNames(self):
+        self._record("GetStackupLayerNames")
+        return list(self.layers.keys())
+
+    def GetAllLayerNames(self):
+        self._record("GetAllLayerNames")
+        return list(self.layers.keys())
+
+    def ChangeLayer(self,args):
+        self._record("ChangeLayer")
+
+    def ChangeLayers(self,args):
+        self._record("ChangeLayers")
+
+    def addStackup(self,conductors = 12,copper = 35e-6,dielectric = 100e-6):
+        '''
+        add stackup layers from top to bottom: L1,D1,L2,D2...Ln, thickness in meter
+        '''
+        layers = []
+        for i in range(1,conductors+1):
+            layers.append(("L%s"%i,"signal",copper,"copper","FR4_epoxy"))
+            if i<conductors:
+                layers.append(("D%s"%i,"dielectric",dielectric,"FR4_epoxy",""))
+
+        h = 0.0
+        infos = []
+        for name,typ,thickness,material,fill in layers[::-1]:
+            visible = "true" if typ == "signal" else "false"
+            info = ['Type: %s'%typ,'TopBottomAssociation: Neither','Color: 16711680d','IsVisible: %s'%visible,
+                    '  IsVisibleShape: %s'%visible,'  IsVisiblePath: %s'%visible,'  IsVisiblePad: %s'%visible,
+                    '  IsVisibleHole: %s'%visible,'  IsVisibleComponent: %s'%visible,'IsLocked: false',
+                    'LayerId: %s'%(len(infos)+1),'Index: %s'%(len(infos)+1),'LayerThickness: %s'%thickness,
+                    'IsIgnored: false','NumberOfSublayers: 1','Material0: %s'%material,'FillMaterial0: %s'%fill,
+                    'Thickness0: %gmm'%(thickness*1e3),'LowerElevation0: %gmm'%(h*1e3)]
+            if typ == "signal":
+                info += ['EtchFactor: -2.5','Roughness0 Type: Groiss','Roughness0: 1um','BottomRoughness0 Type: Groiss',
+                         'BottomRoughness0: 1um','SideRoughness0 Type: Huray','SideRoughness0: 0.5um, 2.9']
+            infos.append((name,info))
+            h += thickness
+
+        self.layers = OrderedDict(infos[::-1])
+        return self
+
+    def GetBBox(self,name):
+        self._record("GetBBox")
+        x0,y0,x1,y1 = self.bboxes[name]
+        return RecordingBBox(x0,y0,x1,y1)
+
+    def Point(self):
+        return RecordingPoint()
+
+    def Polygon(self):
+        return RecordingPolygon()
+
+    def _onLayer(self,info,layer):
+        return layer == "*" or info.get("Layer") == layer
+
+    def FindObjectsByPoint(self,pt,layer):
+        self._record("FindObjectsByPoint")
+        x,y = pt.GetX(),pt.GetY()
+        return [name for name,b in self.bboxes.items() if self._onLayer(self.objects[name],layer)
+                and b[0]<=x<=b[2] and b[1]<=y<=b[3]]
+
+    def FindObjectsByPolygon(self,polygon,layer):
+        self._record("FindObjectsByPolygon")
+        xs = [p.GetX() for p in polygon.points]
+        ys = [p.GetY() for p in polygon.points]
+        return [name for name,b in self.bboxes.items() if self._onLayer(self.objects[name],layer)
+                and not (b[0]>max(xs) or b[2]<min(xs) or b[1]>max(ys) or b[3]<min(ys))]
+
+    def GetActiveUnits(self):
+        self._record("GetActiveUnits")
+        return "mm"
+
+    @classmethod
+    def synthetic(cls,comps = 100,pinsPerComp = 50,pinsPerNet = 4):
+        '''
+        build a simple board: comps components, each with pinsPerComp pins, every pinsPerNet pins share one net.
+        '''
+        oEditor = cls()
+        index = 0
+        for c in range(1,comps+1):
+            comp = "U%s"%c
+            oEditor.addObject(comp,"component")
+            for p in range(1,pinsPerComp+1):
+                x,y = c*10.0,p*0.5
+                oEditor.addObject("%s-%s"%(comp,p),"pin",
+                                  Net = "NET_%s"%(index//pinsPerNet),
+                                  Location = "%s,%s"%(x,y),
+                                  Layer = "TOP",
+                                  bbox = ((x-0.1)*1e-3,(y-0.1)*1e-3,(x+0.1)*1e-3,(y+0.1)*1e-3), #meter
+                                  Start_Layer = "TOP",
+                                  Stop_Layer = "TOP",
+                                  Padstack_Definition = "PAD_%s"%(p%3),
+                                  Component_Pin = str(p)
+                                  )
+                index += 1
+        #reference plane under all components
+        oEditor.addObject("plane_GND","poly",Net = "GND",Layer = "TOP",bbox = (0,0,(comps+1)*10e-3,(pinsPerComp+1)*0.5e-3))
+        return oEditor
+
+    @classmethod
+    def powerTree(cls,rails = 4,depth = 10,fanout = 2,caps = 4):
+        '''
+        build PDN: each rail start from VRM U<rail> pin on net VR<rail>, 
+        every net feed fanout resistors to new nets until depth, sink ICs S<rail>_<n> on last nets.
+        each net have caps decoupling capacitors to GND.
+        '''
+        oEditor = cls()
+        count = [0]
+        
+        def addComp(comp,nets,partType):
+            oEditor.addObject(comp,"component",Part_Type = partType)
+            for i,net in enumerate(nets):
+                oEditor.addObject("%s-%s"%(comp,i+1),"pin",Net = net,Layer = "TOP",Component_Pin = str(i+1))
+        
+        for r in range(1,rails+1):
+            addComp("U%s"%r,["VR%s"%r,"GND"],"IC")
+            nets = ["VR%s"%r]
+            for d in range(depth):
+                newNets = []
+                for net in nets:
+                    for c in range(caps):
+                        count[0] += 1
+                        addComp("C%s"%count[0],[net,"GND"],"Capacitor")
+                    for f in range(fanout if len(nets)*fanout <= 64 else 1):
+                        count[0] += 1
+                        newNet = "VR%s_%s"%(r,count[0])
+                        addComp("R%s"%count[0],[net,newNet],"Resistor")
+                        newNets.append(newNet)
+                nets = newNets
+            for i,net in enumerate(nets):
+                addComp("S%s_%s"%(r,i),[net,"GND"],"IC")
+        return oEditor
+
+
+class RecordingSetupModule(object):
+
+    def __init__(self,oEditor):
+        self.oEditor = oEditor
+        self.setups = {} #name -> setup array
+        self.sweeps = {} #setup name -> sweep names
+        self.variations = [""]
+
+    def GetSetupData(self,name):
+        self.oEditor._record("GetSetupData")
+        return self.setups[name]
+
+    def GetSetups(self):
+        self.oEditor._record("GetSetups")
+        return list(self.sweeps.keys())
+
+    def GetSweeps(self,setup):
+        self.oEditor._record("GetSweeps")
+        return list(self.sweeps[setup])
+
+    def ListVariations(self,solution):
+        self.oEditor._record("ListVariations")
+        return list(self.variations)
+
+
+class RecordingExcitationsModule(object):
+
+    def __init__(self,oEditor):
+        self.oEditor = oEditor
+        self.ports = []
+
+    def GetAllPortsList(self):
+        self.oEditor._record("GetAllPortsList")
+        return list(self.ports)
+
+    def ReorderMatrix(self,names):
+        self.oEditor._record("ReorderMatrix")
+        self.ports = list(names)
+
+
+class RecordingDesign(object):
+
+    def __init__(self,oEditor):
+        self.oEditor = oEditor
+        self.modules = {"SolveSetups":RecordingSetupModule(oEditor),"Excitations":RecordingExcitationsModule(oEditor)}
+
+        self.exportDelay = 0 #seconds of each ExportNetworkData
+        self.exportBytes = 1024*1024
+
+    def GetModule(self,name):
+        self.oEditor._record("GetModule")
+        return self.modules[name]
+
+    def GetDesignType(self):
+        self.oEditor._record("GetDesignType")
+        return "HFSS 3D Layout Design"
+
+    def GetName(self):
+        self.oEditor._record("GetName")
+        return "bench;board"
+
+    def SetActiveEditor(self,name):
+        self.oEditor._record("SetActiveEditor")
+        return self.oEditor
+
+    def DesignOptions(self,*args):
+        self.oEditor._record("DesignOptions")
+
+    def ExportNetworkData(self,variation,solutions,fileType,path,*args):
+        '''
+        wait exportDelay and write a touchstone like text file of exportBytes
+        '''
+        self.oEditor._record("ExportNetworkData")
+        time.sleep(self.exportDelay)
+        line = " ".join(["%.9e"%(0.001*(k%997)) for k in range(16)]) + "\n"
+        with open(path,"w") as f:
+            f.write("! %s %s\n# GHz S RI R 50\n"%(solutions[0],variation))
+            f.write(line*(self.exportBytes//len(line)))
+
+
+class BenchLayout(object):
+    '''
+    minimal layout object for primitive collections, bind to a stand-in oEditor
+    '''
+
+    def __init__(self,oEditor,unit = "mm"):
+        from pyLayout.primitive.component import Components
+        from pyLayout.primitive.pin import Pins
+        from pyLayout.primitive.via import Vias
+        from pyLayout.definition.connectivity import Connectivity
+        from pyLayout.definition.layer import Layers
+
+        self.oEditor = oEditor
+        self.oDesign = RecordingDesign(oEditor)
+        self.unit = unit
+        self.Components = Components(layout = self)
+        self.Pins = Pins(layout = self)
+        self.Vias = Vias(layout = self)
+        self.Connectivity = Connectivity(layout = self)
+        self.Layers = Layers(layout = self)
+        self.layers = self.Layers
+
+        #Point object get layout from __main__ module
+        sys.modules["__main__"].layout = self
+
+
+class RecordingManager(object):
+    '''
+    definition manager of one type (Padstack, Material, Component ...), name -> GetData array
+    '''
+
+    def __init__(self,oEditor):
+        self.oEditor = oEditor
+        self.datas = OrderedDict()
+
+    def GetNames(self):
+        self.oEditor._record("GetNames")
+        return list(self.datas.keys())
+
+    def GetData(self,name):
+        self.oEditor._record("GetData")
+        return self.datas.get(name)
+
+    def Edit(self,name,datas):
+        self.oEditor._record("Edit")
+        self.datas[name] = datas
+
+
+class RecordingDefinitionManager(object):
+
+    def __init__(self,oEditor):
+        self.oEditor = oEditor
+        self.managers = {}
+
+    def GetManager(self,type):
+        self.oEditor._record("GetManager")
+        if type not in self.managers:
+            self.managers[type] = RecordingManager(self.oEditor)
+        return self.managers[type]
+
+    def DoesMaterialExist(self,name):
+        self.oEditor._record("DoesMaterialExist")
+        return name in self.GetManager("Material").datas
+
+    def AddMaterial(self,datas):
+        self.oEditor._record("AddMaterial")
+        self.GetManager("Material").datas[datas[0][5:]] = datas
+
+    def EditMaterial(self,name,datas):
+        self.oEditor._record("EditMaterial")
+        self.GetManager("Material").datas[name] = datas
+
+
+class RecordingProject(object):
+
+    def __init__(self,oEditor,name = "bench",path = None):
+        self.oEditor = oEditor
+        self.name = name
+        self.path = path or tempfile.gettempdir()
+        self.design = RecordingDesign(oEditor)
+        self.definitionManager = RecordingDefinitionManager(oEditor)
+
+    def GetName(self):
+        self.oEditor._record("GetName")
+        return self.name
+
+    def GetPath(self):
+        self.oEditor._record("GetPath")
+        return self.path
+
+    def GetTopDesignList(self):
+        self.oEditor._record("GetTopDesignList")
+        return ["%s;board"%self.name]
+
+    def GetActiveDesign(self):
+        self.oEditor._record("GetActiveDesign")
+        return self.design
+
+    def SetActiveDesign(self,name):
+        self.oEditor._record("SetActiveDesign")
+        return self.design
+
+    def GetDefinitionManager(self):
+        self.oEditor._record("GetDefinitionManager")
+        return self.definitionManager
+
+
+class RecordingDesktop(object):
+    '''
+    oDesktop with one project and one 3D layout design "board", for Layout.initDesign
+    '''
+
+    def __init__(self,oEditor,projectPath = None):
+        self.oEditor = oEditor
+        self.project = RecordingProject(oEditor,path = projectPath)
+        self.autoSave = True
+
+    def GetAutoSaveEnabled(self):
+        self.oEditor._record("GetAutoSaveEnabled")
+        return self.autoSave
+
+    def EnableAutoSave(self,flag):
+        self.oEditor._record("EnableAutoSave")
+        self.autoSave = bool(flag)
+
+    def GetVersion(self):
+        self.oEditor._record("GetVersion")
+        return "2025.1.0"
+
+    def GetExeDir(self):
+        self.oEditor._record("GetExeDir")
+        return tempfile.gettempdir()
+
+    def GetProjectList(self):
+        self.oEditor._record("GetProjectList")
+        return [self.project.name]
+
+    def GetActiveProject(self):
+        self.oEditor._record("GetActiveProject")
+        return self.project
+
+    def SetActiveProject(self,name):
+        self.oEditor._record("SetActiveProject")
+        return self.project
+
+
+def bindLayout(oEditor,desktop = None):
+    '''
+    pyLayout Layout object bind to a stand-in oEditor, collections created by Layout.initObjects
+    '''
+    from pyLayout.pyLayout import Layout
+    desktop = desktop or RecordingDesktop(oEditor)
+    layout = Layout(oDesktop = desktop)
+    layout._oProject = desktop.project
+    layout._oDesign = desktop.project.design
+    layout._info.update("oProject",layout._oProject)
+    layout._info.update("oDesign",layout._oDesign)
+    layout._info.update("oEditor",oEditor)
+    layout.initObjects()
+    sys.modules["__main__"].layout = layout
+    return layout
@@ -28,7 +28,7 @@ from .object3DModel import Objects3DModle
 # from .lib.common.common import *
 from ..common.common import log,isIronpython #log is a globle variable
 from ..common.unit import Unit
-from ..common.common import DisableAutoSave,ProcessTime
+from ..common.tracing import traced
 from ..pyLayout import Layout
 
 class Aedt3DToolBase(object):
@@ -448,8 +448,7 @@ class Aedt3DToolBase(object):
         
         return Enabled
     
-    @ProcessTime
-    @DisableAutoSave
+    @traced(autoSave = False,logTime = True)
     def groupbyNets(self,netInfo):
         '''
         netInfo: {objName:net}
@@ -679,6 +678,19 @@ class Aedt3DToolBase(object):
         return jobId
 
 
+    def submitJobAsync(self,runner = None,host="localhost",cores=20,timeout = None):
+        '''
+        submit batchsolve job to asyncio JobRunner, not block python, python3 only
+        must be called in running event loop, return future of JobResult
+        runner: None for jobRunner.defaultRunner, shared by all submitted jobs
+        
+        Examples:
+            >>> runner = JobRunner(maxJobs = 2)
+            >>> result = await layout.submitJobAsync(runner,cores = 8)
+        '''
+        from ..common.jobRunner import submitBatchSolve
+        return submitBatchSolve(self,runner,host = host,cores = cores,timeout = timeout)
+    
     @classmethod
     def isBatchMode(cls):
         Module = sys.modules['__main__']
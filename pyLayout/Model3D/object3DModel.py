@@ -6,6 +6,7 @@ import re
 
 from ..common.arrayStruct import ArrayStruct
 from ..common.complexDict import ComplexDict
+from ..common.regexQuery import NameQuery
 from ..common.unit import Unit
 from ..common.common import log
 
@@ -255,7 +256,7 @@ class Objects3DModle(object):
                 return self.ObjectDict[key]
             else:
                 #find by 正则表达式
-                lst = [name for name in self.ObjectDict.Keys if re.match(r"^%s$"%key,name,re.I)]
+                lst = NameQuery.of(self.ObjectDict).match(r"^%s$"%key)
                 if not lst:
                     raise Exception("not found component: %s"%key)
                 else:
@@ -281,6 +282,21 @@ class Objects3DModle(object):
     def __len__(self):
         return len(self.ObjectDict)
     
+    def __iter__(self):
+        return iter(self.ObjectDict)
+    
+    def items(self):
+        '''
+        iterate (name,object)
+        '''
+        return self.ObjectDict.items()
+    
+    def iterBatches(self,size = 1000):
+        '''
+        iterate objects in list of length size
+        '''
+        return self.ObjectDict.iterBatches(size)
+    
     @property
     def Count(self):
         return len(self)
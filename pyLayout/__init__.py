@@ -27,17 +27,18 @@ from .common.licenseChecker import LicenseChecker
 from .options import options
 from .postData.solution import Solutions
 
-from .model3D.HFSS import Aedt3DToolBase
-from .model3D.HFSS import HFSS
-from .model3D.Q3D import Q3D
-from .model3D.maxwell import Maxwell
-from .model3D.icepak import Icepak
+from .Model3D.HFSS import Aedt3DToolBase
+from .Model3D.HFSS import HFSS
+from .Model3D.Q3D import Q3D
+from .Model3D.maxwell import Maxwell
+from .Model3D.icepak import Icepak
 
 from .edb.edbApp import EdbApp,EdbSIwaveOptions,edbToSIwave
 
 ##log is a globle variable
 from .common.common import log,isIronpython
 from .common.progressBar import ProgressBar
+from .common.tracing import tracer,traced
 from .common.xlsReader import XlsReader
 from .common.licenseChecker import LicenseChecker
 
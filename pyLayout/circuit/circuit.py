@@ -525,6 +525,19 @@ class Circuit(object):
         return jobId
 
 
+    def submitJobAsync(self,runner = None,host="localhost",cores=20,timeout = None):
+        '''
+        submit batchsolve job to asyncio JobRunner, not block python, python3 only
+        must be called in running event loop, return future of JobResult
+        runner: None for jobRunner.defaultRunner, shared by all submitted jobs
+        
+        Examples:
+            >>> runner = JobRunner(maxJobs = 2)
+            >>> result = await layout.submitJobAsync(runner,cores = 8)
+        '''
+        from ..common.jobRunner import submitBatchSolve
+        return submitBatchSolve(self,runner,host = host,cores = cores,timeout = timeout)
+    
     def release(self):
         
         releaseDesktop()
@@ -54,12 +54,16 @@
             "NAME:Properties",
             "Enable:="        , "true"
         ]
+        
+        Path-indexed mode for large array, get/set/updateByKey cost O(depth) instead of O(size)
+        >>> arys = ArrayStruct(datas,indexed = True)
+        >>> arys.updateByKey("MaxPasses",10)
     
 '''
 
 import re
 from copy import deepcopy
-from .complexDict import ComplexDict
+from .complexDict import ComplexDict,compileMaps
 from .common import log
 
 def getArrayData(datas, keys):
@@ -167,14 +171,27 @@ class ArrayStruct(object):
     '''
     classdocs
     '''
+    _compiledMaps = None #lower case alias -> MapEntry, build by setMaps
+    _mapsSize = -1
+    _indexed = False
+    _pathIndex = None #lower case path tuple -> [(chain,parent,slot,marker)], build when first used
+    _keyIndex = None #lower case key -> [(chain,parent,slot,marker)] for all levels, used by updateByKey
+    _indexSize = -1
 
-    def __init__(self, datas = [], maps = None):
+    def __init__(self, datas = [], maps = None, indexed = False, compiledMaps = None):
         '''
         Constructor
+        
+        indexed: build path -> (parent list, slot index) index once, get/set/updateByKey cost O(depth) 
+        compiledMaps: compileMaps(maps) shared by objects with same maps (class level maps), not compiled again
         '''
         self._datas = datas #tuple2list(datas) will change list id
         self.maps = maps
+        if compiledMaps != None:
+            self._compiledMaps = compiledMaps
+            self._mapsSize = len(maps)
         self._keys = None
+        self._indexed = indexed
     
     def __del__(self):
         del self._datas
@@ -191,22 +208,19 @@ class ArrayStruct(object):
         
 
         #map key have high priority then Array key
-        if self.maps and isinstance(self.maps, dict):
-            maps = ComplexDict(self.maps)
-            if key in maps:
-                log.debug("found key in array, mapKey: %s->%s:"%(key,maps[key]))
-                mapKey = maps[key]
-                if isinstance(mapKey,ComplexDict): #if map key is dict, execulte lambda function
-                    if isinstance(mapKey["Key"], str): #if only one key
-                        data = self.get(mapKey["Key"])
-                        return mapKey["Get"](data)
-                    elif isinstance(mapKey["Key"], (list,tuple,ArrayStruct)): #if more then one key
-                        datas = [self.get(value) for value in mapKey["Key"]] 
-                        return mapKey["Get"](*datas)
-                    else:
-                        pass
+        entry = self._getMapEntry(key)
+        if entry != None:
+            if entry.isFunc: #if map key is dict, execulte lambda function
+                if isinstance(entry.key, str): #if only one key
+                    data = self.get(entry.key)
+                    return entry.getter(data)
+                elif isinstance(entry.key, tuple): #if more then one key
+                    datas = [self.get(value) for value in entry.key] 
+                    return entry.getter(*datas)
                 else:
-                    return self.get(mapKey)
+                    pass
+            else:
+                return self.get(entry.key)
         
         #Array key
         val = self.get(key)
@@ -220,25 +234,21 @@ class ArrayStruct(object):
     def __setitem__(self,key,value):
         
         #map key have high priority then Array key
-        if self.maps and isinstance(self.maps, (dict,ComplexDict)):
-            maps = ComplexDict(self.maps)
-            if key in maps:
-                log.debug("found key in array, mapKey: %s->%s:"%(key,maps[key]))
-                mapKey = maps[key]
-                if isinstance(mapKey,ComplexDict): #if map key is dict, execulte lambda function
-                    if isinstance(mapKey["Key"], str): #if only one key
-                        self.set(mapKey["Key"],mapKey["Set"](value))
-                    elif isinstance(mapKey["Key"], (list,tuple,ArrayStruct)): #if more then one key, lambda should return same size value
-                        for i in range(len(mapKey["Key"])):
-                            self.set(mapKey["Key"][i],mapKey["Set"](value)[i])
-                    else:
-                        pass
+        entry = self._getMapEntry(key)
+        if entry != None:
+            if entry.isFunc: #if map key is dict, execulte lambda function
+                if isinstance(entry.key, str): #if only one key
+                    self.set(entry.key,entry.setter(value))
+                elif isinstance(entry.key, tuple): #if more then one key, lambda should return same size value
+                    values = entry.setter(value)
+                    for i in range(entry.arity):
+                        self.set(entry.key[i],values[i])
                 else:
-                    self.set(mapKey,value)
-                
-                return None
-        else:
-            pass
+                    pass
+            else:
+                self.set(entry.key,value)
+            
+            return None
 
         #Array key have lower priority
         self.set(key,value)
@@ -246,33 +256,21 @@ class ArrayStruct(object):
     def __delitem__(self,key):
 
         #map key have high priority then Array key
-        if self.maps and isinstance(self.maps, dict):
-            maps = ComplexDict(self.maps)
-            if key in maps:
-                log.debug("found key in array, mapKey: %s:"% key)
-                mapKey = maps[key]
-                if isinstance(mapKey,ComplexDict):
-                    log.debug("Could not remove function maps keys: %s"%key)
-#                     if isinstance(mapKey["Key"], str):
-#                         self.set(mapKey["Key"],mapKey["Set"](value))
-#                     elif isinstance(mapKey["Key"], (list,tuple)):
-#                         for i in range(len(mapKey["Key"])):
-#                             self.set(mapKey["Key"][i],mapKey["Set"](value)[i])
-#                     else:
-#                         pass
-                else:
-                    self.delKey(mapKey)
-                
-                return None
-        else:
-            pass
+        entry = self._getMapEntry(key)
+        if entry != None:
+            if entry.isFunc:
+                log.debug("Could not remove function maps keys: %s"%key)
+            else:
+                self.delKey(entry.key)
+            
+            return None
 
         #Array key have lower priority
         self.delKey(key)
         
     def __contains__(self,key):
         
-        if self.maps and key in self.maps:
+        if self._getMapEntry(key) != None:
             return True
         
         if key in self.Keys:
@@ -304,8 +302,12 @@ class ArrayStruct(object):
 
          
     def __setattr__(self, key, value):
-        if key in ["_datas","_keys","maps"]:
+        if key in ["_datas","_keys","maps","_compiledMaps","_mapsSize","_indexed","_pathIndex","_keyIndex","_indexSize"]:
             object.__setattr__(self,key,value)
+            if key == "_datas":
+                object.__setattr__(self,"_pathIndex",None) #rebuild index for new datas
+            if key == "maps":
+                object.__setattr__(self,"_compiledMaps",None) #compile again for new maps
         else:
             self[key] = value
             
@@ -355,6 +357,117 @@ class ArrayStruct(object):
         return self._datas 
 
     
+    def buildIndex(self):
+        '''
+        build path -> (chain,parent list,slot index,marker) index of datas.
+        
+        - "key:=" value: slot is index of value, marker is "key:=" string
+        - "NAME:key" sub list: slot is index of sub list, marker is the sub list
+        - chain is ((list,index),...) from datas to parent, used to check entry still valid
+        
+        path index only follow the first matched sub list like getArrayData, key index include all levels.
+        '''
+        pathIndex = {}
+        keyIndex = {}
+        
+        def _walk(datas,paths,chain):
+            for i in range(len(datas)):
+                val = datas[i]
+                if isinstance(val, ArrayStruct):
+                    log.debug("ArrayStruct in datas, path index disabled.")
+                    return False
+                
+                if isinstance(val, (list,tuple)):
+                    subPaths = [] #paths of this sub list if it is the first matched one
+                    #value of "key:=", entry added by "key:=" string
+                    if i>0 and isinstance(datas[i-1], str) and datas[i-1].endswith(":="):
+                        key = datas[i-1][:-2].lower()
+                        for p in paths:
+                            first = pathIndex[p+(key,)][0]
+                            if first[1] is datas and first[2] == i:
+                                subPaths.append(p+(key,))
+                    #"NAME:key" sub list
+                    for v in val:
+                        if isinstance(v, str) and v[:5].lower() == "name:":
+                            for p in paths:
+                                path = p+(v[5:].lower(),)
+                                entries = pathIndex.setdefault(path,[])
+                                if not entries:
+                                    subPaths.append(path)
+                                entries.append((chain,datas,i,val))
+                    
+                    if _walk(val,subPaths,chain + ((datas,i),)) == False:
+                        return False
+                    
+                elif isinstance(val, str) and val.endswith(":=") and i+1 < len(datas):
+                    key = val[:-2].lower()
+                    entry = (chain,datas,i+1,val)
+                    keyIndex.setdefault(key,[]).append(entry)
+                    for p in paths:
+                        pathIndex.setdefault(p+(key,),[]).append(entry)
+            return True
+        
+        if _walk(self._datas,[()],()) == False:
+            self._indexed = False
+            self._pathIndex = None
+            self._keyIndex = None
+            return None
+        
+        self._pathIndex = pathIndex
+        self._keyIndex = keyIndex
+        self._indexSize = len(self._datas)
+        return pathIndex
+    
+    def _validEntry(self,entry):
+        chain,parent,slot,marker = entry
+        container = self._datas
+        for lst,i in chain:
+            if lst is not container:
+                return False
+            container = lst[i] if i < len(lst) else None
+        
+        if container is not parent or slot >= len(parent):
+            return False
+        
+        if isinstance(marker, str):
+            return parent[slot-1] == marker
+        else:
+            return parent[slot] is marker
+    
+    def _lookup(self,keys,index = "path"):
+        '''
+        return valid index entries of path keys or key, None if not in index mode.
+        '''
+        if not self._indexed:
+            return None
+        
+        if self._pathIndex == None or self._indexSize != len(self._datas):
+            if self.buildIndex() == None:
+                return None
+        
+        if index == "path":
+            entries = self._pathIndex.get(tuple([k.lower() for k in keys]),[])
+        else:
+            entries = self._keyIndex.get(keys.lower(),[])
+        
+        for entry in entries:
+            if not self._validEntry(entry):
+                #datas changed outside of ArrayStruct
+                if self.buildIndex() == None:
+                    return None
+                return self._lookup(keys,index)
+        return entries
+    
+    def _setEntry(self,entry,value):
+        chain,parent,slot,marker = entry
+        if isinstance(marker, str):
+            parent[slot] = parent[slot].__class__(value)
+            if isinstance(parent[slot], (list,tuple)) or isinstance(value, (list,tuple)):
+                self._pathIndex = None #sub list changed
+        else:
+            parent[slot] = value
+            self._pathIndex = None
+    
     def get(self,path):
         '''
         return list data
@@ -369,7 +482,16 @@ class ArrayStruct(object):
         
         if isinstance(path,(list,tuple,ArrayStruct)):
             keys = list(filter(lambda k:k.strip(),path)) #filter empty key
-            return getArrayData(datas, keys)
+            entries = self._lookup(keys)
+            if entries:
+                chain,parent,slot,marker = entries[0]
+                return parent[slot]
+            
+            #not in index mode, or key added to a sub list outside of ArrayStruct
+            value = getArrayData(datas, keys)
+            if entries != None:
+                self._pathIndex = None #found by scan, index is stale
+            return value
         
         raise Exception("key not found: %s"%str(path))
         
@@ -384,12 +506,23 @@ class ArrayStruct(object):
         
         if isinstance(path,(list,tuple,ArrayStruct)):
             keys = list(filter(lambda k:k.strip(),path)) #filter empty key
-            return setArrayData(datas, keys, value)
+            entries = self._lookup(keys)
+            if entries:
+                for entry in entries:
+                    self._setEntry(entry,value)
+                return None
+            
+            #not in index mode, or key added to a sub list outside of ArrayStruct
+            result = setArrayData(datas, keys, value)
+            if entries != None:
+                self._pathIndex = None
+            return result
         
         raise Exception("key not found: %s"%str(path))
     
     def append(self,value):
         self._datas.append(value)
+        self._pathIndex = None
 
     
     def delKey(self,path):
@@ -404,6 +537,7 @@ class ArrayStruct(object):
         
         if isinstance(path,(list,tuple,ArrayStruct)):
             keys = list(filter(lambda k:k.strip(),path)) #filter empty key
+            self._pathIndex = None
             return delArrayKey(datas, keys)
             
         raise Exception("key not found: %s"%str(path))
@@ -428,6 +562,12 @@ class ArrayStruct(object):
         '''
         update all matched key to value 
         '''
+        entries = self._lookup(key,index = "key")
+        if entries:
+            for entry in entries:
+                self._setEntry(entry,value)
+            return len(entries)
+        
         count = [0]  #python 2.7 not support nonlocal keyword
         def _update(key,value,datas):
             
@@ -441,10 +581,35 @@ class ArrayStruct(object):
                 else:
                     pass
         _update(key, value, self.Datas) 
+        if entries != None and count[0]:
+            self._pathIndex = None #found by scan, index is stale
         return count[0]
     
-    def setMaps(self,maps):
+    def setMaps(self,maps,compiledMaps = None):
         self.maps = maps
+        if compiledMaps != None:
+            self._compiledMaps = compiledMaps
+            self._mapsSize = len(maps)
+        else:
+            self._compileMaps()
+    
+    def _compileMaps(self):
+        self._compiledMaps = compileMaps(self.maps)
+        self._mapsSize = len(self.maps) if isinstance(self.maps, (dict,ComplexDict)) else -1
+        return self._compiledMaps
+    
+    def _getMapEntry(self,key):
+        '''
+        return MapEntry of key or None, maps compiled again if items of maps changed outside.
+        '''
+        maps = self.maps
+        if not maps or not isinstance(maps, (dict,ComplexDict)) or not isinstance(key, str):
+            return None
+        
+        compiled = self._compiledMaps
+        if compiled == None or self._mapsSize != len(maps):
+            compiled = self._compileMaps()
+        return compiled.get(key.lower())
     
     def copy(self):
-        return self.__class__(deepcopy(self.Array),maps = self.maps)
\ No newline at end of file
+        return self.__class__(deepcopy(self.Array),maps = self.maps,indexed = self._indexed)
\ No newline at end of file
@@ -0,0 +1,379 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+COM call profiler of AEDT handles (oDesktop, oProject, oDesign, oEditor, and modules/managers got from them).
+
+The handles are wrapped by ComProxy only when profiler is enabled (Layout.enableComProfiler or option AEDT_ProfileCOM),
+not wrapped handles have no overhead.
+
+For each COM method it records: count, total/mean/p50/p90/p99/max latency, argument size (chars of strings and count of other values),
+and count/time per calling pyLayout function. Folded stacks (a;b;oEditor.GetProperties weight) can be opened by flamegraph.pl or speedscope.
+
+Examples:
+    >>> layout.options["AEDT_ProfileCOM"] = True
+    >>> layout.initDesign()
+    or
+    >>> profiler = layout.enableComProfiler()
+    >>> with profiler.stage("ports"):
+    >>>     layout.Ports.autoPorts()
+    >>> profiler.dumpJson("com.json")
+    >>> profiler.dumpCsv("com.csv",stage = "ports")
+    >>> profiler.dumpStacks("com.folded")
+    >>> print(profiler.summary(top = 10))
+'''
+
+import os
+import sys
+import time
+import json
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    basestring
+except NameError:
+    basestring = str #python3
+
+#time.clock in IronPython
+_timer = getattr(time,"perf_counter",None) or getattr(time,"clock",None) or time.time
+
+#results of these types are values, not COM objects
+_valueTypes = (basestring,int,float,bool,list,tuple,dict,type(None))
+try:
+    _valueTypes += (long,)
+except NameError:
+    pass
+
+#methods return COM objects (desktop, project, design, editor, module, manager), results of other methods are values:
+#strings, numbers, and .NET arrays (System.String[]) in IronPython, they must not be wrapped
+_objectMethods = set(["GetAppDesktop","GetActiveProject","SetActiveProject","NewProject","OpenProject","GetProject",
+                      "GetActiveDesign","SetActiveDesign","InsertDesign","GetDesign","GetModule","GetEditor","SetActiveEditor",
+                      "GetDefinitionManager","GetManager","GetChildObject","GetTool"])
+
+def _isComObject(method,result):
+    '''
+    method: method name without handle, GetModule
+    '''
+    return method in _objectMethods and not isinstance(result,_valueTypes) and not isinstance(result,ComProxy)
+
+_packageDir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+_thisFile = os.path.splitext(os.path.realpath(__file__))[0]
+
+
+_codeNames = {} #code object -> (module.function, in pyLayout), None name for this module
+
+def _codeName(code):
+    info = _codeNames.get(code)
+    if info == None:
+        path = os.path.realpath(code.co_filename)
+        name = "%s.%s"%(os.path.splitext(os.path.basename(path))[0],code.co_name)
+        if path.startswith(_thisFile):
+            info = (None,False)
+        else:
+            info = (name,path.startswith(_packageDir))
+        _codeNames[code] = info
+    return info
+
+def argSize(value):
+    '''
+    chars of strings and count of other values, nested lists included
+    '''
+    if isinstance(value,basestring):
+        return len(value)
+    if isinstance(value,(list,tuple)):
+        return sum([argSize(v) for v in value])
+    return 1
+
+def percentile(values,p):
+    '''
+    values: sorted list
+    '''
+    if not values:
+        return 0
+    return values[min(len(values)-1,int(p*len(values)))]
+
+
+class ComRecorder(object):
+    '''
+    records of one stage
+    '''
+
+    def __init__(self,name):
+        self.name = name
+        self.methods = {} #method -> [count,total,latencies,argTotal,argMax]
+        self.callers = {} #(caller,method) -> [count,total]
+        self.stacks = {} #folded stack -> [count,total]
+
+    def add(self,method,seconds,size,caller,stack):
+        stats = self.methods.get(method)
+        if stats == None:
+            stats = self.methods[method] = [0,0.0,[],0,0]
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2].append(seconds)
+        stats[3] += size
+        if size > stats[4]:
+            stats[4] = size
+
+        key = (caller,method)
+        stats = self.callers.get(key)
+        if stats == None:
+            stats = self.callers[key] = [0,0.0]
+        stats[0] += 1
+        stats[1] += seconds
+
+        if stack != None:
+            stats = self.stacks.get(stack)
+            if stats == None:
+                stats = self.stacks[stack] = [0,0.0]
+            stats[0] += 1
+            stats[1] += seconds
+
+    def merge(self,other):
+        for method,(count,total,latencies,argTotal,argMax) in other.methods.items():
+            stats = self.methods.setdefault(method,[0,0.0,[],0,0])
+            stats[0] += count
+            stats[1] += total
+            stats[2].extend(latencies)
+            stats[3] += argTotal
+            stats[4] = max(stats[4],argMax)
+        for target,source in [(self.callers,other.callers),(self.stacks,other.stacks)]:
+            for key,(count,total) in source.items():
+                stats = target.setdefault(key,[0,0.0])
+                stats[0] += count
+                stats[1] += total
+        return self
+
+
+class ComProfiler(object):
+    '''
+    stacks: record folded call stacks of pyLayout functions (for flame graph)
+    maxDepth: max frames of stack
+    '''
+
+    def __init__(self,stacks = True,maxDepth = 32):
+        self.stacks = stacks
+        self.maxDepth = maxDepth
+        self.stages = OrderedDict()
+        self._current = self._getStage("main")
+        self.count = 0 #COM calls, read by tracing spans
+
+    def __repr__(self):
+        return "ComProfiler Object: %s stages, %s calls"%(len(self.stages),sum([s[0] for s in self._merged(None).methods.values()]))
+
+    def _getStage(self,name):
+        if name not in self.stages:
+            self.stages[name] = ComRecorder(name)
+        return self.stages[name]
+
+    @contextmanager
+    def stage(self,name):
+        '''
+        calls in with block are recorded to stage name
+        '''
+        last = self._current
+        self._current = self._getStage(name)
+        try:
+            yield self._current
+        finally:
+            self._current = last
+
+    def reset(self):
+        self.stages = OrderedDict()
+        self._current = self._getStage("main")
+        self.count = 0
+
+    def _caller(self):
+        '''
+        first function out of this module (pyLayout function preferred), and folded stack of pyLayout functions
+        '''
+        frame = sys._getframe(3)
+        caller = None
+        names = []
+        while frame != None and len(names) < self.maxDepth:
+            name,inPackage = _codeName(frame.f_code)
+            if inPackage:
+                if caller == None:
+                    caller = name
+                    if not self.stacks:
+                        break
+                names.append(name)
+            elif caller == None and name != None:
+                caller = name
+            frame = frame.f_back
+        return caller or "<unknown>",names
+
+    def record(self,method,seconds,args,result = None):
+        self.count += 1
+        caller,names = self._caller()
+        stack = None
+        if self.stacks:
+            stack = ";".join(list(reversed(names)) + [method])
+        self._current.add(method,seconds,argSize(args),caller,stack)
+
+
+    #--- reports
+
+    def _merged(self,stage):
+        if stage != None:
+            return self.stages[stage]
+        merged = ComRecorder("all")
+        for recorder in self.stages.values():
+            merged.merge(recorder)
+        return merged
+
+    def report(self,stage = None):
+        '''
+        dict of stage: methods sorted by total time, callers sorted by total time
+        '''
+        recorder = self._merged(stage)
+        methods = []
+        for method,(count,total,latencies,argTotal,argMax) in recorder.methods.items():
+            latencies = sorted(latencies)
+            methods.append(OrderedDict([("Method",method),("Count",count),("Total",total),("Mean",total/count),
+                                        ("P50",percentile(latencies,0.5)),("P90",percentile(latencies,0.9)),
+                                        ("P99",percentile(latencies,0.99)),("Max",latencies[-1]),
+                                        ("ArgMean",float(argTotal)/count),("ArgMax",argMax)]))
+        methods.sort(key = lambda m: -m["Total"])
+
+        callers = [OrderedDict([("Caller",caller),("Method",method),("Count",count),("Total",total)])
+                   for (caller,method),(count,total) in recorder.callers.items()]
+        callers.sort(key = lambda c: -c["Total"])
+
+        return OrderedDict([("Stage",recorder.name),("Calls",sum([m["Count"] for m in methods])),
+                            ("Time",sum([m["Total"] for m in methods])),("Methods",methods),("Callers",callers)])
+
+    def summary(self,stage = None,top = 20):
+        rpt = self.report(stage)
+        lines = ["COM calls of %s: %s calls, %.3fs"%(rpt["Stage"],rpt["Calls"],rpt["Time"])]
+        lines.append("%-48s %8s %10s %10s %10s %10s"%("method","count","total(s)","p50(ms)","p99(ms)","argMean"))
+        for m in rpt["Methods"][:top]:
+            lines.append("%-48s %8s %10.3f %10.3f %10.3f %10.1f"%(m["Method"],m["Count"],m["Total"],m["P50"]*1000,m["P99"]*1000,m["ArgMean"]))
+        return "\n".join(lines)
+
+    def dumpJson(self,path,stage = None):
+        with open(path,"w") as f:
+            json.dump(self.report(stage),f,indent = 2)
+        return path
+
+    def dumpCsv(self,path,stage = None):
+        '''
+        one line per method, then one line per (caller, method)
+        '''
+        rpt = self.report(stage)
+        with open(path,"w") as f:
+            f.write("Method,Count,Total,Mean,P50,P90,P99,Max,ArgMean,ArgMax\n")
+            for m in rpt["Methods"]:
+                f.write("%s,%s,%.6f,%.6f,%.6f,%.6f,%.6f,%.6f,%.1f,%s\n"%tuple(m.values()))
+            f.write("\nCaller,Method,Count,Total\n")
+            for c in rpt["Callers"]:
+                f.write("%s,%s,%s,%.6f\n"%tuple(c.values()))
+        return path
+
+    def dumpStacks(self,path,stage = None):
+        '''
+        folded stacks, weight in microseconds: flamegraph.pl path > com.svg
+        '''
+        recorder = self._merged(stage)
+        with open(path,"w") as f:
+            for stack,(count,total) in sorted(recorder.stacks.items()):
+                f.write("%s %d\n"%(stack,int(total*1e6)))
+        return path
+
+    def dumpStages(self,folder,prefix = "com"):
+        '''
+        json, csv and folded stacks of each stage, return paths
+        '''
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        paths = []
+        for i,name in enumerate(self.stages.keys()):
+            if not self.stages[name].methods:
+                continue
+            base = os.path.join(folder,"%s_%02d_%s"%(prefix,i,name))
+            paths.append(self.dumpJson(base + ".json",name))
+            paths.append(self.dumpCsv(base + ".csv",name))
+            if self.stacks:
+                paths.append(self.dumpStacks(base + ".folded",name))
+        return paths
+
+
+class ComProxy(object):
+    '''
+    forward attributes to COM object, method calls are timed by profiler
+    COM objects returned by methods of _objectMethods (GetModule, GetDefinitionManager, SetActiveEditor ...) are wrapped too,
+    results of other methods are returned as they are
+    profiler: any object with record(method,seconds,args,result), ComProfiler or comReplay.CallRecorder
+    '''
+
+    def __init__(self,obj,name,profiler):
+        object.__setattr__(self,"_obj",obj)
+        object.__setattr__(self,"_name",name)
+        object.__setattr__(self,"_profiler",profiler)
+        object.__setattr__(self,"_wrapped",{})
+
+    def __repr__(self):
+        return "ComProxy(%s): %s"%(self._name,repr(self._obj))
+
+    def __getattr__(self,key):
+        wrapped = self._wrapped.get(key)
+        if wrapped != None:
+            return wrapped
+
+        attr = getattr(self._obj,key)
+        if key.startswith("__") or not callable(attr):
+            return attr
+
+        method = "%s.%s"%(self._name,key)
+        profiler = self._profiler
+        name = self._name
+        def wrapper(*args):
+            args2 = [a._obj if isinstance(a,ComProxy) else a for a in args]
+            start = _timer()
+            result = attr(*args2)
+            profiler.record(method,_timer()-start,args2,result)
+            if not _isComObject(key,result):
+                return result
+            return ComProxy(result,_childName(name,key,args2),profiler)
+
+        self._wrapped[key] = wrapper
+        return wrapper
+
+    def __setattr__(self,key,value):
+        setattr(self._obj,key,value)
+
+    def __eq__(self,other):
+        return self._obj == unwrapCom(other)
+
+    def __ne__(self,other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._obj)
+
+    def __bool__(self):
+        return True
+
+    __nonzero__ = __bool__
+
+
+def _childName(name,method,args):
+    '''
+    oDesign.GetModule("SolveSetups") -> oDesign.SolveSetups
+    '''
+    if args and isinstance(args[0],basestring):
+        return "%s.%s"%(name,args[0])
+    if method.startswith("Get"):
+        method = method[3:]
+    return "%s.%s"%(name,method)
+
+def wrapCom(obj,name,profiler):
+    if obj == None or isinstance(obj,ComProxy):
+        return obj
+    return ComProxy(obj,name,profiler)
+
+def unwrapCom(obj):
+    if isinstance(obj,ComProxy):
+        return obj._obj
+    return obj
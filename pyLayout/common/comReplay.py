@@ -0,0 +1,227 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+record COM calls of a live AEDT session, and replay them without AEDT (offline test and benchmark).
+
+CallRecorder records every call of oDesktop and handles got from it (oProject, oDesign, oEditor, modules, managers):
+    method, arguments, result and latency. Same results are saved once, file is json (gzip if path ends with .gz).
+
+ReplaySession serves the recorded results by (handle, method, arguments), same call repeated returns the results in recorded order,
+after the last one the last result is returned again. Latency: 0 no latency, 1 recorded latency, or scale of recorded latency.
+
+Examples:
+    record on live AEDT
+    >>> layout = Layout()
+    >>> recorder = layout.recordCom()
+    >>> layout.initDesign()
+    >>> layout.Pins.ObjectDict
+    >>> recorder.save("board.comrec.gz")
+
+    replay, no AEDT
+    >>> layout = Layout.fromReplay("board.comrec.gz",latency = 0,projectDir = "/tmp/board")
+    >>> layout.initDesign()
+    >>> layout.Pins.ObjectDict
+'''
+
+import os
+import time
+import json
+import gzip
+from .common import log
+from .comProfiler import ComProxy,_childName,_isComObject,_valueTypes,basestring
+
+
+def _open(path,mode):
+    if path.endswith(".gz"):
+        return gzip.open(path,mode + "t") if str is not bytes else gzip.open(path,mode + "b")
+    return open(path,mode)
+
+def _copy(value):
+    #results may be changed by caller
+    if isinstance(value,list):
+        return [_copy(v) for v in value]
+    if isinstance(value,dict):
+        return dict([(k,_copy(v)) for k,v in value.items()])
+    return value
+
+def callKey(method,args):
+    return "%s(%s)"%(method,json.dumps(args,separators = (",",":")))
+
+
+class CallRecorder(object):
+    '''
+    record(method,seconds,args,result) is called by ComProxy
+    '''
+
+    def __init__(self):
+        self.calls = {} #callKey -> [[resultIndex,latency us]]
+        self.results = [] #unique results
+        self._resultIndex = {} #json of result -> index
+        self._handles = {} #id of raw COM object -> handle name
+        self._objects = [] #keep raw objects alive, id not reused
+        self.count = 0
+
+    def __repr__(self):
+        return "CallRecorder Object: %s calls, %s keys, %s results"%(self.count,len(self.calls),len(self.results))
+
+    def wrap(self,obj,name = "oDesktop"):
+        self._handles[id(obj)] = name
+        self._objects.append(obj)
+        return ComProxy(obj,name,self)
+
+    def _encode(self,value):
+        if isinstance(value,(list,tuple)):
+            return [self._encode(v) for v in value]
+        if isinstance(value,dict):
+            return dict([(str(k),self._encode(v)) for k,v in value.items()])
+        if isinstance(value,ComProxy):
+            return {"__handle__":value._name}
+        if isinstance(value,_valueTypes):
+            return value
+        name = self._handles.get(id(value))
+        if name != None:
+            return {"__handle__":name}
+        if hasattr(value,"__iter__"):
+            #.NET arrays (System.String[]) in IronPython
+            return [self._encode(v) for v in value]
+        return str(value)
+
+    def record(self,method,seconds,args,result = None):
+        self.count += 1
+        name,key = method.rsplit(".",1)
+        if not _isComObject(key,result):
+            encoded = self._encode(result)
+        else:
+            #same name as the ComProxy of result
+            handle = _childName(name,key,args)
+            self._handles[id(result)] = handle
+            self._objects.append(result)
+            encoded = {"__handle__":handle}
+
+        text = json.dumps(encoded,separators = (",",":"),sort_keys = True)
+        index = self._resultIndex.get(text)
+        if index == None:
+            index = self._resultIndex[text] = len(self.results)
+            self.results.append(encoded)
+        self.calls.setdefault(callKey(method,self._encode(list(args))),[]).append([index,int(seconds*1e6)])
+
+    def save(self,path):
+        data = {"Version":1,"Results":self.results,"Calls":self.calls}
+        with _open(path,"w") as f:
+            f.write(json.dumps(data,separators = (",",":")))
+        log.info("%s COM calls recorded to: %s"%(self.count,path))
+        return path
+
+
+class ReplayHandle(object):
+    '''
+    stand-in of COM object, every method call is answered by ReplaySession
+    '''
+
+    def __init__(self,name,session):
+        object.__setattr__(self,"_name",name)
+        object.__setattr__(self,"_session",session)
+
+    def __repr__(self):
+        return "ReplayHandle(%s)"%self._name
+
+    def __getattr__(self,key):
+        if key.startswith("__"):
+            raise AttributeError(key)
+        method = "%s.%s"%(self._name,key)
+        session = self._session
+        def call(*args):
+            return session.call(method,args)
+        object.__setattr__(self,key,call) #next access without __getattr__
+        return call
+
+    def __eq__(self,other):
+        return isinstance(other,ReplayHandle) and other._name == self._name
+
+    def __ne__(self,other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._name)
+
+
+class ReplaySession(object):
+    '''
+    latency: 0 no latency, 1 recorded latency, or scale of recorded latency
+    strict: exception if call not recorded, else return None
+    overrides: method name -> result, for example {"GetPath":"/tmp/board"} (project folder of log file)
+    '''
+
+    def __init__(self,data,latency = 0,strict = True,overrides = None):
+        self.results = data["Results"]
+        self.calls = data["Calls"]
+        self.latency = latency
+        self.strict = strict
+        self.overrides = overrides or {}
+        self._cursor = {}
+        self._handles = {}
+        self.count = 0
+        self.missed = []
+
+    def __repr__(self):
+        return "ReplaySession Object: %s keys, %s calls replayed, %s missed"%(len(self.calls),self.count,len(self.missed))
+
+    @classmethod
+    def load(cls,path,latency = 0,strict = True,overrides = None):
+        with _open(path,"r") as f:
+            data = json.loads(f.read())
+        return cls(data,latency,strict,overrides)
+
+    @property
+    def oDesktop(self):
+        return self.getHandle("oDesktop")
+
+    def getHandle(self,name):
+        if name not in self._handles:
+            self._handles[name] = ReplayHandle(name,self)
+        return self._handles[name]
+
+    def reset(self):
+        '''
+        replay from the first recorded result again
+        '''
+        self._cursor = {}
+        self.count = 0
+        self.missed = []
+
+    def _encode(self,value):
+        if isinstance(value,(list,tuple)):
+            return [self._encode(v) for v in value]
+        if isinstance(value,dict):
+            return dict([(str(k),self._encode(v)) for k,v in value.items()])
+        if isinstance(value,ReplayHandle):
+            return {"__handle__":value._name}
+        return value
+
+    def _decode(self,value):
+        if isinstance(value,dict) and "__handle__" in value:
+            return self.getHandle(value["__handle__"])
+        return _copy(value)
+
+    def call(self,method,args):
+        self.count += 1
+        key = method.rsplit(".",1)[-1]
+        if key in self.overrides:
+            return self.overrides[key]
+
+        ckey = callKey(method,self._encode(list(args)))
+        records = self.calls.get(ckey)
+        if records == None:
+            self.missed.append(ckey)
+            if self.strict:
+                log.exception("COM call not recorded: %s"%ckey)
+            log.debug("COM call not recorded: %s"%ckey)
+            return None
+
+        cursor = self._cursor.get(ckey,0)
+        index,latency = records[min(cursor,len(records)-1)]
+        self._cursor[ckey] = cursor + 1
+        if self.latency:
+            time.sleep(latency*1e-6*self.latency)
+        return self._decode(self.results[index])
@@ -30,6 +30,7 @@ except:
 
 #intial log
 from .log import Log as logger
+from .regexQuery import compilePatterns
 log = logger(logLevel = "DEBUG")  #CRITICAL > ERROR > WARNING > INFO > DEBUG,
 
 isIronpython = "IronPython" in sys.version
@@ -303,11 +304,11 @@ def findDictValue(key,dict1,default = None, valid = None,ignorCase = True, maps
                 else:
                     return dict1[k]
     else:
-        if k in dict1:
-            if not dict1[k] and valid != None:
+        if key in dict1:
+            if not dict1[key] and valid != None:
                 return valid
             else:
-                return dict1[k]
+                return dict1[key]
     #other case, eg key not in dict1   
     val = default if valid == None else valid
     #log.debug("Not found key value:%s , return value %s"%(key,val))
@@ -455,12 +456,15 @@ def regAnyMatch(regs,val,flags = re.IGNORECASE):
     '''
     regs: str or list
     val: str or list
+    
+    patterns are compiled once and cached, list of regs are merged to one regex
     '''
     if isinstance(regs, str) and isinstance(val, str):
-        return re.match(regs+"$",val,flags)
+        return compilePatterns(regs+"$",flags).match(val)
     
     if not isinstance(regs,str) and isinstance(val, str):
-        return any([regAnyMatch(r+"$",val) for r in regs])
+        regs = tuple([r+"$" for r in regs])
+        return bool(regs) and bool(compilePatterns(regs).match(val))
 
     if not isinstance(val, (str,list,tuple)):
         return False
@@ -502,27 +506,15 @@ def copyAedt(source,target):
     
 
 def ProcessTime(func):
-    @wraps(func)
-    def wrapped_function(*args, **kwargs):
-        log.info("start function: {0}".format(func.__name__))
-        if isIronpython:
-            tfun = time.clock
-        else:
-            tfun = time.time
-            
-        start = tfun()
-        func(*args, **kwargs)
-        end = tfun()
-        
-        log.info("{0}: Process time {1}s".format(func.__name__,end-start))
-    return wrapped_function
+    '''
+    log process time of function, as a tracing span (pyLayout.common.tracing), return value is passed through
+    '''
+    from .tracing import traced
+    return traced(logTime = True)(func)
 
 def DisableAutoSave(func):
-    @wraps(func)
-    def wrapped_function(self,*args, **kwargs):
-        log.info("Disable AutoSave for function: {0}".format(func.__name__))
-        temp = self.layout.enableAutosave(flag=False)
-        func(self,*args, **kwargs)
-        log.info("Recover AutoSave for function: {0}".format(func.__name__))
-        temp = self.layout.enableAutosave(flag=temp)
-    return wrapped_function
+    '''
+    disable AEDT AutoSave during the function, as a tracing span (pyLayout.common.tracing), return value is passed through
+    '''
+    from .tracing import traced
+    return traced(autoSave = False)(func)
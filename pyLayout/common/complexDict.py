@@ -75,6 +75,7 @@ Return:
 import sys
 import os
 import re
+import weakref
 from copy import deepcopy
 from .common import loadJson,writeJson,findDictValue,findDictKey,update2Dict,regAnyMatch
 from .common import log
@@ -230,6 +231,106 @@ def delDictKey(key,dict1,ignorCase = True):
         raise Exception("key error: %s"%str(key))
     
 
+class MapEntry(object):
+    '''
+    compiled item of maps, build by compileMaps
+    
+    alias maps: {"X1":"X"}, key is target key str
+    function maps: {"X1":{"Key":"X","Get":func,"Set":func,"Default":value}}, key is str or tuple, arity is count of keys
+    '''
+    __slots__ = ["alias","key","isFunc","arity","getter","setter","hasDefault","default"]
+    
+    def __init__(self,alias,target):
+        self.alias = alias
+        self.getter = None
+        self.setter = None
+        self.hasDefault = False
+        self.default = None
+        
+        if isinstance(target, dict):
+            items = dict([(k.lower(),v) for k,v in target.items() if isinstance(k, str)])
+            key = items.get("key")
+            self.isFunc = True
+            self.key = tuple(key) if isinstance(key, (list,tuple)) else key
+            self.arity = len(self.key) if isinstance(self.key, tuple) else 1
+            self.getter = items.get("get")
+            self.setter = items.get("set")
+            self.hasDefault = "default" in items
+            self.default = items.get("default")
+        else:
+            self.isFunc = False
+            self.key = target
+            self.arity = 1
+    
+    def __repr__(self):
+        return "MapEntry: %s->%s"%(self.alias,str(self.key))
+
+def compileMaps(maps):
+    '''
+    compile maps once to {lower case alias: MapEntry}, used by ComplexDict and ArrayStruct
+    '''
+    compiled = {}
+    if isinstance(maps, ComplexDict):
+        maps = maps.Dict
+    if not isinstance(maps, dict):
+        return compiled
+    
+    for alias,target in maps.items():
+        if not isinstance(alias, str):
+            continue
+        compiled.setdefault(alias.lower(),MapEntry(alias,target))
+    return compiled
+    
+
+class KeyIndex(object):
+    '''
+    lower case key -> keys of one dict (keys differ only in case are all kept), 
+    shared by ComplexDict objects wrap the same dict, so changes by any of them update the index.
+    size is checked for changes of dict outside of ComplexDict, invalidate() force a rebuild.
+    '''
+    __slots__ = ["keys","size","__weakref__"]
+    
+    def __init__(self,dict1):
+        self.build(dict1)
+    
+    def build(self,dict1):
+        keys = {}
+        for k in dict1:
+            if isinstance(k, str):
+                keys.setdefault(k.lower(),[]).append(k)
+        self.keys = keys
+        self.size = len(dict1)
+    
+    def invalidate(self):
+        self.size = -1
+    
+    def add(self,key,size):
+        if isinstance(key, str):
+            keys = self.keys.setdefault(key.lower(),[])
+            if key not in keys:
+                keys.append(key)
+        self.size = size
+    
+    def remove(self,key,size):
+        if isinstance(key, str):
+            lower = key.lower()
+            keys = self.keys.get(lower)
+            if keys and key in keys:
+                keys.remove(key)
+                if not keys:
+                    del self.keys[lower]
+        self.size = size
+    
+    def find(self,lower,dict1):
+        for k in self.keys.get(lower,()):
+            if k in dict1:
+                return k
+        return None
+
+#id of dict -> KeyIndex, entry is removed with the last ComplexDict using it
+_keyIndexes = weakref.WeakValueDictionary()
+
+
 class ComplexDict(object): 
 
     '''
@@ -240,6 +341,12 @@ class ComplexDict(object):
         maps: { Key:{"Value":(x1,x2) ,"Get":lambda (x1,x2):xx*2, "Set":lambda x:xx=x}}
     '''
     enableUpdate = False
+    _keyIndex = None #KeyIndex of _dict, build when first used
+    _compiledMaps = None #lower case alias -> MapEntry, build by setMaps
+    _mapsSize = -1
+    _keySeq = None #key list of _dict for int/slice index and iteration, build when first used
+    _keySeqSize = -1
+    
     def __init__(self,dictData=None, path = None, maps = None):
         self._dict = {}  #intial as empty dict
         self.ignorCase = True
@@ -269,16 +376,18 @@ class ComplexDict(object):
         
         """
         
-        #use for loop iteration, return values
+        #index by int, return values
         if isinstance(key, int):
             if isinstance(self._dict , (list,tuple,ComplexDict)):
-                self._dict[key]
+                return self._dict[key]
             else:
-                #return keys
-                return self._dict[list(self._dict.keys())[key]]
+                #return values
+                return self._dict[self._keyList()[key]]
         
         if isinstance(key, slice):
-            return [self[i] for i in range(len(self))[key]]
+            if isinstance(self._dict , (list,tuple,ComplexDict)):
+                return list(self._dict[key])
+            return [self._dict[k] for k in self._keyList()[key]]
             
         val = self.get(key,default= "//key_not_found//")
         if val == "//key_not_found//":
@@ -302,10 +411,10 @@ class ComplexDict(object):
 
     def __contains__(self,key):
         
-        if self.maps and key in self.maps:
+        if self._getMapEntry(key) != None:
             return True
         
-        if key in self._dict:
+        if self._findKey(key) != "//key_not_found//":
             return True
         
         try:
@@ -332,13 +441,13 @@ class ComplexDict(object):
             print("property or key must be string: %s"% str(key))
             raise("property or key must be string: %s"% str(key))
         
-        if key in ["_dict","maps","ignorCase","enableUpdate"]:
+        if key in ["_dict","maps","ignorCase","enableUpdate","_keyIndex","_compiledMaps","_mapsSize","_keySeq","_keySeqSize"]:
             try:
                 return object.__getattr__(self,key)
             except:
                 print("property or key not exist: %s"%key)
         else:
-            log.debug("__getattr__ from _dict: %s"%key)
+            log.debug("__getattr__ from _dict: %s",key)
             return self[key]
         
 
@@ -351,15 +460,34 @@ class ComplexDict(object):
             print("property or key must be string: %s"% str(key))
             raise("property or key must be string: %s"% str(key))
         
-        if key in ["_dict","maps","ignorCase","enableUpdate"]:
+        if key in ["_dict","maps","ignorCase","enableUpdate","_keyIndex","_compiledMaps","_mapsSize","_keySeq","_keySeqSize"]:
             object.__setattr__(self,key,value)
+            if key == "_dict":
+                object.__setattr__(self,"_keyIndex",None) #rebuild index for new dict
+                object.__setattr__(self,"_keySeq",None)
+            if key == "maps":
+                object.__setattr__(self,"_compiledMaps",None) #compile again for new maps
         else:
-            log.debug("__setattribute__ from _dict: %s"%key)
+            log.debug("__setattribute__ from _dict: %s",key)
             self[key] = value
     
     def __len__(self):
         return len(self._dict)
     
+    def __iter__(self):
+        '''
+        iterate values, same as for loop by int index before.
+        keys are taken from the cached key list, items deleted during the loop are skipped
+        '''
+        dict1 = self._dict
+        if not isinstance(dict1, dict):
+            for v in dict1:
+                yield v
+            return
+        
+        for k in self._iterKeys():
+            yield dict1[k]
+    
     def __str__(self, *args, **kwargs):
         return str(self._dict)
         
@@ -401,7 +529,164 @@ class ComplexDict(object):
         
     def clear(self):
         self._dict.clear()
+        self.invalidateIndex()
+        self._keyIndex = None
+        self._keySeq = None
         del self._dict
+    
+    def _keyList(self):
+        '''
+        cached key list of _dict, build again if keys changed by ComplexDict or size of _dict changed outside.
+        '''
+        keySeq = self._keySeq
+        if keySeq == None or self._keySeqSize != len(self._dict):
+            keySeq = list(self._dict.keys())
+            self._keySeq = keySeq
+            self._keySeqSize = len(keySeq)
+        return keySeq
+    
+    def _iterKeys(self):
+        '''
+        iterate keys of the cached key list, keys deleted during the loop are skipped.
+        if keys changed outside with same size of _dict, new keys are yield at the end and the list is build again.
+        '''
+        dict1 = self._dict
+        keySeq = self._keyList()
+        stale = False
+        for k in keySeq:
+            if k in dict1:
+                yield k
+            elif self._keySeq is keySeq: #not deleted by ComplexDict
+                stale = True
+        
+        if stale:
+            self._keySeq = None
+            seen = set(keySeq)
+            for k in list(dict1.keys()):
+                if k not in seen and k in dict1:
+                    yield k
+    
+    def items(self):
+        '''
+        iterate (key,value), items deleted during the loop are skipped
+        '''
+        dict1 = self._dict
+        if not isinstance(dict1, dict):
+            for i,v in enumerate(dict1):
+                yield i,v
+            return
+        
+        for k in self._iterKeys():
+            yield k,dict1[k]
+    
+    def iterBatches(self,size = 1000):
+        '''
+        iterate values in list of length size, the last list may be shorter
+        '''
+        if size < 1:
+            log.exception("batch size must be larger than 0: %s"%size)
+        
+        batch = []
+        for v in self:
+            batch.append(v)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def _getKeyIndex(self):
+        '''
+        KeyIndex shared by ComplexDict objects of the same dict, build again if size of _dict changed outside
+        '''
+        dict1 = self._dict
+        index = self._keyIndex
+        if index == None:
+            index = _keyIndexes.get(id(dict1))
+            if index == None:
+                index = KeyIndex(dict1)
+                _keyIndexes[id(dict1)] = index
+            self._keyIndex = index
+        if index.size != len(dict1):
+            index.build(dict1)
+        return index
+    
+    def invalidateIndex(self):
+        '''
+        call after keys of _dict changed outside of ComplexDict (same size), index is build again at next lookup
+        '''
+        if self._keyIndex != None:
+            self._keyIndex.invalidate()
+        self._keySeq = None
+    
+    def _findKey(self,key):
+        '''
+        find key of _dict ignore case by index, return "//key_not_found//" if not found.
+        same as findDictKey scan: the first inserted key wins if keys differ only in case ("Net","NET").
+        an index miss fall back to the scan, _dict may be changed outside of ComplexDict with same size.
+        '''
+        dict1 = self._dict
+        if not isinstance(key, str) or not isinstance(dict1, dict):
+            return "//key_not_found//"
+        
+        if not self.ignorCase:
+            return key if key in dict1 else "//key_not_found//"
+        
+        index = self._getKeyIndex()
+        lower = key.lower()
+        k = index.find(lower,dict1)
+        if k != None:
+            return k
+        
+        #slow path, keys changed outside
+        for k in dict1:
+            if isinstance(k, str) and k.lower() == lower:
+                index.build(dict1)
+                return k
+        return "//key_not_found//"
+    
+    def _indexKey(self,key):
+        if self._keyIndex != None:
+            self._keyIndex.add(key,len(self._dict))
+    
+    def _getData(self,key):
+        k = self._findKey(key)
+        if k != "//key_not_found//":
+            return self._dict[k]
+        
+        if isinstance(key, str) and isinstance(self._dict, dict) and not re.search(r"[\\/]",key):
+            return "//key_not_found//"
+        
+        #path mode key
+        return getDictData(key,self._dict, default = "//key_not_found//")
+    
+    def _setData(self,key,value):
+        k = self._findKey(key)
+        if k != "//key_not_found//":
+            self._dict[k] = value
+            return
+        
+        if isinstance(key, str) and isinstance(self._dict, dict) and not re.search(r"[\\/]",key):
+            if self.enableUpdate:
+                self.update(key,value)
+                return
+            raise Exception("key error: %s"%str(key))
+        
+        #path mode key, may add key to _dict
+        setDictData(key,value,self._dict,enableUpdate=self.enableUpdate)
+        self.invalidateIndex()
+    
+    def _delData(self,key):
+        k = self._findKey(key)
+        if k != "//key_not_found//":
+            del self._dict[k]
+            self._keySeq = None
+            if self._keyIndex != None:
+                self._keyIndex.remove(k,len(self._dict))
+            return
+        
+        delDictKey(key,self._dict)
+        self.invalidateIndex()
 
     @property
     def Props(self):
@@ -484,14 +769,46 @@ class ComplexDict(object):
 #                     self.update(key, dict2[key])
                     
     def update(self,key,value):
+        if self._keySeq != None and key not in self._dict:
+            self._keySeq = None
         self._dict[key] = value
+        self._indexKey(key)
         
     def append(self,dict2):
         self._dict.update(dict2._dict)
+        self._keySeq = None
+        if self._keyIndex != None:
+            for key in dict2._dict:
+                self._indexKey(key)
     
-    def setMaps(self,maps):
+    def setMaps(self,maps,compiledMaps = None):
+        '''
+        compiledMaps: compileMaps(maps) shared by objects with same maps (class level maps), not compiled again
+        '''
         self.maps = maps
+        if compiledMaps != None:
+            self._compiledMaps = compiledMaps
+            self._mapsSize = len(maps)
+        else:
+            self._compileMaps()
     
+    def _compileMaps(self):
+        self._compiledMaps = compileMaps(self.maps)
+        self._mapsSize = len(self.maps) if isinstance(self.maps, (dict,ComplexDict)) else -1
+        return self._compiledMaps
+    
+    def _getMapEntry(self,key):
+        '''
+        return MapEntry of key or None, maps compiled again if items of maps changed outside.
+        '''
+        maps = self.maps
+        if not maps or not isinstance(maps, (dict,ComplexDict)) or not isinstance(key, str):
+            return None
+        
+        compiled = self._compiledMaps
+        if compiled == None or self._mapsSize != len(maps):
+            compiled = self._compileMaps()
+        return compiled.get(key.lower())
     
     def get(self,key,default = None):
         '''
@@ -512,38 +829,35 @@ class ComplexDict(object):
         
         '''
         #map key have high priority then Array key
-        if self.maps and isinstance(self.maps, dict):
-            maps = ComplexDict(self.maps)
-            if key in maps:
-                mapKey = maps[key]
-                log.debug("found key in maps: %s->%s:"%(key,mapKey))
-                if isinstance(mapKey,ComplexDict): #if map key is dict, execulte lambda function
-                    if isinstance(mapKey["Key"], str): #if only one key
-                        data = getDictData(mapKey["Key"],self._dict, default = "//key_not_found//") 
-                        if data != "//key_not_found//":
-                            return mapKey["Get"](data)
-                        elif "Default" in mapKey:
-                            return mapKey["Default"]
-                        else:
-                            raise KeyError("key error: %s"%str(mapKey))
-                        
-                    elif isinstance(mapKey["Key"], (list,tuple,ComplexDict)): #if more then one key, lambda should return same size value
-                        datas = [getDictData(value,self._dict, default = "//key_not_found//") for value in mapKey["Key"]] 
-                        if not regAnyMatch("//key_not_found//", datas):
-                            return mapKey["Get"](*datas)
-                        elif "Default" in mapKey:
-                            return mapKey["Default"]
-                        else:
-                            raise KeyError("key error: %s"%str(mapKey))
+        entry = self._getMapEntry(key)
+        if entry != None:
+            if entry.isFunc: #if map key is dict, execulte lambda function
+                if entry.arity == 1 and isinstance(entry.key, str): #if only one key
+                    data = self._getData(entry.key)
+                    if not (isinstance(data, str) and data == "//key_not_found//"):
+                        return entry.getter(data)
+                    elif entry.hasDefault:
+                        return entry.default
                     else:
-                        pass
+                        raise KeyError("key error: %s"%str(entry.key))
+                    
+                elif isinstance(entry.key, tuple): #if more then one key, lambda should return same size value
+                    datas = [self._getData(k) for k in entry.key] 
+                    if "//key_not_found//" not in [d for d in datas if isinstance(d, str)]:
+                        return entry.getter(*datas)
+                    elif entry.hasDefault:
+                        return entry.default
+                    else:
+                        raise KeyError("key error: %s"%str(entry.key))
                 else:
-                    #return map key values
-                    val = getDictData(mapKey,self._dict, default = "//key_not_found//")
-                    if val != "//key_not_found//":
-                        return val
+                    pass
+            else:
+                #return map key values
+                val = self._getData(entry.key)
+                if not (isinstance(val, str) and val == "//key_not_found//"):
+                    return val
         
-        val = getDictData(key, self._dict, default = "//key_not_found//")
+        val = self._getData(key)
         
         if val == "//key_not_found//":
             if default == None:
@@ -560,45 +874,40 @@ class ComplexDict(object):
         '''
         
         #map key have high priority then Array key
-        if self.maps and isinstance(self.maps, dict):
-            maps = ComplexDict(self.maps)
-            if key in maps:
-                log.debug("found key in array, mapKey: %s->%s:"%(key,maps[key]))
-                mapKey = maps[key]
-                if isinstance(mapKey,ComplexDict):
-                    if isinstance(mapKey["Key"], str):
-                        if "Set" not in mapKey:
-                            log.exception("%s property is read only."%mapKey["Key"])
-                            
-                        if mapKey["Key"].lower() == "self":
-                            return mapKey["Set"](self[mapKey["Key"]],value)
-                        else:
-                            returnValue = mapKey["Set"](value)
-                        if returnValue!=None: 
-                            #set return value to dict
-                            setDictData(mapKey["Key"],returnValue,self._dict,enableUpdate=self.enableUpdate)
-                        else:
-                            #if returnValue is none value, which mean returnValue not need,value is set by function.
-                            pass
-                        
-                    elif isinstance(mapKey["Key"], (list,tuple,ComplexDict)):
-                        if "Set" not in mapKey:
-                            log.exception("%s property is read only."%mapKey["Key"])
-                        returnValue = mapKey["Set"](value)
-                        for i in range(len(mapKey)):
-                            if returnValue!=None: 
-                                setDictData(mapKey["Key"][i],returnValue[i],self._dict,enableUpdate=self.enableUpdate)
-                            else:
-                                #if returnValue is none value, which mean returnValue not need,value is set by function.
-                                pass
+        entry = self._getMapEntry(key)
+        if entry != None:
+            if entry.isFunc:
+                if entry.setter == None:
+                    log.exception("%s property is read only."%str(entry.key))
+                    
+                if isinstance(entry.key, str):
+                    if entry.key.lower() == "self":
+                        return entry.setter(self[entry.key],value)
+                    else:
+                        returnValue = entry.setter(value)
+                    if returnValue!=None: 
+                        #set return value to dict
+                        self._setData(entry.key,returnValue)
+                    else:
+                        #if returnValue is none value, which mean returnValue not need,value is set by function.
+                        pass
+                    
+                elif isinstance(entry.key, tuple):
+                    returnValue = entry.setter(value)
+                    if returnValue!=None: 
+                        for i in range(entry.arity):
+                            self._setData(entry.key[i],returnValue[i])
                     else:
+                        #if returnValue is none value, which mean returnValue not need,value is set by function.
                         pass
                 else:
-                    setDictData(mapKey,value,self._dict,enableUpdate=self.enableUpdate)
-                
-                return None
+                    pass
+            else:
+                self._setData(entry.key,value)
+            
+            return None
 
-        setDictData(key,value,self._dict,enableUpdate=self.enableUpdate)
+        self._setData(key,value)
         
 #         try:
 #             setDictData(key,value,self._dict)
@@ -619,11 +928,9 @@ class ComplexDict(object):
             return key
         
         
-        if isinstance(self.maps, dict):
-            for k,v in self.maps.items():
-                if isinstance(k, str) and k.lower() == key.lower(): #isinstance(k, str) add 20240428 yongsheng Guo
-                    log.debug("found key in maps, mapKey: %s:"% v)
-                    return v["Key"] if isinstance(v, dict) else v
+        entry = self._getMapEntry(key)
+        if entry != None:
+            return entry.key
             
         return "//key_not_found//"
     
@@ -638,26 +945,22 @@ class ComplexDict(object):
         if key2 != "//key_not_found//":
             return key2
         else:
-            for k in self._dict:
-                if k.lower() == key.lower():
-                    return k
-            return key
+            k = self._findKey(key)
+            return k if k != "//key_not_found//" else key
 
     def delKey(self,key):
         
-        if self.maps and isinstance(self.maps, dict):
-            for k,v in self.maps.items():
-                if k.lower() == key.lower():
-#                     log.debug("found key in maps, mapKey: %s:"% v)
-                    if isinstance(v, dict):
-                        log.debug("Could not remove function maps keys: %s"%key)
-                        return None
-                    else:
-                        log.debug("del key from map key %s:"% k)
-                        delDictKey(v,self._dict)
-                        return None
+        entry = self._getMapEntry(key)
+        if entry != None:
+            if entry.isFunc:
+                log.debug("Could not remove function maps keys: %s"%key)
+                return None
+            else:
+                log.debug("del key from map key %s:"% entry.alias)
+                self._delData(entry.key)
+                return None
                         
-        delDictKey(key,self._dict)
+        self._delData(key)
         
         
     def findNode(self,nodeName):
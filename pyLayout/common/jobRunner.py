@@ -0,0 +1,290 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+asyncio runner of batch solve jobs (ansysedt -batchsolve), python3 only (not import it in IronPython).
+
+- stdout/stderr of jobs are written to log line by line when they arrive
+- at most maxJobs jobs run at same time, others wait in queue. jobs submitted without runner share defaultRunner
+- job (with its child processes) is killed after timeout seconds, even if it closed stdout/stderr
+- result of job: return code, wall time and peak RSS of the process tree (psutil, or /proc on linux)
+
+Examples:
+    >>> runner = JobRunner(maxJobs = 2,timeout = 4*3600)
+    >>> async def solveAll():
+    >>>     futures = [runner.submit(batchSolveCommand(exePath,aedt,cores = 8)) for aedt in aedtFiles]
+    >>>     return await asyncio.gather(*futures)
+    >>> results = asyncio.run(solveAll())
+    >>> results[0]
+    JobResult aedt_0: returncode 0, 1203.4 seconds, peak RSS 8123.5 MB
+
+    from sync code
+    >>> results = runner.runAll([cmd1,cmd2,cmd3])
+
+    jobs of layouts, at most defaultRunner.maxJobs solves at same time
+    >>> results = await asyncio.gather(layout1.submitJobAsync(cores = 8),layout2.submitJobAsync(cores = 8))
+'''
+
+import os
+import time
+import asyncio
+from .common import log
+
+try:
+    import psutil
+except:
+    psutil = None
+
+
+def batchSolveCommand(exePath,aedtPath,host = "localhost",cores = 20,jobId = None):
+    '''
+    command of ansysedt -batchsolve, same as Layout.submitJob
+    '''
+    if jobId == None:
+        jobId = "RSM_{:.5f}".format(time.time()).replace(".","")
+    return '"{exePath}" -jobid {jobId} -distributed -machinelist list={host}:-1:{cores}:90%:1 -auto -monitor \
+-useelectronicsppe=1 -ng -batchoptions "" -batchsolve {aedtPath}'.format(
+                exePath = exePath,jobId = jobId,host = host, cores = cores, aedtPath = aedtPath)
+
+
+def _procChildren():
+    '''
+    parent pid -> child pids of all processes, from /proc/<pid>/stat
+    '''
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open("/proc/%s/stat"%name) as f:
+                stat = f.read()
+        except Exception:
+            continue #process exit
+        #pid (comm) state ppid ..., comm may have spaces
+        ppid = int(stat.rsplit(")",1)[1].split()[1])
+        children.setdefault(ppid,[]).append(int(name))
+    return children
+
+def _procMemory(pid):
+    '''
+    (current RSS,peak RSS) bytes of one process from /proc/<pid>/status
+    '''
+    rss,hwm = 0,0
+    try:
+        with open("/proc/%s/status"%pid) as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    rss = int(line.split()[1])*1024
+                elif line.startswith("VmHWM:"):
+                    hwm = int(line.split()[1])*1024
+    except Exception:
+        pass
+    return rss,hwm
+
+def treeMemory(pid):
+    '''
+    memory of process and all its children (the solver under a shell wrapper), bytes
+    return (current RSS of the tree, largest peak RSS of one process in the tree), None if not known
+    '''
+    if psutil != None:
+        try:
+            proc = psutil.Process(pid)
+            procs = [proc] + proc.children(recursive = True)
+        except Exception:
+            return None
+        total,peak = 0,0
+        for p in procs:
+            try:
+                info = p.memory_info()
+            except Exception:
+                continue
+            total += info.rss
+            peak = max(peak,getattr(info,"peak_wset",info.rss)) #peak_wset on windows
+        return total,peak
+
+    if not os.path.exists("/proc/%s"%pid):
+        return None
+    children = _procChildren()
+    pids = [pid]
+    for p in pids:
+        pids.extend(children.get(p,[]))
+    total,peak = 0,0
+    for p in pids:
+        rss,hwm = _procMemory(p)
+        total += rss
+        peak = max(peak,hwm)
+    return total,peak
+
+
+class JobResult(object):
+
+    def __init__(self,name,cmd):
+        self.Name = name
+        self.Cmd = cmd
+        self.ReturnCode = None
+        self.WallTime = None #seconds from process start
+        self.PeakRSS = None #bytes
+        self.TimedOut = False
+        self.OutputLines = 0
+        self.StartTime = None #time.time() of process start
+
+    def __repr__(self):
+        rss = "%.1f MB"%(self.PeakRSS/1024.0/1024) if self.PeakRSS != None else "unknown"
+        return "JobResult %s: returncode %s, %.1f seconds, peak RSS %s%s"%(self.Name,self.ReturnCode,self.WallTime or 0,rss,
+                                                                         ", timeout" if self.TimedOut else "")
+
+    @property
+    def Success(self):
+        return self.ReturnCode == 0 and not self.TimedOut
+
+
+class JobRunner(object):
+    '''
+    maxJobs: count of jobs run at same time, for all jobs submitted to the runner in one event loop
+    timeout: default timeout seconds of job, None for no limit
+    sampleInterval: seconds between memory samples
+    killWait: seconds to wait output pipes closed after job killed
+    '''
+
+    def __init__(self,maxJobs = 1,timeout = None,sampleInterval = 1.0,killWait = 5):
+        self.maxJobs = maxJobs
+        self.timeout = timeout
+        self.sampleInterval = sampleInterval
+        self.killWait = killWait
+        self._semaphore = None
+        self._loop = None
+        self._count = 0
+        self.running = 0 #jobs running now
+
+    def __repr__(self):
+        return "JobRunner Object: maxJobs %s, %s jobs submitted"%(self.maxJobs,self._count)
+
+    def _getSemaphore(self):
+        #semaphore bind to the running loop, new one for a new loop (e.g. every asyncio.run)
+        loop = asyncio.get_event_loop()
+        if self._semaphore == None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.maxJobs)
+            self._loop = loop
+        return self._semaphore
+
+    def submit(self,cmd,name = None,timeout = None,cwd = None):
+        '''
+        start job in running loop, return future of JobResult
+        cmd: str run by shell, or list of args
+        '''
+        self._count += 1
+        if name == None:
+            name = "job_%s"%self._count
+        return asyncio.ensure_future(self.run(cmd,name,timeout,cwd))
+
+    def runAll(self,cmds,timeout = None):
+        '''
+        run commands and wait all of them, return list of JobResult, for sync code
+        '''
+        async def _runAll():
+            return await asyncio.gather(*[self.submit(cmd,timeout = timeout) for cmd in cmds])
+        return asyncio.run(_runAll())
+
+    async def run(self,cmd,name = None,timeout = None,cwd = None):
+        if timeout == None:
+            timeout = self.timeout
+        result = JobResult(name,cmd)
+
+        async with self._getSemaphore():
+            log.info("start job %s: %s"%(name,cmd))
+            self.running += 1
+            start = result.StartTime = time.time()
+            #new process group on posix, kill the shell and its children together
+            options = {"stdout":asyncio.subprocess.PIPE,"stderr":asyncio.subprocess.PIPE,"cwd":cwd}
+            if os.name == "posix":
+                options["start_new_session"] = True
+            if isinstance(cmd, str):
+                proc = await asyncio.create_subprocess_shell(cmd,**options)
+            else:
+                proc = await asyncio.create_subprocess_exec(*cmd,**options)
+
+            sampler = asyncio.ensure_future(self._sample(proc,result))
+            streams = asyncio.gather(self._stream(proc.stdout,name,result,log.info),self._stream(proc.stderr,name,result,log.warning))
+            #timeout of output and process exit together, job may close its output and keep running
+            done = asyncio.gather(streams,proc.wait())
+            try:
+                await asyncio.wait_for(asyncio.shield(done),timeout)
+            except asyncio.TimeoutError:
+                result.TimedOut = True
+                log.error("job %s timeout after %s seconds, killed."%(name,timeout))
+                self._kill(proc)
+                await proc.wait()
+                try:
+                    #child not killed may keep the pipes open
+                    await asyncio.wait_for(asyncio.shield(streams),self.killWait)
+                except asyncio.TimeoutError:
+                    log.warning("output of job %s not closed after kill."%name)
+                    streams.cancel()
+            finally:
+                sampler.cancel()
+                self.running -= 1
+
+            result.ReturnCode = proc.returncode
+            result.WallTime = time.time()-start
+
+        log.info(repr(result))
+        return result
+
+    def _kill(self,proc):
+        '''
+        kill job with its child processes, the pipes are closed only after all of them exit
+        '''
+        try:
+            if psutil != None:
+                for child in psutil.Process(proc.pid).children(recursive = True):
+                    child.kill()
+            elif os.name == "posix":
+                import signal
+                os.killpg(proc.pid,signal.SIGKILL)
+                return
+            else:
+                os.system("taskkill /F /T /PID %s"%proc.pid)
+        except Exception as e:
+            log.warning("kill child processes of job error: %s"%str(e))
+        
+        if proc.returncode == None:
+            proc.kill()
+
+    async def _stream(self,reader,name,result,write):
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            result.OutputLines += 1
+            write("[%s] %s"%(name,line.decode(errors = "replace").rstrip()))
+
+    async def _sample(self,proc,result):
+        '''
+        peak of process tree RSS at samples, not less than peak RSS of the largest process (peak between samples)
+        '''
+        while proc.returncode == None:
+            memory = treeMemory(proc.pid)
+            if memory != None:
+                rss = max(memory)
+                if result.PeakRSS == None or rss > result.PeakRSS:
+                    result.PeakRSS = rss
+            await asyncio.sleep(self.sampleInterval)
+
+
+#shared runner of jobs submitted without runner, maxJobs limit all of them
+defaultRunner = JobRunner(maxJobs = 1)
+
+def submitBatchSolve(tool,runner = None,host = "localhost",cores = 20,timeout = None):
+    '''
+    close project of tool (Layout, Aedt3DToolBase, Circuit) and submit its batchsolve job to runner (default defaultRunner)
+    must be called in running event loop, return future of JobResult
+    '''
+    if runner == None:
+        runner = defaultRunner
+    installPath = tool.oDesktop.GetExeDir()
+    jobId = "RSM_{:.5f}".format(time.time()).replace(".","")
+    cmd = batchSolveCommand(os.path.join(installPath,"ansysedt.exe"),tool.ProjectPath,host = host,cores = cores,jobId = jobId)
+    log.info("Project will be closed to submit job.")
+    log.info("submit job ID: %s"%jobId)
+    tool.close(save=True)
+    return runner.submit(cmd,name = jobId,timeout = timeout)
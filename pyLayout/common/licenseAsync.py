@@ -0,0 +1,42 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+asyncio wait of license features, python3 only (not import it in IronPython).
+
+Examples:
+    >>> checker = LicenseChecker.getChecker("1055@licsrv")
+    >>> asyncio.run(checker.awaitFeatures([{"module":"HFSSSolver"}]))
+    True
+'''
+
+import time
+import asyncio
+from .common import log
+
+
+async def awaitFeatures(checker,featureList,timeout = 100*60):
+    '''
+    same rounds as LicenseChecker.waitForlicense, lmstat run in default executor, wait by asyncio.sleep
+    '''
+    loop = asyncio.get_event_loop()
+    start_time = time.time()
+    n = 0
+    while True:
+        await loop.run_in_executor(None,checker.refresh)
+        waiting = checker._checkRound(featureList)
+        elapsed_time = time.time() - start_time
+        if not waiting:
+            break
+
+        if elapsed_time>timeout:
+            log.error("Time out for license check,time cost seconds: %.1f "%elapsed_time)
+            return False
+
+        delay = min(checker._nextDelay(n),max(timeout-elapsed_time,0))
+        n += 1
+        log.info("Wait for license %s ...,  round %s, waiting time: %.1f seconds"%(", ".join(waiting),n,elapsed_time))
+        await asyncio.sleep(delay)
+
+    log.info("Check license success, time cost: %.1f seconds"%elapsed_time)
+    return True
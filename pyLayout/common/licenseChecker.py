@@ -7,15 +7,78 @@ import sys,os,re
 from .common import log,loadJson,writeJson,readCfgFile
 from .complexDict import ComplexDict
 import time
+import random
+
+#Users of elec_solve_hfss:  (Total of 10 licenses issued;  Total of 3 licenses in use)
+_usersPattern = re.compile(r"Users of\s+(\S+?):\s*\(Total\D*(\d+)\D*issued;\s*Total\D*(\d+)",re.I)
+
+def parseLmstat(text):
+    '''
+    parse output of "lmutil lmstat -a", return {feature:(issued,used)}
+    uncounted or error features are not included
+    '''
+    status = {}
+    for feature,issued,used in _usersPattern.findall(text or ""):
+        status[feature] = (int(issued),int(used))
+    return status
+
+def _runCommand(cmd):
+    with os.popen(cmd,"r") as output:
+        return output.read()
+
 
 class LicenseChecker(object):
+    '''
+    feature counts of all features are read by one "lmstat -a" per server, and cached for ttl seconds.
+    
+    Examples:
+        >>> checker = LicenseChecker.getChecker("1055@licsrv")
+        >>> checker.checkHFSSSolver()  #one lmstat for 3 features
+        >>> checker.waitForlicense([{"module":"HFSSSolver"},{"feature":"anshpc_pack","count":2}])
+        
+        canned lmstat output for test
+        >>> checker = LicenseChecker("1055@licsrv",runner = lambda cmd: text)
+    '''
+    
+    ttl = 30 #seconds of cached status
+    interval = 5 #first wait of waitForlicense, double every round
+    maxInterval = 120
+    _checkers = {} #server -> LicenseChecker
+    _licClientPath = None
     
-    def __init__(self,server):
+    def __init__(self,server,runner = None):
         '''
+        server: license server, multi servers split by ";", counts of servers are added
+        runner: function run command and return output, default os.popen
         '''
         self.server = server
         self.unusedCount = 0
+        self.runner = runner
+        self._status = {} #feature -> (issued,used)
+        self._stamp = None #time of last poll
+        self.pollCount = 0 #lmstat calls
 
+    @classmethod
+    def getChecker(cls,server):
+        '''
+        shared checker of server, cached status is reused by later checks
+        '''
+        if server not in cls._checkers:
+            cls._checkers[server] = cls(server)
+        return cls._checkers[server]
+
+    @property
+    def Servers(self):
+        return [s.strip() for s in str(self.server).split(";") if s.strip()]
+
+    @property
+    def Status(self):
+        '''
+        {feature:(issued,used)}, poll servers if cache expired
+        '''
+        if self._stamp == None or time.time()-self._stamp > self.ttl:
+            self.refresh()
+        return self._status
 
     def checkFeature(self,feature,count = 1):
         '''
@@ -80,61 +143,82 @@ class LicenseChecker(object):
     def checkHPCPack(self,count = 1):
         return self.checkFeature("anshpc_pack",count)
 
+    def _checkRound(self,featureList):
+        '''
+        check all features from cached status, return features not available
+        '''
+        waiting = []
+        for feature in featureList:
+            
+            if  "count" not in feature:
+                feature["count"] = 1
+            
+            if "module" in feature and feature["module"].strip():
+                try:
+                    func = getattr(self, "check"+ feature["module"].strip())
+                except:
+                    log.exception("No module defition: %s"%feature["module"])
+                
+                if not func(feature["count"]):
+                    waiting.append("module %s"%feature["module"])
+
+            if "feature" in feature and feature["feature"].strip():
+                if not self.checkFeature(feature["feature"].strip(),feature["count"]):
+                    waiting.append("feature %s"%feature["feature"])
+        return waiting
+
+    def _nextDelay(self,n):
+        '''
+        exponential backoff with jitter, n is round from 0
+        '''
+        delay = min(self.maxInterval,self.interval*(2**min(n,16)))
+        return random.uniform(delay/2.0,delay)
+
     def waitForlicense(self,featureList,timeout = 100*60):
         '''
         []: {"feature":elec_solve_hfss,count:1},{"module":"3DLayoutGUI",count:1}
-        '''
         
-        flag = False
+        one lmstat per server every round, wait with exponential backoff and jitter between rounds
+        '''
         start_time = time.time()
         n = 0
-        while not flag:
-            flag = True
-            
+        while True:
+            self.refresh()
+            waiting = self._checkRound(featureList)
             elapsed_time = time.time() - start_time
+            if not waiting:
+                break
+            
             if elapsed_time>timeout:
                 log.error("Time out for license check,time cost seconds: %.1f "%elapsed_time)
                 return False
             
-            for feature in featureList:
-                
-                if  "count" not in feature:
-                    feature["count"] = 1
-                
-                if "module" in feature and feature["module"].strip():
-                    try:
-                        func = getattr(self, "check"+ feature["module"].strip())
-                    except:
-                        log.info("No module defition: %s"%feature["module"])
-                        
-                    rst = func(feature["count"])
-                    flag = flag and rst
-                    if not rst:
-                        n += 1 
-                        elapsed_time = time.time() - start_time
-                        log.info("Wart for license module %s ...,  round %s, waiting time: %.1f seconds"%(feature["module"],n,elapsed_time))
-                        time.sleep(5) #wait for 5 sceond 
-                        continue
-
-                if "feature" in feature and feature["feature"].strip():
-                    rst = self.checkFeature(feature["feature"].strip(),feature["count"])
-                    flag = flag and rst
-                    if not rst:
-                        n += 1 
-                        elapsed_time = time.time() - start_time
-                        log.info("Wart for license feature %s ...,  round %s, waiting time: %.1f seconds"%(feature["feature"],n,elapsed_time))
-                        time.sleep(5) #wait for 5 sceond 
-                        continue
+            delay = min(self._nextDelay(n),max(timeout-elapsed_time,0))
+            n += 1
+            log.info("Wait for license %s ...,  round %s, waiting time: %.1f seconds"%(", ".join(waiting),n,elapsed_time))
+            time.sleep(delay)
                     
-        elapsed_time = time.time() - start_time
         log.info("Check license success, time cost: %.1f seconds"%elapsed_time)
         return True
 
+    def awaitFeatures(self,featureList,timeout = 100*60):
+        '''
+        coroutine of waitForlicense, lmstat run in executor, python3 only
+        
+        Examples:
+            >>> await checker.awaitFeatures([{"module":"HFSSSolver"}])
+        '''
+        from .licenseAsync import awaitFeatures
+        return awaitFeatures(self,featureList,timeout)
 
-    def getFeatureCount(self,feature):
+    @classmethod
+    def getLicClientPath(cls):
         '''
-        Check license
+        licensingclient dir of AEDT, found once
         '''
+        if cls._licClientPath:
+            return cls._licClientPath
+        
         aedtInstallDir = None
         if "ANSYSEM_ROOT" in os.environ and os.environ["ANSYSEM_ROOT"].strip():
             aedtInstallDir = os.environ["ANSYSEM_ROOT"]
@@ -150,39 +234,61 @@ class LicenseChecker(object):
             log.exception("AEDT InstallDir not found, please set environ ANSYSEM_ROOT=Ansys EM install path...")
         
         licClientPath = os.path.join(aedtInstallDir,"licensingclient","winx64")
-        if os.path.exists(licClientPath):
-            #before 25R2
-            log.info(licClientPath)
-            os.environ["PATH"] = licClientPath  + os.pathsep + os.environ["PATH"]
-        else:
+        if not os.path.exists(licClientPath):
             #begin 26R1
             licClientPath = os.path.join(os.path.dirname(aedtInstallDir),"licensingclient","winx64")
-            log.info(licClientPath)
-            os.environ["PATH"] = licClientPath + os.pathsep + os.environ["PATH"]
+        log.info(licClientPath)
+        cls._licClientPath = licClientPath
+        return licClientPath
+
+    def _addPath(self):
+        #only add once, PATH not grow for every check
+        licClientPath = self.getLicClientPath()
+        if licClientPath not in os.environ["PATH"].split(os.pathsep):
+            os.environ["PATH"] = licClientPath  + os.pathsep + os.environ["PATH"]
 
-        log.info("Check license %s on server %s"%(feature,self.server))
+    def lmstat(self,server):
+        '''
+        output of "lmutil lmstat -a" of server
+        '''
+        cmd = "lmutil lmstat -c %s -a"%server
+        self.pollCount += 1
+        if self.runner != None:
+            return self.runner(cmd)
+        
+        self._addPath()
+        return _runCommand(cmd)
+
+    def refresh(self):
+        '''
+        poll all servers, one lmstat per server
+        '''
         if not self.server:
             log.exception("Server not set, please set server first.")
-
-        cmd = "lmutil lmstat -c %s -f %s"%(self.server,feature)
-        rst = None
-        with os.popen(cmd,"r") as output:
-            rst = output.read()
-            # for line in output:
-            #     log.info(line)
-            output.close()
-#         print(rst)
         
-        rst2 = re.findall("Total\D*(\d+)\D*issued;\D*Total\D*(\d+)\D*",rst,re.DOTALL)
-        if rst2:
-            if len(rst2[0]) != 2:
-                log.info(rst)
-                log.info("get license error.")
-                
-            total,used = rst2[0]
-            log.info("Total:%s,used:%s"%(total,used))
-            return total,used
-        else:
+        status = {}
+        for server in self.Servers:
+            log.info("Check license on server %s"%server)
+            serverStatus = parseLmstat(self.lmstat(server))
+            if not serverStatus:
+                log.warning("No license feature found on server %s"%server)
+            for feature,(issued,used) in serverStatus.items():
+                issued0,used0 = status.get(feature,(0,0))
+                status[feature] = (issued0+issued,used0+used)
+        
+        self._status = status
+        self._stamp = time.time()
+        return status
+
+    def getFeatureCount(self,feature):
+        '''
+        Check license, (total,used) from cached status
+        '''
+        status = self.Status
+        if feature not in status:
             log.exception('License feature "%s" is not available'%feature)
             return None
-
+        
+        total,used = status[feature]
+        log.debug("%s Total:%s,used:%s"%(feature,total,used))
+        return total,used
@@ -17,17 +17,53 @@
         >>> logger.setLogLevel('Error')
                 总共5个log级别,目前默认是DEBUG(即全部都打印)
         
-        4.打印日志        
+        4.打印日志, %参数在级别启用时才格式化
+        >>> log.debug('__getattr__ from _dict: %s',key)
         >>> log.debug('debug,用来打印一些调试信息，级别最低')
         >>> log.info('info,用来打印一些正常的操作信息')
         >>> log.warning('waring,用来用来打印警告信息')
         >>> log.error('error,一般用来打印一些错误信息')
         >>> log.critical('critical,用来打印一些致命的错误信息，等级最高')
+        
+        5.log文件由后台线程写入(QueueHandler/QueueListener, python3), IronPython直接写入
+        >>> log.setPath(r'C:\Temp\logfile.log',background = False) #同步写入
 
 '''
 import sys
+import time
+import atexit
 import logging
 
+try:
+    from logging.handlers import QueueHandler,QueueListener #python3.2+
+    try:
+        from queue import Queue
+    except ImportError:
+        from Queue import Queue
+except ImportError:
+    QueueHandler = QueueListener = Queue = None
+
+if QueueHandler:
+    class _QueueHandler(QueueHandler):
+        '''
+        records are put to queue as they are, formatted by file handler in background thread
+        message of Log is a str already, no args changed later
+        '''
+        def prepare(self,record):
+            return record
+
+
+def formatMessage(content,args):
+    '''
+    content%args, old style call log.info("a:","b","c") joins args by ","
+    '''
+    if not args:
+        return str(content)
+    try:
+        return str(content)%args
+    except (TypeError,ValueError):
+        return str(content)+",".join([str(arg) for arg in args])
+
 class Log(object):
     # 初始化日志
     def __init__(self, logLevel='DEBUG', logPath = None):
@@ -43,6 +79,17 @@ class Log(object):
         
         self.logger = logging.getLogger()
         self.file_handler = None
+        self.queue_handler = None
+        self.listener = None
+        self._atexit = False #stopListener registered to atexit
+        self._level = logging.DEBUG
+        
+        #aedtMessage: at most aedtMaxMessages per aedtInterval seconds, others are counted and reported in next message
+        self.aedtMaxMessages = 20
+        self.aedtInterval = 1.0
+        self._aedtWindow = 0
+        self._aedtCount = 0
+        self._aedtSuppressed = 0
         self.console_handler = logging.StreamHandler()
         self.logger.addHandler(self.console_handler)
         self.setLogLevel(self._logLevel)
@@ -67,29 +114,80 @@ class Log(object):
             self._logLevel = logLevel.upper()
         
         level = eval('logging.' + self._logLevel.upper())
+        self._level = level
         self.logger.setLevel(level)
-        for handle in self.logger.handlers:
+        for handle in self._handlers():
             handle.setLevel(level)
+    
+    def isEnabledFor(self,level):
+        '''
+        level: logging.DEBUG ..., cheap check before building a message
+        '''
+        return level >= self._level
+    
+    def _handlers(self):
+        #queue handler passes records to file handler, format and level of file handler are used
+        handlers = [h for h in self.logger.handlers if h is not self.queue_handler]
+        if self.queue_handler and self.file_handler:
+            handlers.append(self.file_handler)
+        return handlers
 
         
-    def setPath(self,logPath=None):
+    def setPath(self,logPath=None,background=True):
         '''
         Args:
             logPath(str): log文件完整路径
+            background(bool): log文件由后台线程写入, 不阻塞调用者(python3), 退出时(atexit)写完队列中的log
         '''
         if not logPath:
             return
         
         self.logPath = logPath
         
+        self.stopListener()
         if self.file_handler:
             self.file_handler.close()
             self.logger.removeHandler(self.file_handler)
             
         self.file_handler = logging.FileHandler(logPath,mode='a')
-        self.logger.addHandler(self.file_handler)
+        if background and QueueHandler:
+            queue = Queue(-1)
+            self.queue_handler = _QueueHandler(queue)
+            self.listener = QueueListener(queue,self.file_handler,respect_handler_level=True)
+            self.listener.start()
+            self.logger.addHandler(self.queue_handler)
+            #listener thread is daemon, queued records are lost if not stopped before exit
+            #registered after logging, run before logging.shutdown closes file handler
+            if not self._atexit:
+                atexit.register(self.stopListener)
+                self._atexit = True
+        else:
+            self.logger.addHandler(self.file_handler)
         self.setLogFormat()
         self.setLogLevel()
+    
+    def stopListener(self):
+        '''
+        write all queued records to log file, and stop background writer
+        '''
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+        if self.queue_handler:
+            self.logger.removeHandler(self.queue_handler)
+            self.queue_handler = None
+            if self.file_handler:
+                self.logger.addHandler(self.file_handler) #write directly after stop
+    
+    def flush(self):
+        '''
+        wait queued records written to log file
+        '''
+        if self.listener:
+            self.listener.stop()
+            self.listener.start()
+        for handler in self._handlers():
+            handler.flush()
   
             
     def setLogFormat(self,logFormat = None,datefmt = None):
@@ -100,7 +198,7 @@ class Log(object):
             self._datefmt = datefmt
             
         fmt = logging.Formatter(self._logFormat,self._datefmt)
-        for hdlr in self.logger.handlers:
+        for hdlr in self._handlers():
             hdlr.setFormatter(fmt)
         
     def aedtMessage(self,content):
@@ -109,33 +207,54 @@ class Log(object):
         if hasattr(Module, "oDesktop"):
             oDesktop = getattr(Module, "oDesktop")
             
-        if oDesktop:
-            oDesktop.AddMessage("","",0,content)
-        else:
+        if not oDesktop:
             return
         
+        #rate limit, AddMessage is a slow COM call and floods message window
+        now = time.time()
+        if now - self._aedtWindow > self.aedtInterval:
+            if self._aedtSuppressed:
+                content = "%s (%s messages suppressed, see log file)"%(content,self._aedtSuppressed)
+            self._aedtWindow = now
+            self._aedtCount = 0
+            self._aedtSuppressed = 0
+        if self._aedtCount >= self.aedtMaxMessages:
+            self._aedtSuppressed += 1
+            return
+        self._aedtCount += 1
+        oDesktop.AddMessage("","",0,content)
+        
     def debug(self,content,*args):
-        self.logger.debug(content+",".join(args))
+        if logging.DEBUG < self._level:
+            return
+        self.logger.debug(formatMessage(content,args))
 #         self.aedtMessage(content)
 
     def info(self,content,*args):
-        self.logger.info(str(content)+",".join(list(args)))
+        if logging.INFO < self._level:
+            return
+        self.logger.info(formatMessage(content,args))
 #         self.aedtMessage(content+",".join(args))
            
     def warning(self,content,*args):
-        self.logger.warning(str(content)+",".join(args))
-        self.aedtMessage(str(content)+",".join(args))
+        if logging.WARNING < self._level:
+            return
+        content = formatMessage(content,args)
+        self.logger.warning(content)
+        self.aedtMessage(content)
             
     def error(self,content,*args):
-        self.logger.error(str(content)+",".join(args))
-        self.aedtMessage(str(content)+",".join(args))
+        content = formatMessage(content,args)
+        self.logger.error(content)
+        self.aedtMessage(content)
            
     def critical(self,content,*args):
-        self.logger.critical(str(content)+",".join(args))
-        self.aedtMessage(str(content)+",".join(args))
+        content = formatMessage(content,args)
+        self.logger.critical(content)
+        self.aedtMessage(content)
         
     def exception(self,content,*args):
-        content = Exception(str(content)+",".join(args))
+        content = Exception(formatMessage(content,args))
         self.logger.error(content)
         raise content
 
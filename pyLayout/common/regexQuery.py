@@ -0,0 +1,257 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Regex query of names in collections, used by __getitem__ of collections, Nets.getRegularNets and regAnyMatch.
+
+- patterns are compiled once and cached, many patterns are merged to one alternation for any-match,
+  patterns with inline global flags (e.g. "(?i)") or group references are matched separately
+- literal prefix of pattern (e.g. "DDR_DQ" of "DDR_DQ\\d+") select candidates from sorted names by bisect
+- results are memoized per query (LRU), query of a collection is build again when keys of the collection changed
+
+Examples:
+    >>> query = NameQuery.of(layout.Nets.DefinitionDict)
+    >>> query.matchEach(["DDR_DQ\\d+$","DDR_DM\\d$"])
+    ['DDR_DQ0', 'DDR_DQ1', ... ,'DDR_DM0']
+    >>> compilePatterns(["U\\d+","J.*"]).match("U12")
+'''
+
+import re
+import weakref
+from bisect import bisect_left
+from collections import OrderedDict
+
+#regex meta characters, literal prefix stop at them
+_meta = set(".^$*+?{}[]()|\\")
+#char after \ is literal if not letter or digit, e.g. \. \$ \-
+_literalEscape = re.compile(r"[^0-9A-Za-z]")
+#merged alternation not support group reference (numbers shift, names repeat)
+_groupRef = re.compile(r"\\[1-9]|\(\?P[<=]")
+#inline global flags must be at start of regex, not at start of alternation branch (error in python3.11+)
+_inlineFlags = re.compile(r"(?<!\\)\(\?[aiLmsux]+\)")
+
+_cache = OrderedDict() #(patterns,flags) -> compiled regex, LRU
+cacheSize = 4096
+
+
+def compilePatterns(patterns,flags = re.IGNORECASE):
+    '''
+    patterns: str or list of full regex, list are merged to one alternation, the result match if any pattern match.
+    compiled regex are cached.
+    '''
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    else:
+        patterns = tuple(patterns)
+
+    key = (patterns,flags)
+    if key in _cache:
+        regex = _cache.pop(key)
+        _cache[key] = regex #move to end
+        return regex
+
+    if len(patterns) == 1:
+        regex = re.compile(patterns[0],flags)
+    else:
+        merged = [p for p in patterns if _mergeable(p)]
+        if len(merged) == len(patterns):
+            regex = re.compile("|".join(["(?:%s)"%p for p in patterns]),flags)
+        else:
+            regexs = [compilePatterns(merged,flags)] if merged else []
+            regex = _AnyRegex(regexs + [compilePatterns(p,flags) for p in patterns if not _mergeable(p)])
+
+    _cache[key] = regex
+    if len(_cache) > cacheSize:
+        _cache.popitem(last = False)
+    return regex
+
+def _mergeable(pattern):
+    '''
+    pattern could be a branch of merged alternation
+    '''
+    return not _groupRef.search(pattern) and not _inlineFlags.search(pattern)
+
+def literalPrefix(pattern):
+    '''
+    literal string every match must start with, lower case, "" if not known.
+    '''
+    if "|" in pattern or pattern.startswith("(?"):
+        return ""
+
+    chars = []
+    i = 0
+    if pattern.startswith("^"):
+        i = 1
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            if i+1 < len(pattern) and _literalEscape.match(pattern[i+1]):
+                chars.append(pattern[i+1])
+                i += 2
+                continue
+            break
+        if c in _meta:
+            #quantifier make last char optional
+            if c in "*?{" and chars:
+                chars.pop()
+            break
+        chars.append(c)
+        i += 1
+
+    prefix = "".join(chars)
+    if any(ord(c) > 127 for c in prefix):
+        return "" #lower() may not same as re.IGNORECASE
+    return prefix.lower()
+
+
+class _AnyRegex(object):
+    '''
+    any match of compiled patterns, used when patterns can not be merged
+    '''
+    def __init__(self,regexs):
+        self.regexs = regexs
+
+    def match(self,val):
+        for regex in self.regexs:
+            m = regex.match(val)
+            if m:
+                return m
+        return None
+
+
+class NameQuery(object):
+    '''
+    names: list of names in collection order, results keep collection order
+    resultsSize: results kept per query, least recently used dropped
+    '''
+
+    _queries = weakref.WeakKeyDictionary() #key dict of collection -> NameQuery
+    resultsSize = 256
+
+    def __init__(self,names,flags = re.IGNORECASE):
+        self.names = list(names)
+        self.flags = flags
+        self.revision = None
+        self._lowers = None #sorted lower names
+        self._order = None #index of names in sorted order
+        self._results = OrderedDict() #(mode,patterns) -> names, LRU
+
+    def __repr__(self):
+        return "NameQuery Object: %s names, %s results"%(len(self.names),len(self._results))
+
+    @property
+    def Count(self):
+        return len(self.names)
+
+    @classmethod
+    def of(cls,keyDict):
+        '''
+        query of ComplexDict (or ChainedObjectDict), build again if keys changed
+        '''
+        revision = _revision(keyDict)
+        if revision == None:
+            return cls(keyDict.Keys)
+
+        query = cls._queries.get(keyDict)
+        if query != None and len(query.revision) == len(revision) and all(a is b for a,b in zip(query.revision,revision)):
+            return query
+
+        query = cls([k for keys in revision for k in keys])
+        query.revision = revision
+        cls._queries[keyDict] = query
+        return query
+
+    def _buildIndex(self):
+        rows = sorted([(name.lower(),i) for i,name in enumerate(self.names)])
+        self._lowers = [r[0] for r in rows]
+        self._order = [r[1] for r in rows]
+
+    def _candidates(self,prefix):
+        '''
+        index of names start with prefix, in collection order
+        '''
+        if not prefix:
+            return range(len(self.names))
+        if self._lowers == None:
+            self._buildIndex()
+        lo = bisect_left(self._lowers,prefix)
+        hi = bisect_left(self._lowers,prefix[:-1]+chr(ord(prefix[-1])+1),lo)
+        return sorted(self._order[lo:hi])
+
+    def _getResult(self,key):
+        results = self._results
+        if key not in results:
+            return None
+        names = results.pop(key) #move to end
+        results[key] = names
+        return list(names)
+
+    def _setResult(self,key,names):
+        results = self._results
+        results[key] = names
+        if len(results) > self.resultsSize:
+            results.popitem(last = False)
+        return list(names)
+
+    def _match(self,pattern):
+        regex = compilePatterns(pattern,self.flags)
+        names = self.names
+        return [names[i] for i in self._candidates(literalPrefix(pattern)) if regex.match(names[i])]
+
+    def match(self,pattern):
+        '''
+        names match the full regex pattern
+        '''
+        key = ("one",pattern)
+        names = self._getResult(key)
+        if names == None:
+            names = self._setResult(key,self._match(pattern))
+        return names
+
+    def matchEach(self,patterns):
+        '''
+        names match each pattern, concatenated in pattern order, same as loop of match
+        '''
+        key = ("each",tuple(patterns))
+        names = self._getResult(key)
+        if names == None:
+            names = []
+            for pattern in patterns:
+                names += self.match(pattern)
+            names = self._setResult(key,names)
+        return names
+
+    def matchAny(self,patterns):
+        '''
+        names match any of patterns, in collection order
+        '''
+        patterns = tuple(patterns)
+        key = ("any",patterns)
+        names = self._getResult(key)
+        if names != None:
+            return names
+
+        prefixes = [literalPrefix(p) for p in patterns]
+        if patterns and all(prefixes):
+            indexes = set()
+            for prefix in set(prefixes):
+                indexes.update(self._candidates(prefix))
+            indexes = sorted(indexes)
+        else:
+            indexes = range(len(self.names))
+
+        regex = compilePatterns(patterns,self.flags)
+        names = self.names
+        return self._setResult(key,[names[i] for i in indexes if regex.match(names[i])])
+
+
+def _revision(keyDict):
+    '''
+    key lists of ComplexDict are replaced when keys changed, used as revision of collection
+    '''
+    cls = type(keyDict)
+    if hasattr(cls,"_keyLists"):
+        return keyDict._keyLists()
+    if hasattr(cls,"_keyList") and isinstance(keyDict._dict, dict):
+        return (keyDict._keyList(),)
+    return None
@@ -0,0 +1,302 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+hierarchical tracing spans of pyLayout workflows.
+
+A span records wall time, CPU time, COM calls and peak memory of a block, spans opened inside a span are its children.
+- COM calls are counted when COM handles are wrapped (Layout.enableComProfiler or Layout.recordCom), else None
+- peak memory (bytes above memory at span start) is traced by tracemalloc when tracer.memory is True (python3 only), else None
+
+spans are kept per thread, finished spans can be written as Chrome trace-event json (chrome://tracing, ui.perfetto.dev, speedscope)
+or printed as a summary table.
+tracer is disabled by default (decorated functions only run), enable it for a run, e.g. config AEDT/Trace of ExtractBase workflow.
+
+Examples:
+    >>> from pyLayout.common.tracing import tracer,traced
+    >>> tracer.enabled = True
+    >>> @traced(autoSave = False)
+    >>> def loadFromDict(self,layersInfo):
+    >>>     ...
+    >>> with tracer.span("ports",count = 10):
+    >>>     layout.Ports.autoPorts()
+    >>> tracer.dumpChrome("trace.json")
+    >>> print(tracer.summary())
+'''
+
+import os
+import json
+import time
+import threading
+from functools import wraps
+from collections import OrderedDict
+from contextlib import contextmanager
+from .common import log
+
+try:
+    import tracemalloc #python3.4+
+except ImportError:
+    tracemalloc = None
+
+#time.clock in IronPython
+_timer = getattr(time,"perf_counter",None) or getattr(time,"clock",None) or time.time
+_cpuTimer = getattr(time,"process_time",None) or getattr(time,"clock",None) or time.time
+
+
+class Span(object):
+    '''
+    one finished or running block, times in seconds
+    '''
+
+    __slots__ = ("name","category","args","parent","children","start","wall","cpu","comCalls","peakMemory","thread",
+                 "_cpu0","_com0","_mem0","_peak")
+
+    def __init__(self,name,category,args,parent,thread):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.parent = parent
+        self.children = []
+        self.thread = thread
+        self.start = None
+        self.wall = None
+        self.cpu = None
+        self.comCalls = None
+        self.peakMemory = None
+        self._mem0 = None
+        self._peak = None
+
+    def __repr__(self):
+        return "Span(%s): %s, %s children"%(self.name,"running" if self.wall == None else "%.3fs"%self.wall,len(self.children))
+
+    @property
+    def SelfWall(self):
+        '''
+        wall time not in children
+        '''
+        return self.wall - sum([c.wall for c in self.children if c.wall != None])
+
+    @property
+    def Recursive(self):
+        '''
+        a parent span has the same name, wall time is in the parent already
+        '''
+        parent = self.parent
+        while parent != None:
+            if parent.name == self.name:
+                return True
+            parent = parent.parent
+        return False
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            for span in child.walk():
+                yield span
+
+
+class Tracer(object):
+    '''
+    enabled: False (default), spans are not recorded (function and with blocks still run)
+    memory: trace peak memory by tracemalloc, slows python allocations, python3 only
+    maxSpans: root spans kept, oldest dropped
+    '''
+
+    def __init__(self,enabled = False,memory = False,maxSpans = 1000):
+        self.enabled = enabled
+        self.memory = memory
+        self.maxSpans = maxSpans
+        self.comSource = None #object with count of COM calls: ComProfiler, CallRecorder
+        self.roots = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._origin = _timer()
+        self._startedMalloc = False
+
+    def __repr__(self):
+        return "Tracer Object: %s root spans, %s spans"%(len(self.roots),len(self.Spans))
+
+    @property
+    def Spans(self):
+        return [span for root in list(self.roots) for span in root.walk()]
+
+    def _stack(self):
+        stack = getattr(self._local,"stack",None)
+        if stack == None:
+            stack = self._local.stack = []
+        return stack
+
+    def _comCount(self):
+        source = self.comSource
+        return source.count if source != None else None
+
+    def _startMemory(self):
+        if not self.memory or tracemalloc == None:
+            return False
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._startedMalloc = True
+        return True
+
+    def reset(self):
+        self.roots = []
+        self._origin = _timer()
+        if self._startedMalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._startedMalloc = False
+
+    @contextmanager
+    def span(self,name,category = "function",**args):
+        '''
+        with block as a span, nested in the running span of this thread
+        args: shown in trace viewer, values should be json types
+        '''
+        if not self.enabled:
+            yield None
+            return
+
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        span = Span(name,category,args,parent,threading.current_thread().name)
+        traceMemory = self._startMemory()
+        if traceMemory:
+            current,peak = tracemalloc.get_traced_memory()
+            if parent != None and parent._peak != None:
+                parent._peak = max(parent._peak,peak)
+            if hasattr(tracemalloc,"reset_peak"): #python3.9+
+                tracemalloc.reset_peak()
+            span._mem0,span._peak = current,current
+        span._com0 = self._comCount()
+        stack.append(span)
+        span._cpu0 = _cpuTimer()
+        span.start = _timer()
+        try:
+            yield span
+        finally:
+            span.wall = _timer() - span.start
+            span.cpu = _cpuTimer() - span._cpu0
+            com = self._comCount()
+            if com != None and span._com0 != None:
+                span.comCalls = com - span._com0
+            if traceMemory and span._peak != None and tracemalloc.is_tracing():
+                span._peak = max(span._peak,tracemalloc.get_traced_memory()[1])
+                span.peakMemory = span._peak - span._mem0
+                if parent != None and parent._peak != None:
+                    parent._peak = max(parent._peak,span._peak)
+                if hasattr(tracemalloc,"reset_peak"):
+                    tracemalloc.reset_peak()
+            stack.pop()
+            if parent != None:
+                parent.children.append(span)
+            else:
+                with self._lock:
+                    self.roots.append(span)
+                    if len(self.roots) > self.maxSpans:
+                        del self.roots[:len(self.roots)-self.maxSpans]
+
+    def traced(self,name = None,category = "function",autoSave = None,logTime = False):
+        '''
+        decorator, function call as a span, return value and exceptions are passed through
+        name: default Class.method (python3) or function name
+        autoSave: False, disable AEDT AutoSave during the call (method of tool class or of object with .layout), recovered after
+        logTime: log start and process time as info, also when tracer is disabled
+        '''
+        def decorator(func):
+            spanName = name or getattr(func,"__qualname__",func.__name__)
+            @wraps(func)
+            def wrapped(*args,**kwargs):
+                if not self.enabled and autoSave != False and not logTime:
+                    return func(*args,**kwargs)
+                layout = None
+                if autoSave == False:
+                    #method of Layout/Aedt3DToolBase itself, or of object with .layout
+                    layout = args[0] if hasattr(type(args[0]),"enableAutosave") else args[0].layout
+                if logTime:
+                    log.info("start function: %s"%func.__name__)
+                    start = _timer()
+                with self.span(spanName,category):
+                    if layout != None:
+                        log.info("Disable AutoSave for function: %s"%func.__name__)
+                        temp = layout.enableAutosave(flag = False)
+                        try:
+                            result = func(*args,**kwargs)
+                        finally:
+                            log.info("Recover AutoSave for function: %s"%func.__name__)
+                            layout.enableAutosave(flag = temp)
+                    else:
+                        result = func(*args,**kwargs)
+                if logTime:
+                    log.info("%s: Process time %.3fs"%(func.__name__,_timer()-start))
+                return result
+            return wrapped
+        return decorator
+
+
+    #--- reports
+
+    def report(self):
+        '''
+        one record per span name, sorted by total wall time: count, wall/cpu/COM calls (recursive calls once), self wall, cpu, COM calls, max peak memory
+        '''
+        rows = OrderedDict()
+        for span in self.Spans:
+            if span.wall == None:
+                continue
+            row = rows.get(span.name)
+            if row == None:
+                row = rows[span.name] = OrderedDict([("Name",span.name),("Count",0),("Wall",0.0),("SelfWall",0.0),
+                                                     ("Cpu",0.0),("ComCalls",None),("PeakMemory",None)])
+            row["Count"] += 1
+            row["SelfWall"] += span.SelfWall
+            if not span.Recursive:
+                row["Wall"] += span.wall
+                row["Cpu"] += span.cpu
+                if span.comCalls != None:
+                    row["ComCalls"] = (row["ComCalls"] or 0) + span.comCalls
+            if span.peakMemory != None:
+                row["PeakMemory"] = max(row["PeakMemory"] or 0,span.peakMemory)
+        return sorted(rows.values(),key = lambda r: -r["Wall"])
+
+    def summary(self,top = 20):
+        rows = self.report()
+        lines = ["spans: %s names, %s spans"%(len(rows),sum([r["Count"] for r in rows]))]
+        lines.append("%-40s %6s %10s %10s %10s %10s %10s"%("span","count","wall(s)","self(s)","cpu(s)","COM calls","peak(MB)"))
+        for r in rows[:top]:
+            lines.append("%-40s %6s %10.3f %10.3f %10.3f %10s %10s"%(r["Name"],r["Count"],r["Wall"],r["SelfWall"],r["Cpu"],
+                         "-" if r["ComCalls"] == None else r["ComCalls"],
+                         "-" if r["PeakMemory"] == None else "%.1f"%(r["PeakMemory"]/1048576.0)))
+        return "\n".join(lines)
+
+    def chromeEvents(self):
+        '''
+        complete events (ph X) of trace-event format, us from tracer start
+        '''
+        pid = os.getpid()
+        threads = {}
+        events = []
+        for span in self.Spans:
+            if span.wall == None:
+                continue
+            tid = threads.setdefault(span.thread,len(threads)+1)
+            args = dict(span.args)
+            args.update({"cpu":round(span.cpu,6)})
+            if span.comCalls != None:
+                args["comCalls"] = span.comCalls
+            if span.peakMemory != None:
+                args["peakMemory"] = span.peakMemory
+            events.append({"name":span.name,"cat":span.category,"ph":"X","pid":pid,"tid":tid,
+                           "ts":round((span.start-self._origin)*1e6,3),"dur":round(span.wall*1e6,3),"args":args})
+        for thread,tid in threads.items():
+            events.append({"name":"thread_name","ph":"M","pid":pid,"tid":tid,"args":{"name":thread}})
+        return events
+
+    def dumpChrome(self,path):
+        with open(path,"w") as f:
+            json.dump({"traceEvents":self.chromeEvents(),"displayTimeUnit":"ms"},f)
+        return path
+
+
+#global tracer of pyLayout
+tracer = Tracer()
+span = tracer.span
+traced = tracer.traced
@@ -48,10 +48,32 @@ Examples:
     >>> rst = Unit("1um")
     >>> rst["nm"]
     '0.001nm'
+    
+    convert many values to SI value, numpy array if numpy installed
+    
+    >>> Unit.parseMany(["1mm","2mil",1e-3])
+    array([0.001, 5.08e-05, 0.001])
+    
+    "number+unit" literal is parsed by tokens (number, unit) and the scale of unit, without eval,
+    parsed values are kept in a LRU cache.
 '''
 
 
 import re
+import threading
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except:
+    np = None
+
+try:
+    _numberTypes = (int,long,float) #python 2, IronPython
+except NameError:
+    _numberTypes = (int,float)
+if np != None:
+    _numberTypes += (np.number,)
 
 class Unit(object):
     
@@ -86,6 +108,13 @@ class Unit(object):
         }
     
     
+    #"number+unit" literal: 1.5mm, -2e-3, .5mil
+    _literal = re.compile(r"^([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)([a-zA-Z]*)$")
+    _scales = {} #unit -> scale to SI, None if unit not a plain scale
+    _cache = OrderedDict() #str -> SI value, LRU
+    _cacheLock = threading.Lock()
+    cacheSize = 8192
+    
     def __init__(self,value = 0,unit=""):
         '''_summary_
 
@@ -126,7 +155,11 @@ class Unit(object):
 
     @property
     def V(self):
-        s = self.Expression
+        return self.parse(self._value)
+    
+    @classmethod
+    def _eval(cls,value):
+        s = cls(value).Expression
         if s[0] == "*":  #for Unit("Ghz")
             s = "1"+s
         #log.debug(type(s))
@@ -134,6 +167,63 @@ class Unit(object):
             return float(s)
         except:
             return eval(s)
+    
+    @classmethod
+    def _scale(cls,unit):
+        '''
+        scale of unit to SI value, get from expression of "1"+unit, check with "2"+unit
+        '''
+        if unit not in cls._scales:
+            try:
+                scale = cls._eval("1"+unit)
+                if cls._eval("2"+unit) != 2*scale:
+                    scale = None
+            except:
+                scale = None
+            cls._scales[unit] = scale
+        return cls._scales[unit]
+    
+    @classmethod
+    def parse(cls,value):
+        '''
+        SI value of str, int or float, thread safe
+        '''
+        if isinstance(value, _numberTypes):
+            return float(value)
+        
+        cache = cls._cache
+        with cls._cacheLock:
+            if value in cache:
+                v = cache.pop(value) #move to end
+                cache[value] = v
+                return v
+        
+        v = None
+        rst = cls._literal.match(value)
+        if rst:
+            number,unit = rst.groups()
+            scale = cls._scale(unit) if unit else 1.0
+            if scale != None:
+                v = float(number)*scale
+        if v == None:
+            v = cls._eval(value)
+        
+        with cls._cacheLock:
+            cache[value] = v
+            while len(cache) > cls.cacheSize:
+                cache.popitem(last = False)
+        return v
+    
+    @classmethod
+    def parseMany(cls,values):
+        '''
+        SI values of list of str, int or float, return numpy array if numpy installed else list
+        '''
+        parse = cls.parse
+        rst = [parse(str(v) if isinstance(v, cls) else v) for v in values]
+        if np != None:
+            return np.array(rst,dtype=float)
+        return rst
     @property
     def S(self):
         return str(self.Expression)     
@@ -0,0 +1,292 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Connectivity graph of net <-> pin <-> component, build in one pass.
+
+Names are mapped to integer id, adjacency are stored in CSR style arrays (offsets + indices),
+neighbors of one net or component cost O(degree).
+
+Examples:
+    >>> layout.Connectivity.getComponentsOnNet("VDD")
+    ['U1', 'C12', 'R3']
+    >>> layout.Connectivity.getNetsOfComponent("R3")
+    ['VDD', 'VDD_R']
+    >>> layout.Connectivity.getPinsOfComponent("U1",net = "VDD")
+    ['U1-A1', 'U1-B2']
+    >>> layout.Connectivity.getComponentType("C12")
+    'Capacitor'
+
+    it will be build again after Nets.rename, Nets.deleteNets, Components.deleteInvalidComponents ...
+    >>> layout.Connectivity.invalidate()
+'''
+
+from array import array
+from ..common.common import log
+
+
+class Connectivity(object):
+    '''
+    - pins of component: GetComponentPins per component
+    - net of pin: FindObjects('Net',net) per net, or GetPropertyValue per pin if there are more nets than pins,
+      unconnected pin is on net "" by both ways (Net property of the pin), as Component.NetNames
+    - part type of component: GetComponentInfo when first asked, cached until invalidate
+    '''
+
+    def __init__(self,layout = None):
+        self.layout = layout
+        self.built = False
+        self._clear()
+
+    def _clear(self):
+        self.netNames = []
+        self.compNames = []
+        self.pinNames = []
+        self._netId = {}
+        self._compId = {}
+        self._pinId = {}
+        self._netIdLower = None
+        self._compIdLower = None
+        self._compType = {} #comp id -> part type
+
+        self._pinNet = array('i') #pin id -> net id, -1 for no net
+        self._pinComp = array('i') #pin id -> comp id
+
+        #CSR adjacency: ptr[i]:ptr[i+1] in idx
+        self._compPinPtr = array('i',[0])
+        self._compPinIdx = array('i')
+        self._netPinPtr = array('i',[0])
+        self._netPinIdx = array('i')
+        self._netCompPtr = array('i',[0])
+        self._netCompIdx = array('i')
+        self._compNetPtr = array('i',[0])
+        self._compNetIdx = array('i')
+
+    def __repr__(self):
+        return "Connectivity Object: %s nets, %s components, %s pins"%(len(self.netNames),len(self.compNames),len(self.pinNames))
+
+    @property
+    def oEditor(self):
+        return self.layout.oEditor
+
+    @property
+    def NetCount(self):
+        self._check()
+        return len(self.netNames)
+
+    @property
+    def ComponentCount(self):
+        self._check()
+        return len(self.compNames)
+
+    @property
+    def PinCount(self):
+        self._check()
+        return len(self.pinNames)
+
+    def invalidate(self):
+        if self.built:
+            log.debug("Connectivity invalidated.")
+        self.built = False
+        self._clear()
+
+    def _check(self):
+        if not self.built:
+            self.build()
+
+
+    #--- build
+
+    def build(self):
+        oEditor = self.oEditor
+        self._clear()
+
+        #pins of components
+        compPins = []
+        for comp in oEditor.FindObjects('Type','component'):
+            self._compId[comp] = len(self.compNames)
+            self.compNames.append(comp)
+            compPins.append(list(oEditor.GetComponentPins(comp)))
+
+        for compId,pins in enumerate(compPins):
+            for pin in pins:
+                if pin in self._pinId:
+                    continue
+                self._pinId[pin] = len(self.pinNames)
+                self.pinNames.append(pin)
+                self._pinComp.append(compId)
+
+        #nets of pins
+        netNames = list(oEditor.GetNetClassNets('<All>'))
+        for net in netNames:
+            self._netId[net] = len(self.netNames)
+            self.netNames.append(net)
+
+        self._pinNet = array('i',[-1]*len(self.pinNames))
+        if len(netNames) < len(self.pinNames):
+            for net in netNames:
+                netId = self._netId[net]
+                for name in oEditor.FindObjects('Net',net):
+                    pinId = self._pinId.get(name)
+                    if pinId != None:
+                        self._pinNet[pinId] = netId
+            #pins not found on any net are unconnected, Net property is ""
+            if -1 in self._pinNet:
+                if "" not in self._netId:
+                    self._netId[""] = len(self.netNames)
+                    self.netNames.append("")
+                netId = self._netId[""]
+                for pinId in range(len(self.pinNames)):
+                    if self._pinNet[pinId] < 0:
+                        self._pinNet[pinId] = netId
+        else:
+            for pinId,pin in enumerate(self.pinNames):
+                net = oEditor.GetPropertyValue("BaseElementTab",pin,"Net")
+                if net not in self._netId:
+                    self._netId[net] = len(self.netNames)
+                    self.netNames.append(net)
+                self._pinNet[pinId] = self._netId[net]
+
+        self._buildCSR()
+        self.built = True
+        log.debug("Connectivity build: %s"%repr(self))
+        return self
+
+    def _buildCSR(self):
+        netCount = len(self.netNames)
+        compCount = len(self.compNames)
+
+        #pins grouped by component, pin id already ordered by component
+        compPins = [[] for i in range(compCount)]
+        netPins = [[] for i in range(netCount)]
+        for pinId in range(len(self.pinNames)):
+            compPins[self._pinComp[pinId]].append(pinId)
+            netId = self._pinNet[pinId]
+            if netId >= 0:
+                netPins[netId].append(pinId)
+
+        self._compPinPtr,self._compPinIdx = self._toCSR(compPins)
+        self._netPinPtr,self._netPinIdx = self._toCSR(netPins)
+
+        netComps = [self._unique([self._pinComp[pinId] for pinId in pins]) for pins in netPins]
+        self._netCompPtr,self._netCompIdx = self._toCSR(netComps)
+
+        compNets = [self._unique([self._pinNet[pinId] for pinId in pins if self._pinNet[pinId] >= 0]) for pins in compPins]
+        self._compNetPtr,self._compNetIdx = self._toCSR(compNets)
+
+    def _unique(self,ids):
+        #keep order
+        seen = set()
+        return [i for i in ids if not (i in seen or seen.add(i))]
+
+    def _toCSR(self,rows):
+        ptr = array('i',[0])
+        idx = array('i')
+        for row in rows:
+            idx.extend(row)
+            ptr.append(len(idx))
+        return ptr,idx
+
+
+    #--- query
+
+    def _getId(self,name,ids,kind):
+        if name in ids:
+            return ids[name]
+
+        #ignore case like ComplexDict
+        if kind == "net":
+            if self._netIdLower == None:
+                self._netIdLower = dict((k.lower(),v) for k,v in self._netId.items())
+            lowerIds = self._netIdLower
+        else:
+            if self._compIdLower == None:
+                self._compIdLower = dict((k.lower(),v) for k,v in self._compId.items())
+            lowerIds = self._compIdLower
+
+        if name.lower() in lowerIds:
+            return lowerIds[name.lower()]
+        return None
+
+    def _row(self,ptr,idx,i):
+        return idx[ptr[i]:ptr[i+1]]
+
+    def hasNet(self,net):
+        self._check()
+        return self._getId(net,self._netId,"net") != None
+
+    def hasComponent(self,comp):
+        self._check()
+        return self._getId(comp,self._compId,"comp") != None
+
+    def getComponentsOnNet(self,net):
+        self._check()
+        netId = self._getId(net,self._netId,"net")
+        if netId == None:
+            log.debug("net not in connectivity: %s"%net)
+            return []
+        return [self.compNames[i] for i in self._row(self._netCompPtr,self._netCompIdx,netId)]
+
+    def getNetsOfComponent(self,comp):
+        self._check()
+        compId = self._getId(comp,self._compId,"comp")
+        if compId == None:
+            log.debug("component not in connectivity: %s"%comp)
+            return []
+        return [self.netNames[i] for i in self._row(self._compNetPtr,self._compNetIdx,compId)]
+
+    def getPinsOnNet(self,net):
+        self._check()
+        netId = self._getId(net,self._netId,"net")
+        if netId == None:
+            return []
+        return [self.pinNames[i] for i in self._row(self._netPinPtr,self._netPinIdx,netId)]
+
+    def getPinsOfComponent(self,comp,net = None):
+        '''
+        net: None for all pins, else only pins on net
+        '''
+        self._check()
+        compId = self._getId(comp,self._compId,"comp")
+        if compId == None:
+            return []
+
+        pins = self._row(self._compPinPtr,self._compPinIdx,compId)
+        if net == None:
+            return [self.pinNames[i] for i in pins]
+
+        netId = self._getId(net,self._netId,"net")
+        return [self.pinNames[i] for i in pins if self._pinNet[i] == netId]
+
+    def getComponentType(self,comp):
+        '''
+        part type of component: Resistor, Inductor, Capacitor, IC, IO, Other; None if component not found
+        one GetComponentInfo per component, not parse whole Component object
+        '''
+        self._check()
+        compId = self._getId(comp,self._compId,"comp")
+        if compId == None:
+            return None
+
+        if compId not in self._compType:
+            partType = None
+            for item in self.oEditor.GetComponentInfo(self.compNames[compId]):
+                if item.startswith("ComponentType="):
+                    partType = item.split("=",1)[1]
+                    break
+            self._compType[compId] = partType
+        return self._compType[compId]
+
+    def getComponentOfPin(self,pin):
+        self._check()
+        pinId = self._pinId.get(pin)
+        if pinId == None:
+            return None
+        return self.compNames[self._pinComp[pinId]]
+
+    def getNetOfPin(self,pin):
+        self._check()
+        pinId = self._pinId.get(pin)
+        if pinId == None or self._pinNet[pinId] < 0:
+            return None
+        return self.netNames[self._pinNet[pinId]]
@@ -12,6 +12,7 @@ except:
 from ..common import hfss3DLParameters
 from ..common.arrayStruct import ArrayStruct
 from ..common.complexDict import ComplexDict
+from ..common.regexQuery import NameQuery
 from ..common.unit import Unit
 from ..common.common import log,tuple2list
 
@@ -58,6 +59,8 @@ class Definition(object):
         keyList = re.split(r"[\\/]", key,maxsplit = 1)
         keyList = list(filter(lambda k:k.strip(),keyList)) #filter empty key
         if len(keyList)>1:
+            if key in self._info.Array: #path of indexed Array
+                return self._info.Array[key]
             return self[keyList[0]][keyList[1]]
         
         
@@ -78,7 +81,10 @@ class Definition(object):
         keyList = re.split(r"[\\/]", key,maxsplit = 1)
         keyList = list(filter(lambda k:k.strip(),keyList)) #filter empty key
         if len(keyList)>1:
-            self[keyList[0]][keyList[1]] = value
+            if key in self._info.Array: #path of indexed Array
+                self._info.Array[key] = value
+            else:
+                self[keyList[0]][keyList[1]] = value
 
         elif key in self._info.Array:
             self._info.Array[key] = value
@@ -103,7 +109,7 @@ class Definition(object):
         if key in ["layout","name","_info","parsed","type","maps"]:
             return object.__getattr__(self,key)
         else:
-            log.debug("__getattr__ from _dict: %s"%key)
+            log.debug("__getattr__ from _dict: %s",key)
             return self[key]
 
     def __setattr__(self, key, value):
@@ -179,11 +185,11 @@ class Definition(object):
         if self.parsed and not force:
             return
         
-        log.debug("parse definition: %s"%self.name)
+        log.debug("parse definition: %s",self.name)
         maps = self.maps
         datas = self.oManager.GetData(self.name)
         if datas:
-            _array = ArrayStruct(tuple2list(datas),maps)
+            _array = ArrayStruct(tuple2list(datas),maps,indexed = True)
         else:
             _array = ArrayStruct([])
         
@@ -231,7 +237,7 @@ class Definitions(object):
                 return self.DefinitionDict[key]
             else:
                 #find by 正则表达式
-                lst = [name for name in self.DefinitionDict.Keys if re.match(r"^%s$"%key,name,re.I)]
+                lst = NameQuery.of(self.DefinitionDict).match(r"^%s$"%key)
                 if not lst:
                     raise Exception("not found %s: %s"%(self.type,key))
                 else:
@@ -252,7 +258,7 @@ class Definitions(object):
         try:
             return super(self.__class__,self).__getattribute__(key)
         except:
-            log.debug("%s  __getattribute__ from _info: %s"%(self.__class__.__name__,key))
+            log.debug("%s  __getattribute__ from _info: %s",self.__class__.__name__,key)
             return self[key]
             
     def __contains__(self,key):
@@ -261,6 +267,21 @@ class Definitions(object):
     def __len__(self):
         return len(self.DefinitionDict)
     
+    def __iter__(self):
+        return iter(self.DefinitionDict)
+    
+    def items(self):
+        '''
+        iterate (name,object)
+        '''
+        return self.DefinitionDict.items()
+    
+    def iterBatches(self,size = 1000):
+        '''
+        iterate objects in list of length size
+        '''
+        return self.DefinitionDict.iterBatches(size)
+    
     def __repr__(self):
         return "%s Definition Objects"%(self.type)
             
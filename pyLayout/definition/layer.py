@@ -50,7 +50,8 @@ from ..common.complexDict import ComplexDict
 from ..common.unit import Unit
 from ..common.common import log,loadCSV,writeCSV,writeData
 from .definition import Definitions,Definition
-from ..common.common import DisableAutoSave,ProcessTime
+from .stackupTable import StackupTable
+from ..common.tracing import traced
 
 
 class Layer(Definition):
@@ -114,7 +115,7 @@ class Layer(Definition):
         self.Info[key] = value
             
         if self.autoUpdate:
-            log.debug("layer '%s' auto update :%s->%s."%(self.name,key,value))
+            log.debug("layer '%s' auto update :%s->%s.",self.name,key,value)
             self.update()
 
 
@@ -291,12 +292,13 @@ class Layer(Definition):
         
         
     def _getIndexIntra(self):
+        table = self.layout.Layers.table
         if self["Type"] == "signal":
-            layerNames = self.layout.Layers.ConductorLayerNames
+            layerNames = table.ConductorNames
             idx = layerNames.index(self.Name)
 
         elif self["Type"]  == "dielectric":
-            layerNames = self.layout.Layers.DielectricLayerNames
+            layerNames = table.DielectricNames
             idx = layerNames.index(self.Name)
         else:
             idx = -1
@@ -305,10 +307,11 @@ class Layer(Definition):
     
     
     def _halfStack(self):
+        table = self.layout.Layers.table
         if self["Type"] == "signal":
-            layerNames = self.layout.Layers.ConductorLayerNames 
+            layerNames = table.ConductorNames
         elif self["Type"]  == "dielectric":
-            layerNames = self.layout.Layers.DielectricLayerNames
+            layerNames = table.DielectricNames
  
         else:
             return -1
@@ -349,6 +352,7 @@ class Layer(Definition):
         
         if self.__class__._enableUpdate:
             self.layout.oEditor.ChangeLayer(self.ArrayDatas)
+            self.layout.Layers.invalidate()
             self.parse()
         else:
             log.debug("layer '%s' update is disabled."%self.name)
@@ -588,6 +592,8 @@ class Layers(Definitions):
         
     def __init__(self,layout=None):
         super(self.__class__,self).__init__(layout, type="Layer",definitionCalss=Layer)
+        self._table = None
+        self._version = 0 #stackup version, +1 for each change
         
 
     def __getitem__(self, key):
@@ -638,15 +644,31 @@ class Layers(Definitions):
     
     @property
     def ConductorLayerNames(self):
-        return [layer for layer in self.LayerNames if self.DefinitionDict[layer]["Type"] == "signal"]
+        return list(self.table.ConductorNames)
 
     @property
     def DielectricLayerNames(self):
-        return [layer for layer in self.LayerNames if self.DefinitionDict[layer]["Type"]  == "dielectric"]
+        return list(self.table.DielectricNames)
     
+    @property
+    def table(self):
+        '''
+        columnar view of stackup (StackupTable), build once per stackup version
+        '''
+        if self._table == None or self._table.version != self._version:
+            self._table = StackupTable(self,version = self._version)
+        return self._table
+    
+    def invalidate(self):
+        '''
+        stackup changed, table will be build again at next access
+        '''
+        self._version += 1
+        self._table = None
     
     def refresh(self):
         self._definitionDict = None
+        self.invalidate()
         #re-calculate LowerElevation0 for add or delete layer
 #         elevation = Unit(0)
 #         for layerName in self.LayerNames[::-1]:
@@ -800,6 +822,7 @@ class Layers(Definitions):
             self.refresh()
 
     
+    @traced()
     def setLayerDatas(self,layersInfo,mode = 0):
         '''
         layersInfo:
@@ -862,6 +885,7 @@ class Layers(Definitions):
                 [
                     "NAME:pps"
                 ]]+layerArrayDatas)
+            self.invalidate()
             
             Layer._enableUpdate = True
             self.refresh()
@@ -958,8 +982,7 @@ class Layers(Definitions):
             if not flag:
                 log.info("layer name: '%s' not found, ignore."% inputDict["Name"])   
     
-    @ProcessTime
-    @DisableAutoSave
+    @traced(autoSave = False,logTime = True)
     def loadFromDict(self,layersInfo):
         '''
         强制更新,给定全部信息
@@ -1076,57 +1099,51 @@ class Layers(Definitions):
             self[layer].Lower = (stackupH - self[layer].Upper)["mm"]
         
         self._definitionDict = None
+        self.invalidate()
         
     def getLayerByHeight(self,height,type="Conductor",adjust = "Near"):
         '''
-        adjust: above,below,Near,Inner, Outer
+        Args:
+            height: value (meter) or str with unit, or list of heights
+            type: Conductor(signal) or Dielectric
+            adjust: above,below,Near,Inner, Outer
+        
+        return layer name, list of layer names if height is list
         '''
-        flayer = None
-        distance = 1e9 #max enough
         
-        height = Unit(height)
         if type[0].lower() == "c" or type[0].lower() == "s":
-            for name in self.layout.layers.ConductorLayerNames[::-1]:
-                layer = self.layout.layers[name]
-                if height> layer.Upper: #above the layer
-                    distance1 = height - layer.Upper
-                elif height<layer.Lower:
-                    distance1 = height - layer.Lower
-                else:
-                    distance = 0
-                    flayer = name
-                    break
-                
-                if abs(distance1)<abs(distance):
-                    distance = distance1
-                    flayer = name
-                    
-            if distance == 0:
-                return flayer
-            
-            if adjust == "Near":
-                return flayer
+            layerType = "signal"
+        elif type[0].lower() == "d":
+            layerType = "dielectric"
+        else:
+            log.exception("unknown layer type: %s"%type)
+        
+        isList = not isinstance(height, str) and hasattr(height, "__iter__")
+        heights = list(height) if isList else [height]
+        
+        rst = []
+        for flayer,distance in self.table.searchHeights(heights,type = layerType):
+            if flayer == None or not distance or adjust == "Near":
+                rst.append(flayer)
+                continue
             
+            direction = adjust
             if adjust == "Inner": #HalfStackup 0,1
-                adjust = "below" if self["HalfStackup"] else "above"
+                direction = "below" if self[flayer].HalfStackup else "above"
                  
             if adjust == "Outer":
-                adjust = "above" if self["HalfStackup"] else "below"              
+                direction = "above" if self[flayer].HalfStackup else "below"              
             
-            if adjust == "above":
-                flayer = self.layout.layers[flayer].offLayer(1 if distance>0 else 0,type=type).Name
-            if adjust == "below":
-                flayer = self.layout.layers[flayer].offLayer(0 if distance>0 else -1,type=type).Name
+            if direction == "above":
+                flayer = self[flayer].offLayer(1 if distance>0 else 0,type=type).Name
+            if direction == "below":
+                flayer = self[flayer].offLayer(0 if distance>0 else -1,type=type).Name
             
 #            #for 2025.2 'Zone1;signal_3'
 #             flayer = flayer.split(";")[-1]
-            return flayer
-                    
+            rst.append(flayer)
         
-        elif type[0].lower() == "d":
-            pass
-        else:
-            log.exception("unknown layer type: %s"%type)
+        return rst if isList else rst[0]
     
     def getVisibleConductorLayers(self):
         ConductorLayerNames = self.ConductorLayerNames
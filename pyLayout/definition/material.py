@@ -53,7 +53,7 @@ class Material(Definition):
         if self.parsed and not force:
             return
         
-        log.debug("parse definition: %s"%self.name)
+        log.debug("parse definition: %s",self.name)
         maps = self.maps
         
         datas = self.oManager.GetData(self.name)
@@ -40,6 +40,7 @@ import re
 from ..common.common import log
 from ..common.unit import Unit
 from ..common.complexDict import ComplexDict
+from ..common.regexQuery import NameQuery
 from ..common.arrayStruct import ArrayStruct
 from .definition import Definitions,Definition
 
@@ -113,13 +114,7 @@ class Net(Definition):
     
     def getConnectedComponnets(self):
 #         return self.getConnectedObjs('component') #return wrong values
-        pins = self.getConnectedObjs('pin')
-        compList = []
-        for name in pins:
-            pinObj = self.layout.Pins[name]
-            if pinObj.CompName and pinObj.CompName not in compList:
-                compList.append(pinObj.CompName)
-        return compList
+        return self.layout.Connectivity.getComponentsOnNet(self.Name)
 
     
     def getConnectedPorts(self):
@@ -143,11 +138,11 @@ class Net(Definition):
         if not lines:
             return None
 
-        segLens = [Unit(self.layout.lines[o].TotalLength) for o in lines]
+        length = sum(Unit.parseMany([self.layout.lines[o].TotalLength for o in lines]))
         if unit is None:
-            return sum(segLens)
+            return Unit(length)
         else:
-            return Unit(sum(segLens))[unit]
+            return Unit(length)[unit]
 
     def createPortOnNet(self,comps = None,ignorRLC = True):
 
@@ -174,13 +169,14 @@ class Net(Definition):
             
         log.info("Backdrill net : %s"%self.name)
         
-        viaNames = self.getConnectedObjs("via")
-        for name in viaNames:
-            self.layout.Vias[name].backdrill(stub = stub)
-            
-        pinNames = self.getConnectedObjs("pin")
-        for name in pinNames:
-            self.layout.Pins[name].backdrill(stub = stub)
+        with self.layout.batch():
+            viaNames = self.getConnectedObjs("via")
+            for name in viaNames:
+                self.layout.Vias[name].backdrill(stub = stub)
+                
+            pinNames = self.getConnectedObjs("pin")
+            for name in pinNames:
+                self.layout.Pins[name].backdrill(stub = stub)
             
     def rename(self,newNet):
         objs = self.layout.oEditor.FindObjects('Net', self.Name)
@@ -206,6 +202,8 @@ class Net(Definition):
                     ]
                 ]
             ])
+        self.layout.invalidateSnapshots("Net")
+        self.layout.Connectivity.invalidate()
     
     
     def nameNoNet(self):
@@ -260,9 +258,12 @@ class Net(Definition):
                         ]
                     ]
                 ])      
+            self.layout.invalidateSnapshots("Net")
+            self.layout.Connectivity.invalidate()
     
     def delete(self):
         self.layout.oEditor.DeleteNets([self.Name])
+        self.layout.Connectivity.invalidate()
 
 class Nets(Definitions):
 
@@ -359,12 +360,9 @@ class Nets(Definitions):
         regNets = nets #if len(nets)>0 else regNets
         
         
-        nets = []
-
-        for regNet in regNets:
-            regNet = regNet.replace("$","\$").strip()
-            nets += filter(lambda x: re.match(regNet+"$",x,re.IGNORECASE),self.NameList)
-        return nets
+        #compiled patterns and results are cached until nets changed
+        patterns = [regNet.replace("$","\$").strip()+"$" for regNet in regNets]
+        return NameQuery.of(self.DefinitionDict).matchEach(patterns)
     
     
     def deleteNets(self,netList):
@@ -382,6 +380,7 @@ class Nets(Definitions):
         
         log.info("delete nets: %s"%str(netList))
         self.layout.oEditor.DeleteNets(netList)
+        self.layout.Connectivity.invalidate()
         self.layout.initObjects()  #add 20250707
         
     def reNameXnetForce(self,regNets,tail="_C"):
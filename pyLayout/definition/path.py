@@ -10,6 +10,7 @@
 
 
 import re
+from collections import deque
 from ..common.common import log,regAnyMatch
 from ..common.complexDict import ComplexDict
 
@@ -22,7 +23,7 @@ class Node(ComplexDict):
     def __init__(self,node):
         
         if isinstance(node,Node):
-            return node
+            component,net = node.Component,node.Net
         elif isinstance(node,(list,tuple)):
             component,net = node
         else:
@@ -48,12 +49,26 @@ class Node(ComplexDict):
 
 
 class Path(object):
-    '''_summary_
+    '''
+    power tree search, breadth-first from start nodes (VRM) through PTH components (R,L,FB) to end nodes (Sink)
+    
+    Examples:
+        >>> path = Path(layout = layout)
+        >>> path.startNodes = [["U1","VDD_1V0"],["U2","VDD_1V8"]] #one or more rails in one search
+        >>> path.endNodes = [["U10","VDD_1V0_CPU"],["U11","VDD_1V8_IO"]]
+        >>> path.search()
+        >>> path.nets
     '''
     
     def __init__(self,startNode = None, endNodes = None,includeComps=None,excludedNets=None,layout=None):
-        self._startNode = startNode
-        self._endNodes = endNodes
+        self._startNodes = []
+        self._endNodes = []
+        self._nodeDict = {} #node name -> node, for hasNode
+        if startNode:
+            self.startNode = startNode
+        if endNodes:
+            self.endNodes = endNodes
+            
         if excludedNets:
             self.excludedNets = excludedNets
         else:
@@ -71,28 +86,42 @@ class Path(object):
         
         self.layout = layout
         self.nodes = []
+        self._netCache = {} #net -> [(comp,expand)], neighbors of net
         
 #     def addNode(self,node):
 #         self.nodes.append(node)
     
     @property
     def startNode(self):
-        return self._startNode
+        return self._startNodes[0] if self._startNodes else None
     @startNode.setter
     def startNode(self,node):
-        self._startNode = Node(node)
+        self._startNodes = [Node(node)]
+    
+    @property
+    def startNodes(self):
+        return self._startNodes
+    @startNodes.setter
+    def startNodes(self,nodes):
+        self._startNodes = self._uniqueNodes(nodes)
     
     @property
     def endNodes(self):
         return self._endNodes
     @endNodes.setter
     def endNodes(self,nodes):
-        
         #remove dumplicate node
-        path = Path()
+        self._endNodes = self._uniqueNodes(nodes)
+    
+    def _uniqueNodes(self,nodes):
+        temp = {}
+        result = []
         for node in nodes:
-            path.insertNode(Node(node)) #will remove dumplicate node automation
-        self._endNodes = path.nodes
+            node = Node(node)
+            if node.name not in temp:
+                temp[node.name] = node
+                result.append(node)
+        return result
     
     @property
     def nets(self):
@@ -108,6 +137,7 @@ class Path(object):
             log.info("Add node %s as start node."%node.name)
             node.Type = "Start"
             self.nodes.append(node)
+            self._nodeDict[node.name] = node
             return
         
         if self.hasNode(node):
@@ -115,8 +145,7 @@ class Path(object):
             return
         else:
             self.nodes.append(node)
-        
-
+            self._nodeDict[node.name] = node
         
         if not loc:
             loc = self.nodes[0]
@@ -135,136 +164,154 @@ class Path(object):
     def removeNode(self,node):
         log.info("Remove node %s"%node.name)
         self.nodes.remove(node)
+        self._nodeDict.pop(node.name,None)
         for node2 in node.Next:
             node2.Previous.remove(node)
         for node2 in node.Previous:
             node2.Next.remove(node)
+            
     def hasNode(self,node):
-        for node2 in self.nodes:
-            if node.name == node2.name:
-                return True
-        
-        return False
+        return node.name in self._nodeDict
     
     def search(self):
-        if not self.startNode:
+        if not self.startNodes:
             log.info("StartNode must set before search path.")
             return None
         if not self.endNodes:
             log.info("EndNodes must set before search path.")
             return None
-        log.info("Search path from %s to %s"%(self.startNode.name,self.endNodes[0].name))
+        log.info("Search path from %s to %s"%(",".join([n.name for n in self.startNodes]),",".join([n.name for n in self.endNodes])))
         self.nodes = []
-        self.nodes.append(self.startNode) 
-        self.startNode.Type = "Start"
+        self._nodeDict = {}
+        for node in self.startNodes:
+            node.Type = "Start"
+            node.Previous = []
+            node.Next = []
+            self.nodes.append(node)
+            self._nodeDict[node.name] = node
         self._searchPath()
         self.removeInvalidNodes()
 
     def removeInvalidNodes(self):
-        flag = True
-        while(flag):
-            flag = False
-            for node in self.nodes:
-                if node.Type.lower() in ["end","start"]:
-                    continue
-                
-                if not node.Next or not node.Previous:
-                    self.removeNode(node)
-                    flag = True
-    
-    def _searchPath(self,startNode=None,endNodes=None):
+        '''
+        remove Mid nodes not have Next or Previous until no such node, each node is checked once after its neighbor removed.
+        '''
+        def _invalid(node):
+            return node.Type.lower() not in ["end","start"] and (not node.Next or not node.Previous)
         
-        if not startNode:
-            startNode = self.startNode
+        removed = set()
+        queue = deque([node for node in self.nodes if _invalid(node)])
+        while queue:
+            node = queue.popleft()
+            if node.name in removed or not _invalid(node):
+                continue
             
-        if not endNodes:
-            endNodes = self.endNodes
+            log.debug("Remove node %s"%node.name)
+            removed.add(node.name)
+            for node2 in node.Next:
+                node2.Previous.remove(node)
+                queue.append(node2)
+            for node2 in node.Previous:
+                node2.Next.remove(node)
+                queue.append(node2)
+            node.Next = []
+            node.Previous = []
         
-        net = startNode.Net
-        startComp = startNode.Component
-        endComps = [node.Component for node in endNodes]
+        if removed:
+            self.nodes = [node for node in self.nodes if node.name not in removed]
+            for name in removed:
+                self._nodeDict.pop(name,None)
+    
+    def _getNeighbors(self,net):
+        '''
+        components on net with flag expand, capacitors are ignored, cached per net
+        expand: True if component is in includeComps, or is PTH component with pins not more than maxPinCount
+        '''
+        if net in self._netCache:
+            return self._netCache[net]
         
         #layout.oEditor.FilterObjectList('Type','component',layout.oEditor.FindObjects('Net','BST_V1P5_S5')) 
         #return error components
-    #     comps = layout.Nets[net].Objects.Components
-        pins = self.layout.Nets[net].Objects.Pins
-        comps = [self.layout.Pins[p].CompName for p in pins]
-        comps = list(set(comps))
-        
-        
-        newComps = []
-        #comp is refdes
-        for comp in comps:
-            if comp == startComp:
-                continue
-            
-            #if capacitor, ignor
-            if self.layout.Components[comp].PartType in ["Capacitor"]:
+        connectivity = self.layout.Connectivity
+        neighbors = []
+        for comp in connectivity.getComponentsOnNet(net):
+            #if capacitor, ignor. part type from connectivity, Components[comp].PartType parse all properties of component
+            if connectivity.getComponentType(comp) in ["Capacitor"]:
                 continue
             
             #include comps in includeComps for first
             if comp in self.includeComps:
-                newComps.append(comp)
+                neighbors.append((comp,True))
                 continue
             
-            #if is endComps, remove
-            flag = False
-            for node in endNodes:
-                if node.Component == comp and node.Net == net:
-                    # newNode = Node(comp,net)
-                    node.Type = "End"
-                    node.Previous = []
-                    node.Next = []
-                    self.insertNode(node,startNode,pos="Next")
-                    flag = True
-                    break
-            if flag:
-                endNodes = [node for node in endNodes if not (node.Component == comp and node.Net == net)]
-                continue
-            
-            #ingor comps with more than maxPinCount
-            if self.layout.Components[comp].PinCount>self.maxPinCount:
-                continue            
-            
-            #if comp in PTH
-            if regAnyMatch(self.PTH,comp):
-                newComps.append(comp)
+            #ingor comps with more than maxPinCount, they only could be end node
+            expand = len(connectivity.getPinsOfComponent(comp)) <= self.maxPinCount and bool(regAnyMatch(self.PTH,comp))
+            neighbors.append((comp,expand))
+        
+        self._netCache[net] = neighbors
+        return neighbors
+    
+    def _searchPath(self,startNodes=None,endNodes=None):
+        '''
+        breadth-first search from all start nodes, node already in path is not visited again.
+        '''
+        if not startNodes:
+            startNodes = self.startNodes
             
-        if not newComps:
-            return 
+        if not endNodes:
+            endNodes = self.endNodes
         
-        for comp in newComps:
-            for newNet in self.layout.Components[comp].NetNames:
-                if newNet == net:
+        ends = dict([(node.name,node) for node in endNodes]) #end nodes not reached
+        queue = deque(startNodes)
+        while queue:
+            node = queue.popleft()
+            net = node.Net
+            
+            for comp,expand in self._getNeighbors(net):
+                if comp == node.Component:
                     continue
-                if regAnyMatch(self.excludedNets,newNet):
+                
+                #if is endComps, remove
+                name = "%s:%s"%(comp,net)
+                if name in ends and comp not in self.includeComps:
+                    endNode = ends.pop(name)
+                    endNode.Type = "End"
+                    endNode.Previous = []
+                    endNode.Next = []
+                    self.insertNode(endNode,node,pos="Next")
                     continue
                 
-                newNode = Node([comp,newNet])
+                if not expand:
+                    continue
                 
-                #exit recursive if node already exist
-                #known issue here, Unable to display cyclic issues among components; when multiple resistors or inductors are connected in parallel, only one of the components can be displayed.
-                if self.hasNode(node):
-                    log.info("Node already in the path: %s"%node.name)
-#                     self.insertNode(newNode,startNode)
-                    return
-                else:
-                    self.insertNode(newNode,startNode)
-                    self._searchPath(newNode, endNodes)
+                for newNet in self.layout.Connectivity.getNetsOfComponent(comp):
+                    if newNet == net or not newNet: #"" for unconnected pins
+                        continue
+                    if regAnyMatch(self.excludedNets,newNet):
+                        continue
+                    
+                    newNode = Node([comp,newNet])
+                    #known issue here, Unable to display cyclic issues among components; when multiple resistors or inductors are connected in parallel, only one of the components can be displayed.
+                    if self.hasNode(newNode):
+                        continue
+                    self.insertNode(newNode,node)
+                    queue.append(newNode)
 
     def printTree(self,startNode=None,prefix='    '):
-        if not startNode:
-            startNode = self.startNode
-            log.info("Power Tree:")
-            log.info(startNode.name)
-        # 遍历所有项
-        
-        if not startNode.Next:
-            return
-
-        for item in startNode.Next:
-            log.info("%s|__ %s"%(prefix,item.name))
-            self.printTree(item, prefix + '    ')
+        startNodes = [startNode] if startNode else self.startNodes
+        log.info("Power Tree:")
+        for node in startNodes:
+            log.info(node.name)
+            # 遍历所有项, stack for deep tree
+            stack = [(item,prefix) for item in node.Next[::-1]]
+            visited = set()
+            while stack:
+                item,pre = stack.pop()
+                log.info("%s|__ %s"%(pre,item.name))
+                if item.name in visited:
+                    continue
+                visited.add(item.name)
+                stack += [(item2,pre + '    ') for item2 in item.Next[::-1]]
      
 
 def searchPath(startNode,endNodes,layout,PTH=["R.*","L.*"],excludedNets = [".*GND"],path=None):
@@ -17,9 +17,10 @@ Examples:
 import re,os
 from ..common import hfss3DLParameters
 from ..common.arrayStruct import ArrayStruct
-from ..common.complexDict import ComplexDict
+from ..common.complexDict import ComplexDict,compileMaps
 from ..common.unit import Unit
 from ..common.common import log,tuple2list
+from ..common.tracing import traced
 from .definition import Definitions,Definition
 from ..common.progressBar import ProgressBar
 
@@ -49,6 +50,9 @@ class Sweep(Definition):
                      "Set":lambda x: {"interpolating":"kInterpolating","discrete":"kDiscrete"}[x.lower()]} #kInterpolating or discrete
         }
     
+    #compiled once for all sweeps
+    _compiledHFSS = compileMaps(mapsForHFSS)
+    _compiledSIwave = compileMaps(mapsForSIwave)
     
     def __init__(self,sweepName = None,setupName=None,layout=None):
         super(self.__class__,self).__init__(sweepName,type="Sweep",layout=layout)
@@ -77,21 +81,21 @@ class Sweep(Definition):
         if self.parsed and not force:
             return
         
-        log.debug("parse primitive: %s"%self.name)
+        log.debug("parse primitive: %s",self.name)
         SolveSetupType =  self.layout.Setups[self._info.setupName].SolveSetupType 
         
         maps = {}
         if SolveSetupType== "HFSS":
-            maps = self.mapsForHFSS
+            maps,compiled = self.mapsForHFSS,Sweep._compiledHFSS
         elif SolveSetupType== "SIwave":
-            maps = self.mapsForSIwave
+            maps,compiled = self.mapsForSIwave,Sweep._compiledSIwave
         else:
-            maps = self.mapsForSIwave
+            maps,compiled = self.mapsForSIwave,Sweep._compiledSIwave
             log.error("Unknow setup type:%s"%self._info.setupName)
  
         datas = self.oModule.GetSweepInfo(self._info.setupName,self._info.sweepName)
         if datas:
-            _array = ArrayStruct(tuple2list(datas),maps)
+            _array = ArrayStruct(tuple2list(datas),maps,indexed = True,compiledMaps = compiled)
         else:
             _array = []
             
@@ -141,40 +145,48 @@ class Sweeps(Definitions):
         return ComplexDict(dict([(name,Sweep(name,self.setupName,layout=self.layout)) for name in self.oModule.GetSweeps(self.setupName)]))
 
 class Setup(Definition):
-
-
+    
+    arrayMaps = {
+        # "AdaptiveFrequency":"AdaptiveSettings/SingleFrequencyDataList/AdaptiveFrequencyData/AdaptiveFrequency",
+        # "DeltaS": "AdaptiveSettings/SingleFrequencyDataList/AdaptiveFrequencyData/MaxDelta",
+        "Order": {"Key":"AdvancedSettings/OrderBasis",
+                "Set":lambda x:[-1,1,2][("mixed","first","second").index(x.lower())],
+                "Get":lambda y:("mixed","first","second")[(-1,1,2).index(y)],
+                },
+        "PortMaxDeltaZo":"AdvancedSettings/MaxDeltaZo",
+        #for Siwave
+        "SISliderPos":"SimulationSettings/SISliderPos", #0:Speed, 1:Balanced, 2:Accurary
+        "PISliderPos":"SimulationSettings/PISliderPos", #0:Speed, 1:Balanced, 2:Accurary
+        }
+    
+    setupMaps = {
+        "DeltaS": {"Key":"self",
+                "Set":lambda s,x:s.updateByKey("MaxDelta",x),
+                "Get":lambda s:s["AdaptiveSettings/SingleFrequencyDataList/AdaptiveFrequencyData/MaxDelta"],
+                },
+        "MaxPasses": {"Key":"self",
+                "Set":lambda s,x:s.updateByKey("MaxPasses",x),
+                "Get":lambda s:s["AdaptiveSettings/SingleFrequencyDataList/AdaptiveFrequencyData/MaxPasses"],
+                },
+        "AdaptiveFrequency": {
+            "Key":"self",
+            "Set":lambda s,v:s._setAdaptiveFrequency(v),
+            "Get":lambda s: s["AdaptiveSettings/SingleFrequencyDataList/AdaptiveFrequencyData/AdaptiveFrequency"]
+            },
+        "Sweeps":{
+            "Key":"self",
+            "Get":lambda s: Sweeps(layout=s.layout,setupName=s.name) #[Sweep(k,sweepName) for sweepName in self.oModule.GetSweeps(self.name)]
+            },
+        }
+    
+    #compiled once for all setups, maps of a setup are compiled again only if items added to them
+    _compiledArrayMaps = compileMaps(arrayMaps)
+    _compiledSetupMaps = compileMaps(setupMaps)
     
     def __init__(self,name = None,layout=None):
         super(self.__class__,self).__init__(name,type="Setup",layout=layout)
-        arrayMaps = {
-            # "AdaptiveFrequency":"AdaptiveSettings/SingleFrequencyDataList/AdaptiveFrequencyData/AdaptiveFrequency",
-            # "DeltaS": "AdaptiveSettings/SingleFrequencyDataList/AdaptiveFrequencyData/MaxDelta",
-            "Order": {"Key":"AdvancedSettings/OrderBasis",
-                    "Set":lambda x:[-1,1,2][("mixed","first","second").index(x.lower())],
-                    "Get":lambda y:("mixed","first","second")[(-1,1,2).index(y)],
-                    },
-            "PortMaxDeltaZo":"AdvancedSettings/MaxDeltaZo",
-            #for Siwave
-            "SISliderPos":"SimulationSettings/SISliderPos", #0:Speed, 1:Balanced, 2:Accurary
-            "PISliderPos":"SimulationSettings/PISliderPos", #0:Speed, 1:Balanced, 2:Accurary
-            }
-        self._info.update("arrayMaps",arrayMaps)
-        
-        self.maps = {
-            "DeltaS": {"Key":"self",
-                    "Set":lambda s,x:s.updateByKey("MaxDelta",x),
-                    "Get":lambda s:s["AdaptiveSettings/SingleFrequencyDataList/AdaptiveFrequencyData/MaxDelta"],
-                    },
-            "MaxPasses": {"Key":"self",
-                    "Set":lambda s,x:s.updateByKey("MaxPasses",x),
-                    "Get":lambda s:s["AdaptiveSettings/SingleFrequencyDataList/AdaptiveFrequencyData/MaxPasses"],
-                    },
-            "AdaptiveFrequency": {
-                "Key":"self",
-                "Set":lambda s,v:s._setAdaptiveFrequency(v),
-                "Get":lambda s: s["AdaptiveSettings/SingleFrequencyDataList/AdaptiveFrequencyData/AdaptiveFrequency"]
-            }
-        }
+        self._info.update("arrayMaps",dict(Setup.arrayMaps))
+        self.maps = dict(Setup.setupMaps)
     
     @property
     def oModule(self):
@@ -198,11 +210,13 @@ class Setup(Definition):
         if self.parsed and not force:
             return
         
-        log.debug("parse primitive: %s"%self.name)
+        log.debug("parse primitive: %s",self.name)
     
         datas = self.oModule.GetSetupData(self.name)
         if datas:
-            _array = ArrayStruct(tuple2list(datas),self._info.arrayMaps)
+            arrayMaps = self._info.arrayMaps
+            _array = ArrayStruct(tuple2list(datas),arrayMaps,indexed = True,
+                                 compiledMaps = Setup._compiledArrayMaps if len(arrayMaps) == len(Setup.arrayMaps) else None)
         else:
             _array = []
             
@@ -211,12 +225,7 @@ class Setup(Definition):
         
         self._info.update("Name",self.name)
         maps = self.maps
-        maps.update({"Sweeps":{
-            "Key":"self",
-            "Get":lambda s: Sweeps(layout=s.layout,setupName=s.name) #[Sweep(k,sweepName) for sweepName in self.oModule.GetSweeps(self.name)]
-            }})
-        
-        self._info.setMaps(maps)
+        self._info.setMaps(maps,Setup._compiledSetupMaps if len(maps) == len(Setup.setupMaps) else None)
         self._info.update("self", self)
         self.parsed = True
 
@@ -364,6 +373,36 @@ class Setup(Definition):
         
         self.oDesign.Analyze(self.name)
     
+    def _getNetByPoint(self,index,point,layer):
+        '''
+        net of layout object on point, confirmed by oEditor.FindObjectsByPoint (BBox hit is not in shape: L-shape trace, void).
+        spatial index only prunes points hit no BBox (no COM call), and gives net of found objects without parse them.
+        '''
+        indexed = index.hasLayer(layer)
+        if indexed and not index.query(point,layer=layer):
+            return None
+        
+        layoutObjs = self.layout.getObjectByPoint(point,layer=layer)
+        if not layoutObjs:
+            return None
+        
+        for obj2 in layoutObjs:
+            net = index.getNet(obj2) if indexed else None
+            if net:
+                return net
+            
+            try:
+                element = self.layout[obj2]
+            except:
+                continue
+            
+            if "Net" in  element.Props:
+                return element.Net
+        
+        log.error("\nobj %s not found."%obj2)
+        return None
+
+    @traced()
     def exportToHfss(self,path = None,timeout = 10*60):
         if not path:
             path = os.path.join(self.layout.projectDir, "%s_%s.aedt"%(self.layout.projectName,self.layout.designName))
@@ -385,13 +424,14 @@ class Setup(Definition):
         if i>=timeout:
             log.exception("time out (>30 mins), Execution interrupt... .")
             
-        from ..model3D.HFSS import HFSS
+        from ..Model3D.HFSS import HFSS
         hfss = HFSS()
         hfss.openAedt(path)
         unit = hfss.getUnit()
         netInfo = {}
         log.info("Get net information ... ")
         
+        index = self.layout.spatialIndex() #BBox of layout objects, load once
         bar = ProgressBar(len(hfss.Objects),"Get net information progress")
         
         for obj in hfss.Objects:
@@ -411,26 +451,11 @@ class Setup(Definition):
             for vertex in obj.Vertexs:
                 pt0 = ["%s%s"%(x,unit) for x in  vertex]
                 layer = self.layout.layers.getLayerByHeight(pt0[2])
-                layoutObjs = self.layout.getObjectByPoint([pt0[0],pt0[1]],layer=layer)
-                if layoutObjs:
-                    net = None
-                    for obj2 in layoutObjs:
-                        try:
-                            element = self.layout[obj2]
-                        except:
-                            continue
-                        
-                        if "Net" in  element.Props:
-                            net = element.Net
-                            break
-                        else:
-                            continue
-                    if not net:
-                        log.error("\nobj %s not found."%obj2)
-                    else:
-                        netInfo.update({obj.name:net})
-                        flag = 0
-                        break
+                net = self._getNetByPoint(index,[pt0[0],pt0[1]],layer)
+                if net:
+                    netInfo.update({obj.name:net})
+                    flag = 0
+                    break
             if flag:
                 log.debug("Not found object on layout:%s"%obj.name)                 
         
@@ -466,13 +491,14 @@ class Setup(Definition):
         if i>=timeout:
             log.exception("time out (>30 mins), Execution interrupt... .")
             
-        from ..model3D.Q3D import Q3D
+        from ..Model3D.Q3D import Q3D
         q3d = Q3D()
         q3d.openAedt(path)
         unit = q3d.getUnit()
         netInfo = {}
         log.info("Get net information ... please wait for some minitus ...........")
         
+        index = self.layout.spatialIndex() #BBox of layout objects, load once
         bar = ProgressBar(len(q3d.Objects),"Get net information progress")
         for obj in q3d.Objects:
             bar.showPercent()
@@ -491,26 +517,11 @@ class Setup(Definition):
             for vertex in obj.Vertexs:
                 pt0 = ["%s%s"%(x,unit) for x in  vertex]
                 layer = self.layout.layers.getLayerByHeight(pt0[2])
-                layoutObjs = self.layout.getObjectByPoint([pt0[0],pt0[1]],layer=layer)
-                if layoutObjs:
-                    net = None
-                    for obj2 in layoutObjs:
-                        try:
-                            element = self.layout[obj2]
-                        except:
-                            continue
-                        
-                        if "Net" in  element.Props:
-                            net = element.Net
-                            break
-                        else:
-                            continue
-                    if not net:
-                        log.error("\nobj %s not found."%obj2)
-                    else:
-                        netInfo.update({obj.name:net})
-                        flag = 0
-                        break
+                net = self._getNetByPoint(index,[pt0[0],pt0[1]],layer)
+                if net:
+                    netInfo.update({obj.name:net})
+                    flag = 0
+                    break
             if flag:
                 log.debug("Not found object on layout:%s"%obj.name)                      
                 
@@ -525,7 +536,7 @@ class Setup(Definition):
         log.info("First export to Q3D, then Copy to Maxwell")
         q3d = self.exportToQ3D(path, timeout)
         
-        from ..model3D.maxwell import Maxwell
+        from ..Model3D.maxwell import Maxwell
         maxwell = Maxwell()
         maxwell.newDesign(q3d.designName+"_maxwell",q3d.projectName)
         q3d.oEditor.Copy(["NAME:Selections","Selections:=",",".join(q3d.AllParts)])
@@ -0,0 +1,200 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Columnar view of the stackup, one column per layer attribute in stack order (top -> bottom).
+
+Columns are build once from GetLayerInfo of all stackup layers, elevation and thickness are SI value (meter).
+Numeric columns are numpy arrays if numpy installed, else python list.
+Layers.table build a new table after Layers.refresh() or Layer.update().
+
+Examples:
+    >>> table = layout.Layers.table
+    >>> table.Names
+    ['TOP', 'D1', 'L2', ... ]
+    >>> table.Lower[0], table.Thickness[0]
+    (0.0016256, 3.556e-05)
+    >>> table.getLayerByHeight([0.0016, "1.2mm"])
+    ['TOP', 'L4']
+'''
+
+from bisect import bisect_right
+from ..common.common import log
+from ..common.unit import Unit
+
+try:
+    import numpy as np
+except:
+    np = None
+
+
+class StackupTable(object):
+    '''
+    - Names, Types, Materials, FillMaterials: list
+    - Lower, Thickness, Upper: float array (meter)
+    - DK, DF: float array, load from Materials at first access, nan if not found
+    '''
+
+    #relative tolerance of height compare, same as Unit compare
+    tolerance = 1e-3
+
+    def __init__(self,layers,version = 0):
+        self.layers = layers
+        self.version = version
+        self._dk = None
+        self._df = None
+        self._sorted = {} #type -> (lowers,uppers,names), ascending by lower elevation
+        self.build()
+
+    @property
+    def Count(self):
+        return len(self.Names)
+
+    def __repr__(self):
+        return "StackupTable Object: %s layers, version %s"%(len(self.Names),self.version)
+
+    @property
+    def layout(self):
+        return self.layers.layout
+
+    def _array(self,values):
+        if np != None:
+            return np.array(values,dtype=float)
+        return list(values)
+
+    def build(self):
+        names = list(self.layers.LayerNames)
+        definitionDict = self.layers.DefinitionDict
+
+        types = []
+        materials = []
+        fillMaterials = []
+        lowers = []
+        thicknesses = []
+        for name in names:
+            info = definitionDict[name].Info
+            types.append(info["Type"])
+            materials.append(info["Material0"] if "Material0" in info else "")
+            fillMaterials.append(info["FillMaterial0"] if "FillMaterial0" in info else "")
+            lowers.append(info["LowerElevation0"] if "LowerElevation0" in info else 0.0)
+            thicknesses.append(info["Thickness0"] if "Thickness0" in info else 0.0)
+        lowers = list(Unit.parseMany(lowers))
+        thicknesses = list(Unit.parseMany(thicknesses))
+
+        self.Names = names
+        self.Types = types
+        self.Materials = materials
+        self.FillMaterials = fillMaterials
+        self.Lower = self._array(lowers)
+        self.Thickness = self._array(thicknesses)
+        self.Upper = self._array([l+t for l,t in zip(lowers,thicknesses)])
+        self._index = dict((name,i) for i,name in enumerate(names))
+        self._indexLower = dict((name.lower(),i) for i,name in enumerate(names))
+
+        self.ConductorNames = [n for n,t in zip(names,types) if t == "signal"]
+        self.DielectricNames = [n for n,t in zip(names,types) if t == "dielectric"]
+        log.debug("Stackup table build: %s"%repr(self))
+        return self
+
+
+    #--- columns
+
+    def _loadMaterialColumns(self):
+        materials = self.layout.Materials
+        dks = []
+        dfs = []
+        cache = {}
+        for typ,material,fill in zip(self.Types,self.Materials,self.FillMaterials):
+            name = material if typ == "dielectric" else fill
+            if name not in cache:
+                try:
+                    cache[name] = (float(materials[name].DK),float(materials[name].DF))
+                except:
+                    log.debug("DK/DF of material '%s' is not a number."%name)
+                    cache[name] = (float("nan"),float("nan"))
+            dks.append(cache[name][0])
+            dfs.append(cache[name][1])
+        self._dk = self._array(dks)
+        self._df = self._array(dfs)
+
+    @property
+    def DK(self):
+        if self._dk is None:
+            self._loadMaterialColumns()
+        return self._dk
+
+    @property
+    def DF(self):
+        if self._df is None:
+            self._loadMaterialColumns()
+        return self._df
+
+    def indexOf(self,name):
+        '''
+        stack index of layer name, ignore case, -1 if not found
+        '''
+        if name in self._index:
+            return self._index[name]
+        return self._indexLower.get(name.lower(),-1)
+
+    def row(self,name):
+        i = self.indexOf(name)
+        if i<0:
+            return None
+        return {"Name":self.Names[i],"Type":self.Types[i],"Material":self.Materials[i],"FillMaterial":self.FillMaterials[i],
+                "Lower":float(self.Lower[i]),"Thickness":float(self.Thickness[i]),"Upper":float(self.Upper[i])}
+
+
+    #--- height search
+
+    def _sortedLayers(self,type = "signal"):
+        if type not in self._sorted:
+            rows = [(float(self.Lower[i]),float(self.Upper[i]),self.Names[i]) for i in range(len(self.Names)) if self.Types[i] == type]
+            rows.sort(key = lambda r: r[0])
+            self._sorted[type] = ([r[0] for r in rows],[r[1] for r in rows],[r[2] for r in rows])
+        return self._sorted[type]
+
+    def _nearest(self,h,i,lowers,uppers):
+        '''
+        i: last layer which lower<=h, return (layer index, distance), distance>0 if h above the layer
+        '''
+        tol = abs(h)*self.tolerance
+        if i>=0 and h-uppers[i]<=tol:
+            return i,0
+
+        below = h-uppers[i] if i>=0 else None #h above layer i
+        above = h-lowers[i+1] if i+1<len(lowers) else None #h below layer i+1
+        if below == None:
+            return i+1,above
+        if above == None or abs(below)<=abs(above):
+            return i,below
+        return i+1,above
+
+    def searchHeights(self,heights,type = "signal"):
+        '''
+        heights: list of heights, value (meter) or str with unit
+        return: list of (layer name, distance), distance is 0 if inside the layer, >0 if above the layer
+        '''
+        lowers,uppers,names = self._sortedLayers(type)
+        if not names:
+            return [(None,None) for h in heights]
+
+        values = list(Unit.parseMany(heights))
+        if np != None:
+            hs = np.asarray(values,dtype=float)
+            idx = np.searchsorted(np.asarray(lowers),hs+np.abs(hs)*self.tolerance,side="right")-1
+            idx = idx.tolist()
+        else:
+            idx = [bisect_right(lowers,h+abs(h)*self.tolerance)-1 for h in values]
+
+        result = []
+        for h,i in zip(values,idx):
+            j,distance = self._nearest(h,i,lowers,uppers)
+            result.append((names[j],distance))
+        return result
+
+    def getLayerByHeight(self,heights,type = "signal"):
+        '''
+        nearest layer of each height, return list of layer names
+        '''
+        return [name for name,distance in self.searchHeights(heights,type)]
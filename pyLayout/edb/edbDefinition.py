@@ -9,6 +9,7 @@ Note: "This file defines a parent class, which cannot be used independently and
 import re
 
 from ..common.complexDict import ComplexDict
+from ..common.regexQuery import NameQuery
 from ..common.unit import Unit
 from ..common.common import log,Iterable
 
@@ -156,7 +157,7 @@ class EdbDefinitions(object):
                 return self.DefinitionDict[key]
             else:
                 #find by 正则表达式
-                lst = [name for name in self.DefinitionDict.Keys if re.match(r"^%s$"%key,name,re.I)]
+                lst = NameQuery.of(self.DefinitionDict).match(r"^%s$"%key)
                 if not lst:
                     raise Exception("not found %s: %s"%(self.type,key))
                 else:
@@ -186,6 +187,21 @@ class EdbDefinitions(object):
     def __len__(self):
         return len(self.DefinitionDict)
     
+    def __iter__(self):
+        return iter(self.DefinitionDict)
+    
+    def items(self):
+        '''
+        iterate (name,object)
+        '''
+        return self.DefinitionDict.items()
+    
+    def iterBatches(self,size = 1000):
+        '''
+        iterate objects in list of length size
+        '''
+        return self.DefinitionDict.iterBatches(size)
+    
     def __repr__(self):
         return "%s Definition Objects"%(self.type)
             
@@ -128,6 +128,8 @@ options = Option({
     #---solver
     "AEDT_HPC_MachineName":'localhost',
     "AEDT_HPC_NumCores":None,
+    #---profile
+    "AEDT_ProfileCOM": False, #wrap COM handles in initDesign, see common/comProfiler.py
     #---default
     "H3DL_Default":None
 })
@@ -0,0 +1,240 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+S-parameter metrics of all channels at once: insertion loss, return loss, NEXT, FEXT and mixed-mode SDD.
+
+Channels and differential pairs are found from port names "comp.pin.net" (same rule as Ports.reorder):
+- single ended channel: two ports with same net on different components
+- differential pair: two ports of one component with nets like DQS_P/DQS_N, CLK+/CLK-, D0P/D0N
+- differential channel: same differential net on two components
+
+All metrics are dB of the S-parameter (20*log10|S|), computed by numpy indexing over all channels.
+Result is one numpy structured array, one row per (metric, victim, aggressor):
+    Metric, Victim, Aggressor, Worst (dB), dB (curve over frequency)
+
+Examples:
+    >>> ts = layout.Solutions[0].loadNetworkData()
+    >>> metrics = SParamMetrics.fromTouchstone(ts,nearComps = ["U1"])
+    >>> table = metrics.getTable()
+    >>> table[table["Metric"] == "SDD21"][["Victim","Worst"]]
+    >>> metrics.writeCsv("metrics.csv",frequencies = [4e9,8e9])
+'''
+
+import re
+from ..common.common import log
+
+try:
+    import numpy as np
+except:
+    np = None
+
+
+#net of positive / negative of differential pair
+_diffNet = re.compile(r"^(.*?)(_?)(P|N|\+|-)$",re.I)
+_positive = {"p":"n","+":"-"}
+
+
+def parsePortName(name):
+    '''
+    (comp,pin,net) of port name comp.pin.net, None if not in this rule
+    '''
+    splits = name.split(".")
+    if len(splits) != 3:
+        return None
+    return tuple(splits)
+
+def findChannels(portNames,nearComps = None):
+    '''
+    single ended channels, list of (net,nearIndex,farIndex)
+    nearComps: components of near end, default the first component by name
+    '''
+    nets = {}
+    for i,name in enumerate(portNames):
+        parsed = parsePortName(name)
+        if parsed:
+            nets.setdefault(parsed[2],[]).append((parsed[0],i))
+
+    nearComps = set([c.lower() for c in nearComps or []])
+    channels = []
+    for net,ports in nets.items():
+        if len(ports) != 2 or ports[0][0] == ports[1][0]:
+            continue
+        a,b = sorted(ports)
+        if b[0].lower() in nearComps and a[0].lower() not in nearComps:
+            a,b = b,a
+        channels.append((net,a[1],b[1]))
+    channels.sort(key = lambda c: c[1])
+    return channels
+
+def findDiffPairs(portNames):
+    '''
+    differential pairs of ports, list of (comp.base,posIndex,negIndex)
+    '''
+    ports = {} #(comp,net lower) -> index
+    for i,name in enumerate(portNames):
+        parsed = parsePortName(name)
+        if parsed:
+            ports[(parsed[0],parsed[2].lower())] = i
+
+    pairs = []
+    for i,name in enumerate(portNames):
+        parsed = parsePortName(name)
+        if not parsed:
+            continue
+        comp,pin,net = parsed
+        m = _diffNet.match(net)
+        if not m or m.group(3).lower() not in _positive:
+            continue
+        negNet = (m.group(1)+m.group(2)+_positive[m.group(3).lower()]).lower()
+        if (comp,negNet) in ports:
+            pairs.append(("%s.%s"%(comp,m.group(1)),i,ports[(comp,negNet)]))
+    return pairs
+
+def mixedModeDD(S,pairs):
+    '''
+    differential mode matrix F x D x D of pairs [(name,pos,neg)]
+    Sdd[a,b] = (S[pa,pb] - S[pa,nb] - S[na,pb] + S[na,nb])/2
+    '''
+    pos = np.array([p[1] for p in pairs],dtype = int)
+    neg = np.array([p[2] for p in pairs],dtype = int)
+    return 0.5*(S[:,pos[:,None],pos[None,:]] - S[:,pos[:,None],neg[None,:]]
+                - S[:,neg[:,None],pos[None,:]] + S[:,neg[:,None],neg[None,:]])
+
+def toDB(values):
+    return 20*np.log10(np.maximum(np.abs(values),1e-30))
+
+
+class SParamMetrics(object):
+    '''
+    frequency: Hz, F
+    S: complex F x N x N
+    portNames: N port names comp.pin.net
+    '''
+
+    def __init__(self,frequency,S,portNames,nearComps = None,crosstalk = True):
+        if np == None:
+            log.exception("numpy is required for S-parameter metrics.")
+        self.Frequency = np.asarray(frequency,dtype = float)
+        self.S = np.asarray(S)
+        self.PortNames = list(portNames)
+        self.nearComps = nearComps
+        self.crosstalk = crosstalk
+        self._table = None
+
+    @classmethod
+    def fromTouchstone(cls,ts,**kwargs):
+        return cls(ts.Frequency,ts.Data,ts.PortNames,**kwargs)
+
+    def __repr__(self):
+        return "SParamMetrics Object: %s ports, %s frequencies"%(len(self.PortNames),len(self.Frequency))
+
+    @property
+    def Channels(self):
+        return findChannels(self.PortNames,self.nearComps)
+
+    @property
+    def DiffPairs(self):
+        return findDiffPairs(self.PortNames)
+
+    def getDiffChannels(self):
+        '''
+        differential channels over diff pairs, list of (name,nearPairIndex,farPairIndex)
+        '''
+        pairs = self.DiffPairs
+        names = ["%s.%s.%s"%(name.split(".",1)[0],"diff",name.split(".",1)[1]) for name,p,n in pairs]
+        return pairs,findChannels(names,self.nearComps)
+
+
+    #--- metrics
+
+    def _rows(self,metric,S,channels,victims,aggressors,outIndex,inIndex,worst):
+        '''
+        rows of one metric: S[:,outIndex,inIndex] for each (victim,aggressor)
+        '''
+        if len(outIndex) == 0:
+            return []
+        curves = toDB(S[:,np.asarray(outIndex,dtype = int),np.asarray(inIndex,dtype = int)]).T #K x F
+        worsts = curves.max(axis = 1) if worst == "max" else curves.min(axis = 1)
+        return [(metric,v,a,w,c) for v,a,w,c in zip(victims,aggressors,worsts,curves)]
+
+    def _channelRows(self,S,channels,prefix):
+        '''
+        IL, RL, NEXT, FEXT of channels on matrix S
+        '''
+        rows = []
+        nets = [c[0] for c in channels]
+        near = [c[1] for c in channels]
+        far = [c[2] for c in channels]
+
+        #insertion loss S(far,near), return loss S(near,near) and S(far,far)
+        rows += self._rows(prefix+"21",S,channels,nets,nets,far,near,"min")
+        rows += self._rows(prefix+"11",S,channels,nets,nets,near,near,"max")
+        rows += self._rows(prefix+"22",S,channels,nets,nets,far,far,"max")
+
+        if self.crosstalk and len(channels) > 1:
+            #victim v, aggressor g != v
+            count = len(channels)
+            v,g = np.nonzero(~np.eye(count,dtype = bool))
+            near = np.asarray(near)
+            far = np.asarray(far)
+            victims = [nets[i] for i in v]
+            aggressors = [nets[i] for i in g]
+            rows += self._rows(prefix+"NEXT",S,channels,victims,aggressors,near[v],near[g],"max")
+            rows += self._rows(prefix+"FEXT",S,channels,victims,aggressors,far[v],near[g],"max")
+        return rows
+
+    def getTable(self,refresh = False):
+        '''
+        structured array: Metric, Victim, Aggressor, Worst, dB[F]
+        metrics: S21 (IL), S11/S22 (RL), NEXT, FEXT, and SDD21/SDD11/SDD22/SDDNEXT/SDDFEXT of differential channels
+        '''
+        if self._table is not None and not refresh:
+            return self._table
+
+        rows = self._channelRows(self.S,self.Channels,"S")
+        pairs,diffChannels = self.getDiffChannels()
+        if diffChannels:
+            rows += self._channelRows(mixedModeDD(self.S,pairs),diffChannels,"SDD")
+
+        width = max([len(r[1]) for r in rows] + [len(r[2]) for r in rows] + [1])
+        dtype = [("Metric","U8"),("Victim","U%s"%width),("Aggressor","U%s"%width),("Worst","f8"),("dB","f8",(len(self.Frequency),))]
+        table = np.zeros(len(rows),dtype = dtype)
+        if rows:
+            table["Metric"] = [r[0] for r in rows]
+            table["Victim"] = [r[1] for r in rows]
+            table["Aggressor"] = [r[2] for r in rows]
+            table["Worst"] = [r[3] for r in rows]
+            table["dB"] = np.array([r[4] for r in rows])
+        self._table = table
+        log.debug("S-parameter metrics: %s rows"%len(table))
+        return table
+
+    def getValues(self,frequencies,table = None):
+        '''
+        dB of each row at frequencies (Hz), linear interpolation, K x len(frequencies)
+        '''
+        table = self.getTable() if table is None else table
+        values = np.empty((len(table),len(frequencies)))
+        for k,f in enumerate(frequencies):
+            i = int(np.clip(np.searchsorted(self.Frequency,f),1,len(self.Frequency)-1))
+            f0,f1 = self.Frequency[i-1],self.Frequency[i]
+            t = 0.0 if f1 == f0 else (f-f0)/(f1-f0)
+            values[:,k] = table["dB"][:,i-1]*(1-t) + table["dB"][:,i]*t
+        return values
+
+    def writeCsv(self,path,frequencies = None):
+        '''
+        Metric,Victim,Aggressor,Worst and dB at frequencies
+        '''
+        table = self.getTable()
+        frequencies = frequencies or []
+        values = self.getValues(frequencies,table) if frequencies else None
+        with open(path,"w") as f:
+            f.write(",".join(["Metric","Victim","Aggressor","Worst"] + ["%gHz"%fr for fr in frequencies]) + "\n")
+            for k,row in enumerate(table):
+                cells = [row["Metric"],row["Victim"],row["Aggressor"],"%.4f"%row["Worst"]]
+                if values is not None:
+                    cells += ["%.4f"%v for v in values[k]]
+                f.write(",".join(cells) + "\n")
+        return path
@@ -14,8 +14,19 @@ Examples:
 '''
 import os
 import re
+import time
+import gzip
+import shutil
 from ..common.complexDict import ComplexDict
+from ..common.regexQuery import NameQuery
 from ..common.common import log
+from .touchstone import Touchstone
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except:
+    #IronPython, post process in export thread
+    ThreadPoolExecutor = None
 
 class Solution(object):
     
@@ -39,9 +50,14 @@ class Solution(object):
     def exportSNP(self,path = None):
         self.exportNetworkData(path)
         
-    def exportNetworkData(self,path = None):
+    def exportNetworkData(self,path = None,variation = None,portCount = None):
+        '''
+        variation: variation string of ListVariations, default the first one
+        '''
         solutionName = self.name
-        ext = ".s%sp"%len(self.layout.Ports)
+        if portCount == None:
+            portCount = len(self.layout.Ports)
+        ext = ".s%sp"%portCount
         
         if not path:
 #             path = self.layout.projectDir + "\%s"%solutionName
@@ -54,15 +70,40 @@ class Solution(object):
 
         try:
             log.info("export snp: %s"%path)
-            oModule = self.layout.oDesign.GetModule("SolveSetups")
-            variation_array=oModule.ListVariations(solutionName)
-            if not variation_array:
-                variation_array = [""]
-            self.layout.oDesign.ExportNetworkData(variation_array[0], [solutionName], 3, path, ["ALL"], True, 50, "S", -1, 0, 15)
+            if variation == None:
+                variation = self.getVariations()[0]
+            self._export(path,variation)
         except:
             log.error("Export snp fail, Solution data may be not available.")
+        return path
+    
 #         variation_array=self.oModule.ListVariations(solutionName)
 #         self.oDesign.ExportNetworkData(variation_array[0], [solutionName], 3, path, ["ALL"], True, 50, "S", -1, 0, 15)
+
+    def _export(self,path,variation):
+        self.layout.oDesign.ExportNetworkData(variation, [self.name], 3, path, ["ALL"], True, 50, "S", -1, 0, 15)
+    
+    def getVariations(self):
+        '''
+        variation strings of solution, [""] if design has no variables
+        '''
+        oModule = self.layout.oDesign.GetModule("SolveSetups")
+        return list(oModule.ListVariations(self.name) or [""])
+        
+    def loadNetworkData(self,path = None):
+        '''
+        export snp if path not exist, and read it to Touchstone object (Frequency, Data: F x N x N)
+        '''
+        if not path or not os.path.exists(path):
+            path = self.exportNetworkData(path)
+        return Touchstone.read(path)
+    
+    def getMetrics(self,path = None,nearComps = None,crosstalk = True):
+        '''
+        IL/RL/NEXT/FEXT/SDD metrics of all channels, see postData.metrics
+        '''
+        from .metrics import SParamMetrics
+        return SParamMetrics.fromTouchstone(self.loadNetworkData(path),nearComps = nearComps,crosstalk = crosstalk)
         
     
     
@@ -90,6 +131,76 @@ class Solution(object):
 #         pass
 
 
+class ExportRecord(object):
+    '''
+    one (solution, variation) export of Solutions.exportAll
+    '''
+    
+    def __init__(self,solution,variation,path):
+        self.Solution = solution
+        self.Variation = variation
+        self.Path = path
+        self.Size = None #bytes of final file
+        self.ExportTime = None #seconds of COM ExportNetworkData
+        self.PostTime = None #seconds of compress and postProcess
+        self.Error = None
+    
+    def __repr__(self):
+        if self.Error:
+            return "ExportRecord %s [%s]: fail, %s"%(self.Solution,self.Variation,self.Error)
+        return "ExportRecord %s [%s]: %s, %.1f KB, export %.2fs, post %.2fs"%(self.Solution,self.Variation,self.Path,
+                                                                            (self.Size or 0)/1024.0,self.ExportTime or 0,self.PostTime or 0)
+    
+    @property
+    def Success(self):
+        return self.Error == None
+
+
+class ExportSummary(list):
+    '''
+    list of ExportRecord, in plan order
+    '''
+    
+    def __init__(self,records = None):
+        super(self.__class__,self).__init__(records or [])
+        self.WallTime = None
+    
+    @property
+    def Paths(self):
+        return [r.Path for r in self if r.Success]
+    
+    @property
+    def TotalSize(self):
+        return sum([r.Size or 0 for r in self])
+    
+    @property
+    def Failed(self):
+        return [r for r in self if not r.Success]
+    
+    def report(self):
+        lines = [repr(r) for r in self]
+        lines.append("%s exports, %s fail, %.1f MB, export %.2fs, post %.2fs, wall %.2fs"%(len(self),len(self.Failed),self.TotalSize/1024.0/1024,
+                    sum([r.ExportTime or 0 for r in self]),sum([r.PostTime or 0 for r in self]),self.WallTime or 0))
+        return "\n".join(lines)
+
+
+def _fileTag(variation,index):
+    '''
+    file name tag of variation: "w='3mil' len='2mm'" -> "v1_w-3mil_len-2mm"
+    '''
+    tag = re.sub(r"[^\w\.\-]+","_",variation.replace("=","-").replace("'","")).strip("_")
+    if len(tag) > 60:
+        tag = tag[:60]
+    return "v%s_%s"%(index,tag) if tag else "v%s"%index
+
+def _compress(path):
+    with open(path,"rb") as src:
+        with gzip.open(path + ".gz","wb") as dst:
+            shutil.copyfileobj(src,dst,1024*1024)
+    os.remove(path)
+    return path + ".gz"
+
+
 class Solutions(object):
     
     def __init__(self,layout=None):
@@ -112,7 +223,7 @@ class Solutions(object):
                 return self.SolutionDict[key]
             else:
                 #find by 正则表达式
-                lst = [name for name in self.SolutionDict.Keys if re.match(r"^%s$"%key,name,re.I)]
+                lst = NameQuery.of(self.SolutionDict).match(r"^%s$"%key)
                 if not lst:
                     raise Exception("not found component: %s"%key)
                 else:
@@ -160,4 +271,102 @@ class Solutions(object):
         return self.SolutionDict
     
     def refresh(self):
-        self.solutionDict = None
\ No newline at end of file
+        self.solutionDict = None
+    
+    def planExports(self,pattern = ".*",variations = "all",outDir = None,portCount = None):
+        '''
+        (solution,variation,path) of each export, without COM export call
+        pattern: regex of solution name setup:sweep
+        variations: "all", "first", or list of variation strings
+        '''
+        names = NameQuery.of(self.SolutionDict).match(r"^%s$"%pattern)
+        if not names:
+            log.exception("not found solution: %s"%pattern)
+        
+        if outDir == None:
+            outDir = self.layout.projectDir
+        if portCount == None:
+            portCount = len(self.layout.Ports)
+        prefix = "_".join([self.layout.projectName,self.layout.designName])
+        
+        plan = []
+        for name in names:
+            solution = self.SolutionDict[name]
+            if isinstance(variations,(list,tuple)):
+                varList = list(variations)
+            else:
+                varList = solution.getVariations()
+                if variations == "first":
+                    varList = varList[:1]
+            
+            for i,variation in enumerate(varList):
+                fileName = "%s_%s_%s.s%sp"%(prefix,re.sub(r"\W+","_",name),_fileTag(variation,i),portCount)
+                plan.append((solution,variation,os.path.join(outDir,fileName)))
+        return plan
+    
+    def exportAll(self,pattern = ".*",variations = "all",workers = 4,outDir = None,compress = False,postProcess = None):
+        '''
+        export snp of every (solution, variation)
+        
+        COM ExportNetworkData calls are sent one by one from this thread (AEDT is not thread safe),
+        written files are compressed (gzip) and passed to postProcess(record) in a thread pool of workers threads,
+        while the next export is running.
+        
+        pattern: regex of solution name setup:sweep
+        variations: "all", "first", or list of variation strings
+        postProcess: function(record) run after export and compress, return value is not used
+        
+        return ExportSummary, list of ExportRecord (Path, Size, ExportTime, PostTime, Error)
+        '''
+        start = time.time()
+        plan = self.planExports(pattern,variations,outDir)
+        log.info("export %s snp files, %s workers"%(len(plan),workers))
+        
+        pool = ThreadPoolExecutor(max_workers = workers) if ThreadPoolExecutor != None and workers > 0 else None
+        summary = ExportSummary()
+        try:
+            for solution,variation,path in plan:
+                record = ExportRecord(solution.Name,variation,path)
+                summary.append(record)
+                dirName = os.path.dirname(path)
+                if dirName and not os.path.exists(dirName):
+                    os.makedirs(dirName)
+                
+                t0 = time.time()
+                try:
+                    log.info("export snp: %s [%s] -> %s"%(solution.Name,variation,path))
+                    solution._export(path,variation)
+                except Exception as e:
+                    record.Error = "export fail: %s"%str(e)
+                    log.error("Export snp fail: %s [%s]"%(solution.Name,variation))
+                    continue
+                finally:
+                    record.ExportTime = time.time()-t0
+                
+                if pool != None:
+                    pool.submit(self._postExport,record,compress,postProcess)
+                else:
+                    self._postExport(record,compress,postProcess)
+        finally:
+            if pool != None:
+                pool.shutdown(wait = True)
+        
+        summary.WallTime = time.time()-start
+        log.info("export snp summary:\n%s"%summary.report())
+        return summary
+    
+    def _postExport(self,record,compress,postProcess):
+        t0 = time.time()
+        try:
+            if not os.path.exists(record.Path):
+                raise Exception("file not written")
+            if compress:
+                record.Path = _compress(record.Path)
+            if postProcess != None:
+                postProcess(record)
+            record.Size = os.path.getsize(record.Path)
+        except Exception as e:
+            record.Error = "post process fail: %s"%str(e)
+            log.error("post process snp fail %s: %s"%(record.Path,str(e)))
+        record.PostTime = time.time()-t0
+        return record
\ No newline at end of file
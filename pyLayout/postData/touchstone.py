@@ -0,0 +1,499 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Touchstone v1/v2 (.sNp) reader and writer.
+
+Network data are parsed chunk by chunk into a preallocated F x N x N complex array,
+extra memory is one chunk of text, not the lines of whole file.
+numpy is used if installed, else nested python list data[f][i][j] (slow, for small files).
+
+Examples:
+    >>> ts = Touchstone.read("board.s96p")
+    >>> ts.Frequency.shape, ts.Data.shape
+    ((4001,), (4001, 96, 96))
+    >>> ts.getParam(2,1)   #S21, port index from 1
+    >>> ts.write("board_ri.s96p",format = "RI")
+
+    >>> layout.Solutions[0].loadNetworkData()
+'''
+
+import os
+import re
+import cmath
+import math
+from ..common.common import log
+
+try:
+    import numpy as np
+except:
+    np = None
+
+
+_freqScales = {"hz":1.0,"khz":1e3,"mhz":1e6,"ghz":1e9}
+_comment = re.compile(r"!.*")
+_portName = re.compile(r"!\s*Port\[(\d+)\]\s*=\s*(.*\S)",re.I)
+_keyword = re.compile(r"^\s*\[([^\]]+)\]\s*(.*)$")
+
+
+class Touchstone(object):
+    '''
+    - Frequency: Hz, F
+    - Data: complex, F x N x N, not normalized (v1 Y/Z are multiplied or divided by R when read)
+    - Z0: reference impedance, float or list of N
+    '''
+
+    chunkSize = 8*1024*1024 #chars of text parsed once
+
+    def __init__(self,frequency = None,data = None,z0 = 50.0,paramType = "S",portNames = None,comments = None):
+        self.Frequency = frequency
+        self.Data = data
+        self.Z0 = z0
+        self.ParamType = paramType
+        self.PortNames = portNames or []
+        self.Comments = comments or []
+
+    def __repr__(self):
+        return "Touchstone Object: %s ports, %s frequencies"%(self.PortCount,self.FrequencyCount)
+
+    @property
+    def PortCount(self):
+        if self.Data is None or len(self.Data) == 0:
+            return len(self.PortNames)
+        return len(self.Data[0])
+
+    @property
+    def FrequencyCount(self):
+        return 0 if self.Frequency is None else len(self.Frequency)
+
+    def getParam(self,i,j):
+        '''
+        vector of parameter (i,j) over frequency, port index from 1, e.g. getParam(2,1) is S21
+        '''
+        if np != None:
+            return self.Data[:,i-1,j-1]
+        return [m[i-1][j-1] for m in self.Data]
+
+
+    #--- read
+
+    @classmethod
+    def read(cls,path,chunkSize = None):
+        '''
+        read .sNp file, version 1 or 2
+        '''
+        chunkSize = chunkSize or cls.chunkSize
+        with open(path,"r") as f:
+            header = _readHeader(f,path)
+            portCount = header["ports"]
+            matrix = header["matrix"]
+            rowLen = 1 + 2*(portCount*portCount if matrix == "full" else portCount*(portCount+1)//2)
+
+            #version 1 not give frequency count, estimate it by file size
+            sizeHint = os.fstat(f.fileno()).st_size - f.tell()
+            reader = _NetworkReader(portCount,header["freqs"],rowLen,header,sizeHint)
+            reader.feed(header["pending"])
+            for text in _chunks(f,chunkSize):
+                reader.feed(text)
+            reader.close()
+
+        ts = cls(reader.freq,reader.data,header["z0"],header["param"],header["portNames"],header["comments"])
+        log.debug("read touchstone %s: %s"%(path,repr(ts)))
+        return ts
+
+
+    #--- write
+
+    def write(self,path,format = "RI",version = 1,freqUnit = "GHz",digits = 9,blockSize = 64):
+        '''
+        format: RI, MA or DB
+        version: 1 or 2, 2 write [Reference] for each port
+        blockSize: frequencies formatted once
+        '''
+        format = format.upper()
+        if format not in ["RI","MA","DB"]:
+            log.exception("touchstone format must be RI, MA or DB: %s"%format)
+        if freqUnit.lower() not in _freqScales:
+            log.exception("frequency unit error: %s"%freqUnit)
+
+        n = self.PortCount
+        z0 = self.Z0
+        z0s = list(z0) if isinstance(z0,(list,tuple)) or (np != None and isinstance(z0,np.ndarray)) else [z0]*n
+        if version == 1 and len(set(z0s)) > 1:
+            log.exception("version 1 touchstone only support one reference impedance, use version = 2")
+
+        scale = _freqScales[freqUnit.lower()]
+        fmt = "%%.%de"%digits
+        template = _rowTemplate(n,fmt,version)
+        norm = z0s[0] if version == 1 else 1.0
+
+        with open(path,"w") as f:
+            for c in self.Comments:
+                f.write("!%s\n"%c)
+            for i,name in enumerate(self.PortNames):
+                f.write("! Port[%s] = %s\n"%(i+1,name))
+
+            if version == 1:
+                f.write("# %s %s %s R %s\n"%(freqUnit,self.ParamType,format,_num(z0s[0])))
+            else:
+                f.write("[Version] 2.0\n")
+                f.write("# %s %s %s R %s\n"%(freqUnit,self.ParamType,format,_num(z0s[0])))
+                f.write("[Number of Ports] %s\n"%n)
+                if n == 2:
+                    f.write("[Two-Port Data Order] 12_21\n")
+                f.write("[Number of Frequencies] %s\n"%self.FrequencyCount)
+                f.write("[Reference] %s\n"%" ".join([_num(z) for z in z0s]))
+                f.write("[Matrix Format] Full\n")
+                f.write("[Network Data]\n")
+
+            for start in range(0,self.FrequencyCount,blockSize):
+                rows = self._formatRows(start,min(start+blockSize,self.FrequencyCount),format,scale,norm,version)
+                f.write("".join([template%row for row in rows]))
+
+            if version != 1:
+                f.write("[End]\n")
+        log.debug("write touchstone %s: %s"%(path,repr(self)))
+        return path
+
+    def _formatRows(self,start,stop,format,scale,norm,version):
+        '''
+        tuple of values of each frequency in file order
+        '''
+        n = self.PortCount
+        factor = 1.0
+        if version == 1 and self.ParamType.upper() == "Z":
+            factor = 1.0/norm
+        elif version == 1 and self.ParamType.upper() == "Y":
+            factor = norm
+
+        if np != None:
+            block = np.asarray(self.Data[start:stop])*factor
+            if n == 2 and version == 1:
+                block = block.transpose(0,2,1) #21_12 order
+            block = block.reshape(stop-start,n*n)
+            values = np.empty((stop-start,1+2*n*n))
+            values[:,0] = np.asarray(self.Frequency[start:stop])/scale
+            a,b = _fromComplex(block,format)
+            values[:,1::2] = a
+            values[:,2::2] = b
+            return [tuple(row) for row in values.tolist()]
+
+        rows = []
+        for k in range(start,stop):
+            m = self.Data[k]
+            if n == 2 and version == 1:
+                cells = [m[0][0],m[1][0],m[0][1],m[1][1]]
+            else:
+                cells = [v for r in m for v in r]
+            row = [self.Frequency[k]/scale]
+            for v in cells:
+                row.extend(_fromComplexOne(v*factor,format))
+            rows.append(tuple(row))
+        return rows
+
+
+def readTouchstone(path):
+    return Touchstone.read(path)
+
+def writeTouchstone(path,frequency,data,z0 = 50.0,format = "RI",version = 1,**kwargs):
+    return Touchstone(frequency,data,z0).write(path,format = format,version = version,**kwargs)
+
+
+#--- helpers
+
+def _num(v):
+    return ("%g"%v) if isinstance(v,float) else str(v)
+
+def _chunks(f,chunkSize):
+    '''
+    text of about chunkSize chars, end at line end, comments removed
+    '''
+    while True:
+        text = f.read(chunkSize)
+        if not text:
+            break
+        if not text.endswith("\n"):
+            text += f.readline()
+        if "!" in text:
+            text = _comment.sub("",text)
+        if "[" in text:
+            #[End], [Noise Data] of version 2
+            idx = text.find("[")
+            yield text[:idx]
+            break
+        yield text
+
+def _readHeader(f,path):
+    '''
+    read until first network data line, the rest of the line is in header["pending"]
+    '''
+    header = {"version":1,"ports":None,"freqs":None,"freqScale":1e9,"param":"S","format":"MA","z0":50.0,
+              "matrix":"full","order":None,"portNames":[],"comments":[],"pending":""}
+
+    m = re.search(r"\.s(\d+)p$",path,re.I)
+    if m:
+        header["ports"] = int(m.group(1))
+
+    z0Pending = False
+    while True:
+        line = f.readline()
+        if not line:
+            break
+
+        stripped = line.strip()
+        if stripped.startswith("!"):
+            nm = _portName.match(stripped)
+            if nm:
+                header["portNames"].append(nm.group(2))
+            else:
+                header["comments"].append(stripped[1:])
+            continue
+
+        stripped = _comment.sub("",line).strip()
+        if not stripped:
+            continue
+
+        if stripped.startswith("#"):
+            _parseOption(stripped,header)
+            continue
+
+        km = _keyword.match(stripped)
+        if km:
+            z0Pending = False
+            key,value = km.group(1).strip().lower(),km.group(2).strip()
+            if key == "version":
+                header["version"] = 2
+            elif key == "number of ports":
+                header["ports"] = int(value)
+            elif key == "number of frequencies":
+                header["freqs"] = int(value)
+            elif key == "two-port data order":
+                header["order"] = value
+            elif key == "matrix format":
+                header["matrix"] = value.lower()
+            elif key == "reference":
+                header["z0"] = [float(v) for v in value.split()]
+                z0Pending = True
+            elif key == "network data":
+                break
+            continue
+
+        if z0Pending:
+            #[Reference] values may continue on next lines
+            header["z0"] += [float(v) for v in stripped.split()]
+            continue
+
+        #first data line of version 1
+        header["pending"] = stripped + "\n"
+        break
+
+    if not header["ports"]:
+        log.exception("port count of touchstone not found: %s"%path)
+
+    z0 = header["z0"]
+    if isinstance(z0,list) and len(z0) == 1:
+        header["z0"] = z0[0]
+    if header["order"] == None:
+        header["order"] = "21_12" if header["version"] == 1 else "12_21"
+    return header
+
+def _parseOption(line,header):
+    tokens = line[1:].split()
+    i = 0
+    while i < len(tokens):
+        t = tokens[i].lower()
+        if t in _freqScales:
+            header["freqScale"] = _freqScales[t]
+        elif t in ["s","y","z","h","g"]:
+            header["param"] = t.upper()
+        elif t in ["ma","db","ri"]:
+            header["format"] = t.upper()
+        elif t == "r" and i+1 < len(tokens):
+            header["z0"] = float(tokens[i+1])
+            i += 1
+        i += 1
+
+def _fromComplex(block,format):
+    if format == "RI":
+        return block.real,block.imag
+    mag = np.abs(block)
+    ang = np.degrees(np.angle(block))
+    if format == "DB":
+        with np.errstate(divide = "ignore"):
+            mag = 20*np.log10(mag)
+    return mag,ang
+
+def _fromComplexOne(v,format):
+    if format == "RI":
+        return v.real,v.imag
+    mag = abs(v)
+    ang = math.degrees(cmath.phase(v))
+    if format == "DB":
+        mag = 20*math.log10(mag) if mag > 0 else float("-inf")
+    return mag,ang
+
+def _rowTemplate(n,fmt,version):
+    '''
+    % template of one frequency, for n>2 each matrix row start on new line, at most 4 pairs per line
+    '''
+    pair = "%s %s"%(fmt,fmt)
+    if n <= 2:
+        return fmt + " " + " ".join([pair]*(n*n)) + "\n"
+
+    lines = []
+    for r in range(n):
+        for c in range(0,n,4):
+            lines.append(" ".join([pair]*min(4,n-c)))
+    return fmt + " " + "\n".join(lines) + "\n"
+
+
+class _NetworkReader(object):
+    '''
+    convert values to complex matrix row by row, a partial row is kept to next feed
+    '''
+
+    def __init__(self,portCount,freqCount,rowLen,header,sizeHint = None):
+        '''
+        freqCount: None if not known, array is allocated by estimate of first feed, 
+        grow geometrically if more data, and cut to the read size at close
+        '''
+        self.n = portCount
+        self.freqCount = freqCount
+        self.rowLen = rowLen
+        self.header = header
+        self.sizeHint = sizeHint
+        self.index = 0
+        self.rest = None
+        self.freq = None if np != None else []
+        self.data = None if np != None else []
+
+        z0 = header["z0"]
+        self.factor = 1.0
+        if header["version"] == 1 and header["param"] == "Z":
+            self.factor = z0
+        elif header["version"] == 1 and header["param"] == "Y":
+            self.factor = 1.0/z0
+
+    def feed(self,text):
+        if not text.strip():
+            return
+        if np != None:
+            values = np.fromstring(text,sep = " ")
+            if self.rest is not None and len(self.rest):
+                values = np.concatenate([self.rest,values])
+            rows = len(values)//self.rowLen
+            if self.data is None and rows:
+                #first full row, not the partial first line of header
+                self._allocate(rows,len(text))
+            if rows:
+                self._putRows(values[:rows*self.rowLen].reshape(rows,self.rowLen))
+            self.rest = values[rows*self.rowLen:]
+        else:
+            values = [float(t) for t in text.split()]
+            if self.rest:
+                values = self.rest + values
+            rows = len(values)//self.rowLen
+            for k in range(rows):
+                self._putRowList(values[k*self.rowLen:(k+1)*self.rowLen])
+            self.rest = values[rows*self.rowLen:]
+
+    def _allocate(self,rows,chars):
+        if self.freqCount != None:
+            capacity = self.freqCount
+        elif self.sizeHint and chars:
+            capacity = int(rows*float(self.sizeHint)/chars*1.02) + rows + 1
+        else:
+            capacity = rows + 1
+        self.freq = np.empty(capacity)
+        self.data = np.empty((capacity,self.n,self.n),dtype = complex)
+
+    def _resize(self,capacity):
+        '''
+        new arrays of capacity, rows read are copied
+        '''
+        count = min(self.index,capacity)
+        freq = np.empty(capacity)
+        data = np.empty((capacity,self.n,self.n),dtype = complex)
+        freq[:count] = self.freq[:count]
+        data[:count] = self.data[:count]
+        self.freq = freq
+        self.data = data
+
+    def close(self):
+        if self.rest is not None and len(self.rest):
+            log.exception("touchstone data incomplete, %s values left"%len(self.rest))
+        if np != None:
+            if self.data is None:
+                self._allocate(0,0)
+            if self.index != len(self.data):
+                if self.freqCount != None:
+                    log.exception("touchstone frequency count error: %s read, %s expected"%(self.index,self.freqCount))
+                if len(self.data) - self.index <= len(self.data)//8:
+                    #estimate is close, view of rows read, not a second copy of whole data
+                    self.freq = self.freq[:self.index]
+                    self.data = self.data[:self.index]
+                else:
+                    self._resize(self.index)
+        elif self.freqCount != None and self.index != self.freqCount:
+            log.exception("touchstone frequency count error: %s read, %s expected"%(self.index,self.freqCount))
+
+    def _toComplex(self,a,b):
+        fmt = self.header["format"]
+        if fmt == "RI":
+            return a + 1j*b
+        if fmt == "DB":
+            a = 10**(a/20.0)
+        return a*np.exp(1j*np.radians(b))
+
+    def _putRows(self,rows):
+        count = len(rows)
+        if self.index + count > len(self.data):
+            if self.freqCount != None:
+                log.exception("touchstone has more data than %s frequencies"%self.freqCount)
+            self._resize(max(self.index+count,int(len(self.data)*1.5)+1))
+        n = self.n
+        values = self._toComplex(rows[:,1::2],rows[:,2::2])*self.factor
+        out = self.data[self.index:self.index+count]
+        if self.header["matrix"] == "full":
+            values = values.reshape(count,n,n)
+            if n == 2 and self.header["order"] == "21_12":
+                values = values.transpose(0,2,1)
+            out[:] = values
+        else:
+            iu = np.triu_indices(n) if self.header["matrix"] == "upper" else np.tril_indices(n)
+            out[:,iu[0],iu[1]] = values
+            out[:,iu[1],iu[0]] = values
+        self.freq[self.index:self.index+count] = rows[:,0]*self.header["freqScale"]
+        self.index += count
+
+    def _putRowList(self,row):
+        n = self.n
+        fmt = self.header["format"]
+        cells = []
+        for k in range(1,len(row),2):
+            a,b = row[k],row[k+1]
+            if fmt == "RI":
+                v = complex(a,b)
+            else:
+                if fmt == "DB":
+                    a = 10**(a/20.0)
+                v = cmath.rect(a,math.radians(b))
+            cells.append(v*self.factor)
+
+        m = [[0j]*n for i in range(n)]
+        if self.header["matrix"] == "full":
+            for k,v in enumerate(cells):
+                i,j = divmod(k,n)
+                if n == 2 and self.header["order"] == "21_12":
+                    i,j = j,i
+                m[i][j] = v
+        else:
+            k = 0
+            upper = self.header["matrix"] == "upper"
+            for i in range(n):
+                for j in (range(i,n) if upper else range(0,i+1)):
+                    m[i][j] = m[j][i] = cells[k]
+                    k += 1
+        self.data.append(m)
+        self.freq.append(row[0]*self.header["freqScale"])
+        self.index += 1
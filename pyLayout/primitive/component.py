@@ -38,6 +38,7 @@ from ..common.arrayStruct import ArrayStruct
 from ..common.complexDict import ComplexDict
 from ..common.unit import Unit
 from ..common.common import log
+from ..common.tracing import traced
 from ..definition.spiceModel import Subckt
 
 from collections import Counter
@@ -119,12 +120,12 @@ class Component(Primitive):
         
         maps.update({"NetNames":{
             "Key":"self",
-            "Get":lambda s: list(set([s.layout.Pins[p].Net for p in s.layout.oEditor.GetComponentPins(s.name)]))
+            "Get":lambda s: s.layout.Connectivity.getNetsOfComponent(s.name)
             }})
         
         maps.update({"Nets":{
             "Key":"self",
-            "Get":lambda s: [s.layout.Nets[name] for name in set([s.layout.Pins[p].Net for p in s.layout.oEditor.GetComponentPins(s.name)])]
+            "Get":lambda s: [s.layout.Nets[name] for name in s.layout.Connectivity.getNetsOfComponent(s.name)]
             }})
         
         self._info.setMaps(maps)
@@ -679,18 +680,29 @@ class Component(Primitive):
             f.close()
             
     def hasPin(self,pinName):
-        for pin in self.PinNames:
-            if pin.lower() == pinName.lower():
+        '''
+        ignore case, use pin index of Components if it is built, else pins of this component only
+        '''
+        components = self.layout.Components
+        if components._pinIndex != None:
+            compName = components.getCompNameByPin(pinName)
+            return compName != None and compName.lower() == self.name.lower()
+
+        pinName = pinName.lower()
+        for pin in self.layout.oEditor.GetComponentPins(self.name):
+            if pin.lower() == pinName:
                 return True
         return False
     
     def dissolve(self):
         self.layout.oEditor.DissolveComponents(["NAME:elements",self.Name])
         self.layout.Components.pop(self.Name)
+        self.layout.Connectivity.invalidate()
         
     def delete(self):
         self.layout.oEditor.Delete([self.Name])
         self.layout.Components.pop(self.Name)
+        self.layout.Connectivity.invalidate()
         
 
 #not use
@@ -699,7 +711,56 @@ class Components(Primitives):
     
     def __init__(self,layout=None):
         super(self.__class__,self).__init__(layout, type="component",primitiveClass=Component)
+        self._pinIndex = None #lower pin name -> component name, build by one GetComponentPins sweep
+        self._compPins = {} #component name -> pin names in _pinIndex
 
+    def refresh(self):
+        super(self.__class__,self).refresh()
+        self.invalidatePinIndex()
+    
+    def push(self,name,obj=None):
+        super(self.__class__,self).push(name,obj)
+        if self._pinIndex != None:
+            self._addPinIndex(name,self.layout.oEditor.GetComponentPins(name))
+    
+    def pop(self,name):
+        super(self.__class__,self).pop(name)
+        if self._pinIndex != None:
+            self._removePinIndex(name)
+    
+    @property
+    def PinIndex(self):
+        '''
+        lower pin name -> component name of all components
+        '''
+        if self._pinIndex == None:
+            self._pinIndex = {}
+            self._compPins = {}
+            for comp in self.NameList:
+                self._addPinIndex(comp,self.layout.oEditor.GetComponentPins(comp))
+            log.debug("Pin index build: %s pins of %s components"%(len(self._pinIndex),len(self._compPins)))
+        return self._pinIndex
+    
+    def invalidatePinIndex(self):
+        self._pinIndex = None
+        self._compPins = {}
+    
+    def _addPinIndex(self,comp,pins):
+        pins = list(pins)
+        for pin in pins:
+            self._pinIndex[pin.lower()] = comp
+        self._compPins[comp] = pins
+    
+    def _removePinIndex(self,comp):
+        for pin in self._compPins.pop(comp,[]):
+            if self._pinIndex.get(pin.lower()) == comp: #pin may be moved to new component
+                del self._pinIndex[pin.lower()]
+    
+    def getCompNameByPin(self,pinName):
+        '''
+        component name of pin, ignore case, None if pin not in any component
+        '''
+        return self.PinIndex.get(pinName.lower())
         
     def importBOM(self,csvfile):
         pass
@@ -739,6 +800,7 @@ class Components(Primitives):
             
         self.layout.oEditor.DissolveComponents(delComps)
         self.refresh()
+        self.layout.Connectivity.invalidate()
         
     def deleteInvalidComponents(self,ConnectedNetsLessThen = 1):
         '''
@@ -758,6 +820,7 @@ class Components(Primitives):
 #         self.layout.oEditor.DissolveComponents(delComps)
         self.layout.oEditor.Delete(delComps) #oEditor.Delete(["R440", "R442", "R443"])
         self.refresh()
+        self.layout.Connectivity.invalidate()
         
         
     def getUniqueName(self,prefix="U"):
@@ -796,12 +859,14 @@ class Components(Primitives):
                 "elements:=", pinList
             ])        
         self.push(compName)
+        self.layout.Connectivity.invalidate()
         return compName
     
     def createResistor(self,points,R=50,L=None,C=None,padR="1um"):
         pass
         
     
+    @traced()
     def updateModels(self,models):
         #[{"RefDes":"","Part":"cap1","PartType":"Capacitor","FileName":null,"R":null,"L":null,"C":null,"Library":null}]
         
@@ -879,7 +944,7 @@ class Components(Primitives):
         bar.stop()
 
     def findComponentByPin(self,pinName):
-        for component in self.All:
-            if component.hasPin(pinName):
-                return component
-        return None
\ No newline at end of file
+        compName = self.getCompNameByPin(pinName)
+        if compName == None or compName not in self:
+            return None
+        return self[compName]
\ No newline at end of file
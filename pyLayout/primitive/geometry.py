@@ -73,7 +73,7 @@ class Point(object):
         if key in ["x","y","arc","layout"]: #not key.lower()
             return object.__getattr__(self,key)
         else:
-            log.debug("__getattr__ from __getitem__: %s"%key)
+            log.debug("__getattr__ from __getitem__: %s",key)
             return self[key]
         
         
@@ -154,12 +154,21 @@ class Polygen(object):
             ply.SetClosed(True)
         return ply
     
+    def getXYValues(self):
+        '''
+        return x values and y values of points, str with unit convert to SI value
+        '''
+        xs = list(Unit.parseMany([pt.x for pt in self.points]))
+        ys = list(Unit.parseMany([pt.y for pt in self.points]))
+        return xs,ys
+    
     def getPerimeter(self):
         n = len(self.points)
+        xs,ys = self.getXYValues()
         perimeter = 0
         for i in range(n):
-            x1, y1 = self.points[i].XY
-            x2, y2 = self.points[(i+1) % n].XY
+            x1, y1 = xs[i],ys[i]
+            x2, y2 = xs[(i+1) % n],ys[(i+1) % n]
             side_length = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
             perimeter += side_length
             
@@ -167,16 +176,18 @@ class Polygen(object):
 
     def getArea(self):
         n = len(self.points)
+        xs,ys = self.getXYValues()
         area = 0
         for i in range(n):
-            x1, y1 = self.points[i].XY
-            x2, y2 = self.points[(i+1) % n].XY
+            x1, y1 = xs[i],ys[i]
+            x2, y2 = xs[(i+1) % n],ys[(i+1) % n]
             area += (x1 * y2 - x2 * y1) / 2
         return area
     
     def getCenter(self):
-        x = sum([pt.x for pt in self.points])/len(self.points)
-        y = sum([pt.y for pt in self.points])/len(self.points)
+        xs,ys = self.getXYValues()
+        x = sum(xs)/len(self.points)
+        y = sum(ys)/len(self.points)
         return x,y
 
     @classmethod
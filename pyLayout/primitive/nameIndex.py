@@ -0,0 +1,158 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Object name -> type index of all layout objects, build by one FindObjects('Type','*') and FilterObjectList per type.
+
+Layout.delete builds it to find the collection of an object, without building every collection by FindObjects('Type',type).
+Layout.__getitem__ uses it only when it is already built, and does not build it.
+
+Examples:
+    >>> layout.NameIndex.getType("line_23")
+    'line'
+    >>> layout.NameIndex.getCollection("line_23")
+    line Objects collection: 1203 Objects
+    >>> layout["line_23"] #collection of line only, index built before
+'''
+
+from ..common.common import log
+
+
+class NameIndex(object):
+    '''
+    - names are exact, lookup ignore case like ComplexDict
+    - add/remove update the index incrementally, invalidate build all again at next query
+    '''
+
+    def __init__(self,layout = None,types = None):
+        '''
+        types: FindObjects types, None for Layout.primitiveTypes
+        '''
+        self.layout = layout
+        self.types = types
+        self.built = False
+        self._types = {} #name -> type
+        self._lower = None #lower name -> name
+
+    def __contains__(self,name):
+        return self.getType(name) != None
+
+    def __repr__(self):
+        return "NameIndex Object: %s objects"%len(self._types)
+
+    @property
+    def oEditor(self):
+        return self.layout.oEditor
+
+    @property
+    def Count(self):
+        self._check()
+        return len(self._types)
+
+    def _getTypes(self):
+        return self.types or self.layout.primitiveTypes
+
+    def _check(self):
+        if not self.built:
+            self.build()
+
+    def invalidate(self):
+        self.built = False
+        self._types = {}
+        self._lower = None
+
+    def build(self):
+        names = list(self.oEditor.FindObjects('Type','*'))
+        self._types = {}
+        self._lower = None
+        self._classify(names)
+        self.built = True
+        log.debug("Name index build: %s objects"%len(self._types))
+        return self
+
+    def _classify(self,names):
+        '''
+        FilterObjectList per type on the names not classified yet
+        '''
+        rest = list(names)
+        for typ in self._getTypes():
+            if not rest:
+                break
+            found = self.oEditor.FilterObjectList('Type',typ,rest)
+            if not found:
+                continue
+            for name in found:
+                self._types[name] = typ
+                if self._lower != None:
+                    self._lower[name.lower()] = name
+            found = set(found)
+            rest = [name for name in rest if name not in found]
+        return rest
+
+
+    #--- incremental update
+
+    def add(self,names,typ = None):
+        '''
+        typ: type of names if known, else FilterObjectList per type
+        '''
+        if not self.built:
+            return
+        if isinstance(names, str):
+            names = [names]
+
+        if typ != None:
+            for name in names:
+                self._types[name] = typ
+                if self._lower != None:
+                    self._lower[name.lower()] = name
+        else:
+            self._classify(names)
+
+    def remove(self,names):
+        if not self.built:
+            return
+        if isinstance(names, str):
+            names = [names]
+        for name in names:
+            name = self._findName(name)
+            if name == None:
+                continue
+            del self._types[name]
+            if self._lower != None:
+                self._lower.pop(name.lower(),None)
+
+
+    #--- query
+
+    def _findName(self,name):
+        if name in self._types:
+            return name
+        if self._lower == None:
+            self._lower = dict((k.lower(),k) for k in self._types)
+        return self._lower.get(name.lower())
+
+    def getType(self,name):
+        '''
+        FindObjects type of object, None if not found
+        '''
+        self._check()
+        name = self._findName(name)
+        if name == None:
+            return None
+        return self._types[name]
+
+    def getCollection(self,name):
+        '''
+        Primitives collection of object in layout, None if not found
+        '''
+        typ = self.getType(name)
+        if typ == None:
+            return None
+        return self.layout[typ+"s"]
+
+    def getNames(self,typ = None):
+        self._check()
+        if typ == None:
+            return list(self._types.keys())
+        return [name for name,t in self._types.items() if t.lower() == typ.lower()]
@@ -10,6 +10,7 @@ import re
 from ..common import hfss3DLParameters
 from ..common.arrayStruct import ArrayStruct
 from ..common.complexDict import ComplexDict
+from ..common.regexQuery import NameQuery
 from ..common.unit import Unit
 from ..common.common import log
 
@@ -177,12 +178,13 @@ class Ports(Primitives):
         rules = []
         comp,pin,net = port.split('.')
         #if compOrder:
-        rules.append(compOrder.index(comp) if comp in compOrder else comp)
+        #(0,index) before (1,name), comparable in python3
+        rules.append((0,compOrder.index(comp)) if comp in compOrder else (1,comp))
         
         if net in netOrder:
-            rules.append(netOrder.index(net))
+            rules.append((0,netOrder.index(net)))
         else:
-            rules += sortBus(net)
+            rules.append((1,) + tuple(sortBus(net)))
         
         return rules
 
@@ -191,7 +193,7 @@ class Ports(Primitives):
         name: support regex
         '''
         name ="^" + name.replace("*",".*?") + "$" #.replace(".","\.") 
-        return list(filter(lambda x:re.match(name, x,re.I), self.NameList))
+        return NameQuery.of(self.ObjectDict).match(name)
 
     def reorder(self,compOrder=[],netOrder=[],portOrder = []):
         '''
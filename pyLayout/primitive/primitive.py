@@ -12,10 +12,12 @@ except:
 from ..common import hfss3DLParameters
 from ..common.arrayStruct import ArrayStruct
 from ..common.complexDict import ComplexDict
+from ..common.regexQuery import NameQuery
 from ..common.unit import Unit
 from ..common.common import log
 
 from .geometry import Point
+from .propertyBatch import PropertyBatch
 
 '''
 this a base class for privitives of : 
@@ -26,6 +28,127 @@ this a base class for privitives of :
 It 's not recommand to initial Primitive or Primitives object redirect.
 '''
 
+def _pointFromValue(ptValue,unit):
+    #3DL return point property like "0.1,0.2" without unit
+    return Point(["%s%s"%(c.strip(),unit) for c in ptValue.split(",")])
+
+def _isPointProp(prop):
+    return bool(re.match(r"Pt\d+$",prop)) or prop in ["Center","Pt A","Pt B","Location"]
+
+
+class PropertyTable(object):
+    '''
+    column-oriented property buffer of a Primitives collection, build by Primitives.snapshot(props).
+    
+    one list per property, row index by object name. Primitive.get read value from table until it is invalidated.
+    
+    Examples:
+        >>> table = layout.Pins.snapshot(["Net","Location","Start Layer"])
+        >>> table["Net"]
+        list of net names, same order with table.Names
+        >>> table.getValue("U1-A1","StartLayer")
+        >>> layout.Pins["U1-A1"].Net  #read from table, no COM call
+    '''
+    
+    NotFound = "//key_not_found//"
+
+    def __init__(self,names=None):
+        self.names = list(names) if names else []
+        self.rows = dict([(n,i) for i,n in enumerate(self.names)])
+        self.columns = {}
+        self.alias = {} #lower case key and key without space -> column name
+        self.valid = True
+    
+    def __getitem__(self,prop):
+        column = self.getColumnName(prop)
+        if column == None:
+            log.exception("property not in snapshot: %s"%prop)
+        return self.columns[column]
+    
+    def __contains__(self,prop):
+        return self.getColumnName(prop) != None
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def __repr__(self):
+        return "%s Object: %s rows, props: %s"%(self.__class__.__name__,len(self.names),",".join(self.Props))
+    
+    @property
+    def Names(self):
+        return self.names
+    
+    @property
+    def Props(self):
+        return list(self.columns.keys())
+    
+    @property
+    def Count(self):
+        return len(self.names)
+    
+    def getColumnName(self,prop):
+        if not isinstance(prop, str):
+            return None
+        key = prop.lower()
+        if key in self.alias:
+            return self.alias[key]
+        return None
+        
+    def addColumn(self,prop,values):
+        if len(values) != len(self.names):
+            log.exception("snapshot column length error: %s %s/%s"%(prop,len(values),len(self.names)))
+        self.columns[prop] = list(values)
+        self.alias[prop.lower()] = prop
+        self.alias[prop.replace(" ","").replace("-","_").lower()] = prop
+    
+    def dropColumn(self,prop):
+        column = self.getColumnName(prop)
+        if column == None:
+            return
+        del self.columns[column]
+        for k in [k for k,v in self.alias.items() if v == column]:
+            del self.alias[k]
+    
+    def getValue(self,name,prop):
+        if not self.valid:
+            return self.NotFound
+        column = self.getColumnName(prop)
+        if column == None or name not in self.rows:
+            return self.NotFound
+        return self.columns[column][self.rows[name]]
+
+    def setValue(self,name,prop,value):
+        column = self.getColumnName(prop)
+        if column == None or name not in self.rows:
+            return
+        self.columns[column][self.rows[name]] = value
+    
+    def discard(self,name,prop=None):
+        '''
+        remove value of object from table, value will be read from layout next time.
+        prop: None for all properties of object
+        '''
+        if name not in self.rows:
+            return
+        if prop == None:
+            columns = self.Props
+        else:
+            columns = [self.getColumnName(prop)]
+        
+        for column in columns:
+            if column != None:
+                self.columns[column][self.rows[name]] = self.NotFound
+    
+    def toDict(self,prop):
+        '''
+        return {name:value} of property
+        '''
+        return dict(zip(self.names,self[prop]))
+    
+    def invalidate(self):
+        self.valid = False
+
+
 
 class Primitive(object):
     '''_summary_
@@ -45,6 +168,7 @@ class Primitive(object):
         self._info = None
         self.maps = {}
         self.parsed = False
+        self._snapshot = None #PropertyTable of collection, build by Primitives.snapshot
 
     def __getitem__(self, key):
         """
@@ -60,18 +184,18 @@ class Primitive(object):
 
     def __getattr__(self,key):
 
-        if key in ["layout","name","_info","maps","parsed"]:
+        if key in ["layout","name","_info","maps","parsed","_snapshot"]:
             return object.__getattr__(self,key)
         else:
-            log.debug("__getattr__ from _dict: %s"%key)
+            log.debug("__getattr__ from _dict: %s",key)
             return self[key]
         
 
     def __setattr__(self, key, value):
-        if key in ["layout","name","_info","maps","parsed"]:
+        if key in ["layout","name","_info","maps","parsed","_snapshot"]:
             object.__setattr__(self,key,value)
         else:
-            log.debug("get property '%s' from dict."%key)
+            log.debug("get property '%s' from dict.",key)
             self[key] = value
 
     def __repr__(self):
@@ -118,7 +242,7 @@ class Primitive(object):
         if self.parsed and not force:
             return
         
-        log.debug("parse primitive: %s"%self.name)
+        log.debug("parse primitive: %s",self.name)
         self._info = ComplexDict()
         maps = self.maps
 #         self._info.update("Name",self.name) #add name to Info
@@ -183,6 +307,12 @@ class Primitive(object):
         mapping key must not have same value with maped key.
         '''
         
+        #read from snapshot table of collection, not need parse
+        if self._snapshot != None:
+            value = self._snapshot.getValue(self.name,key)
+            if value is not PropertyTable.NotFound:
+                return value
+        
         if not self.parsed:
             self.parse()
   
@@ -221,11 +351,22 @@ class Primitive(object):
            
         if re.match(r"Pt(\d+|s)$",realKey,re.IGNORECASE) or realKey in ["Center","Pt A","Pt B","Location"]: 
             self.setPoint(realKey, value)
-            self.parsed = False #refresh
+            if PropertyBatch.active(self.layout) == None:
+                self.parsed = False #refresh
+            elif realKey.lower() == "pts":
+                self._info.update(realKey,[Point(v,layout=self.layout) for v in value]) #not write to layout until flush
+                for i in range(len(value)):
+                    self._info.update("Pt%s"%i,Point(value[i],layout=self.layout))
+            else:
+                self._info.update(realKey,Point(value,layout=self.layout))
+            if self._snapshot != None:
+                self._snapshot.discard(self.name,realKey)
             
         elif realKey in self._info.Properties: 
             self.setProp(realKey, value)
             self._info[realKey] = value
+            if self._snapshot != None:
+                self._snapshot.setValue(self.name,realKey,value)
 #             self.parsed = False #refresh
             
         elif key in self._info:
@@ -242,6 +383,11 @@ class Primitive(object):
         
         if re.match(r"Pt\s*[\dAB]+$",prop): #set Points: Pt0,Pt1, Pt A, Pt B, support expression
             self.setPoint(prop, value)
+            return
+        
+        batch = PropertyBatch.active(self.layout)
+        if batch != None:
+            batch.setProp(self.name,prop,value,obj = self)
         else:
             self.layout.oEditor.SetPropertyValue("BaseElementTab",self.name, prop,value)
 
@@ -255,6 +401,11 @@ class Primitive(object):
         key = ptName
         if re.match(r"Pt\d+$",key) or key in ["Center","Pt A","Pt B","Location"]:
             pt = Point(value)
+            batch = PropertyBatch.active(self.layout)
+            if batch != None:
+                batch.setPoint(self.Name,ptName,pt.X,pt.Y,obj = self)
+                return None
+            
             self.layout.oEditor.ChangeProperty(
                 [
                     "NAME:AllTabs",
@@ -288,9 +439,9 @@ class Primitive(object):
         #add unit for pt\d+ or pt [AB]
         
         key = self._info.getReallyKey(ptName)
-        if re.match(r"Pt\d+$",key) or key in ["Center","Pt A","Pt B","Location"]:
+        if _isPointProp(key):
             ptValue = self.layout.oEditor.GetPropertyValue("BaseElementTab",self.Name,key)
-            return Point(["%s%s"%(c.strip(),self.layout.unit) for c in ptValue.split(",")])
+            return _pointFromValue(ptValue,self.layout.unit)
         
         if re.match(r"ArcHeight.*$",key):
             ptValue = self.layout.oEditor.GetPropertyValue("BaseElementTab",self.Name,key)
@@ -326,10 +477,22 @@ class Primitive(object):
         
         self.layout[type+"s"].pop(self.Name)
         self.layout.oEditor.Delete([self.Name])
+        if hasattr(self.layout,"updateSpatialIndex"):
+            self.layout.updateSpatialIndex(removed = [self.Name])
+        if hasattr(self.layout,"updateNameIndex"):
+            self.layout.updateNameIndex(removed = [self.Name])
         
 
     def update(self):
+        batch = PropertyBatch.active(self.layout)
+        if batch != None:
+            batch.addUpdate(self) #cached values are new values, update after flush
+            return
+        
         self._info = None #delay update
+        self.parsed = False
+        if self._snapshot != None:
+            self._snapshot.discard(self.name)
 #         self.parse()
 
 
@@ -338,6 +501,7 @@ class Primitives(object):
 
     def __init__(self,layout=None,type="*",primitiveClass=Primitive):
         self._objectDict = None #ComplexDict component buffer
+        self._snapshot = None #PropertyTable buffer, build by snapshot()
         self.layout = layout
         self.type = type
         self.primitiveClass = primitiveClass
@@ -363,7 +527,7 @@ class Primitives(object):
                 return self.ObjectDict[key]
             elif re.match(r".*[\*\.\?\+\{\}\|].*",key,re.I): #正则表达式
                 #find by 正则表达式
-                lst = [name for name in self.ObjectDict.Keys if re.match(r"^%s$"%key,name,re.I)]
+                lst = NameQuery.of(self.ObjectDict).match(r"^%s$"%key)
                 if not lst:
                     return []
 #                     raise Exception("not found component: %s"%key)
@@ -380,10 +544,10 @@ class Primitives(object):
         if key in ['__get__','__set__']:
             #just for debug run
             return None
-        if key in ["layout","_objectDict","type","primitiveClass"]:
+        if key in ["layout","_objectDict","type","primitiveClass","_snapshot"]:
             return object.__getattr__(self,key)
         else:
-            log.debug("__getattr__ from _dict: %s"%key)
+            log.debug("__getattr__ from _dict: %s",key)
             return self[key]
     
     def __contains__(self,key):
@@ -392,16 +556,29 @@ class Primitives(object):
     def __len__(self):
         return len(self.ObjectDict)
     
+    def __iter__(self):
+        return iter(self.ObjectDict)
+    
+    def items(self):
+        '''
+        iterate (name,object)
+        '''
+        return self.ObjectDict.items()
+    
+    def iterBatches(self,size = 1000):
+        '''
+        iterate objects in list of length size
+        '''
+        return self.ObjectDict.iterBatches(size)
+    
     def __repr__(self):
         return "%s Objects collection: %s Objects"%(str(self.type),len(self.ObjectDict))
     
     def __add__(self,prim2):
         if isinstance(prim2, Primitives):
-            _objectDict = ComplexDict()
-            _objectDict.append(self.ObjectDict)
-            _objectDict.append(prim2.ObjectDict)
+            #chained view of both collections, objects are not copied
             primObject = Primitives(layout=self.layout,type="MixedObjects",primitiveClass=object)
-            primObject._objectDict = _objectDict
+            primObject._objectDict = ChainedObjectDict([self,prim2])
             return primObject
         else:
             log.exception("Only Primitive Class can be __add__")
@@ -478,6 +655,96 @@ class Primitives(object):
 #             del self._objectDict
             
         self._objectDict  = None
+        self.invalidateSnapshot()
+    
+    def snapshot(self,props,refresh=False):
+        '''
+        fetch properties of all objects in collection in one pass, store them in column-oriented PropertyTable.
+        Primitive.get (e.g. Pin.Net, Via.Location) read from the table until it is invalidated by 
+        refresh(), invalidateSnapshot() or set property.
+        
+        Args:
+            props (str,list): property names, e.g. ["Net","Location","Start Layer"]
+            refresh (bool): rebuild table, default only fetch properties not in table
+        Returns:
+            (PropertyTable): column table of properties
+        
+        Examples:
+            >>> table = layout.Pins.snapshot(["Net","Location"])
+            >>> for pin in layout.Pins: pin.Net  #no COM call
+        '''
+        
+        if isinstance(props, str):
+            props = [props]
+            
+        table = self._snapshot
+        if refresh or table == None or not table.valid:
+            table = PropertyTable(self.NameList)
+        
+        for prop in props:
+            if prop in table:
+                continue
+            log.debug("snapshot %s property: %s",self.type,prop)
+            table.addColumn(prop,self._fetchColumn(prop,table.Names))
+        
+        if table is not self._snapshot:
+            for obj in self.ObjectDict.Values:
+                if isinstance(obj,Primitive):
+                    obj._snapshot = table
+            self._snapshot = table
+            
+        return table
+    
+    def _fetchColumn(self,prop,names):
+        '''
+        AEDT not have bulk GetPropertyValue API (GetProperties return names only), 
+        Net and Layer columns are gathered by one FindObjects per net/layer when there are less values than objects,
+        other properties (and objects not found) are read one by one.
+        '''
+        oEditor = self.layout.oEditor
+        values = dict()
+        
+        findBy = {"net":("Net",lambda: oEditor.GetNetClassNets('<All>')),
+                  "layer":("Layer",lambda: oEditor.GetStackupLayerNames())}
+        if prop.lower() in findBy and names:
+            by,getValues = findBy[prop.lower()]
+            keys = getValues()
+            if len(keys) < len(names):
+                rows = set(names)
+                for key in keys:
+                    for name in oEditor.FindObjects(by,key):
+                        if name in rows:
+                            values[name] = key
+        
+        isPoint = _isPointProp(prop)
+        column = []
+        for name in names:
+            if name in values:
+                column.append(values[name])
+                continue
+            
+            value = oEditor.GetPropertyValue("BaseElementTab",name,prop)
+            if isPoint and value:
+                value = _pointFromValue(value,self.layout.unit)
+            column.append(value)
+        return column
+    
+    def invalidateSnapshot(self,props=None):
+        '''
+        props: None will drop the table, or only remove given properties from table
+        '''
+        if self._snapshot == None:
+            return
+        
+        if props == None:
+            self._snapshot.invalidate()
+            self._snapshot = None
+            return
+        
+        if isinstance(props, str):
+            props = [props]
+        for prop in props:
+            self._snapshot.dropColumn(prop)
 
         
     def push(self,name,obj=None):
@@ -542,15 +809,128 @@ class Primitives(object):
 #         self.push(name)
 #         return self[name]
 
+class ChainedObjectDict(object):
+    '''
+    read view of ObjectDict of member Primitives, objects are not copied to a merged dict.
+    lookup, len and iteration go to the members in order, refresh of a member is followed at next access.
+    '''
+    
+    def __init__(self,members):
+        self.members = members #Primitives list
+    
+    def _dicts(self):
+        return [m.ObjectDict for m in self.members]
+    
+    def _owner(self,key):
+        for d in self._dicts():
+            if key in d:
+                return d
+        return None
+    
+    def __contains__(self,key):
+        return self._owner(key) != None
+    
+    def __getitem__(self,key):
+        if isinstance(key, int):
+            index = key if key >= 0 else key+len(self)
+            if index >= 0:
+                for d in self._dicts():
+                    if index < len(d):
+                        return d[index]
+                    index -= len(d)
+            raise IndexError("index out of range: %s"%key)
+        
+        if isinstance(key, slice):
+            return list(self)[key]
+        
+        d = self._owner(key)
+        if d == None:
+            raise KeyError("key error: %s"%str(key))
+        return d[key]
+    
+    def __delitem__(self,key):
+        d = self._owner(key)
+        if d == None:
+            raise KeyError("key error: %s"%str(key))
+        del d[key]
+    
+    def __len__(self):
+        return sum([len(d) for d in self._dicts()])
+    
+    def _keyLists(self):
+        '''
+        key lists of members, used as revision of the view
+        '''
+        keyLists = ()
+        for d in self._dicts():
+            if hasattr(type(d),"_keyLists"):
+                keyLists += d._keyLists()
+            else:
+                keyLists += (d._keyList(),)
+        return keyLists
+    
+    def __iter__(self):
+        for d in self._dicts():
+            for v in d:
+                yield v
+    
+    def __repr__(self):
+        return "ChainedObjectDict object: %s members"%len(self.members)
+    
+    def items(self):
+        for d in self._dicts():
+            for k,v in d.items():
+                yield k,v
+    
+    def iterBatches(self,size = 1000):
+        if size < 1:
+            log.exception("batch size must be larger than 0: %s"%size)
+        
+        batch = []
+        for v in self:
+            batch.append(v)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    @property
+    def Keys(self):
+        return [k for d in self._dicts() for k in d.Keys]
+    
+    @property
+    def Values(self):
+        return list(self)
+    
+    @property
+    def Items(self):
+        return list(self.items())
+    
+    @property
+    def Count(self):
+        return len(self)
+    
+    def update(self,key,value):
+        d = self._owner(key)
+        if d == None:
+            log.exception("%s not in members of view, push it to the member collection"%key)
+        d.update(key,value)
+    
+    def clear(self):
+        #view only, objects of members are kept
+        pass
+
 class Objects3DL(Primitives):
 
     def __init__(self,layout=None,types=".*"):
         super(self.__class__,self).__init__(layout, type=types,primitiveClass=None)
-
+        self._members = None #member Primitives, resolved when first used
+    
     @property
-    def ObjectDict(self):
+    def Members(self):
         '''
-        alway return new object list.
+        Primitives of layout which FindObjects type match self.type
         
         FindObjects
         "Type" to search by object type.
@@ -558,6 +938,9 @@ class Objects3DL(Primitives):
         'plg', 'circle void', 'line void', 'rect void', 'poly void', 'plg void', 'text', 'cell', 
         'Measurement', 'Port', 'Port Instance', 'Port Instance Port', 'Edge Port', 'component', 'CS', 'S3D', 'ViaGroup'
         '''
+        if self._members != None:
+            return self._members
+        
         types = []
         if isinstance(self.type, str):
             types = [self.type]
@@ -571,19 +954,28 @@ class Objects3DL(Primitives):
             for t2 in self.layout.primitiveTypes:
                 if re.match(r"^%s?$"%t,t2,re.I):
                     objTypes.append(t2)
-
-        if len(objTypes)<1:
-            return []
         
-        objectPrimitives = None
+        members = []
         for typ in objTypes:
             try:
-                if objectPrimitives == None:
-                    objectPrimitives = self.layout[typ+"s"]
-                else:
-                    objectPrimitives += self.layout[typ+"s"]
+                members.append(self.layout[typ+"s"])
             except:
                 log.exception("%s not in layout deifiniton"%typ)
-                
-        self._objectDict = objectPrimitives._objectDict
+        
+        self._members = members
+        return self._members
+
+    @property
+    def ObjectDict(self):
+        '''
+        chained view of ObjectDict of members, not copy objects
+        '''
+        if self._objectDict is None:
+            self._objectDict = ChainedObjectDict(self.Members)
         return self._objectDict
+    
+    def refresh(self):
+        #members are not refreshed, the view read them again at next access
+        self._members = None
+        self._objectDict = None
+        self.invalidateSnapshot()
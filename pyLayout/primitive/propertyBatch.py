@@ -0,0 +1,172 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Batched property writer, queue property edits of primitives and send them by few oEditor.ChangeProperty.
+
+Edits are grouped by (tab, property, value), all objects of one group are PropServers of one ChangeProperty,
+groups with same PropServers are merged to one ChangeProperty. One undo entry for each ChangeProperty.
+
+Examples:
+    >>> with layout.batch():
+    >>>     for via in layout.Vias:
+    >>>         via.BackdrillTop = "L3"
+    >>>         via.TopOffset = "2mil"
+    send 1 ChangeProperty if all vias have same values
+
+    if the with block raise exception, queued edits are discarded (nothing write to layout),
+    edited primitives are parsed again from layout.
+'''
+
+import weakref
+from collections import OrderedDict
+from ..common.common import log
+
+
+class PropertyBatch(object):
+    '''
+    context manager, nested batch of same layout join the outer batch, flush when the outer batch exit,
+    discard when the outer batch exit by exception.
+    '''
+    _active = weakref.WeakKeyDictionary() #layout -> weakref of PropertyBatch, batch hold layout
+
+    def __init__(self,layout):
+        self.layout = layout
+        self._edits = OrderedDict() #(tab,name,prop) -> value entry, last edit win
+        self._updates = OrderedDict() #name -> primitive, update after flush
+        self._objects = OrderedDict() #name -> edited primitive, update if edits discarded
+        self._depth = 0
+        self.calls = 0 #count of ChangeProperty sent
+
+    @classmethod
+    def active(cls,layout):
+        '''
+        return active batch of layout, None if not in batch
+        '''
+        ref = cls._active.get(layout)
+        return ref() if ref != None else None
+
+    def __enter__(self):
+        outer = self.active(self.layout)
+        if outer != None and outer is not self:
+            outer._depth += 1
+            return outer
+
+        self._depth += 1
+        self._active[self.layout] = weakref.ref(self)
+        return self
+
+    def __exit__(self,exc_type,exc_value,traceback):
+        batch = self.active(self.layout)
+        if batch is None:
+            return False
+
+        batch._depth -= 1
+        if batch._depth > 0:
+            return False
+
+        del self._active[batch.layout]
+        if exc_type != None:
+            batch.discard()
+        else:
+            batch.flush()
+        return False
+
+    @property
+    def Count(self):
+        return len(self._edits)
+
+    def __repr__(self):
+        return "PropertyBatch Object: %s edits"%len(self._edits)
+
+    def setProp(self,name,prop,value,tab = "BaseElementTab",obj = None):
+        '''
+        obj: primitive of name, its cached values are parsed again if edits discarded
+        '''
+        key = (tab,name,prop)
+        self._edits.pop(key,None) #move to end
+        self._edits[key] = ("Value:=",value)
+        if obj != None:
+            self._objects[name] = obj
+
+    def setPoint(self,name,prop,x,y,tab = "BaseElementTab",obj = None):
+        key = (tab,name,prop)
+        self._edits.pop(key,None)
+        self._edits[key] = ("X:=",x,"Y:=",y)
+        if obj != None:
+            self._objects[name] = obj
+
+    def addUpdate(self,obj):
+        '''
+        primitive.update() will be called after flush
+        '''
+        self._updates[obj.name] = obj
+
+    def _groups(self):
+        '''
+        return [(tab,names,[changedProp])], keep order of first edit
+        '''
+        groups = OrderedDict() #(tab,prop,value) -> (value,names)
+        for (tab,name,prop),value in self._edits.items():
+            groups.setdefault((tab,prop,repr(value)),(value,[]))[1].append(name)
+
+        merged = OrderedDict() #(tab,names) -> [changedProp]
+        for (tab,prop,key),(value,names) in groups.items():
+            merged.setdefault((tab,tuple(names)),[]).append(["NAME:%s"%prop] + list(value))
+
+        return [(tab,list(names),props) for (tab,names),props in merged.items()]
+
+    def flush(self):
+        '''
+        send queued edits, then update primitives
+        '''
+        if not self._edits:
+            self._refresh()
+            return 0
+
+        count = len(self._edits)
+        groups = self._groups()
+        self._edits = OrderedDict()
+        self._objects = OrderedDict()
+
+        for tab,names,props in groups:
+            self.layout.oEditor.ChangeProperty(
+                [
+                    "NAME:AllTabs",
+                    [
+                        "NAME:%s"%tab,
+                        [
+                            "NAME:PropServers"
+                        ] + names,
+                        [
+                            "NAME:ChangedProps"
+                        ] + props
+                    ]
+                ])
+            self.calls += 1
+
+        log.debug("Property batch flush: %s edits by %s ChangeProperty"%(count,len(groups)))
+        self._refresh()
+        return len(groups)
+
+    def discard(self):
+        '''
+        drop queued edits, edited primitives are parsed again from layout, return count of dropped edits
+        '''
+        count = len(self._edits)
+        objs = OrderedDict(self._updates)
+        objs.update(self._objects)
+        self._edits = OrderedDict()
+        self._updates = OrderedDict()
+        self._objects = OrderedDict()
+        if count:
+            log.warning("Property batch discarded: %s edits not written to layout"%count)
+        for obj in objs.values():
+            obj.update()
+        return count
+
+    def _refresh(self):
+        updates = list(self._updates.values())
+        self._updates = OrderedDict()
+        for obj in updates:
+            obj.update()
@@ -0,0 +1,368 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Spatial index of layout objects, answer point/box/radius queries without oEditor.FindObjectsByPoint.
+
+BBox of all objects are loaded once (one GetBBox per object), objects are put into a uniform grid per layer.
+Query result is the objects whose BBox hit the query, sorted by BBox area (small objects first),
+it is a superset of oEditor.FindObjectsByPoint result.
+
+Examples:
+    >>> index = layout.spatialIndex(layers = ["TOP","BOTTOM"])
+    >>> index.query(["10mm","20mm"],layer = "TOP")
+    ['via_1', 'line_23', 'poly_2']
+    >>> index.queryRadius(["10mm","20mm"],"1mm",layer = "*")
+    >>> index.queryMany([["10mm","20mm"],["11mm","20mm"]],layer = "TOP")
+    >>> index.queryNets(["10mm","20mm"],layer = "TOP")
+    ['GND']
+'''
+
+import math
+from ..common.common import log
+from ..common.unit import Unit
+
+
+class SpatialIndex(object):
+    '''
+    uniform grid per layer, coordinates are SI value (meter) same as oEditor.Point().
+
+    - objects cover more than maxCells grid cells are kept in a list of the layer (planes), checked one by one
+    - add/remove update the grid incrementally, refresh build all again
+    '''
+
+    #conductor objects, FindObjects Type
+    objectTypes = ['pin', 'via', 'rect','circle', 'arc', 'line', 'poly','plg']
+    maxCells = 256
+
+    def __init__(self,layout = None,layers = None,types = None,cellSize = None):
+        '''
+        layers: layer names to index, None for all conductor layers
+        types: object types to index, None for SpatialIndex.objectTypes
+        cellSize: grid size (meter), None to estimate from object size
+        '''
+        self.layout = layout
+        self.layers = layers
+        self.types = types or self.objectTypes
+        self.cellSize = cellSize
+        self._autoCell = cellSize == None
+
+        self._bboxes = {} #name -> (x0,y0,x1,y1)
+        self._objLayers = {} #name -> [layer]
+        self._grids = {} #lower layer -> {(ix,iy):set(names)}
+        self._larges = {} #lower layer -> set(names)
+        self._layerNames = {} #lower layer -> layer name
+        self._nets = None #name -> net, load by loadNets()
+        self.built = False
+
+    def __contains__(self,name):
+        return name in self._bboxes
+
+    def __len__(self):
+        return len(self._bboxes)
+
+    def __repr__(self):
+        return "SpatialIndex Object: %s objects on %s layers"%(len(self._bboxes),len(self._grids))
+
+    @property
+    def oEditor(self):
+        return self.layout.oEditor
+
+    @property
+    def Count(self):
+        return len(self._bboxes)
+
+    @property
+    def LayerNames(self):
+        return list(self._layerNames.values())
+
+    @property
+    def NameList(self):
+        return list(self._bboxes.keys())
+
+
+    #--- build
+
+    def build(self):
+        '''
+        load layers and BBox of all objects, put into grid
+        '''
+        oEditor = self.oEditor
+        if self.layers == None:
+            layers = self.layout.Layers.ConductorLayerNames
+        elif isinstance(self.layers, str):
+            layers = [self.layers]
+        else:
+            layers = list(self.layers)
+
+        typed = set()
+        for typ in self.types:
+            typed.update(oEditor.FindObjects('Type',typ))
+
+        self._bboxes = {}
+        self._objLayers = {}
+        self._grids = {}
+        self._larges = {}
+        self._layerNames = {}
+        self._nets = None
+
+        for layer in layers:
+            self._layerNames[layer.lower()] = layer
+            self._grids[layer.lower()] = {}
+            self._larges[layer.lower()] = set()
+            for name in oEditor.FindObjects('Layer',layer):
+                if name in typed:
+                    self._objLayers.setdefault(name,[]).append(layer.lower())
+
+        for name in self._objLayers:
+            bbox = self._loadBBox(name)
+            if bbox:
+                self._bboxes[name] = bbox
+
+        if self._autoCell:
+            self.cellSize = self._estimateCellSize()
+
+        for name,bbox in self._bboxes.items():
+            self._insert(name, bbox)
+
+        self.built = True
+        log.info("Spatial index build: %s objects on %s layers, cell size %.3gm"%(len(self._bboxes),len(layers),self.cellSize))
+        return self
+
+    def refresh(self):
+        return self.build()
+
+    def _loadBBox(self,name):
+        try:
+            bbox = self.oEditor.GetBBox(name)
+        except:
+            log.debug("GetBBox error: %s"%name)
+            return None
+        if not bbox:
+            return None
+        LL = bbox.BBoxLL()
+        UR = bbox.BBoxUR()
+        x0,y0,x1,y1 = LL.GetX(),LL.GetY(),UR.GetX(),UR.GetY()
+        return (min(x0,x1),min(y0,y1),max(x0,x1),max(y0,y1))
+
+    def _estimateCellSize(self):
+        '''
+        median object size, at least extent/1024 to limit the grid cells of small objects
+        '''
+        if not self._bboxes:
+            return 1e-3
+        sizes = sorted(max(b[2]-b[0],b[3]-b[1]) for b in self._bboxes.values())
+        median = sizes[len(sizes)//2]
+        x0 = min(b[0] for b in self._bboxes.values())
+        y0 = min(b[1] for b in self._bboxes.values())
+        x1 = max(b[2] for b in self._bboxes.values())
+        y1 = max(b[3] for b in self._bboxes.values())
+        extent = max(x1-x0,y1-y0)
+        return max(median*2,extent/1024.0,1e-9)
+
+    def _cellRange(self,bbox):
+        size = self.cellSize
+        return (int(math.floor(bbox[0]/size)),int(math.floor(bbox[1]/size)),
+                int(math.floor(bbox[2]/size)),int(math.floor(bbox[3]/size)))
+
+    def _insert(self,name,bbox):
+        ix0,iy0,ix1,iy1 = self._cellRange(bbox)
+        large = (ix1-ix0+1)*(iy1-iy0+1) > self.maxCells
+        for layer in self._objLayers.get(name,[]):
+            if large:
+                self._larges[layer].add(name)
+                continue
+            grid = self._grids[layer]
+            for ix in range(ix0,ix1+1):
+                for iy in range(iy0,iy1+1):
+                    grid.setdefault((ix,iy),set()).add(name)
+
+    def _discard(self,name):
+        bbox = self._bboxes.pop(name,None)
+        layers = self._objLayers.pop(name,[])
+        if self._nets != None:
+            self._nets.pop(name,None)
+        if not bbox:
+            return
+        ix0,iy0,ix1,iy1 = self._cellRange(bbox)
+        for layer in layers:
+            self._larges[layer].discard(name)
+            grid = self._grids[layer]
+            if (ix1-ix0+1)*(iy1-iy0+1) > self.maxCells:
+                continue
+            for ix in range(ix0,ix1+1):
+                for iy in range(iy0,iy1+1):
+                    cell = grid.get((ix,iy))
+                    if cell:
+                        cell.discard(name)
+                        if not cell:
+                            del grid[(ix,iy)]
+
+
+    #--- incremental update
+
+    def add(self,names):
+        '''
+        add new objects or update changed objects, query layers by FindObjects('Layer') of indexed layers
+        '''
+        if not self.built:
+            return
+        if isinstance(names, str):
+            names = [names]
+
+        names = set(names)
+        for name in names:
+            self._discard(name)
+
+        typed = set()
+        for typ in self.types:
+            typed.update(self.oEditor.FilterObjectList('Type',typ,list(names)))
+
+        for layer in self._layerNames.values():
+            for name in self.oEditor.FilterObjectList('Layer',layer,list(names)):
+                if name in typed:
+                    self._objLayers.setdefault(name,[]).append(layer.lower())
+
+        for name in names:
+            if name not in self._objLayers:
+                continue
+            bbox = self._loadBBox(name)
+            if not bbox:
+                self._objLayers.pop(name)
+                continue
+            self._bboxes[name] = bbox
+            self._insert(name, bbox)
+            if self._nets != None:
+                self._nets[name] = self.oEditor.GetPropertyValue("BaseElementTab",name,"Net")
+
+    def remove(self,names):
+        if isinstance(names, str):
+            names = [names]
+        for name in names:
+            self._discard(name)
+
+
+    #--- query
+
+    def hasLayer(self,layer):
+        '''
+        layer (ignore case) is indexed
+        '''
+        return isinstance(layer, str) and layer.lower() in self._layerNames
+
+    def _layerKeys(self,layer):
+        if layer in [None,"*"]:
+            return list(self._grids.keys())
+        key = layer.lower()
+        if key not in self._grids:
+            log.exception("layer not in spatial index: %s"%layer)
+        return [key]
+
+    def _point(self,point):
+        if len(point)!=2:
+            log.exception("point must be list with length 2")
+        return [Unit(p).V if isinstance(p, str) else p for p in point]
+
+    def _hits(self,bbox,layer,test = None):
+        '''
+        objects names which BBox intersect bbox, test(name,objBBox) for fine filter
+        '''
+        ix0,iy0,ix1,iy1 = self._cellRange(bbox)
+        scanAll = (ix1-ix0+1)*(iy1-iy0+1) > self.maxCells
+        x0,y0,x1,y1 = bbox
+
+        names = set()
+        for key in self._layerKeys(layer):
+            candidates = set(self._larges[key])
+            grid = self._grids[key]
+            if scanAll:
+                for cell in grid.values():
+                    candidates.update(cell)
+            else:
+                for ix in range(ix0,ix1+1):
+                    for iy in range(iy0,iy1+1):
+                        cell = grid.get((ix,iy))
+                        if cell:
+                            candidates.update(cell)
+
+            for name in candidates:
+                b = self._bboxes[name]
+                if b[0]>x1 or b[2]<x0 or b[1]>y1 or b[3]<y0:
+                    continue
+                if test and not test(name,b):
+                    continue
+                names.add(name)
+
+        return sorted(names,key = lambda n: self.getArea(n))
+
+    def query(self,point,layer = "*",radius = 0):
+        '''
+        same arguments with Layout.getObjectByPoint: radius is the side length of square around point
+        '''
+        x,y = self._point(point)
+        l = Unit(radius).V/2.0 if isinstance(radius, str) else radius/2.0
+        return self._hits((x-l,y-l,x+l,y+l),layer)
+
+    def queryBox(self,ptA,ptB,layer = "*"):
+        xa,ya = self._point(ptA)
+        xb,yb = self._point(ptB)
+        return self._hits((min(xa,xb),min(ya,yb),max(xa,xb),max(ya,yb)),layer)
+
+    def queryRadius(self,center,radius,layer = "*"):
+        '''
+        objects which BBox has distance to center less than radius
+        '''
+        x,y = self._point(center)
+        r = Unit(radius).V if isinstance(radius, str) else radius
+
+        def _inCircle(name,b):
+            dx = max(b[0]-x,0,x-b[2])
+            dy = max(b[1]-y,0,y-b[3])
+            return dx*dx + dy*dy <= r*r
+
+        return self._hits((x-r,y-r,x+r,y+r),layer,_inCircle)
+
+    def queryMany(self,points,layer = "*",radius = 0):
+        '''
+        points: list of points, layer: one layer for all points or list of layers per point
+        return: list of query result per point
+        '''
+        if isinstance(layer, (list,tuple)):
+            return [self.query(pt,lay,radius) for pt,lay in zip(points,layer)]
+        return [self.query(pt,layer,radius) for pt in points]
+
+    def queryNets(self,point,layer = "*",radius = 0):
+        '''
+        nets of objects hit the point, ordered by object area
+        '''
+        if self._nets == None:
+            self.loadNets()
+        nets = []
+        for name in self.query(point,layer,radius):
+            net = self._nets.get(name)
+            if net and net not in nets:
+                nets.append(net)
+        return nets
+
+    def loadNets(self):
+        '''
+        FindObjects per net, usually less calls than GetPropertyValue per object
+        '''
+        self._nets = {}
+        for net in self.oEditor.GetNetClassNets('<All>'):
+            for name in self.oEditor.FindObjects('Net',net):
+                if name in self._bboxes:
+                    self._nets[name] = net
+        return self._nets
+
+    def getBBox(self,name):
+        return self._bboxes.get(name)
+
+    def getArea(self,name):
+        b = self._bboxes[name]
+        return (b[2]-b[0])*(b[3]-b[1])
+
+    def getNet(self,name):
+        if self._nets == None:
+            self.loadNets()
+        return self._nets.get(name)
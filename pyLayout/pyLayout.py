@@ -64,6 +64,7 @@ from .definition.setup import Setups
 from .definition.net import Nets
 from .definition.variable import Variables
 from .definition.pinGroup import PinGroups
+from .definition.connectivity import Connectivity
 
 from .postData.solution import Solutions
 
@@ -74,6 +75,9 @@ from .options import options
 
 from .primitive.primitive import Primitives,Objects3DL
 from .primitive.geometry import Polygen,Point
+from .primitive.spatialIndex import SpatialIndex
+from .primitive.propertyBatch import PropertyBatch
+from .primitive.nameIndex import NameIndex
 
 #log is a globle variable
 from .common import common
@@ -129,6 +133,8 @@ class Layout(object):
         self._info.update("PyAedtApp", None)
         self._info.update("Log", log)
         self._info.update("options",options)
+        self._info.update("ComProfiler",None)
+        self._info.update("ComRecorder",None)
 #         self._info.update("Maps", self.maps)
         
         if not isIronpython:
@@ -171,12 +177,22 @@ class Layout(object):
             log.exception("layout should be intial use method: 'Layout.initDesign(projectName = None,designName = None)'")
             return
         
-        log.debug("try to get element type: %s"%key)
+        log.debug("try to get element type: %s",key)
+        
+        #find collection by name index if it is built (by delete), only build the collection of the object
+        #index is not build here, attribute miss of layout comes here too
+        index = self._info["NameIndex"] if "NameIndex" in self._info else None
+        if index != None and index.built:
+            typ = index.getType(key)
+            if typ != None and typ+"s" in self._info and key in self._info[typ+"s"]:
+                return self._info[typ+"s"][key]
         
         for ele in self.primitiveTypes:
             collection = ele+"s"
             if key in self._info[collection]:
-                log.debug("Try to return %s for key: %s"%(collection,key))
+                log.debug("Try to return %s for key: %s",collection,key)
+                if index != None:
+                    index.add(key,typ = ele)
                 return self._info[collection][key]
             
         log.exception("not found element on layout: %s"%key)
@@ -196,7 +212,7 @@ class Layout(object):
         try:
             return super(self.__class__,self).__getattribute__(key)
         except:
-            log.debug("Layout __getattribute__ from info: %s"%str(key))
+            log.debug("Layout __getattribute__ from info: %s",key)
             return self[key]
         
     def __setattr__(self, key, value):
@@ -295,7 +311,7 @@ class Layout(object):
             os.environ["ANSYSLMD_LICENSE_FILE"] = self.options["AEDT_LicenseServer"]
 
         if self.options["AEDT_LicenseServer"] and self.options["AEDT_WaitForLicense"]:
-            licchk = LicenseChecker(os.environ["ANSYSLMD_LICENSE_FILE"])
+            licchk = LicenseChecker.getChecker(os.environ["ANSYSLMD_LICENSE_FILE"]) #shared cached status
             licchk.waitForlicense(featureList,timeout)
 
     @property
@@ -503,12 +519,85 @@ class Layout(object):
                 log.info("init design: %s : %s"%(self.projectName,self.designName))
                     
 
+                if self.options["AEDT_ProfileCOM"]:
+                    self.enableComProfiler()
+                
                 #intial layout elements
                 self.enableICMode(False)
                 
                 if initLayout and self._info.oEditor:
                     self.initObjects()
 
+    def enableComProfiler(self,profiler = None,stacks = True):
+        '''
+        wrap oDesktop, oProject, oDesign and oEditor by ComProxy, record all COM calls to profiler
+        the handles are wrapped again by initDesign if option AEDT_ProfileCOM is True
+        '''
+        from .common.comProfiler import ComProfiler,wrapCom
+        from .common.tracing import tracer
+        if profiler == None:
+            profiler = self._info["ComProfiler"] or ComProfiler(stacks = stacks)
+        self._info.update("ComProfiler",profiler)
+        tracer.comSource = profiler
+        
+        self._oDesktop = wrapCom(self._oDesktop,"oDesktop",profiler)
+        self._oProject = wrapCom(self._oProject,"oProject",profiler)
+        self._oDesign = wrapCom(self._oDesign,"oDesign",profiler)
+        for name in ["oProject","oDesign","oEditor"]:
+            if name in self._info:
+                self._info.update(name,wrapCom(self._info[name],name,profiler))
+        log.info("COM profiler enabled.")
+        return profiler
+    
+    def disableComProfiler(self):
+        '''
+        restore raw COM handles, return the profiler with records
+        '''
+        from .common.comProfiler import unwrapCom
+        from .common.tracing import tracer
+        self._oDesktop = unwrapCom(self._oDesktop)
+        self._oProject = unwrapCom(self._oProject)
+        self._oDesign = unwrapCom(self._oDesign)
+        for name in ["oProject","oDesign","oEditor"]:
+            if name in self._info:
+                self._info.update(name,unwrapCom(self._info[name]))
+        profiler = self._info["ComProfiler"]
+        self._info.update("ComProfiler",None)
+        if tracer.comSource is profiler:
+            tracer.comSource = None
+        return profiler
+
+    def recordCom(self,recorder = None):
+        '''
+        record all COM calls from oDesktop for offline replay, must be called before initDesign
+        save by recorder.save(path), replay by Layout.fromReplay(path)
+        '''
+        from .common.comReplay import CallRecorder
+        from .common.tracing import tracer
+        if self._info["ComRecorder"]:
+            return self._info["ComRecorder"]
+        if recorder == None:
+            recorder = CallRecorder()
+        self._oDesktop = recorder.wrap(self.oDesktop,"oDesktop")
+        self._info.update("ComRecorder",recorder)
+        if tracer.comSource == None:
+            tracer.comSource = recorder
+        return recorder
+    
+    @classmethod
+    def fromReplay(cls,path,latency = 0,projectDir = None,strict = True):
+        '''
+        Layout bind to recorded COM calls instead of AEDT, call initDesign as with live AEDT
+        latency: 0 no latency, 1 recorded latency
+        projectDir: replace project folder of recording (log file is written in it)
+        '''
+        from .common.comReplay import ReplaySession
+        overrides = {"GetPath":projectDir} if projectDir else None
+        session = ReplaySession.load(path,latency = latency,strict = strict,overrides = overrides)
+        layout = cls(oDesktop = session.oDesktop)
+        layout._info.update("ReplaySession",session)
+        return layout
+
     def initObjects(self):
         
         info = self._info
@@ -544,6 +633,8 @@ class Layout(object):
         info.update("ModelDefs", ModelDefs(layout = self))
         info.update("PinGroups", PinGroups(layout = self))
         info.update("Sources", Sources(layout = self))
+        info.update("Connectivity", Connectivity(layout = self)) #build when first used
+        info.update("NameIndex", NameIndex(layout = self)) #build when first used
         
 #         info.update("Primitives",Primitives(layout = self))
         info.update("unit",self.getUnit2())  #some bug exit in oEditor.GetActiveUnits()
@@ -750,6 +841,56 @@ class Layout(object):
             posObj = self.oEditor.FindObjectsByPolygon(box, layer)
             return list(posObj)
         
+    def spatialIndex(self,layers = None,types = None,refresh = False):
+        '''
+        build spatial index of layout objects once, point/box/radius query without COM calls
+        layers: layer names to index, None for all conductor layers
+        
+        Examples:
+            >>> index = layout.spatialIndex(layers = ["TOP"])
+            >>> index.query(["10mm","20mm"],layer = "TOP")
+        '''
+        if isinstance(layers, str):
+            layers = [layers]
+        
+        index = self._info["SpatialIndex"] if "SpatialIndex" in self._info else None
+        if index != None and not refresh and (types == None or types == index.types):
+            if layers == None and index.layers == None:
+                return index
+            if layers != None and index.layers != None and set([l.lower() for l in layers]) <= set([l.lower() for l in index.layers]):
+                return index
+        
+        index = SpatialIndex(layout = self,layers = layers,types = types).build()
+        self._info.update("SpatialIndex",index)
+        return index
+    
+    def updateSpatialIndex(self,added = None,removed = None):
+        '''
+        incremental update of spatial index after objects changed, do nothing if index not build
+        '''
+        if "SpatialIndex" not in self._info or self._info["SpatialIndex"] == None:
+            return
+        
+        index = self._info["SpatialIndex"]
+        if removed:
+            index.remove(removed)
+        if added:
+            index.add(added)
+    
+    def updateNameIndex(self,added = None,removed = None,type = None):
+        '''
+        incremental update of name index after objects created or deleted, do nothing if index not build
+        type: FindObjects type of added objects if known
+        '''
+        if "NameIndex" not in self._info:
+            return
+        
+        index = self._info["NameIndex"]
+        if removed:
+            index.remove(removed)
+        if added:
+            index.add(added,typ = type)
+    
     def setUnit(self, unit = "um"):
         #return old unit
         return self.oEditor.SetActiveUnits(unit)
@@ -791,6 +932,27 @@ class Layout(object):
         return self.oEditor.GetActiveUnits()
     
     
+    def invalidateSnapshots(self,props=None):
+        '''
+        drop snapshot tables of primitive collections, build by Primitives.snapshot()
+        props: None for all properties, or only given properties, e.g. "Net" 
+        '''
+        collections = [obj.lower()+"s" for obj in self.primitiveTypes] + ["Objects","Traces","Shapes","Voids"]
+        for key in collections:
+            if key in self._info:
+                self._info[key].invalidateSnapshot(props)
+    
+    def batch(self):
+        '''
+        queue property edits of primitives, send them by few ChangeProperty when exit
+        
+        Examples:
+            >>> with layout.batch():
+            >>>     for net in layout.Nets["DQ.*"]:
+            >>>         net.backdrill()
+        '''
+        return PropertyBatch(self)
+    
     def select(self,objs):
         '''
         objs: names of  objs
@@ -807,15 +969,21 @@ class Layout(object):
         '''
         if isinstance(objs, str):
             objs = [objs]
-            
+        
+        #only remove from collections already loaded
+        index = self.NameIndex
         for name in objs:
-            try:
-                obj = self.Objects[name]
-                self[obj.Type+"s"].pop(name)
-            except:
+            typ = index.getType(name)
+            if typ == None:
                 log.warning("%s: delete error from layout."%name)
+                continue
+            collection = self._info[typ+"s"]
+            if collection._objectDict != None and name in collection._objectDict:
+                collection.pop(name)
                 
         self.oEditor.Delete(objs)
+        self.updateNameIndex(removed = objs)
+        self.updateSpatialIndex(removed = objs)
         self.Objects.refresh()
         self.Traces.refresh()
         self.Shapes.refresh()
@@ -866,6 +1034,8 @@ class Layout(object):
         obj.Radius = ra
         if net:
             obj.Net = net
+        self.updateSpatialIndex(added = obj.Name)
+        self.updateNameIndex(added = obj.Name,type = "circle")
         return obj
     
     def addLine(self,layerName,points,width="0.1mm",net=None,name=None):
@@ -914,6 +1084,8 @@ class Layout(object):
         if net:
             obj.Net = net
             
+        self.updateSpatialIndex(added = obj.Name)
+        self.updateNameIndex(added = obj.Name,type = "line")
         return obj
     
     def addRectangle(self,layerName,ptA,ptB,net=None,name=None):
@@ -939,6 +1111,8 @@ class Layout(object):
         if net:
             obj.Net = net
         
+        self.updateSpatialIndex(added = obj.Name)
+        self.updateNameIndex(added = obj.Name,type = "rect")
         return obj
     
     def addpolygon(self,layerName,points,net=None,name=None):
@@ -981,6 +1155,8 @@ class Layout(object):
         if net:
             obj.Net = net
             
+        self.updateSpatialIndex(added = obj.Name)
+        self.updateNameIndex(added = obj.Name,type = "poly")
         return obj
     
     def addVia(self,position,padStack,hole="0mm",upperLayer=None,lowerLayer=None,isPin = False,net=None,name=None):
@@ -1025,6 +1201,8 @@ class Layout(object):
             
         obj.Location = Point(position)
         obj.HoleDiameter = hole
+        self.updateSpatialIndex(added = obj.Name)
+        self.updateNameIndex(added = obj.Name,type = "via")
         return obj
     
     def sanitize(self,nets):
@@ -1502,6 +1680,19 @@ class Layout(object):
         
         return jobId
     
+    def submitJobAsync(self,runner = None,host="localhost",cores=20,timeout = None):
+        '''
+        submit batchsolve job to asyncio JobRunner, not block python, python3 only
+        must be called in running event loop, return future of JobResult
+        runner: None for jobRunner.defaultRunner, shared by all submitted jobs
+        
+        Examples:
+            >>> runner = JobRunner(maxJobs = 2)
+            >>> result = await layout.submitJobAsync(runner,cores = 8)
+        '''
+        from .common.jobRunner import submitBatchSolve
+        return submitBatchSolve(self,runner,host = host,cores = cores,timeout = timeout)
+    
     def batchAnalysis(self,host="localhost",cores=20):
         installPath = self.oDesktop.GetExeDir()
         jobId = "RSM_{:.5f}".format(time.time()).replace(".","")
@@ -26,6 +26,7 @@ from ..pyLayout import Layout
 from ..definition.path import Path,Node
 from ..common.common import log,writeJson,getParent,readData,writeData
 from ..common.complexDict import ComplexDict
+from ..common.tracing import tracer
 from .simConfig import SimConfig
 log.info("Start ExtractLayout analyse, this progrom powered by Ansys AE.")
 
@@ -209,8 +210,9 @@ class ExtractBase(object):
 
         Nets = self.layout.Nets.getRegularNets(self.Config["Backdrill"]["Nets"])
         stub = self.Config["Backdrill"]["Stub"]
-        for net in Nets:
-            self.layout.nets[net].backdrill(stub=stub)
+        with self.layout.batch(): #one ChangeProperty for vias with same backdrill layer
+            for net in Nets:
+                self.layout.nets[net].backdrill(stub=stub)
 
     def clearLayout(self):
         if "ClearLayout" not in self.Config:
@@ -237,7 +239,7 @@ class ExtractBase(object):
 
             if ports["PortbyPins"]:
                 pinNets = []
-                startNode = None
+                startNodes = []
                 endNodes = []
                 excludedNets = []
                 
@@ -257,7 +259,7 @@ class ExtractBase(object):
                             pinNets.append(net)
                         
                         if "Type"in p and "vrm" in p["Type"].lower():
-                            startNode = [comp,net]
+                            startNodes.append([comp,net])
                             
                         if "Type"in  p and "sink" in p["Type"].lower():
                             endNodes.append([comp,net])
@@ -275,10 +277,10 @@ class ExtractBase(object):
                             
                 KeepNet += pinNets
 
-                #search other nets, just for PI 
-                if startNode and endNodes:
+                #search other nets, just for PI, all rails in one search
+                if startNodes and endNodes:
                     path = Path(layout=self.layout)
-                    path.startNode = startNode
+                    path.startNodes = startNodes
                     path.endNodes = endNodes
                     path.excludedNets = excludedNets
                     path.search()
@@ -461,8 +463,31 @@ class ExtractBase(object):
         if Analysis["ExportSNP"]:
             if not Analysis["SnpPath"] and self.Config["Header"]["Name"]:
                 Analysis["SnpPath"] = os.path.join(self.layout.ProjectDir,self.Config["Header"]["Name"])
-            solution.exportSNP(Analysis["SnpPath"])
             
+            exportVariations = Analysis["ExportVariations"] if "ExportVariations" in Analysis else None
+            if exportVariations and exportVariations != "first":
+                #parametric: all variations, SnpPath as output folder
+                workers = Analysis["ExportWorkers"] if "ExportWorkers" in Analysis else 4
+                self.layout.Solutions.exportAll(re.escape(solution.Name),variations = exportVariations,workers = workers,
+                                                outDir = Analysis["SnpPath"] or self.layout.ProjectDir)
+            else:
+                solution.exportSNP(Analysis["SnpPath"])
+            
+    def runStage(self,name,func,message = None,save = True):
+        '''
+        run one stage of workflow as a tracing span, COM calls are recorded to the stage if COM profiler enabled
+        '''
+        log.info(message or name)
+        profiler = self.layout.ComProfiler if self.layout else None
+        with tracer.span(name,"stage"):
+            if profiler:
+                with profiler.stage(name):
+                    func()
+            else:
+                func()
+            if save:
+                self.layout.save()
+
     def run(self):
         '''
         workflow:
@@ -488,10 +513,14 @@ class ExtractBase(object):
         self.layout.options["AEDT_LicenseServer"] = self.Config["AEDT/LicenseServer"]
         self.layout.options["AEDT_KeepGUILicense"] = self.Config["AEDT/KeepGUILicense"]
         
+        self.layout.options["AEDT_ProfileCOM"] = bool(self.Config["AEDT/ProfileCOM"]) if "ProfileCOM" in self.Config["AEDT"] else False
+        trace = bool(self.Config["AEDT/Trace"]) if "Trace" in self.Config["AEDT"] else False
+        if trace:
+            tracer.reset()
+            tracer.enabled = True
+        
         #---load layout file
-        log.info("load layout file")
-        self.loadLayout()
-        self.layout.save()
+        self.runStage("loadLayout",self.loadLayout,"load layout file")
         
         if not version:
             self.Config["AEDT/Version"] = self.layout.Version
@@ -503,49 +532,48 @@ class ExtractBase(object):
         autoSave = self.layout.enableAutosave(False) 
         
         #---preConfig
-        self.preConfig()
+        self.runStage("preConfig",self.preConfig,save = False)
 
         #---load stackup
-        log.info("load stackup file")
-        self.loadStackup()
-        self.layout.save()
+        self.runStage("loadStackup",self.loadStackup,"load stackup file")
         
         #ConfigNets
 #         layout.configNets()
         #---cutout pcb to reduced simulaiton time
-        log.info("cutout Design")
-        self.cutoutDesign()
-        self.layout.save()
+        self.runStage("cutoutDesign",self.cutoutDesign,"cutout Design")
 
         #---clear layout befor analysis
-        log.info("clearLayout")
-        self.clearLayout()
-        self.layout.save()
+        self.runStage("clearLayout",self.clearLayout)
 
         #---Component models
-        log.info("configComponents")
-        self.configComponents()
-        self.layout.save()
+        self.runStage("configComponents",self.configComponents)
 
         #---backdrill
-        log.info("backdrill")
-        self.backdrill()
-        self.layout.save()
+        self.runStage("backdrill",self.backdrill)
 
         #---create ports
-        log.info("Create ports")
-        self.setPorts()
-        self.layout.save()
+        self.runStage("setPorts",self.setPorts,"Create ports")
 
         #---solve frequency, sweep scope
-        log.info("Add setup and sweep")
-        self.solveSetup()
-        self.layout.save()
+        self.runStage("solveSetup",self.solveSetup,"Add setup and sweep")
 
         #---run the simution
-        log.info("Run the simution")
-        self.analyze()
-        self.layout.save()
+        self.runStage("analyze",self.analyze,"Run the simution")
+        
+        #---COM profile, one report per stage
+        profiler = self.layout.ComProfiler
+        if profiler:
+            folder = os.path.join(self.layout.ProjectDir,"%s_com"%self.layout.ProjectName)
+            profiler.dumpStages(folder)
+            log.info("COM profile of stages written to: %s"%folder)
+            log.info(profiler.summary(top = 10))
+        
+        #---tracing spans of stages
+        if trace:
+            tracer.enabled = False
+            tracePath = tracer.dumpChrome(os.path.join(self.layout.ProjectDir,"%s_trace.json"%self.layout.ProjectName))
+            log.info("trace of stages written to: %s"%tracePath)
+            log.info(tracer.summary(top = 20))
         
         #---quit Aedt
         self.layout.enableAutosave(autoSave)
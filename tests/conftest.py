@@ -0,0 +1,13 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+tests run without AEDT, pyLayout is imported from the repository,
+layouts are bound to the stand-in oEditor of benchmark/boardGenerator.py
+'''
+
+import sys,os
+rootDir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+for path in [rootDir,os.path.join(rootDir,"benchmark")]:
+    if path not in sys.path:
+        sys.path.insert(0,path)
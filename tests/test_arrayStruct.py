@@ -0,0 +1,95 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+ArrayStruct path-indexed mode gives the same results as the scan, and falls back to the scan when index is stale
+'''
+
+from copy import deepcopy
+import pytest
+from pyLayout.common.arrayStruct import ArrayStruct
+
+def setupDatas():
+    return ["NAME:HFSS Setup 1",
+            "Properties:=", ["NAME:SetupProps","Enabled:=", True],
+            ["NAME:AdaptiveSettings",
+                "MaxPasses:=", 10,
+                "MinPasses:=", 1,
+                ["NAME:Sweep1","MaxPasses:=", 20,"Freq:=", "1GHz"]],
+            "MaxPasses:=", 30,
+            "Name:=", "setup"]
+
+def both():
+    return ArrayStruct(setupDatas()),ArrayStruct(setupDatas(),indexed = True)
+
+
+@pytest.mark.parametrize("path",["MaxPasses","AdaptiveSettings/MaxPasses","adaptivesettings/sweep1/freq",
+                                 "Properties/Enabled","AdaptiveSettings/Sweep1"])
+def test_getSameAsScan(path):
+    scan,indexed = both()
+    assert indexed.get(path) == scan.get(path)
+
+
+def test_setSameAsScan():
+    scan,indexed = both()
+    for ary in [scan,indexed]:
+        ary.set("AdaptiveSettings/MaxPasses",15)
+        ary.set("adaptivesettings/sweep1/FREQ","2GHz")
+        ary["Name"] = "setup2"
+    assert indexed.Array == scan.Array
+    assert indexed.get("AdaptiveSettings/MaxPasses") == 15
+    assert indexed.Name == "setup2"
+
+
+def test_missingKey():
+    scan,indexed = both()
+    for ary in [scan,indexed]:
+        with pytest.raises(Exception):
+            ary.get("AdaptiveSettings/NotAKey")
+
+
+def test_updateByKeySameAsScan():
+    scan,indexed = both()
+    assert scan.updateByKey("maxpasses",5) == 3
+    assert indexed.updateByKey("maxpasses",5) == 3
+    assert indexed.Array == scan.Array
+    assert indexed.get("AdaptiveSettings/Sweep1/MaxPasses") == 5
+    assert indexed.updateByKey("NotAKey",1) == 0
+
+
+def test_scanFallbackKeyAddedOutside():
+    datas = setupDatas()
+    ary = ArrayStruct(datas,indexed = True)
+    assert ary.get("AdaptiveSettings/MaxPasses") == 10 #index built
+
+    #sub list changed outside, size of top list not changed
+    adaptive = datas[3]
+    adaptive.extend(["MaxDelta:=","0.02"])
+    assert ary.get("AdaptiveSettings/MaxDelta") == "0.02"
+    ary.set("AdaptiveSettings/MaxDelta","0.01")
+    assert adaptive[-1] == "0.01"
+    assert ary.updateByKey("MaxDelta","0.005") == 1
+    assert adaptive[-1] == "0.005"
+    #index build again after the scan
+    assert ary.get("AdaptiveSettings/MaxDelta") == "0.005"
+
+
+def test_indexValidAfterSubListReplaced():
+    datas = setupDatas()
+    ary = ArrayStruct(datas,indexed = True)
+    assert ary.get("AdaptiveSettings/Sweep1/Freq") == "1GHz"
+    datas[3][-1] = ["NAME:Sweep1","Freq:=","5GHz"] #replaced outside
+    assert ary.get("AdaptiveSettings/Sweep1/Freq") == "5GHz"
+
+    ary.set("AdaptiveSettings/Sweep1",["NAME:Sweep1","Freq:=","6GHz"])
+    assert ary.get("AdaptiveSettings/Sweep1/Freq") == "6GHz"
+    assert ary.updateByKey("Freq","7GHz") == 1
+    assert datas[3][-1] == ["NAME:Sweep1","Freq:=","7GHz"]
+
+
+def test_copyNotShareIndex():
+    ary = ArrayStruct(setupDatas(),indexed = True)
+    assert ary.MaxPasses == 30
+    ary2 = ArrayStruct(deepcopy(ary.Array),indexed = True)
+    ary2.MaxPasses = 1
+    assert ary.MaxPasses == 30 and ary2.MaxPasses == 1
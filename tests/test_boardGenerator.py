@@ -0,0 +1,38 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+SyntheticBoard smoke test: object counts, same board of same seed, Layout collections bind to it
+'''
+
+import pyLayout
+from boardGenerator import SyntheticBoard
+
+
+def test_build():
+    board = SyntheticBoard(comps = 4,pinsPerComp = 9,layers = 4,seed = 1).build()
+    assert board.oEditor.CallCount == 0 #counter reset after build
+    assert len(board.oEditor.FindObjects("Type","component")) == 4
+    assert len(board.oEditor.FindObjects("Type","pin")) == 36
+    assert len(board.oEditor.FindObjects("Type","via")) == 18 #one via per 2 pins
+    assert sorted(board.oEditor.FindObjects("Type","poly")) == ["plane_L2","plane_L3"]
+    assert board.nets == 9 and board.netNames[-2:] == ["VDD","GND"]
+
+    same = SyntheticBoard(comps = 4,pinsPerComp = 9,layers = 4,seed = 1).build()
+    other = SyntheticBoard(comps = 4,pinsPerComp = 9,layers = 4,seed = 2).build()
+    location = lambda b:b.oEditor.GetPropertyValue("BaseElementTab","via_3","Location")
+    assert location(same) == location(board) != location(other)
+    assert SyntheticBoard.ofScale(500).comps == 10
+
+
+def test_bindLayout():
+    pyLayout.log.setLogLevel("ERROR")
+    board = SyntheticBoard(comps = 4,pinsPerComp = 10,layers = 3,ports = 5)
+    layout = board.bindLayout() #built at first call
+    assert board.oEditor != None
+    assert len(layout.Components) == 4 and len(layout.Pins) == 40 and len(layout.Vias) == 20
+    assert layout.Pins["U2-3"].Net == board.netNames[12%board.nets] #pin index 12 of 10 nets
+    assert layout.Components["U1"].hasPin("U1-10")
+    assert layout.oDesign.GetModule("Excitations").GetAllPortsList()[0] == "U1.1.NET_0"
+    assert len(layout.oDesign.GetModule("Excitations").GetAllPortsList()) == 5
+    assert board.desktop.project.definitionManager.GetManager("Padstack").GetNames() == ["PAD_0","PAD_1","VIA_0","VIA_1"]
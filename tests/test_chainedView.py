@@ -0,0 +1,73 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+ChainedObjectDict of Objects3DL and Primitives.__add__: membership follows push/pop/refresh of the member collections
+'''
+
+import pytest
+import pyLayout
+from boardGenerator import SyntheticBoard
+
+
+@pytest.fixture
+def board():
+    pyLayout.log.setLogLevel("ERROR")
+    board = SyntheticBoard(comps = 2,pinsPerComp = 4,vias = 3,layers = 4).build()
+    board.layout = board.bindLayout()
+    return board
+
+
+@pytest.fixture
+def layout(board):
+    return board.layout
+
+
+def test_viewOfMembers(layout):
+    shapes = layout.Shapes
+    assert sorted(shapes.NameList) == ["plane_L2","plane_L3"]
+    objects = layout.Objects
+    assert len(objects) == 8 + 3 + 2 + 2 #pins, vias, planes, components
+    assert "U1-1" in objects and "via_0" in objects and "plane_l2" in objects
+    assert objects["via_2"] is layout.Vias["via_2"]
+    assert [obj.Name for obj in objects] == [obj.Name for obj in objects.ObjectDict[0:len(objects)]]
+    assert objects.ObjectDict[-1].Name == objects.ObjectDict.Keys[-1]
+
+
+def test_pushPop(board,layout):
+    mixed = layout.Pins + layout.Vias
+    objects = layout.Objects
+    assert len(objects) == 15 and len(mixed) == 11
+
+    board.oEditor.addObject("via_new","via",Net = "GND",Layer = "L1",Location = "0,0")
+    layout.Vias.push("via_new")
+    assert "via_new" in objects and "VIA_NEW" in mixed
+    assert len(objects) == 16 and len(mixed) == 12
+    assert objects["via_new"] is layout.Vias["via_new"]
+    assert [obj.Name for obj in mixed][-1] == "via_new"
+
+    layout.Pins.pop("U1-1")
+    assert "U1-1" not in objects and "U1-1" not in mixed
+    assert len(objects) == 15 and len(mixed) == 11
+    with pytest.raises(KeyError):
+        objects.ObjectDict["U1-1"]
+
+
+def test_deleteByView(layout):
+    mixed = layout.Pins + layout.Vias
+    del mixed.ObjectDict["via_1"]
+    assert "via_1" not in layout.Vias
+    with pytest.raises(KeyError):
+        del mixed.ObjectDict["via_1"]
+    with pytest.raises(Exception):
+        mixed.ObjectDict.update("via_1",None)
+
+
+def test_memberRefresh(layout):
+    objects = layout.Objects
+    assert "via_0" in objects
+    layout.Vias.pop("via_0")
+    assert "via_0" not in objects
+    layout.Vias.refresh() #read from layout again
+    assert "via_0" in objects
+    assert len(objects) == 15
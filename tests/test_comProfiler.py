@@ -0,0 +1,86 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+ComProxy of profiled handles: only results of object methods are wrapped, values and arrays are returned as they are
+'''
+
+import pytest
+import pyLayout
+from pyLayout.common.comProfiler import ComProxy,unwrapCom
+from boardGenerator import SyntheticBoard
+
+
+class StringArray(object):
+    '''
+    stand-in of System.String[] in IronPython: a sequence, not list or tuple
+    '''
+
+    def __init__(self,values):
+        self.values = list(values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self,index):
+        return self.values[index]
+
+
+@pytest.fixture
+def board():
+    pyLayout.log.setLogLevel("ERROR")
+    board = SyntheticBoard(comps = 2,pinsPerComp = 4,vias = 2,layers = 3).build()
+    board.layout = board.bindLayout()
+    return board
+
+
+def test_arrayNotWrapped(board,monkeypatch):
+    oEditor = board.oEditor
+    pins = oEditor.GetComponentPins
+    monkeypatch.setattr(oEditor,"GetComponentPins",lambda comp:StringArray(pins(comp)))
+    layout = board.layout
+    profiler = layout.enableComProfiler()
+    try:
+        result = layout.oEditor.GetComponentPins("U1")
+        assert isinstance(result,StringArray)
+        assert list(result) == ["U1-1","U1-2","U1-3","U1-4"]
+        assert layout.Components["U1"].hasPin("u1-3")
+    finally:
+        layout.disableComProfiler()
+    assert profiler.report()["Methods"][0]["Method"] == "oEditor.GetComponentPins"
+
+
+def test_objectMethodsWrapped(board):
+    layout = board.layout
+    profiler = layout.enableComProfiler()
+    try:
+        module = layout.oDesign.GetModule("SolveSetups")
+        assert isinstance(module,ComProxy) and module._name == "oDesign.SolveSetups"
+        manager = layout.oProject.GetDefinitionManager().GetManager("Material")
+        assert manager._name == "oProject.DefinitionManager.Material"
+        assert unwrapCom(manager) is board.desktop.project.definitionManager.managers["Material"]
+        assert manager.GetNames() == ["copper","FR4_epoxy"]
+        assert layout.oDesign.SetActiveEditor("Layout") == board.oEditor
+        assert layout.oDesign.GetName() == "bench;board"
+        for name in ["oDesign.GetModule","oProject.DefinitionManager.Material.GetNames","oDesign.SetActiveEditor"]:
+            assert name in profiler.stages["main"].methods
+    finally:
+        layout.disableComProfiler()
+    assert not isinstance(layout.oDesign,ComProxy)
+
+
+def test_otherObjectNotWrapped(board,monkeypatch):
+    #not an object method: returned as it is, even an object of unknown type
+    point = object()
+    monkeypatch.setattr(board.oEditor,"Point",lambda:point,raising = False)
+    layout = board.layout
+    layout.enableComProfiler()
+    try:
+        assert layout.oEditor.Point() is point
+        monkeypatch.setattr(board.desktop.project,"GetActiveDesign",lambda:None)
+        assert layout.oProject.GetActiveDesign() == None
+    finally:
+        layout.disableComProfiler()
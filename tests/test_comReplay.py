@@ -0,0 +1,71 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+record COM calls of the synthetic board, save, and replay by Layout.fromReplay without the stand-in
+'''
+
+import json
+import pytest
+import pyLayout
+from pyLayout.pyLayout import Layout
+from pyLayout.common.comReplay import CallRecorder,ReplaySession,ReplayHandle
+from boardGenerator import SyntheticBoard
+from test_comProfiler import StringArray
+
+
+def session(layout):
+    layout.initDesign()
+    pins = sorted([(pin.Name,pin.Net) for pin in layout.Pins.ObjectDict.Values])
+    comps = [(name,list(layout.oEditor.GetComponentPins(name))) for name in layout.Components.ObjectDict.Keys]
+    layers = list(layout.Layers.LayerNames)
+    return pins,comps,layers
+
+
+@pytest.fixture
+def board(tmp_path,monkeypatch):
+    pyLayout.log.setLogLevel("ERROR")
+    board = SyntheticBoard(comps = 3,pinsPerComp = 4,vias = 4,layers = 4).build()
+    board.desktop.project.path = str(tmp_path)
+    #GetComponentPins returns System.String[] in IronPython
+    pins = board.oEditor.GetComponentPins
+    monkeypatch.setattr(board.oEditor,"GetComponentPins",lambda comp:StringArray(pins(comp)))
+    return board
+
+
+@pytest.mark.parametrize("fileName",["board.comrec","board.comrec.gz"])
+def test_roundTrip(board,tmp_path,fileName):
+    layout = Layout(oDesktop = board.desktop)
+    recorder = layout.recordCom()
+    live = session(layout)
+    assert live[1][0] == ("U1",["U1-1","U1-2","U1-3","U1-4"])
+    path = recorder.save(str(tmp_path/fileName))
+
+    replay = Layout.fromReplay(path,projectDir = str(tmp_path))
+    assert session(replay) == live
+    replaySession = replay.ReplaySession
+    assert replaySession.missed == [] and replaySession.count > 0
+    assert isinstance(replay.oEditor,ReplayHandle) and replay.oEditor._name == "oDesktop.ActiveProject.ActiveDesign.Layout"
+
+
+def test_encodeResults(board):
+    recorder = CallRecorder()
+    oDesktop = recorder.wrap(board.desktop)
+    oProject = oDesktop.GetActiveProject()
+    oEditor = oProject.GetActiveDesign().SetActiveEditor("Layout")
+    assert list(oEditor.GetComponentPins("U2")) == ["U2-1","U2-2","U2-3","U2-4"]
+    assert oProject.GetName() == "bench"
+
+    results = [recorder.results[recorder.calls[key][0][0]] for key in sorted(recorder.calls)]
+    encoded = dict(zip(sorted(recorder.calls),results))
+    assert encoded['oDesktop.GetActiveProject([])'] == {"__handle__":"oDesktop.ActiveProject"}
+    assert encoded['oDesktop.ActiveProject.ActiveDesign.SetActiveEditor(["Layout"])'] == {"__handle__":"oDesktop.ActiveProject.ActiveDesign.Layout"}
+    assert encoded['oDesktop.ActiveProject.ActiveDesign.Layout.GetComponentPins(["U2"])'] == ["U2-1","U2-2","U2-3","U2-4"]
+    assert encoded['oDesktop.ActiveProject.GetName([])'] == "bench"
+    json.dumps(recorder.results)
+
+    replay = ReplaySession({"Results":recorder.results,"Calls":recorder.calls})
+    oEditor2 = replay.oDesktop.GetActiveProject().GetActiveDesign().SetActiveEditor("Layout")
+    assert oEditor2.GetComponentPins("U2") == ["U2-1","U2-2","U2-3","U2-4"]
+    with pytest.raises(Exception):
+        oEditor2.GetComponentPins("U9")
@@ -0,0 +1,152 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+ComplexDict: case-insensitive key index against the findDictKey scan, order of items and iterBatches
+'''
+
+import pytest
+import pyLayout
+from pyLayout.common.complexDict import ComplexDict
+from pyLayout.common.common import findDictKey
+from boardGenerator import SyntheticBoard
+
+
+def test_ignoreCase():
+    cd = ComplexDict({"Net":1,"Layer":"L1"})
+    assert cd["net"] == 1
+    assert cd["LAYER"] == "L1"
+    assert "NET" in cd
+    assert "Nets" not in cd
+    with pytest.raises(KeyError):
+        cd["nets"]
+
+
+def test_caseCollisionFirstInserted():
+    data = {"NET":1,"Net":2,"net":3}
+    cd = ComplexDict(data)
+    for key in ["NET","Net","net","nEt"]:
+        assert cd[key] == 1
+        assert findDictKey(key,data) == "NET"
+
+    #first one deleted, next inserted wins
+    del cd["NET"]
+    assert cd["net"] == 2
+    assert set(data) == set(["Net","net"])
+
+
+def test_deleteAndAddAgain():
+    data = {"Net":1,"Layer":2}
+    cd = ComplexDict(data)
+    assert cd["NET"] == 1
+    del cd["net"]
+    assert "Net" not in data
+    assert "NET" not in cd
+
+    cd.enableUpdate = True
+    cd["Net"] = 5
+    assert cd["NET"] == 5
+    cd.update("NET",6) #update add key as it is, same as findDictKey the first one is found
+    assert data == {"Layer":2,"Net":5,"NET":6}
+    assert cd["net"] == 5 and cd["NET"] == 5
+
+
+def test_changedOutside():
+    data = {"Net":1,"Layer":2}
+    cd = ComplexDict(data)
+    assert cd["net"] == 1 #index built
+
+    #same size: one key removed and one key added outside
+    del data["Net"]
+    data.update({"Width":3})
+    assert cd["width"] == 3
+    assert "net" not in cd
+
+    #renamed outside in case only
+    data["LAYER"] = data.pop("Layer")
+    assert cd["layer"] == 2
+
+    #size changed outside
+    data.update({"Start Layer":"L1","Stop Layer":"L4"})
+    assert cd["start layer"] == "L1"
+
+
+def test_sharedIndex():
+    data = {"Net":1}
+    cd1 = ComplexDict(data)
+    cd2 = ComplexDict(data)
+    assert cd1["net"] == 1 and cd2["NET"] == 1
+    cd1.enableUpdate = True
+    cd1["Layer"] = "L1"
+    assert cd2["layer"] == "L1"
+    del cd1["layer"]
+    assert "LAYER" not in cd2
+
+
+def test_pathKey():
+    data = {"Header":{"Comment":"a"}}
+    cd = ComplexDict(data)
+    assert cd["header/comment"] == "a"
+    assert cd["HEADER"]["COMMENT"] == "a"
+
+
+def test_itemsOrder():
+    data = dict(("K%s"%i,i) for i in [3,1,4,0,5,9,2])
+    cd = ComplexDict(data)
+    assert list(cd.items()) == list(data.items())
+    assert list(cd) == list(data.values())
+    assert cd[0] == 3 and cd[-1] == 2 and cd[1:3] == [1,4]
+
+    cd.enableUpdate = True
+    cd["K7"] = 7 #added at the end
+    del cd["k4"]
+    assert [k for k,v in cd.items()] == ["K3","K1","K0","K5","K9","K2","K7"]
+
+
+def test_iterBatchesOrder():
+    data = dict(("K%s"%i,i) for i in range(7))
+    cd = ComplexDict(data)
+    batches = list(cd.iterBatches(3))
+    assert [len(b) for b in batches] == [3,3,1]
+    assert sum(batches,[]) == list(cd)
+    assert list(cd.iterBatches(10)) == [list(range(7))]
+    with pytest.raises(Exception):
+        list(cd.iterBatches(0))
+
+
+def test_itemsDeleteDuringLoop():
+    data = dict(("K%s"%i,i) for i in range(6))
+    cd = ComplexDict(data)
+    seen = []
+    for k,v in cd.items():
+        seen.append(k)
+        if v == 1:
+            del cd["K2"]
+            del cd["K0"] #already yield
+    assert seen == ["K0","K1","K3","K4","K5"]
+
+
+def test_itemsKeysChangedOutside():
+    data = {"A":1,"B":2,"C":3}
+    cd = ComplexDict(data)
+    assert list(cd) == [1,2,3] #key list cached
+
+    #same size, B replaced by another ComplexDict of the same dict
+    other = ComplexDict(data)
+    del other["B"]
+    other.update("D",4)
+    assert list(cd.items()) == [("A",1),("C",3),("D",4)]
+    assert list(cd.iterBatches(2)) == [[1,3],[4]]
+    assert cd[-1] == 4
+
+
+def test_collectionItemsOrder():
+    pyLayout.log.setLogLevel("ERROR")
+    board = SyntheticBoard(comps = 3,pinsPerComp = 5,vias = 0).build()
+    layout = board.bindLayout()
+    pins = [name for name,info in board.oEditor.objects.items() if info["Type"] == "pin"]
+    assert [name for name,pin in layout.Pins.items()] == pins
+    assert [pin.Name for pin in layout.Pins] == pins
+    batches = list(layout.Pins.iterBatches(4))
+    assert [len(b) for b in batches] == [4,4,4,3]
+    assert [pin.Name for b in batches for pin in b] == pins
@@ -0,0 +1,50 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Component.hasPin and pin -> component index of Components
+'''
+
+import pytest
+import pyLayout
+from boardGenerator import SyntheticBoard
+
+
+@pytest.fixture
+def board():
+    pyLayout.log.setLogLevel("ERROR")
+    board = SyntheticBoard(comps = 20,pinsPerComp = 4,vias = 0).build()
+    board.layout = board.bindLayout()
+    board.layout.Components.NameList
+    board.oEditor.reset()
+    return board
+
+
+def test_hasPinNotBuildIndex(board):
+    comp = board.layout.Components["U3"]
+    board.oEditor.reset()
+    assert comp.hasPin("U3-2") and comp.hasPin("u3-4")
+    assert not comp.hasPin("U4-1") and not comp.hasPin("NotAPin")
+    assert board.oEditor.calls["GetComponentPins"] == 4
+    assert board.layout.Components._pinIndex == None
+
+
+def test_hasPinByBuiltIndex(board):
+    components = board.layout.Components
+    assert components.getCompNameByPin("U5-1") == "U5" #index built
+    comp = components["U3"]
+    board.oEditor.reset()
+    assert comp.hasPin("U3-2") and comp.hasPin("u3-4")
+    assert not comp.hasPin("U4-1") and not comp.hasPin("NotAPin")
+    assert "GetComponentPins" not in board.oEditor.calls
+
+
+def test_indexAfterPop(board):
+    components = board.layout.Components
+    comp = components["U3"]
+    assert components.getCompNameByPin("U3-1") == "U3"
+    components.pop("U3")
+    assert components.getCompNameByPin("U3-1") == None
+    assert not comp.hasPin("U3-1")
+    components.invalidatePinIndex()
+    assert comp.hasPin("U3-1") #pins in layout
@@ -0,0 +1,75 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Connectivity: same nets of components as the Net property of pins, unconnected pin on net ""
+'''
+
+import pytest
+import pyLayout
+from pyLayout.definition.path import Path
+from recordingEditor import RecordingEditor,BenchLayout
+
+
+def floatingCapBoard(rails = 1,depth = 2):
+    '''
+    power tree with capacitor C1 on VR1 has an unconnected pin
+    '''
+    pyLayout.log.setLogLevel("ERROR")
+    oEditor = RecordingEditor.powerTree(rails = rails,depth = depth,fanout = 1,caps = 1)
+    oEditor.objects["C1-2"]["Net"] = ""
+    return oEditor,BenchLayout(oEditor)
+
+
+def test_findObjectsBranch():
+    oEditor,layout = floatingCapBoard()
+    connectivity = layout.Connectivity
+    assert connectivity.NetCount < connectivity.PinCount #nets gathered by FindObjects
+    assert sorted(connectivity.getNetsOfComponent("C1")) == ["","VR1"]
+    assert connectivity.getNetOfPin("C1-2") == ""
+    assert connectivity.getPinsOnNet("") == ["C1-2"]
+    assert sorted(connectivity.getNetsOfComponent("C3")) == ["GND","VR1_2"]
+
+
+def test_propertyBranch():
+    #more nets than pins, net of pin by GetPropertyValue
+    oEditor = RecordingEditor()
+    oEditor.addObject("C1","component",Part_Type = "Capacitor")
+    oEditor.addObject("C1-1","pin",Net = "VDD",Component_Pin = "1")
+    oEditor.addObject("C1-2","pin",Net = "",Component_Pin = "2")
+    layout = BenchLayout(oEditor)
+    connectivity = layout.Connectivity
+    assert connectivity.NetCount >= connectivity.PinCount
+    assert sorted(connectivity.getNetsOfComponent("C1")) == ["","VDD"]
+
+
+def test_componentNetNamesAsPins():
+    oEditor,layout = floatingCapBoard()
+    for comp in ["C1","R2","C3","U1"]:
+        netNames = layout.Components[comp].NetNames
+        pinNets = set([oEditor.objects[pin]["Net"] for pin in oEditor.GetComponentPins(comp)])
+        assert set(netNames) == pinNets
+        assert len(netNames) == len(pinNets)
+
+
+def test_deleteInvalidRLCKeepFloatingPin():
+    oEditor,layout = floatingCapBoard()
+    #2 pin capacitor on one net is invalid
+    oEditor.objects["C3-2"]["Net"] = oEditor.objects["C3-1"]["Net"]
+    layout.Connectivity.invalidate()
+    dissolved = []
+    oEditor.DissolveComponents = lambda comps: dissolved.extend(comps)
+    layout.Components.deleteInvalidRLC()
+    assert dissolved == ["C3"]
+
+
+def test_pathNotWalkUnconnectedNet():
+    oEditor,layout = floatingCapBoard(depth = 3)
+    #resistor with unconnected pin, "" is not a net to search
+    oEditor.objects["R4-2"]["Net"] = ""
+    oEditor.objects["C1-2"]["Net"] = "GND"
+    path = Path(layout = layout)
+    path.startNodes = [["U1","VR1"]]
+    path.endNodes = [["S1_0",oEditor.objects["S1_0-1"]["Net"]]]
+    path.search()
+    assert all(node.Net for node in path.nodes)
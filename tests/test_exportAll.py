@@ -0,0 +1,112 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Solutions.exportAll on the synthetic board: file names, compress, error records of export and post process
+'''
+
+import os
+import gzip
+import pytest
+import pyLayout
+from boardGenerator import SyntheticBoard
+
+
+@pytest.fixture
+def board(tmp_path):
+    pyLayout.log.setLogLevel("CRITICAL")
+    board = SyntheticBoard(comps = 2,pinsPerComp = 10,layers = 3,ports = 4).build()
+    board.layout = board.bindLayout()
+    board.layout._info.update("ProjectDir",str(tmp_path))
+    board.layout._info.update("ProjectName","bench")
+    board.layout._info.update("DesignName","board")
+    design = board.layout.oDesign
+    design.exportBytes = 4096
+    setups = design.GetModule("SolveSetups")
+    setups.sweeps = {"HFSS":["Sweep1","Sweep2"]}
+    setups.variations = ["w='3mil'","w='4mil'","w='5mil'"]
+    return board
+
+
+def test_plan(board,tmp_path):
+    plan = board.layout.Solutions.planExports("HFSS:Sweep1")
+    assert [variation for solution,variation,path in plan] == ["w='3mil'","w='4mil'","w='5mil'"]
+    assert os.path.basename(plan[1][2]) == "bench_board_HFSS_Sweep1_v1_w-4mil.s4p"
+    assert all(os.path.dirname(path) == str(tmp_path) for s,v,path in plan)
+    assert len(board.layout.Solutions.planExports(variations = "first")) == 2
+    assert len(board.layout.Solutions.planExports(variations = ["a","b"])) == 4
+    with pytest.raises(Exception):
+        board.layout.Solutions.planExports("NoSetup:.*")
+
+
+@pytest.mark.parametrize("workers",[0,1,4])
+@pytest.mark.parametrize("compress",[False,True])
+def test_exportAll(board,tmp_path,workers,compress):
+    seen = []
+    summary = board.layout.Solutions.exportAll(workers = workers,outDir = str(tmp_path/"snp"),compress = compress,
+                                               postProcess = lambda record:seen.append(record.Path))
+    assert len(summary) == 6 and not summary.Failed
+    assert [(r.Solution,r.Variation) for r in summary] == [(s,v) for s in ["HFSS:Sweep1","HFSS:Sweep2"]
+                                                          for v in ["w='3mil'","w='4mil'","w='5mil'"]]
+    assert sorted(seen) == sorted(summary.Paths)
+    assert sorted(os.listdir(str(tmp_path/"snp"))) == sorted(os.path.basename(p) for p in summary.Paths)
+    for r in summary:
+        assert r.Path.endswith(".s4p.gz" if compress else ".s4p")
+        assert r.Size == os.path.getsize(r.Path) and r.Size > 0
+        assert r.ExportTime != None and r.PostTime != None
+    opener = gzip.open if compress else open
+    with opener(summary[0].Path,"rb") as f:
+        assert f.readline().startswith(b"! HFSS:Sweep1 w='3mil'")
+    assert summary.WallTime != None
+    assert summary.report().splitlines()[-1].startswith("6 exports, 0 fail")
+
+
+@pytest.mark.parametrize("workers",[0,4])
+def test_exportFail(board,tmp_path,workers):
+    design = board.layout.oDesign
+    export = design.ExportNetworkData
+    def failOne(variation,solutions,fileType,path,*args):
+        if variation == "w='4mil'" and solutions[0] == "HFSS:Sweep1":
+            raise Exception("solution data not available")
+        return export(variation,solutions,fileType,path,*args)
+    design.ExportNetworkData = failOne
+
+    summary = board.layout.Solutions.exportAll(workers = workers,outDir = str(tmp_path),compress = True)
+    assert len(summary) == 6 #loop continues after the failed export
+    assert [(r.Solution,r.Variation) for r in summary.Failed] == [("HFSS:Sweep1","w='4mil'")]
+    failed = summary.Failed[0]
+    assert failed.Error == "export fail: solution data not available"
+    assert failed.Size == None and failed.ExportTime != None
+    assert failed.Path not in summary.Paths and not os.path.exists(failed.Path + ".gz")
+    assert len(summary.Paths) == 5 and all(os.path.exists(p) for p in summary.Paths)
+    assert "fail, export fail: solution data not available" in summary.report()
+    assert summary.report().splitlines()[-1].startswith("6 exports, 1 fail")
+
+
+def test_fileNotWritten(board,tmp_path):
+    design = board.layout.oDesign
+    export = design.ExportNetworkData
+    def skipSweep2(variation,solutions,fileType,path,*args):
+        if solutions[0] != "HFSS:Sweep2":
+            export(variation,solutions,fileType,path,*args)
+    design.ExportNetworkData = skipSweep2
+
+    summary = board.layout.Solutions.exportAll(workers = 2,outDir = str(tmp_path),compress = True)
+    assert [r.Solution for r in summary.Failed] == ["HFSS:Sweep2"]*3
+    assert all(r.Error == "post process fail: file not written" for r in summary.Failed)
+    assert all(r.PostTime != None for r in summary.Failed)
+    assert len(summary.Paths) == 3
+
+
+@pytest.mark.parametrize("workers",[0,3])
+def test_postProcessFail(board,tmp_path,workers):
+    def check(record):
+        if record.Variation == "w='5mil'":
+            raise ValueError("bad data %s"%os.path.basename(record.Path))
+    summary = board.layout.Solutions.exportAll("HFSS:Sweep1",workers = workers,outDir = str(tmp_path),postProcess = check)
+    assert [r.Variation for r in summary.Failed] == ["w='5mil'"]
+    failed = summary.Failed[0]
+    assert failed.Error == "post process fail: bad data bench_board_HFSS_Sweep1_v2_w-5mil.s4p"
+    assert os.path.exists(failed.Path) #export is kept, only post process failed
+    assert failed.Size == None
+    assert [r.Success for r in summary] == [True,True,False]
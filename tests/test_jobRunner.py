@@ -0,0 +1,167 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+JobRunner with python stand-in jobs: concurrency limit, timeout kill, exit code, memory of process tree
+'''
+
+import sys,os
+import time
+import asyncio
+import pytest
+from pyLayout.common import jobRunner
+from pyLayout.common.jobRunner import JobRunner,submitBatchSolve
+
+posixOnly = pytest.mark.skipif(os.name != "posix",reason = "shell wrapper and /proc of posix")
+
+def pythonJob(code,*args):
+    return [sys.executable,"-c",code] + [str(a) for a in args]
+
+def shellJob(code,*args):
+    #python under a shell, the shell is not the solver process
+    return " ".join(['"%s"'%sys.executable,"-c",'"%s"'%code] + [str(a) for a in args]) + "; exit $?"
+
+sleepJob = "import sys,time; time.sleep(float(sys.argv[1]))"
+
+def maxOverlap(results):
+    '''
+    max count of jobs running at same time, from start and end time
+    '''
+    events = sorted([(r.StartTime,1) for r in results] + [(r.StartTime+r.WallTime,-1) for r in results],key = lambda e: (e[0],e[1]))
+    running,peak = 0,0
+    for t,step in events:
+        running += step
+        peak = max(peak,running)
+    return peak
+
+def alive(pid):
+    try:
+        os.kill(pid,0)
+    except OSError:
+        return False
+    #zombie of killed child not reaped yet
+    try:
+        with open("/proc/%s/stat"%pid) as f:
+            return f.read().rsplit(")",1)[1].split()[0] != "Z"
+    except Exception:
+        return True
+
+
+def test_concurrencyLimit():
+    runner = JobRunner(maxJobs = 2,sampleInterval = 0.05)
+    results = runner.runAll([pythonJob(sleepJob,0.3) for i in range(6)])
+    assert [r.ReturnCode for r in results] == [0]*6
+    assert maxOverlap(results) == 2
+    assert runner.running == 0
+
+
+def test_concurrencyLimitAcrossSubmits():
+    runner = JobRunner(maxJobs = 1,sampleInterval = 0.05)
+
+    async def submitLater():
+        first = runner.submit(pythonJob(sleepJob,0.2))
+        await asyncio.sleep(0.05)
+        second = runner.submit(pythonJob(sleepJob,0.2))
+        return await asyncio.gather(first,second)
+
+    results = asyncio.run(submitLater())
+    assert maxOverlap(results) == 1
+    #runner reused in a new event loop
+    results = runner.runAll([pythonJob(sleepJob,0.1)]*2)
+    assert maxOverlap(results) == 1
+
+
+def test_exitCode():
+    runner = JobRunner(maxJobs = 3)
+    results = runner.runAll([pythonJob("import sys; print('solve'); sys.exit(int(sys.argv[1]))",code) for code in [0,3,7]])
+    assert [r.ReturnCode for r in results] == [0,3,7]
+    assert [r.Success for r in results] == [True,False,False]
+    assert [r.OutputLines for r in results] == [1,1,1]
+
+
+@posixOnly
+def test_exitCodeOfShell():
+    results = JobRunner().runAll([shellJob("import sys; sys.exit(5)")])
+    assert results[0].ReturnCode == 5
+    assert not results[0].TimedOut
+
+
+def test_timeoutKillJob():
+    start = time.time()
+    results = JobRunner(timeout = 0.5).runAll([pythonJob(sleepJob,30)])
+    assert results[0].TimedOut
+    assert not results[0].Success
+    assert results[0].ReturnCode != 0
+    assert time.time() - start < 10
+
+
+def test_timeoutJobClosedOutput():
+    #job closed stdout/stderr but keep running, timeout still apply to process exit
+    code = "import os,sys,time; os.close(1); os.close(2); time.sleep(30)"
+    start = time.time()
+    results = JobRunner(timeout = 0.5).runAll([pythonJob(code)])
+    assert results[0].TimedOut
+    assert time.time() - start < 10
+
+
+@posixOnly
+def test_timeoutKillChildren(tmp_path):
+    pidFile = str(tmp_path/"pid.txt")
+    code = "import os,sys,time; open(sys.argv[1],'w').write(str(os.getpid())); time.sleep(30)"
+    start = time.time()
+    results = JobRunner(timeout = 1).runAll([shellJob(code,pidFile)])
+    assert results[0].TimedOut
+    assert time.time() - start < 10
+
+    pid = int(open(pidFile).read())
+    for i in range(50):
+        if not alive(pid):
+            break
+        time.sleep(0.1)
+    assert not alive(pid)
+
+
+@posixOnly
+def test_peakRssOfChildProcess():
+    #solver under shell wrapper allocates 200MB, shell itself is small
+    code = "import sys,time; data = bytearray(200*1024*1024); time.sleep(1)"
+    results = JobRunner(sampleInterval = 0.05).runAll([shellJob(code)])
+    assert results[0].ReturnCode == 0
+    assert results[0].PeakRSS > 200*1024*1024
+
+
+class FakeDesktop(object):
+    def GetExeDir(self):
+        return "/aedt"
+
+class FakeTool(object):
+    '''
+    Layout like object, project closed before submit
+    '''
+    def __init__(self,name):
+        self.oDesktop = FakeDesktop()
+        self.ProjectPath = name
+        self.closed = False
+
+    def close(self,save = True):
+        self.closed = save
+
+
+def test_submitBatchSolveShareDefaultRunner(monkeypatch):
+    commands = []
+    def command(exePath,aedtPath,host = "localhost",cores = 20,jobId = None):
+        commands.append((exePath,aedtPath,cores))
+        return pythonJob(sleepJob,0.2)
+    monkeypatch.setattr(jobRunner,"batchSolveCommand",command)
+    monkeypatch.setattr(jobRunner,"defaultRunner",JobRunner(maxJobs = 1,sampleInterval = 0.05))
+
+    tools = [FakeTool("a.aedt"),FakeTool("b.aedt")]
+    async def solveAll():
+        return await asyncio.gather(*[submitBatchSolve(tool,cores = 8) for tool in tools])
+    results = asyncio.run(solveAll())
+
+    assert [tool.closed for tool in tools] == [True,True]
+    assert [c[1:] for c in commands] == [("a.aedt",8),("b.aedt",8)]
+    assert commands[0][0] == os.path.join("/aedt","ansysedt.exe")
+    assert [r.ReturnCode for r in results] == [0,0]
+    assert maxOverlap(results) == 1
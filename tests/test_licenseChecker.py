@@ -0,0 +1,148 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+lmstat status cache of LicenseChecker: hit within ttl, expiry, isolation per server
+'''
+
+import asyncio
+import pytest
+from pyLayout.common import licenseChecker
+from pyLayout.common.licenseChecker import LicenseChecker
+
+lmstatText = \
+'''License server status: %(server)s
+Users of electronics_desktop:  (Total of 20 licenses issued;  Total of 4 licenses in use)
+Users of elec_solve_hfss:  (Total of 10 licenses issued;  Total of %(hfss)s licenses in use)
+Users of elec_solve_level1:  (Total of 10 licenses issued;  Total of 3 licenses in use)
+Users of elec_solve_level2:  (Total of 10 licenses issued;  Total of 3 licenses in use)
+Users of anshpc_pack:  (Total of 8 licenses issued;  Total of 2 licenses in use)
+'''
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self,seconds):
+        self.now += seconds
+
+
+class CannedServers(object):
+    '''
+    lmstat runner, used hfss licenses per server, commands are recorded
+    '''
+    def __init__(self,used):
+        self.used = used
+        self.cmds = []
+
+    def __call__(self,cmd):
+        self.cmds.append(cmd)
+        server = cmd.split(" -c ")[1].split()[0]
+        return lmstatText%{"server":server,"hfss":self.used[server]}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(licenseChecker,"time",clock)
+    monkeypatch.setattr(LicenseChecker,"_checkers",{})
+    return clock
+
+
+def test_parseLmstat():
+    status = licenseChecker.parseLmstat(lmstatText%{"server":"1055@a","hfss":7})
+    assert status["elec_solve_hfss"] == (10,7)
+    assert status["anshpc_pack"] == (8,2)
+    assert licenseChecker.parseLmstat(None) == {}
+
+
+def test_cacheHitWithinTtl(clock):
+    servers = CannedServers({"1055@a":3})
+    checker = LicenseChecker("1055@a",runner = servers)
+
+    assert checker.checkHFSSSolver()
+    assert checker.pollCount == 1
+
+    #3 features of HFSSSolver and later checks read the cached status
+    clock.now += checker.ttl - 1
+    servers.used["1055@a"] = 10
+    assert checker.checkHFSSSolver()
+    assert checker.checkDesktop(16)
+    assert checker.pollCount == 1
+    assert len(servers.cmds) == 1
+
+
+def test_cacheExpired(clock):
+    servers = CannedServers({"1055@a":3})
+    checker = LicenseChecker("1055@a",runner = servers)
+    assert checker.checkFeature("elec_solve_hfss",7)
+
+    servers.used["1055@a"] = 10
+    clock.now += checker.ttl + 1
+    assert not checker.checkFeature("elec_solve_hfss")
+    assert checker.pollCount == 2
+    assert checker.unusedCount == 0
+
+    #new status cached again
+    assert not checker.checkFeature("elec_solve_hfss")
+    assert checker.pollCount == 2
+
+
+def test_refreshIgnoreTtl(clock):
+    servers = CannedServers({"1055@a":3})
+    checker = LicenseChecker("1055@a",runner = servers)
+    checker.Status
+    checker.refresh()
+    assert checker.pollCount == 2
+
+
+def test_cachePerServer(clock):
+    servers = CannedServers({"1055@a":3,"1055@b":10})
+    checkerA = LicenseChecker.getChecker("1055@a")
+    checkerB = LicenseChecker.getChecker("1055@b")
+    assert checkerA is not checkerB
+    assert LicenseChecker.getChecker("1055@a") is checkerA
+    checkerA.runner = checkerB.runner = servers
+
+    assert checkerA.checkFeature("elec_solve_hfss",7)
+    assert not checkerB.checkFeature("elec_solve_hfss")
+    assert checkerA.pollCount == 1 and checkerB.pollCount == 1
+
+    #expire of one server status not poll the other one
+    clock.now += 10
+    checkerB._stamp -= checkerB.ttl
+    assert not checkerB.checkFeature("elec_solve_hfss")
+    assert checkerA.checkFeature("elec_solve_hfss")
+    assert checkerA.pollCount == 1 and checkerB.pollCount == 2
+    assert [cmd.split(" -c ")[1].split()[0] for cmd in servers.cmds] == ["1055@a","1055@b","1055@b"]
+
+
+def test_multiServersAdded(clock):
+    servers = CannedServers({"1055@a":3,"1055@b":10})
+    checker = LicenseChecker("1055@a;1055@b",runner = servers)
+    assert checker.getFeatureCount("elec_solve_hfss") == (20,13)
+    assert checker.getFeatureCount("anshpc_pack") == (16,4)
+    assert checker.pollCount == 2 #one lmstat per server
+
+
+def test_waitPollOncePerRound(clock):
+    servers = CannedServers({"1055@a":10})
+    checker = LicenseChecker("1055@a",runner = servers)
+
+    def release(seconds):
+        clock.now += seconds
+        servers.used["1055@a"] = 3
+    clock.sleep = release
+    assert checker.waitForlicense([{"module":"HFSSSolver"},{"feature":"anshpc_pack","count":2}],timeout = 600)
+    assert checker.pollCount == 2
+
+
+def test_awaitFeatures(clock):
+    servers = CannedServers({"1055@a":3})
+    checker = LicenseChecker("1055@a",runner = servers)
+    assert asyncio.run(checker.awaitFeatures([{"module":"HFSSSolver"}],timeout = 10))
+    assert checker.pollCount == 1
@@ -0,0 +1,58 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+log file written by background listener: all records are in file after the process exit, no hang at exit
+'''
+
+import sys,os
+import re
+import subprocess
+import pytest
+from pyLayout.common.log import formatMessage
+
+rootDir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+script = '''
+import sys
+sys.path.insert(0,sys.argv[1])
+from pyLayout import log
+log.setLogLevel("INFO")
+log.setPath(sys.argv[2],background = sys.argv[4] == "background")
+for i in range(int(sys.argv[3])):
+    log.info("line %%s of %%s",i,sys.argv[3])
+log.debug("not written")
+%s
+'''
+
+exits = {"end":"","sysExit":"sys.exit(3)","exception":"raise RuntimeError('stop')"}
+
+
+def writeLines(tmp_path,count,mode = "background",exit = "end"):
+    path = str(tmp_path/"run.log")
+    proc = subprocess.run([sys.executable,"-c",script%exits[exit],rootDir,path,str(count),mode],
+                          stdout = subprocess.PIPE,stderr = subprocess.PIPE,timeout = 120)
+    with open(path) as f:
+        lines = [l for l in f.read().splitlines() if re.search(r"INFO: line \d+ of %s$"%count,l)]
+    return proc.returncode,lines
+
+
+@pytest.mark.parametrize("exit,code",[("end",0),("sysExit",3),("exception",1)])
+def test_backgroundAllLinesWritten(tmp_path,exit,code):
+    count = 20000
+    returnCode,lines = writeLines(tmp_path,count,exit = exit)
+    assert returnCode == code
+    assert len(lines) == count
+    assert lines[-1].endswith("line %s of %s"%(count-1,count))
+
+
+def test_syncAllLinesWritten(tmp_path):
+    returnCode,lines = writeLines(tmp_path,2000,mode = "sync")
+    assert returnCode == 0
+    assert len(lines) == 2000
+
+
+def test_formatMessage():
+    assert formatMessage("a: %s",("b",)) == "a: b"
+    assert formatMessage("a:",("b","c")) == "a:b,c"
+    assert formatMessage("100%",()) == "100%"
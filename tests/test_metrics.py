@@ -0,0 +1,109 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+SParamMetrics against the loop per pair and frequency, and IL/RL/SDD of a small network by hand
+'''
+
+import math
+import pytest
+np = pytest.importorskip("numpy")
+
+from pyLayout.postData import metrics
+from pyLayout.postData.metrics import SParamMetrics,findChannels,findDiffPairs,mixedModeDD
+from benchMetrics import synthetic,loopMetrics
+
+
+def dB(v):
+    return 20*math.log10(abs(v))
+
+
+#ports: 2 single ended channels and 1 differential channel
+names = ["U1.A1.DQ0","U2.B1.DQ0","U1.A2.DQ1","U2.B2.DQ1",
+         "U1.C1.CLK_P","U1.C2.CLK_N","U2.D1.CLK_P","U2.D2.CLK_N"]
+
+
+def network():
+    '''
+    2 frequencies, S[far,near] of DQ0 0.9/0.8, reflection 0.1/0.2, NEXT 0.01, FEXT 0.02
+    '''
+    S = np.zeros((2,8,8),dtype = complex)
+    for k,(il,rl) in enumerate([(0.9,0.1),(0.8,0.2)]):
+        S[k,1,0] = S[k,0,1] = il
+        S[k,0,0] = rl
+        S[k,1,1] = rl/2
+        S[k,3,2] = S[k,2,3] = 0.7j
+        S[k,2,2] = S[k,3,3] = 0.05
+        S[k,2,0] = S[k,0,2] = 0.01 #NEXT DQ1 <- DQ0
+        S[k,3,0] = S[k,0,3] = 0.02 #FEXT DQ1 <- DQ0
+        #CLK: P/N through, coupled in the opposite way
+        S[k,6,4] = S[k,4,6] = 0.6
+        S[k,7,5] = S[k,5,7] = 0.6
+        S[k,7,4] = S[k,4,7] = -0.1
+        S[k,6,5] = S[k,5,6] = -0.1
+    return np.array([1e9,2e9]),S
+
+
+def test_channelsAndPairs():
+    assert findChannels(names) == [("DQ0",0,1),("DQ1",2,3),("CLK_P",4,6),("CLK_N",5,7)]
+    assert findChannels(names,nearComps = ["u2"])[0] == ("DQ0",1,0)
+    assert findDiffPairs(names) == [("U1.CLK",4,5),("U2.CLK",6,7)]
+    assert findDiffPairs(["U1.1.D0P","U1.2.D0N","U1.3.CK+","U1.4.CK-","U1.5.VDD"]) == [("U1.D0",0,1),("U1.CK",2,3)]
+
+
+def test_referenceValues():
+    freq,S = network()
+    table = SParamMetrics(freq,S,names).getTable()
+    rows = dict(((r["Metric"],r["Victim"],r["Aggressor"]),r) for r in table)
+
+    il = rows[("S21","DQ0","DQ0")]
+    assert list(il["dB"]) == pytest.approx([dB(0.9),dB(0.8)])
+    assert il["Worst"] == pytest.approx(dB(0.8)) #min
+    assert rows[("S11","DQ0","DQ0")]["Worst"] == pytest.approx(dB(0.2)) #max
+    assert rows[("S22","DQ0","DQ0")]["Worst"] == pytest.approx(dB(0.1))
+    assert rows[("S21","DQ1","DQ1")]["Worst"] == pytest.approx(dB(0.7))
+    assert rows[("SNEXT","DQ1","DQ0")]["Worst"] == pytest.approx(dB(0.01))
+    assert rows[("SFEXT","DQ1","DQ0")]["Worst"] == pytest.approx(dB(0.02))
+
+    #Sdd21 = (0.6 - (-0.1) - (-0.1) + 0.6)/2 = 0.7
+    sdd = rows[("SDD21","CLK","CLK")]
+    assert sdd["Victim"] == "CLK"
+    assert sdd["Worst"] == pytest.approx(dB(0.7))
+    assert mixedModeDD(S,findDiffPairs(names))[0,1,0] == pytest.approx(0.7)
+    assert sorted(set(table["Metric"])) == ["S11","S21","S22","SDD11","SDD21","SDD22","SFEXT","SNEXT"]
+
+
+def test_sameAsLoop():
+    freq,S,names = synthetic(6)
+    loop = loopMetrics(S.tolist(),names)
+    table = SParamMetrics(freq,S,names).getTable()
+    assert len(table) == len(loop)
+    for r in table:
+        assert r["Worst"] == pytest.approx(loop[(r["Metric"],r["Victim"],r["Aggressor"])],abs = 1e-9)
+
+
+def test_noCrosstalk():
+    freq,S = network()
+    table = SParamMetrics(freq,S,names,crosstalk = False).getTable()
+    assert not any(m.endswith("EXT") for m in table["Metric"])
+
+
+def test_valuesAndCsv(tmp_path):
+    freq,S = network()
+    m = SParamMetrics(freq,S,names)
+    table = m.getTable()
+    k = [i for i,r in enumerate(table) if r["Metric"] == "S21" and r["Victim"] == "DQ0"][0]
+    values = m.getValues([1e9,1.5e9,2e9])
+    assert values[k] == pytest.approx([dB(0.9),(dB(0.9)+dB(0.8))/2,dB(0.8)])
+
+    path = m.writeCsv(str(tmp_path/"metrics.csv"),frequencies = [1e9])
+    lines = open(path).read().splitlines()
+    assert lines[0] == "Metric,Victim,Aggressor,Worst,1e+09Hz"
+    assert len(lines) == len(table)+1
+    assert lines[k+1] == "S21,DQ0,DQ0,%.4f,%.4f"%(dB(0.8),dB(0.9))
+
+
+def test_numpyRequired(monkeypatch):
+    monkeypatch.setattr(metrics,"np",None)
+    with pytest.raises(Exception):
+        SParamMetrics([1e9],[[[0j]]],["U1.1.A"])
@@ -0,0 +1,53 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+NameIndex of Layout: built by delete, used by __getitem__ only when built
+'''
+
+import pytest
+import pyLayout
+from boardGenerator import SyntheticBoard
+
+
+@pytest.fixture
+def board(monkeypatch):
+    pyLayout.log.setLogLevel("ERROR")
+    board = SyntheticBoard(comps = 2,pinsPerComp = 4,vias = 3,layers = 3).build()
+    board.layout = board.bindLayout()
+    board.finds = []
+    find = board.oEditor.FindObjects
+    def record(by,value):
+        board.finds.append(value)
+        return find(by,value)
+    monkeypatch.setattr(board.oEditor,"FindObjects",record)
+    return board
+
+
+def test_getItemNotBuildIndex(board):
+    layout = board.layout
+    assert layout["U1-2"].Name == "U1-2"
+    assert layout["via_1"].Name == "via_1"
+    assert not layout.NameIndex.built
+    assert "*" not in board.finds
+
+
+def test_attributeMissNotBuildIndex(board):
+    layout = board.layout
+    with pytest.raises(Exception):
+        layout.NotAnAttributeOrObject
+    assert not layout.NameIndex.built
+    assert "*" not in board.finds
+
+
+def test_getItemByBuiltIndex(board):
+    layout = board.layout
+    layout.delete(["U1-1"])
+    assert layout.NameIndex.built
+    assert layout.NameIndex.getType("via_2") == "via"
+
+    del board.finds[:]
+    layout.Pins.refresh()
+    assert layout["via_2"].Name == "via_2"
+    assert board.finds == ["via"] #collection of via only
+    assert "U1-1" not in layout.NameIndex
@@ -0,0 +1,132 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+PropertyBatch: edits grouped by value and merged by PropServers, discarded when the with block raise
+'''
+
+import gc
+import pytest
+import pyLayout
+from pyLayout.primitive.propertyBatch import PropertyBatch
+from recordingEditor import RecordingEditor,BenchLayout
+
+
+def pinLayout(comps = 2,pinsPerComp = 4):
+    pyLayout.log.setLogLevel("ERROR")
+    oEditor = RecordingEditor.synthetic(comps,pinsPerComp)
+    for info in oEditor.objects.values():
+        if info["Type"] == "pin":
+            info["Backdrill Top"] = "----"
+            info["Top Offset"] = "0mil"
+    layout = BenchLayout(oEditor)
+    pins = list(layout.Pins.All)
+    oEditor.reset()
+    return oEditor,layout,pins
+
+
+def changedProps(oEditor):
+    '''
+    [(PropServers,[prop names])] of recorded ChangeProperty
+    '''
+    return [(args[1][1][1:],[p[0][5:] for p in args[1][2][1:]]) for args in oEditor.changes]
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    oEditor,layout,pins = pinLayout()
+    oEditor.changes = []
+    change = oEditor.ChangeProperty
+    def record(args):
+        oEditor.changes.append(args)
+        return change(args)
+    monkeypatch.setattr(oEditor,"ChangeProperty",record)
+    return oEditor,layout,pins
+
+
+def test_sameValueOneCall(recorded):
+    oEditor,layout,pins = recorded
+    with PropertyBatch(layout) as batch:
+        for pin in pins:
+            pin["Backdrill Top"] = "L3"
+        assert batch.Count == len(pins)
+    assert batch.calls == 1
+    assert "SetPropertyValue" not in oEditor.calls
+    assert changedProps(oEditor) == [([pin.Name for pin in pins],["Backdrill Top"])]
+    assert all(oEditor.objects[pin.Name]["Backdrill Top"] == "L3" for pin in pins)
+
+
+def test_groupsMergedBySameServers(recorded):
+    oEditor,layout,pins = recorded
+    with PropertyBatch(layout) as batch:
+        for pin in pins[:2]:
+            pin["Backdrill Top"] = "L2"
+            pin["Top Offset"] = "1mil"
+        pins[2]["Backdrill Top"] = "L4"
+        pins[0]["Top Offset"] = "2mil" #last edit win, pins[0] leaves the 1mil group
+        groups = batch._groups()
+    names = [pin.Name for pin in pins]
+    assert groups == [
+        ("BaseElementTab",names[:2],[["NAME:Backdrill Top","Value:=","L2"]]),
+        ("BaseElementTab",names[1:2],[["NAME:Top Offset","Value:=","1mil"]]),
+        ("BaseElementTab",names[2:3],[["NAME:Backdrill Top","Value:=","L4"]]),
+        ("BaseElementTab",names[0:1],[["NAME:Top Offset","Value:=","2mil"]])]
+    assert batch.calls == 4
+    assert oEditor.objects[names[0]]["Top Offset"] == "2mil"
+
+
+def test_mergeDifferentProps():
+    batch = PropertyBatch(None)
+    batch.setProp("V1","Start Layer","L1")
+    batch.setProp("V2","Start Layer","L1")
+    batch.setProp("V1","Stop Layer","L4")
+    batch.setProp("V2","Stop Layer","L4")
+    batch.setPoint("V1","Location","1mm","2mm")
+    assert batch._groups() == [
+        ("BaseElementTab",["V1","V2"],[["NAME:Start Layer","Value:=","L1"],["NAME:Stop Layer","Value:=","L4"]]),
+        ("BaseElementTab",["V1"],[["NAME:Location","X:=","1mm","Y:=","2mm"]])]
+
+
+def test_nestedFlushOnce(recorded):
+    oEditor,layout,pins = recorded
+    with PropertyBatch(layout) as outer:
+        pins[0]["Top Offset"] = "3mil"
+        with PropertyBatch(layout) as inner:
+            assert inner is outer
+            pins[1]["Top Offset"] = "3mil"
+        assert oEditor.changes == []
+    assert outer.calls == 1
+    assert PropertyBatch.active(layout) == None
+
+
+def test_exceptionDiscardEdits(recorded):
+    oEditor,layout,pins = recorded
+    with pytest.raises(ValueError):
+        with PropertyBatch(layout) as batch:
+            pins[0]["Backdrill Top"] = "L3"
+            pins[1].Location = ["1mm","1mm"]
+            pins[1].update()
+            assert pins[0]["Backdrill Top"] == "L3" #cached in batch
+            raise ValueError("half-built")
+    assert oEditor.changes == [] and batch.calls == 0
+    assert batch.Count == 0
+    assert PropertyBatch.active(layout) == None
+    assert pins[0]["Backdrill Top"] == "----" #parsed from layout again
+    assert oEditor.objects[pins[1].Name]["Location"] != "1mm,1mm"
+
+
+def test_activeNotKeptForCollectedLayout():
+    oEditor,layout,pins = pinLayout(1,2)
+    with PropertyBatch(layout):
+        assert len(PropertyBatch._active) == 1
+    assert len(PropertyBatch._active) == 0
+
+    #batch and layout collected without exit, entry does not go to a new layout
+    class Layout(object):
+        pass
+    batch = PropertyBatch(Layout())
+    batch.__enter__()
+    del batch
+    gc.collect()
+    assert len(PropertyBatch._active) == 0
+    assert PropertyBatch.active(Layout()) == None
@@ -0,0 +1,89 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+compilePatterns merged alternation and NameQuery against re.match of each pattern
+'''
+
+import re
+import pytest
+from pyLayout.common import regexQuery
+from pyLayout.common.regexQuery import compilePatterns,literalPrefix,NameQuery
+from pyLayout.common.complexDict import ComplexDict
+from pyLayout.common.common import regAnyMatch
+
+names = ["DDR_DQ0","DDR_DQ1","ddr_dq12","DDR_DM0","AA","ABAB","abab","VDD","vdd_1V8","NET.1","NET_1","GND",""]
+
+
+def anyMatch(patterns,name,flags = re.IGNORECASE):
+    return any(re.match(p,name,flags) for p in patterns)
+
+
+@pytest.mark.parametrize("patterns",[
+    ["DDR_DQ\\d+$","DDR_DM\\d$"],
+    ["(\\w)\\1","DDR_DQ(\\d)$"], #backref, groups of other branch shift numbers
+    ["(?P<a>\\w)(?P=a)","(?P<a>AB)(?P=a)$"], #same group name in two patterns
+    ["(?i)vdd","DDR_DQ1$","GND"], #inline global flag
+    ["(?s)NET.1","(?x) v d d $"],
+    ["(?i:ab)AB","NET\\.1"], #scoped flag is mergeable
+    ])
+@pytest.mark.parametrize("flags",[re.IGNORECASE,0])
+def test_sameAsEachPattern(patterns,flags):
+    regex = compilePatterns(patterns,flags)
+    for name in names:
+        assert bool(regex.match(name)) == anyMatch(patterns,name,flags),name
+
+
+def test_mergedOrSeparate():
+    merged = compilePatterns(["DDR_DQ\\d+$","GND","(?i:ab)AB"])
+    assert hasattr(merged,"pattern") #one regex
+    assert merged.pattern == "(?:DDR_DQ\\d+$)|(?:GND)|(?:(?i:ab)AB)"
+
+    mixed = compilePatterns(["(?i)vdd","(\\w)\\1","DDR_DQ1$","GND"],0)
+    assert isinstance(mixed,regexQuery._AnyRegex)
+    assert [r.pattern for r in mixed.regexs] == ["(?:DDR_DQ1$)|(?:GND)","(?i)vdd","(\\w)\\1"]
+    assert mixed.match("VDD_1V8") and not mixed.match("GNd")
+
+
+def test_cache(monkeypatch):
+    monkeypatch.setattr(regexQuery,"_cache",regexQuery._cache.__class__())
+    monkeypatch.setattr(regexQuery,"cacheSize",2)
+    regex = compilePatterns(["A","B"])
+    assert compilePatterns(("A","B")) is regex
+    assert compilePatterns(["A","B"],0) is not regex
+    compilePatterns("C")
+    assert (("A","B"),re.IGNORECASE) not in regexQuery._cache
+    assert len(regexQuery._cache) == 2
+
+
+@pytest.mark.parametrize("pattern,prefix",[
+    ("DDR_DQ\\d+","ddr_dq"),("^NET\\.1","net.1"),("VDD?","vd"),("GND{2}","gn"),
+    ("A|B",""),("(?i)vdd",""),(".*",""),("U\\d","u"),("abc","abc")])
+def test_literalPrefix(pattern,prefix):
+    assert literalPrefix(pattern) == prefix
+
+
+def test_regAnyMatch():
+    regs = ["DDR_DQ\\d","(\\w)\\1","(?i)gnd"]
+    for name in names:
+        assert bool(regAnyMatch(regs,name)) == anyMatch([r+"$" for r in regs],name),name
+    assert not regAnyMatch([],"GND")
+
+
+def test_nameQuery():
+    data = dict((name,i) for i,name in enumerate(names))
+    cd = ComplexDict(data)
+    query = NameQuery.of(cd)
+    patterns = ["DDR_DQ\\d+$","(\\w)\\1$","(?i)vdd"]
+    expected = [name for name in names if anyMatch(patterns,name)]
+    assert query.matchAny(patterns) == expected
+    assert query.matchEach(patterns) == [name for p in patterns for name in names if re.match(p,name,re.I)]
+    assert query.match("ddr_dq\\d$") == ["DDR_DQ0","DDR_DQ1"]
+    assert NameQuery.of(cd) is query
+
+    #keys changed, query build again
+    cd.enableUpdate = True
+    cd["DDR_DQ7"] = 1
+    query2 = NameQuery.of(cd)
+    assert query2 is not query
+    assert query2.match("ddr_dq\\d$") == ["DDR_DQ0","DDR_DQ1","DDR_DQ7"]
@@ -0,0 +1,57 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+SpatialIndex layers and net of point in Setup, every net confirmed by FindObjectsByPoint
+'''
+
+import pytest
+import pyLayout
+from pyLayout.definition.setup import Setup
+from boardGenerator import SyntheticBoard
+
+
+@pytest.fixture(scope = "module")
+def board():
+    pyLayout.log.setLogLevel("ERROR")
+    board = SyntheticBoard(comps = 4,pinsPerComp = 9,layers = 4).build()
+    board.layout = board.bindLayout()
+    board.index = board.layout.spatialIndex()
+    return board
+
+
+def pinPoint(board,pin):
+    info = board.oEditor.objects[pin]
+    x,y = info["Location"].split(",")
+    return [x+"mm",y+"mm"],info["Layer"],info["Net"]
+
+
+def test_hasLayer(board):
+    index = board.index
+    assert index.hasLayer("L1") and index.hasLayer("l4")
+    assert not index.hasLayer("D1")
+    assert not index.hasLayer(None)
+
+
+def test_netByPoint(board):
+    setup = Setup("setup1",layout = board.layout)
+    point,layer,net = pinPoint(board,"U1-1")
+    board.oEditor.reset()
+    assert setup._getNetByPoint(board.index,point,layer) == net
+    assert board.oEditor.calls["FindObjectsByPoint"] == 1
+
+
+def test_netByPointPruned(board):
+    setup = Setup("setup1",layout = board.layout)
+    board.oEditor.reset()
+    assert setup._getNetByPoint(board.index,["500mm","500mm"],"L1") == None
+    assert "FindObjectsByPoint" not in board.oEditor.calls
+
+
+def test_netByPointNotInShape(board,monkeypatch):
+    #BBox hit, but point is not in shape of object
+    setup = Setup("setup1",layout = board.layout)
+    point,layer,net = pinPoint(board,"U1-1")
+    monkeypatch.setattr(board.oEditor,"FindObjectsByPoint",lambda pt,layer: [])
+    assert board.index.query(point,layer = layer)
+    assert setup._getNetByPoint(board.index,point,layer) == None
@@ -0,0 +1,74 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+StackupTable.searchHeights: nearest layer of height, layer boundaries and dielectric layers
+
+stackup of the board (um): L1 270-305, D1 170-270, L2 135-170, D2 35-135, L3 0-35
+'''
+
+import pytest
+import pyLayout
+from pyLayout.definition import stackupTable
+from boardGenerator import SyntheticBoard
+
+um = 1e-6
+
+
+@pytest.fixture(scope = "module")
+def layout():
+    pyLayout.log.setLogLevel("ERROR")
+    return SyntheticBoard(comps = 1,pinsPerComp = 1,layers = 3).bindLayout()
+
+
+@pytest.fixture(params = ["numpy","python"])
+def table(request,layout,monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(stackupTable,"np",None)
+    elif stackupTable.np == None:
+        pytest.skip("numpy not installed")
+    layout.Layers.invalidate()
+    return layout.Layers.table
+
+
+def check(result,expected):
+    assert [name for name,distance in result] == [name for name,distance in expected]
+    for (name,distance),(name2,distance2) in zip(result,expected):
+        assert distance == pytest.approx(distance2,abs = 1e-12)
+
+
+def test_columns(table):
+    assert table.Names == ["L1","D1","L2","D2","L3"]
+    assert table.ConductorNames == ["L1","L2","L3"]
+    assert table.DielectricNames == ["D1","D2"]
+    assert list(table.Lower) == pytest.approx([270*um,170*um,135*um,35*um,0])
+    assert list(table.Upper) == pytest.approx([305*um,270*um,170*um,135*um,35*um])
+    assert table.row("l2")["Thickness"] == pytest.approx(35*um)
+    assert table.indexOf("D9") == -1
+
+
+def test_insideAndBoundaries(table):
+    check(table.searchHeights([0,10*um,35*um,135*um,150*um,170*um,305*um]),
+          [("L3",0),("L3",0),("L3",0),("L2",0),("L2",0),("L2",0),("L1",0)])
+
+
+def test_relativeTolerance(table):
+    #inside tolerance of the upper boundary is on the layer
+    check(table.searchHeights([170*um*(1+5e-4)]),[("L2",0)])
+    check(table.searchHeights([170*um*(1+5e-3)]),[("L2",170*um*5e-3)])
+
+
+def test_betweenLayers(table):
+    #distance >0 if above the layer, <0 if below
+    check(table.searchHeights([100*um,60*um,"0.2mm",400*um,-10*um]),
+          [("L2",-35*um),("L3",25*um),("L2",30*um),("L1",95*um),("L3",-10*um)])
+    assert table.getLayerByHeight(["0.29mm","0.0001m"]) == ["L1","L2"]
+
+
+def test_dielectricLayers(table):
+    check(table.searchHeights([100*um,135*um,150*um,20*um,300*um],type = "dielectric"),
+          [("D2",0),("D2",0),("D2",15*um),("D2",-15*um),("D1",30*um)])
+
+
+def test_noLayerOfType(table):
+    assert table.searchHeights([0,1*um],type = "metalizedsignal") == [(None,None),(None,None)]
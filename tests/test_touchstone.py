@@ -0,0 +1,183 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Touchstone v1/v2 reader and writer: round trip, matrix formats, 2-port order, comment and continuation lines
+'''
+
+import cmath
+import pytest
+from pyLayout.postData import touchstone
+from pyLayout.postData.touchstone import Touchstone
+
+
+@pytest.fixture(params = ["numpy","python"],autouse = True)
+def backend(request,monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(touchstone,"np",None)
+    elif touchstone.np == None:
+        pytest.skip("numpy not installed")
+    return request.param
+
+
+def network(n,freqs,symmetric = False):
+    '''
+    data[k][i][j] = 0.1*(k+1) * (i+1 + 0.01*(j+1)) at angle of 10*(i+2j+k) deg, (i,j) != (j,i) if not symmetric
+    '''
+    freq = [1e9*(k+1) for k in range(freqs)]
+    data = []
+    for k in range(freqs):
+        m = []
+        for i in range(n):
+            row = []
+            for j in range(n):
+                a,b = (min(i,j),max(i,j)) if symmetric else (i,j)
+                row.append(cmath.rect(0.1*(k+1)*(a+1+0.01*(b+1)),cmath.pi/18*(a+2*b+k)))
+            m.append(row)
+        data.append(m)
+    if touchstone.np != None:
+        return touchstone.np.array(freq),touchstone.np.array(data)
+    return freq,data
+
+
+def assertSame(ts,freq,data,tol = 1e-7):
+    assert ts.FrequencyCount == len(freq)
+    n = len(data[0])
+    assert ts.PortCount == n
+    for k in range(len(freq)):
+        assert ts.Frequency[k] == pytest.approx(freq[k],rel = 1e-9)
+        for i in range(n):
+            for j in range(n):
+                assert abs(ts.Data[k][i][j]-data[k][i][j]) < tol*max(1,abs(data[k][i][j])),(k,i,j)
+
+
+@pytest.mark.parametrize("n",[1,2,3,5])
+@pytest.mark.parametrize("format",["RI","MA","DB"])
+@pytest.mark.parametrize("version",[1,2])
+def test_roundTrip(tmp_path,n,format,version):
+    freq,data = network(n,4)
+    path = str(tmp_path/("a.s%sp"%n))
+    Touchstone(freq,data,50.0,portNames = ["P%s"%(i+1) for i in range(n)],comments = [" test"]).write(path,format = format,version = version)
+    ts = Touchstone.read(path)
+    assertSame(ts,freq,data)
+    assert ts.PortNames == ["P%s"%(i+1) for i in range(n)]
+    assert ts.Comments == [" test"]
+    z0 = ts.Z0 if isinstance(ts.Z0,list) else [ts.Z0]*n #[Reference] of each port in version 2
+    assert list(z0) == [50.0]*n
+
+
+def test_twoPortOrder(tmp_path):
+    freq,data = network(2,1)
+    path = str(tmp_path/"a.s2p")
+    Touchstone(freq,data).write(path,format = "RI",version = 1)
+    values = [float(v) for v in open(path).read().split("\n")[1].split()]
+    #version 1: S11 S21 S12 S22
+    cells = [complex(values[i],values[i+1]) for i in range(1,9,2)]
+    expected = [data[0][0][0],data[0][1][0],data[0][0][1],data[0][1][1]]
+    assert all(abs(a-b) < 1e-8 for a,b in zip(cells,expected))
+
+    Touchstone(freq,data).write(path,format = "RI",version = 2)
+    text = open(path).read()
+    assert "[Two-Port Data Order] 12_21" in text
+    values = [float(v) for v in text.split("[Network Data]\n")[1].split("\n")[0].split()]
+    cells = [complex(values[i],values[i+1]) for i in range(1,9,2)]
+    expected = [data[0][0][0],data[0][0][1],data[0][1][0],data[0][1][1]]
+    assert all(abs(a-b) < 1e-8 for a,b in zip(cells,expected))
+
+
+@pytest.mark.parametrize("order,swap",[("12_21",False),("21_12",True)])
+def test_twoPortOrderV2(tmp_path,order,swap):
+    path = tmp_path/"b.s2p"
+    path.write_text("[Version] 2.0\n# GHz S RI R 50\n[Number of Ports] 2\n[Two-Port Data Order] %s\n"
+                    "[Number of Frequencies] 1\n[Network Data]\n1 0.1 0 0.2 0 0.3 0 0.4 0\n[End]\n"%order)
+    ts = Touchstone.read(str(path))
+    s12,s21 = (0.3,0.2) if swap else (0.2,0.3)
+    assert [ts.Data[0][0][1].real,ts.Data[0][1][0].real] == pytest.approx([s12,s21])
+
+
+@pytest.mark.parametrize("matrix",["Lower","Upper"])
+def test_triangleMatrix(tmp_path,matrix):
+    n = 3
+    freq,data = network(n,2,symmetric = True)
+    lines = ["[Version] 2.0","# Hz S MA R 50","[Number of Ports] 3","[Number of Frequencies] 2",
+             "[Reference] 50 50","50","[Matrix Format] %s"%matrix,"[Network Data]"]
+    for k in range(2):
+        lines.append("%.12g"%freq[k])
+        for i in range(n):
+            cols = range(0,i+1) if matrix == "Lower" else range(i,n)
+            lines.append(" ".join(["%.12g %.12g"%(abs(data[k][i][j]),cmath.phase(data[k][i][j])*180/cmath.pi) for j in cols]))
+    lines.append("[End]")
+    path = tmp_path/"c.s3p"
+    path.write_text("\n".join(lines)+"\n")
+    ts = Touchstone.read(str(path))
+    assertSame(ts,freq,data)
+    assert ts.Z0 == [50.0,50.0,50.0] #[Reference] continued on next line
+
+
+def test_commentAndContinuation(tmp_path):
+    text = """! board extraction
+! Port[1] = U1.A1
+! Port[2] = U1.A2
+! Port[3] = U1.A3
+# MHz S RI R 50
+! data
+100 0.1 0.0 0.2 0.0   ! S11 S12
+    0.3 0.0
+0.4 0.0 0.5 0.0 0.6 0.0 0.7 0.0
+! inside data
+0.8 0.0
+0.9 0.0
+200 1.1 0.0 1.2 0.0 1.3 0.0 1.4 0.0 1.5 0.0 1.6 0.0 1.7 0.0 1.8 0.0 1.9 0.0
+"""
+    path = tmp_path/"d.s3p"
+    path.write_text(text)
+    for chunkSize in [None,16]:
+        ts = Touchstone.read(str(path),chunkSize = chunkSize)
+        assert ts.PortNames == ["U1.A1","U1.A2","U1.A3"]
+        assert ts.Comments == [" board extraction"," data"]
+        assert list(ts.Frequency) == pytest.approx([1e8,2e8])
+        assert [ts.Data[k][i][j].real for k in range(2) for i in range(3) for j in range(3)] == pytest.approx(
+            [0.1*v for v in range(1,10)] + [1+0.1*v for v in range(1,10)])
+
+
+def test_normalizedImpedance(tmp_path):
+    path = tmp_path/"z.s1p"
+    path.write_text("# GHz Z RI R 25\n1 2 0\n")
+    ts = Touchstone.read(str(path))
+    assert ts.ParamType == "Z" and ts.Data[0][0][0] == pytest.approx(50)
+    ts.write(str(path),format = "RI",version = 1)
+    assert Touchstone.read(str(path)).Data[0][0][0] == pytest.approx(50)
+
+
+def test_growWithoutFrequencyCount(tmp_path):
+    #version 1 has no frequency count, array grows when estimate is too small
+    freq,data = network(2,200)
+    path = str(tmp_path/"e.s2p")
+    Touchstone(freq,data).write(path,format = "MA",version = 1)
+    ts = Touchstone.read(path,chunkSize = 64)
+    assertSame(ts,freq,data)
+    assert len(ts.Data) == 200
+
+
+def test_frequencyCountError(tmp_path):
+    path = tmp_path/"f.s1p"
+    path.write_text("[Version] 2.0\n# GHz S RI R 50\n[Number of Ports] 1\n[Number of Frequencies] 3\n"
+                    "[Network Data]\n1 0.1 0\n2 0.2 0\n[End]\n")
+    with pytest.raises(Exception):
+        Touchstone.read(str(path))
+
+
+@pytest.mark.parametrize("sizeHint",[1,10**6])
+def test_readerCapacity(sizeHint):
+    #estimate too small: grow, too large: cut at close
+    header = {"version":1,"ports":1,"freqs":None,"freqScale":1.0,"param":"S","format":"RI","z0":50.0,
+              "matrix":"full","order":"21_12"}
+    reader = touchstone._NetworkReader(1,None,3,header,sizeHint)
+    reader.feed("1 0.1")
+    for k in range(2,50):
+        reader.feed(" 0\n%s %s"%(k,0.1*k))
+    reader.feed(" 0\n")
+    reader.close()
+    assert len(reader.data) == 49 and len(reader.freq) == 49
+    assert [reader.data[k][0][0].real for k in range(49)] == pytest.approx([0.1*k for k in range(1,50)])
+    assert list(reader.freq) == pytest.approx(list(range(1,50)))
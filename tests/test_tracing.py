@@ -0,0 +1,59 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+tracer disabled by default, process time logged with or without tracer
+'''
+
+import pytest
+from pyLayout.common import tracing
+from pyLayout.common.tracing import Tracer
+
+
+class FakeLog(object):
+    def __init__(self):
+        self.lines = []
+
+    def info(self,content):
+        self.lines.append(content)
+
+
+@pytest.fixture
+def fakeLog(monkeypatch):
+    fake = FakeLog()
+    monkeypatch.setattr(tracing,"log",fake)
+    return fake
+
+
+def test_disabledByDefault():
+    assert not tracing.tracer.enabled
+    local = Tracer()
+    with local.span("block") as span:
+        assert span == None
+    assert local.roots == []
+
+
+@pytest.mark.parametrize("enabled",[False,True])
+def test_logTime(fakeLog,enabled):
+    local = Tracer(enabled = enabled)
+    @local.traced(logTime = True)
+    def solve(a):
+        return a*2
+
+    assert solve(3) == 6
+    assert fakeLog.lines[0] == "start function: solve"
+    assert fakeLog.lines[1].startswith("solve: Process time ")
+    assert len(local.roots) == (1 if enabled else 0)
+
+
+def test_spansNested():
+    local = Tracer(enabled = True)
+    @local.traced(name = "inner")
+    def inner():
+        return 1
+    with local.span("outer","stage"):
+        inner()
+        inner()
+    assert [s.name for s in local.Spans] == ["outer","inner","inner"]
+    rows = local.report()
+    assert [(r["Name"],r["Count"]) for r in rows] == [("outer",1),("inner",2)]
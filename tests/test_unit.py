@@ -0,0 +1,79 @@
+#--- coding=utf-8
+#--- @Author: Yongsheng.Guo@ansys.com, Henry.he@ansys.com,Yang.zhao@ansys.com
+#--- @Time: 20250801
+'''
+Unit.parse / parseMany: literal fast path against the expression eval, LRU cache shared by threads
+'''
+
+import threading
+import pytest
+from pyLayout.common.unit import Unit
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(Unit,"_cache",Unit._cache.__class__())
+    return Unit._cache
+
+
+@pytest.mark.parametrize("value,expected",[
+    ("1mm",1e-3),("1.5um",1.5e-6),("3nm",3e-9),("2pF",2e-12),("1fs",1e-15),
+    ("2GHz",2e9),("2MHz",2e6),("1THz",1e12),
+    ("1in",0.0254),(".5mil",1.27e-5),("3ft",0.9144),("2dm",0.2),("4cm",0.04),
+    ("1meter",1.0),("5ohm",5.0),("10deg",10.0),("100",100.0),
+    ("-2e-3",-2e-3),("1e3um",1e-3),("1E-3mm",1e-6),("2.5e+2nm",2.5e-7),("+.5mm",5e-4),
+    ])
+def test_unitsTable(value,expected,cache):
+    assert Unit.parse(value) == pytest.approx(expected)
+    assert Unit.parse(value) == Unit._eval(value)
+    assert value in cache
+
+
+@pytest.mark.parametrize("value",["1um+1um","2*3mm","(1mm+1mil)/2","1mm-0.5mm","2**3"])
+def test_evalFallback(value,cache):
+    assert Unit.parse(value) == Unit._eval(value)
+    assert Unit.parse(value) == Unit.parse(value) #from cache
+    assert value in cache
+
+
+def test_numbers():
+    assert Unit.parse(3) == 3.0 and isinstance(Unit.parse(3),float)
+    assert Unit.parse(1.5e-3) == 1.5e-3
+    assert Unit.parse(True) == 1.0
+    assert Unit.parse(2**70) == float(2**70) #long of python 2
+
+
+def test_parseMany(cache):
+    values = ["1mm",2,"1um+1um",Unit("1mil"),0.5]
+    rst = Unit.parseMany(values)
+    assert list(rst) == pytest.approx([1e-3,2.0,2e-6,2.54e-5,0.5])
+    assert list(Unit.parseMany([])) == []
+
+
+def test_lruEviction(cache,monkeypatch):
+    monkeypatch.setattr(Unit,"cacheSize",3)
+    for v in ["1mm","2mm","3mm"]:
+        Unit.parse(v)
+    Unit.parse("1mm") #most recent
+    Unit.parse("4mm")
+    assert list(cache) == ["3mm","1mm","4mm"]
+
+
+def test_threads(cache,monkeypatch):
+    monkeypatch.setattr(Unit,"cacheSize",16)
+    values = ["%smm"%i for i in range(64)] + ["%sum+1um"%i for i in range(16)]
+    errors = []
+    def work():
+        try:
+            for n in range(20):
+                for v in values:
+                    assert Unit.parse(v) == Unit._eval(v)
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target = work) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(cache) <= 16